@@ -9,20 +9,26 @@ from models import db, Request
 from core.logger import LoggerConfig
 
 
-def create_app():
-    """Application factory"""
+def create_app(config_class=Config):
+    """
+    Application factory
+
+    Args:
+        config_class: Configuration class to load (tests pass TestConfig
+                      to use their own database and directories)
+    """
     # Initialize logging first
     LoggerConfig.setup()
     
     app = Flask(__name__)
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     # Enable sessions for chat
-    app.config['SECRET_KEY'] = Config.SECRET_KEY
+    app.config['SECRET_KEY'] = config_class.SECRET_KEY
     
     # Apply connection pooling configuration (Requirement 11.5)
-    if hasattr(Config, 'SQLALCHEMY_ENGINE_OPTIONS'):
-        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = Config.SQLALCHEMY_ENGINE_OPTIONS
+    if hasattr(config_class, 'SQLALCHEMY_ENGINE_OPTIONS'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = config_class.SQLALCHEMY_ENGINE_OPTIONS
 
     # Initialize extensions
     db.init_app(app)
@@ -87,7 +93,7 @@ def create_app():
         return dict(get_object_icon=get_object_icon)
 
     # Initialize directories
-    Config.init_directories()
+    config_class.init_directories()
 
     # Create database tables
     with app.app_context():
@@ -189,6 +195,7 @@ def _register_repositories(container):
     from repositories.customer_comparison_repository import (
         CustomerComparisonRepository
     )
+    from repositories.content_blob_repository import ContentBlobRepository
     
     # Register each repository
     container.register_repository(RequestRepository)
@@ -198,6 +205,7 @@ def _register_repositories(container):
     container.register_repository(PackageObjectMappingRepository)
     container.register_repository(DeltaComparisonRepository)
     container.register_repository(CustomerComparisonRepository)
+    container.register_repository(ContentBlobRepository)
 
 
 def _register_services(container):
@@ -211,6 +219,7 @@ def _register_services(container):
     from services.request.request_service import RequestService
     from services.request.file_service import FileService
     from services.request.document_service import DocumentService
+    from services.request.request_job_service import RequestJobService
     
     # AI services
     from services.ai.bedrock_service import BedrockRAGService
@@ -220,7 +229,10 @@ def _register_services(container):
     from services.three_way_merge_orchestrator import (
         ThreeWayMergeOrchestrator
     )
+    from services.merge_job_service import MergeJobService
     from services.package_extraction_service import PackageExtractionService
+    from services.extraction_cache_service import ExtractionCacheService
+    from services.bulk_comparison_service import BulkComparisonService
     from services.delta_comparison_service import DeltaComparisonService
     from services.customer_comparison_service import (
         CustomerComparisonService
@@ -235,11 +247,13 @@ def _register_services(container):
         ComparisonRetrievalService
     )
     from services.merge_summary_service import MergeSummaryService
+    from services.summary_cache_service import SummaryCacheService
     
     # Register request services
     container.register_service(RequestService)
     container.register_service(FileService)
     container.register_service(DocumentService)
+    container.register_service(RequestJobService)
 
     # Register AI services
     container.register_service(BedrockRAGService)
@@ -247,7 +261,10 @@ def _register_services(container):
     
     # Register three-way merge services
     container.register_service(ThreeWayMergeOrchestrator)
+    container.register_service(MergeJobService)
     container.register_service(PackageExtractionService)
+    container.register_service(ExtractionCacheService)
+    container.register_service(BulkComparisonService)
     container.register_service(DeltaComparisonService)
     container.register_service(CustomerComparisonService)
     container.register_service(ClassificationService)
@@ -256,6 +273,7 @@ def _register_services(container):
     container.register_service(ComparisonPersistenceService)
     container.register_service(ComparisonRetrievalService)
     container.register_service(MergeSummaryService)
+    container.register_service(SummaryCacheService)
 
 
 if __name__ == '__main__':
@@ -22,6 +22,33 @@ class Config:
         SECRET_KEY: Flask secret key for session management (default: 'dev-secret-key-change-in-production')
         AWS_REGION: AWS region for Bedrock services (default: 'us-east-1')
         BEDROCK_KB_ID: Bedrock knowledge base ID (default: 'WAQ6NJLGKN')
+        REQUEST_JOB_WORKERS: Breakdown/verify/create/convert jobs run at the same time (default: 4)
+        REQUEST_JOB_MAX_PENDING: Unfinished jobs before new requests are rejected (default: 50)
+        BEDROCK_CACHE_TTL_SECONDS: Seconds a Bedrock retrieval is reused, 0 = off (default: 300)
+        BEDROCK_CACHE_MAX_ENTRIES: Maximum number of cached Bedrock retrievals (default: 256)
+        MERGE_JOB_WORKERS: Merge workflows run at the same time in the background (default: 2)
+        MERGE_JOB_MAX_PENDING: Unfinished merge workflows before new sessions are rejected (default: 10)
+        CHANGES_PAGE_SIZE: Changes per page of GET /merge/<ref>/changes (default: 100)
+        CHANGES_MAX_PAGE_SIZE: Largest page a client may ask for with per_page (default: 500)
+        EXTRACTION_WORKERS: Worker processes for package XML parsing (default: 0)
+        CONCURRENT_PACKAGE_EXTRACTION: Parse merge packages concurrently (default: 'false')
+        EXTRACTION_BATCH_SIZE: Parsed objects persisted per batch (default: 200)
+        EXTRACTION_CACHE_ENABLED: Reuse extractions of identical ZIPs (default: 'true')
+        EXTRACTION_CACHE_MAX_AGE_DAYS: Days an unused extraction stays cached (default: 30)
+        EXTRACTION_CACHE_MAX_SIZE_MB: Total ZIP size the extraction cache covers (default: 2048)
+        SUMMARY_MAX_CONCURRENCY: Q agent summary batches run at the same time (default: 4)
+        SUMMARY_RATE_LIMIT_PER_MINUTE: Q agent summary invocations per minute (default: 30)
+        SUMMARY_MAX_RETRIES: Retries of a summary batch after a transient failure (default: 2)
+        SUMMARY_RETRY_BACKOFF_SECONDS: Delay before the first summary retry (default: 2.0)
+        SUMMARY_PROMPT_TOKEN_BUDGET: Estimated prompt tokens per summary batch (default: 16000)
+        SUMMARY_CACHE_ENABLED: Reuse AI summaries of identical changes (default: 'true')
+        SUMMARY_CACHE_MAX_AGE_DAYS: Days an unused cached summary is kept (default: 90)
+        SUMMARY_CACHE_MAX_ENTRIES: Maximum number of cached summaries (default: 20000)
+        Q_AGENT_POOL_SIZE: Warm Q agent worker processes, 0 = one process per call (default: 0)
+        Q_AGENT_WORKER_COMMAND: Command of a Q agent worker (default: python -m services.ai.agent_worker)
+        Q_AGENT_TIMEOUT_SECONDS: Time limit of one Q agent call (default: 120)
+        Q_AGENT_MAX_CALLS_PER_WORKER: Calls after which a worker is recycled (default: 100)
+        Q_AGENT_HEALTH_CHECK_SECONDS: Idle time after which a worker is pinged before reuse (default: 60)
     
     Usage:
         # Access configuration values
@@ -83,6 +110,83 @@ class Config:
     
     MERGE_SESSION_TIMEOUT: int = 24 * 60 * 60  # 24 hours in seconds
     """Merge session timeout in seconds (24 hours)"""
+    
+    MERGE_JOB_WORKERS: int = int(os.environ.get('MERGE_JOB_WORKERS', '2'))
+    """Merge workflows (POST /merge/create) processed concurrently in the background"""
+    
+    MERGE_JOB_MAX_PENDING: int = int(os.environ.get('MERGE_JOB_MAX_PENDING', '10'))
+    """Running and queued merge workflows beyond which new sessions are rejected"""
+    
+    CHANGES_PAGE_SIZE: int = int(os.environ.get('CHANGES_PAGE_SIZE', '100'))
+    """Changes returned per page of the working set API when per_page is not given"""
+    
+    CHANGES_MAX_PAGE_SIZE: int = int(os.environ.get('CHANGES_MAX_PAGE_SIZE', '500'))
+    """Largest per_page accepted by the working set API"""
+    
+    EXTRACTION_WORKERS: int = int(os.environ.get('EXTRACTION_WORKERS', '0'))
+    """Worker processes used to parse package XML files (0 or 1 = parse serially)"""
+    
+    CONCURRENT_PACKAGE_EXTRACTION: bool = (
+        os.environ.get('CONCURRENT_PACKAGE_EXTRACTION', 'false').lower() == 'true'
+    )
+    """Unzip and parse the three packages of a merge session concurrently"""
+    
+    EXTRACTION_BATCH_SIZE: int = int(os.environ.get('EXTRACTION_BATCH_SIZE', '200'))
+    """Parsed objects collected before they are bulk-inserted during extraction"""
+    
+    EXTRACTION_CACHE_ENABLED: bool = (
+        os.environ.get('EXTRACTION_CACHE_ENABLED', 'true').lower() == 'true'
+    )
+    """Clone previously extracted packages when the same ZIP is uploaded again"""
+    
+    EXTRACTION_CACHE_MAX_AGE_DAYS: int = int(os.environ.get('EXTRACTION_CACHE_MAX_AGE_DAYS', '30'))
+    """Days since last use after which an extraction cache entry is evicted"""
+    
+    EXTRACTION_CACHE_MAX_SIZE_MB: int = int(os.environ.get('EXTRACTION_CACHE_MAX_SIZE_MB', '2048'))
+    """Total ZIP size of cached extractions; least recently used entries are evicted beyond it"""
+    
+    SUMMARY_MAX_CONCURRENCY: int = int(os.environ.get('SUMMARY_MAX_CONCURRENCY', '4'))
+    """Maximum Q agent summary batches processed concurrently"""
+    
+    SUMMARY_RATE_LIMIT_PER_MINUTE: int = int(os.environ.get('SUMMARY_RATE_LIMIT_PER_MINUTE', '30'))
+    """Maximum Q agent summary invocations started per minute, retries included (0 = unlimited)"""
+    
+    SUMMARY_MAX_RETRIES: int = int(os.environ.get('SUMMARY_MAX_RETRIES', '2'))
+    """Retries of a summary batch after a timeout or unusable agent output"""
+    
+    SUMMARY_RETRY_BACKOFF_SECONDS: float = float(
+        os.environ.get('SUMMARY_RETRY_BACKOFF_SECONDS', '2.0')
+    )
+    """Delay before the first summary retry; doubled for each further retry"""
+    
+    SUMMARY_PROMPT_TOKEN_BUDGET: int = int(os.environ.get('SUMMARY_PROMPT_TOKEN_BUDGET', '16000'))
+    """Estimated prompt tokens of the changes packed into one summary batch (0 = size limit only)"""
+    
+    SUMMARY_CACHE_ENABLED: bool = (
+        os.environ.get('SUMMARY_CACHE_ENABLED', 'true').lower() == 'true'
+    )
+    """Reuse AI summaries of changes with identical prompt inputs across sessions"""
+    
+    SUMMARY_CACHE_MAX_AGE_DAYS: int = int(os.environ.get('SUMMARY_CACHE_MAX_AGE_DAYS', '90'))
+    """Days since last use after which a cached summary is evicted"""
+    
+    SUMMARY_CACHE_MAX_ENTRIES: int = int(os.environ.get('SUMMARY_CACHE_MAX_ENTRIES', '20000'))
+    """Cached summaries kept; least recently used summaries are evicted beyond it"""
+    
+    Q_AGENT_POOL_SIZE: int = int(os.environ.get('Q_AGENT_POOL_SIZE', '0'))
+    """Warm Q agent worker processes (0 = start one q process per call; the pool is opt-in)"""
+    
+    Q_AGENT_WORKER_COMMAND: str = os.environ.get('Q_AGENT_WORKER_COMMAND', '')
+    """Command line of a Q agent worker speaking the agent pool protocol (empty = services.ai.agent_worker)"""
+    
+    Q_AGENT_TIMEOUT_SECONDS: int = int(os.environ.get('Q_AGENT_TIMEOUT_SECONDS', '120'))
+    """Seconds one Q agent call may take"""
+    
+    Q_AGENT_MAX_CALLS_PER_WORKER: int = int(os.environ.get('Q_AGENT_MAX_CALLS_PER_WORKER', '100'))
+    """Calls after which a Q agent worker is replaced (0 = never)"""
+    
+    Q_AGENT_HEALTH_CHECK_SECONDS: int = int(os.environ.get('Q_AGENT_HEALTH_CHECK_SECONDS', '60'))
+    """Idle seconds after which a Q agent worker is pinged before it is reused"""
 
     # Data Source Configuration
     DATA_SOURCE: str = 'BEDROCK'
@@ -94,6 +198,18 @@ class Config:
     
     BEDROCK_KB_ID: str = os.environ.get('BEDROCK_KB_ID', 'WAQ6NJLGKN')
     """Bedrock knowledge base identifier"""
+    
+    REQUEST_JOB_WORKERS: int = int(os.environ.get('REQUEST_JOB_WORKERS', '4'))
+    """Breakdown, verify, create and convert requests processed concurrently in the background"""
+    
+    REQUEST_JOB_MAX_PENDING: int = int(os.environ.get('REQUEST_JOB_MAX_PENDING', '50'))
+    """Queued and running request jobs beyond which new requests are rejected"""
+    
+    BEDROCK_CACHE_TTL_SECONDS: int = int(os.environ.get('BEDROCK_CACHE_TTL_SECONDS', '300'))
+    """Seconds a Bedrock retrieval is reused for the same query (0 = no caching)"""
+    
+    BEDROCK_CACHE_MAX_ENTRIES: int = int(os.environ.get('BEDROCK_CACHE_MAX_ENTRIES', '256'))
+    """Cached Bedrock retrievals kept; least recently used are evicted beyond it"""
 
     @classmethod
     def init_directories(cls) -> None:
@@ -155,6 +271,75 @@ class Config:
         if cls.MERGE_SESSION_TIMEOUT <= 0:
             errors.append("MERGE_SESSION_TIMEOUT must be positive")
         
+        if cls.EXTRACTION_WORKERS < 0:
+            errors.append("EXTRACTION_WORKERS must not be negative")
+        
+        if cls.EXTRACTION_BATCH_SIZE < 1:
+            errors.append("EXTRACTION_BATCH_SIZE must be positive")
+        
+        if cls.EXTRACTION_CACHE_MAX_AGE_DAYS < 1:
+            errors.append("EXTRACTION_CACHE_MAX_AGE_DAYS must be positive")
+        
+        if cls.EXTRACTION_CACHE_MAX_SIZE_MB < 0:
+            errors.append("EXTRACTION_CACHE_MAX_SIZE_MB must not be negative")
+        
+        if cls.MERGE_JOB_WORKERS < 1:
+            errors.append("MERGE_JOB_WORKERS must be positive")
+        
+        if cls.MERGE_JOB_MAX_PENDING < 1:
+            errors.append("MERGE_JOB_MAX_PENDING must be positive")
+        
+        if cls.CHANGES_PAGE_SIZE < 1:
+            errors.append("CHANGES_PAGE_SIZE must be positive")
+        
+        if cls.CHANGES_MAX_PAGE_SIZE < cls.CHANGES_PAGE_SIZE:
+            errors.append("CHANGES_MAX_PAGE_SIZE must be at least CHANGES_PAGE_SIZE")
+        
+        if cls.SUMMARY_MAX_CONCURRENCY < 1:
+            errors.append("SUMMARY_MAX_CONCURRENCY must be positive")
+        
+        if cls.SUMMARY_RATE_LIMIT_PER_MINUTE < 0:
+            errors.append("SUMMARY_RATE_LIMIT_PER_MINUTE must not be negative")
+        
+        if cls.SUMMARY_MAX_RETRIES < 0:
+            errors.append("SUMMARY_MAX_RETRIES must not be negative")
+        
+        if cls.SUMMARY_RETRY_BACKOFF_SECONDS < 0:
+            errors.append("SUMMARY_RETRY_BACKOFF_SECONDS must not be negative")
+        
+        if cls.SUMMARY_PROMPT_TOKEN_BUDGET < 0:
+            errors.append("SUMMARY_PROMPT_TOKEN_BUDGET must not be negative")
+        
+        if cls.SUMMARY_CACHE_MAX_AGE_DAYS < 1:
+            errors.append("SUMMARY_CACHE_MAX_AGE_DAYS must be positive")
+        
+        if cls.SUMMARY_CACHE_MAX_ENTRIES < 0:
+            errors.append("SUMMARY_CACHE_MAX_ENTRIES must not be negative")
+        
+        if cls.REQUEST_JOB_WORKERS < 1:
+            errors.append("REQUEST_JOB_WORKERS must be positive")
+        
+        if cls.REQUEST_JOB_MAX_PENDING < 1:
+            errors.append("REQUEST_JOB_MAX_PENDING must be positive")
+        
+        if cls.BEDROCK_CACHE_TTL_SECONDS < 0:
+            errors.append("BEDROCK_CACHE_TTL_SECONDS must not be negative")
+        
+        if cls.BEDROCK_CACHE_MAX_ENTRIES < 0:
+            errors.append("BEDROCK_CACHE_MAX_ENTRIES must not be negative")
+        
+        if cls.Q_AGENT_POOL_SIZE < 0:
+            errors.append("Q_AGENT_POOL_SIZE must not be negative")
+        
+        if cls.Q_AGENT_TIMEOUT_SECONDS < 1:
+            errors.append("Q_AGENT_TIMEOUT_SECONDS must be positive")
+        
+        if cls.Q_AGENT_MAX_CALLS_PER_WORKER < 0:
+            errors.append("Q_AGENT_MAX_CALLS_PER_WORKER must not be negative")
+        
+        if cls.Q_AGENT_HEALTH_CHECK_SECONDS < 0:
+            errors.append("Q_AGENT_HEALTH_CHECK_SECONDS must not be negative")
+        
         # Validate allowed extensions
         if not cls.ALLOWED_EXTENSIONS:
             errors.append("ALLOWED_EXTENSIONS cannot be empty")
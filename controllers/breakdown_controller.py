@@ -1,12 +1,12 @@
 """
 Breakdown Controller - Handle spec document breakdown
 """
-from flask import Blueprint, request, send_file
+from flask import Blueprint, request, send_file, url_for
 from controllers.base_controller import BaseController
+from core.exceptions import ResourceConstraintException
 from services.request.file_service import FileService
 from services.request.request_service import RequestService
-from services.ai.q_agent_service import QAgentService
-from services.request.document_service import DocumentService
+from services.request.request_job_service import RequestJobService
 from services.excel_service import ExcelService
 import json
 from pathlib import Path
@@ -34,7 +34,12 @@ def index():
 
 @breakdown_bp.route('/upload', methods=['POST'])
 def upload_file():
-    """Handle file upload"""
+    """
+    Handle file upload
+
+    Saves the file and queues the breakdown; returns 202 with a poll URL
+    for the request's progress.
+    """
     try:
         # Validate file presence
         if 'file' not in request.files:
@@ -47,43 +52,31 @@ def upload_file():
         # Access services through base controller
         file_service = controller.get_service(FileService)
         request_service = controller.get_service(RequestService)
-        document_service = controller.get_service(DocumentService)
-        q_agent_service = controller.get_service(QAgentService)
+        job_service = controller.get_service(RequestJobService)
 
         # Create request first to get ID
-        req = request_service.create_request('breakdown', file.filename)
+        req = request_service.create_request(
+            'breakdown', file.filename, status='queued'
+        )
 
         # Save file
         file_path = file_service.save_upload(file, req.id)
 
-        # Extract document content
-        file_content = document_service.extract_content(file_path)
-
-        # Process with Bedrock to get context
-        query_text = (
-            f"Find similar spec breakdowns for: {file_content[:500]}..."
-        )
-        bedrock_response = request_service.process_with_bedrock(
-            req, query_text
-        )
-
-        # Process with Q agent
-        breakdown_data = q_agent_service.process_breakdown(
-            req.id, file_content, bedrock_response
-        )
-
-        # Update request with results
-        request_service.update_request_status(
-            req.id, 'completed', json.dumps(breakdown_data)
-        )
+        # Extract, retrieve context and break down in the background
+        job_service.submit(req.id, 'breakdown', file_path=file_path)
 
         return controller.json_success(
             data={
                 'request_id': req.id,
-                'breakdown_data': breakdown_data
-            }
+                'status': 'queued',
+                'poll_url': url_for('process.request_status', request_id=req.id)
+            },
+            status_code=202
         )
 
+    except ResourceConstraintException as e:
+        request_service.update_request_status(req.id, 'error')
+        return controller.json_error(str(e), status_code=503)
     except Exception as e:
         return controller.handle_error(
             e,
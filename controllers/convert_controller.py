@@ -1,11 +1,11 @@
 """
 Convert Controller - Handle SQL conversion from MariaDB to Oracle
 """
-from flask import Blueprint, request
+from flask import Blueprint, request, url_for
 from controllers.base_controller import BaseController
+from core.exceptions import ResourceConstraintException
 from services.request.request_service import RequestService
-from services.ai.q_agent_service import QAgentService
-import json
+from services.request.request_job_service import RequestJobService
 
 convert_bp = Blueprint('convert', __name__, url_prefix='/convert')
 
@@ -25,11 +25,11 @@ def index():
 
 @convert_bp.route('/process', methods=['POST'])
 def convert_sql():
-    """Convert MariaDB SQL to Oracle format"""
+    """Queue MariaDB to Oracle SQL conversion; returns 202 with a poll URL"""
     try:
         # Access services through base controller
         request_service = controller.get_service(RequestService)
-        q_agent_service = controller.get_service(QAgentService)
+        job_service = controller.get_service(RequestJobService)
         
         data = request.get_json()
         maria_sql = data.get('maria_sql', '').strip()
@@ -38,20 +38,22 @@ def convert_sql():
             return controller.json_error('No SQL script provided', status_code=400)
 
         # Create request
-        req = request_service.create_request('convert', input_text=maria_sql)
+        req = request_service.create_request('convert', input_text=maria_sql, status='queued')
 
-        # Process with Q agent
-        oracle_sql = q_agent_service.process_conversion(req.id, maria_sql)
-
-        # Update request with results
-        request_service.update_request_status(req.id, 'completed', oracle_sql)
+        # Convert in the background
+        job_service.submit(req.id, 'convert', maria_sql=maria_sql)
 
         return controller.json_success(
             data={
                 'request_id': req.id,
-                'oracle_sql': oracle_sql
-            }
+                'status': 'queued',
+                'poll_url': url_for('process.request_status', request_id=req.id)
+            },
+            status_code=202
         )
 
+    except ResourceConstraintException as e:
+        request_service.update_request_status(req.id, 'error')
+        return controller.json_error(str(e), status_code=503)
     except Exception as e:
         return controller.handle_error(e, return_json=True)
@@ -1,10 +1,11 @@
 """
 Create Controller - Handle design document creation
 """
-from flask import Blueprint, request, send_file
+from flask import Blueprint, request, send_file, url_for
 from controllers.base_controller import BaseController
+from core.exceptions import ResourceConstraintException
 from services.request.request_service import RequestService
-from services.ai.q_agent_service import QAgentService
+from services.request.request_job_service import RequestJobService
 from services.word_service import WordService
 import json
 from pathlib import Path
@@ -27,11 +28,11 @@ def index():
 
 @create_bp.route('/generate', methods=['POST'])
 def generate_design():
-    """Generate design document from acceptance criteria"""
+    """Queue design document generation; returns 202 with a poll URL"""
     try:
         # Access services through base controller
         request_service = controller.get_service(RequestService)
-        q_agent_service = controller.get_service(QAgentService)
+        job_service = controller.get_service(RequestJobService)
         
         data = request.get_json()
         acceptance_criteria = data.get('acceptance_criteria', '').strip()
@@ -40,26 +41,23 @@ def generate_design():
             return controller.json_error('No acceptance criteria provided', status_code=400)
 
         # Create request
-        req = request_service.create_request('create', input_text=acceptance_criteria)
+        req = request_service.create_request('create', input_text=acceptance_criteria, status='queued')
 
-        # Process with Bedrock to get context - ask specifically for objects to modify
-        query_text = (f"What objects need to be modified for: {acceptance_criteria}? "
-                      "List the specific components, forms, rules, and services that require changes.")
-        bedrock_response = request_service.process_with_bedrock(req, query_text)
-
-        # Process with Q agent
-        design_data = q_agent_service.process_creation(req.id, acceptance_criteria, bedrock_response)
-
-        # Update request with results
-        request_service.update_request_status(req.id, 'completed', json.dumps(design_data))
+        # Retrieve objects to modify and generate the design in the background
+        job_service.submit(req.id, 'create', acceptance_criteria=acceptance_criteria)
 
         return controller.json_success(
             data={
                 'request_id': req.id,
-                'design_data': design_data
-            }
+                'status': 'queued',
+                'poll_url': url_for('process.request_status', request_id=req.id)
+            },
+            status_code=202
         )
 
+    except ResourceConstraintException as e:
+        request_service.update_request_status(req.id, 'error')
+        return controller.json_error(str(e), status_code=503)
     except Exception as e:
         return controller.handle_error(e, return_json=True)
 
@@ -2,20 +2,27 @@
 Merge Assistant Controller - Handle three-way merge operations
 
 This controller provides REST API endpoints for the three-way merge workflow:
-- Create merge session from 3 packages
+- Create merge session from 3 packages (processed in the background)
+- Re-merge a session against a new customer package
+- Poll or stream merge workflow progress
 - Get merge session summary
 - Get working set of changes
 - Get individual change details
 """
 
+import json
 import os
-from flask import Blueprint, request
+import shutil
+import uuid
+from flask import Blueprint, Response, make_response, request, url_for
 from werkzeug.utils import secure_filename
 
 from controllers.base_controller import BaseController
+from services.merge_job_service import MergeJobService
 from services.three_way_merge_orchestrator import ThreeWayMergeOrchestrator
 from models import db, MergeSession, Change, Package
-from core.exceptions import ThreeWayMergeException
+from repositories.change_repository import ChangeRepository
+from core.exceptions import ResourceConstraintException, ThreeWayMergeException
 from core.logger import get_merge_logger, LoggerConfig
 
 # Create blueprint
@@ -27,12 +34,20 @@ controller = BaseController()
 # Configure logging
 logger = get_merge_logger()
 
+# Seconds between keep-alive comments on an idle progress stream
+PROGRESS_STREAM_HEARTBEAT_SECONDS = 15
+
 
 @merge_bp.route('/create', methods=['POST'])
 def create_merge_session():
     """
     Create a new merge session from three uploaded packages.
     
+    The session is created and its reference_id returned straight away;
+    the merge workflow runs in the background. Follow it with
+    GET /merge/<reference_id>/progress or the Server-Sent-Events stream
+    GET /merge/<reference_id>/progress/stream.
+    
     Expects multipart/form-data with three files:
     - base_package: Package A (Base Version)
     - customized_package: Package B (Customer Version)
@@ -42,19 +57,20 @@ def create_merge_session():
         JSON response with session information:
         {
             "success": true,
-            "message": "Merge session created successfully",
+            "message": "Merge session created - processing in background",
             "data": {
                 "reference_id": "MRG_001",
-                "status": "ready",
-                "total_changes": 42,
-                "session_id": 1
+                "status": "processing",
+                "progress_url": "/merge/MRG_001/progress",
+                "stream_url": "/merge/MRG_001/progress/stream"
             }
         }
         
     Status Codes:
-        201: Session created successfully
+        202: Session created, workflow queued
         400: Invalid request (missing files, invalid file types)
-        500: Server error during processing
+        503: Too many merge sessions are being processed
+        500: Server error
         
     Example:
         >>> import requests
@@ -140,60 +156,55 @@ def create_merge_session():
                 status_code=400
             )
         
-        # Create upload directory if it doesn't exist
-        upload_dir = controller.ensure_directory_exists('uploads/merge')
-        
-        # Save uploaded files with secure filenames
-        base_filename = secure_filename(base_file.filename)
-        customized_filename = secure_filename(customized_file.filename)
-        new_vendor_filename = secure_filename(new_vendor_file.filename)
-        
-        base_path = upload_dir / base_filename
-        customized_path = upload_dir / customized_filename
-        new_vendor_path = upload_dir / new_vendor_filename
-        
-        base_file.save(str(base_path))
-        customized_file.save(str(customized_path))
-        new_vendor_file.save(str(new_vendor_path))
+        # Save uploaded files with secure filenames in a directory of their own
+        upload_dir, (base_path, customized_path, new_vendor_path) = _save_merge_uploads(
+            base=base_file,
+            customized=customized_file,
+            new_vendor=new_vendor_file
+        )
         
         LoggerConfig.log_separator(logger, char="-")
         logger.info("FILES UPLOADED SUCCESSFULLY")
-        logger.info(f"  Base Package: {base_filename} ({os.path.getsize(base_path)} bytes)")
-        logger.info(f"  Customized Package: {customized_filename} ({os.path.getsize(customized_path)} bytes)")
-        logger.info(f"  New Vendor Package: {new_vendor_filename} ({os.path.getsize(new_vendor_path)} bytes)")
+        logger.info(f"  Base Package: {base_path.name} ({os.path.getsize(base_path)} bytes)")
+        logger.info(f"  Customized Package: {customized_path.name} ({os.path.getsize(customized_path)} bytes)")
+        logger.info(f"  New Vendor Package: {new_vendor_path.name} ({os.path.getsize(new_vendor_path)} bytes)")
         LoggerConfig.log_separator(logger, char="-")
         
-        # Get orchestrator service
-        orchestrator = controller.get_service(ThreeWayMergeOrchestrator)
+        # Get job service
+        job_service = controller.get_service(MergeJobService)
         
-        # Create merge session (this runs the entire workflow)
-        logger.info("Initiating three-way merge workflow via orchestrator")
+        # Create merge session; the workflow runs in the background
+        logger.info("Queueing three-way merge workflow")
         
-        session = orchestrator.create_merge_session(
+        progress = job_service.submit(
             base_zip_path=str(base_path),
             customized_zip_path=str(customized_path),
             new_vendor_zip_path=str(new_vendor_path)
         )
+        reference_id = progress.reference_id
         
         LoggerConfig.log_separator(logger, char="-")
-        logger.info("MERGE SESSION CREATED SUCCESSFULLY")
-        logger.info(f"  Reference ID: {session.reference_id}")
-        logger.info(f"  Total Changes: {session.total_changes}")
-        logger.info(f"  Status: {session.status}")
+        logger.info("MERGE SESSION QUEUED")
+        logger.info(f"  Reference ID: {reference_id}")
         LoggerConfig.log_separator(logger, char="-")
         
-        # Return success response
+        # Return accepted response
         return controller.json_success(
             data={
-                'reference_id': session.reference_id,
-                'status': session.status,
-                'total_changes': session.total_changes,
-                'session_id': session.id
+                'reference_id': reference_id,
+                'status': progress.status,
+                'progress_url': url_for('merge.get_merge_progress', reference_id=reference_id),
+                'stream_url': url_for('merge.stream_merge_progress', reference_id=reference_id)
             },
-            message='Merge session created successfully',
-            status_code=201
+            message='Merge session created - processing in background',
+            status_code=202
         )
         
+    except ResourceConstraintException as e:
+        logger.warning(f"Merge session rejected: {e}")
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        return controller.json_error(str(e), status_code=503)
+    
     except ThreeWayMergeException as e:
         LoggerConfig.log_error_with_context(
             logger,
@@ -233,6 +244,258 @@ def create_merge_session():
         )
 
 
+@merge_bp.route('/<reference_id>/remerge', methods=['POST'])
+def remerge_customer_package(reference_id):
+    """
+    Re-merge a session against a new Package B (Customer Version).
+    
+    Packages A and C are kept; only the new customer package is extracted
+    and only objects whose customer version changed are re-classified.
+    Review status and notes of the other changes are preserved. The
+    re-merge runs in the background; follow it like a new session.
+    
+    Expects multipart/form-data with one file:
+    - customized_package: New Package B (Customer Version)
+    
+    Returns:
+        JSON response:
+        {
+            "success": true,
+            "message": "Re-merge started - processing in background",
+            "data": {
+                "reference_id": "MRG_001",
+                "status": "processing",
+                "progress_url": "/merge/MRG_001/progress",
+                "stream_url": "/merge/MRG_001/progress/stream"
+            }
+        }
+    
+    Status Codes:
+        202: Re-merge queued
+        400: Missing or invalid file
+        404: Session not found
+        409: Session is not ready or already being processed
+        503: Too many merge sessions are being processed
+        500: Server error
+    """
+    try:
+        customized_file = request.files.get('customized_package')
+        if customized_file is None or not customized_file.filename:
+            return controller.json_error(
+                'Missing customized_package file',
+                status_code=400
+            )
+        
+        if not controller.validate_file_extension(
+            customized_file.filename, {'zip'}
+        ):
+            return controller.json_error(
+                'customized_package must be a ZIP file',
+                status_code=400
+            )
+        
+        if not db.session.query(MergeSession).filter_by(
+            reference_id=reference_id
+        ).first():
+            return controller.json_error(
+                f'Session {reference_id} not found',
+                status_code=404
+            )
+        
+        upload_dir, (customized_path,) = _save_merge_uploads(
+            customized=customized_file
+        )
+        
+        logger.info(
+            f"Queueing customer package re-merge for session {reference_id}: "
+            f"{customized_path.name} ({os.path.getsize(customized_path)} bytes)"
+        )
+        
+        job_service = controller.get_service(MergeJobService)
+        try:
+            progress = job_service.submit_remerge(
+                reference_id=reference_id,
+                customized_zip_path=str(customized_path)
+            )
+        except ValueError as e:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+            return controller.json_error(str(e), status_code=409)
+        
+        return controller.json_success(
+            data={
+                'reference_id': reference_id,
+                'status': progress.status,
+                'progress_url': url_for('merge.get_merge_progress', reference_id=reference_id),
+                'stream_url': url_for('merge.stream_merge_progress', reference_id=reference_id)
+            },
+            message='Re-merge started - processing in background',
+            status_code=202
+        )
+    
+    except ResourceConstraintException as e:
+        logger.warning(f"Re-merge of session {reference_id} rejected: {e}")
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        return controller.json_error(str(e), status_code=503)
+    
+    except Exception as e:
+        logger.error(f"Error starting re-merge of session {reference_id}: {e}", exc_info=True)
+        return controller.json_error(
+            f"Failed to start re-merge: {str(e)}",
+            status_code=500
+        )
+
+
+def _save_merge_uploads(**files):
+    """
+    Save uploaded packages to a new directory of their own.
+    
+    Each upload gets uploads/merge/<upload id>/<package type>/<filename>, so
+    a later upload never overwrites the ZIPs of a queued or running merge,
+    which are read again when it resumes from a checkpoint.
+    
+    Args:
+        **files: Uploaded files by package type
+    
+    Returns:
+        Tuple of the upload directory and the saved paths, in argument order
+    """
+    upload_dir = controller.ensure_directory_exists(
+        f'uploads/merge/{uuid.uuid4().hex}'
+    )
+    paths = []
+    for package_type, file in files.items():
+        path = controller.ensure_directory_exists(upload_dir / package_type)
+        path = path / secure_filename(file.filename)
+        file.save(str(path))
+        paths.append(path)
+    return upload_dir, paths
+
+
+@merge_bp.route('/<reference_id>/progress', methods=['GET'])
+def get_merge_progress(reference_id):
+    """
+    Get step progress of a merge workflow.
+    
+    Args:
+        reference_id: Session reference ID (e.g., MRG_001)
+        
+    Returns:
+        JSON response with workflow progress:
+        {
+            "success": true,
+            "data": {
+                "reference_id": "MRG_001",
+                "status": "processing",
+                "current_step": 5,
+                "total_steps": 10,
+                "steps": [
+                    {
+                        "step": 2,
+                        "description": "Extracting Package A (Base Version)",
+                        "status": "completed",
+                        "objects_processed": 412,
+                        "elapsed_seconds": 3.21
+                    },
+                    ...
+                ],
+                "elapsed_seconds": 12.4,
+                "version": 9
+            }
+        }
+        
+        Finished workflows add total_changes (status 'ready') or error
+        (status 'error').
+        
+    Status Codes:
+        200: Success
+        404: Session not found
+        500: Server error
+    """
+    try:
+        job_service = controller.get_service(MergeJobService)
+        progress = job_service.get_progress(reference_id)
+        
+        if progress is None:
+            return controller.json_error(
+                f"Session not found: {reference_id}",
+                status_code=404
+            )
+        
+        return controller.json_success(data=progress)
+        
+    except Exception as e:
+        logger.error(f"Error getting merge progress: {e}", exc_info=True)
+        return controller.json_error(
+            f"Failed to get merge progress: {str(e)}",
+            status_code=500
+        )
+
+
+@merge_bp.route('/<reference_id>/progress/stream', methods=['GET'])
+def stream_merge_progress(reference_id):
+    """
+    Stream step progress of a merge workflow as Server-Sent Events.
+    
+    Sends a 'progress' event with the same data as GET
+    /merge/<reference_id>/progress whenever it changes, then one 'done'
+    event once the workflow is ready or failed, and closes the stream.
+    Idle streams get a keep-alive comment every
+    PROGRESS_STREAM_HEARTBEAT_SECONDS.
+    
+    Args:
+        reference_id: Session reference ID (e.g., MRG_001)
+        
+    Status Codes:
+        200: Event stream
+        404: Session not found
+        
+    Example (JavaScript):
+        const source = new EventSource('/merge/MRG_001/progress/stream');
+        source.addEventListener('progress', e => render(JSON.parse(e.data)));
+        source.addEventListener('done', e => source.close());
+    """
+    job_service = controller.get_service(MergeJobService)
+    progress = job_service.get_job(reference_id)
+    
+    if progress is None:
+        # Not running here: report the stored status once
+        data = job_service.get_progress(reference_id)
+        if data is None:
+            return controller.json_error(
+                f"Session not found: {reference_id}",
+                status_code=404
+            )
+        body = _sse_event('progress', data) + _sse_event('done', data)
+        return Response(body, mimetype='text/event-stream')
+    
+    def generate():
+        version = -1
+        while True:
+            current = progress.wait_for_change(
+                version, PROGRESS_STREAM_HEARTBEAT_SECONDS
+            )
+            if current == version and not progress.finished:
+                yield ': keep-alive\n\n'
+                continue
+            version = current
+            data = progress.to_dict()
+            yield _sse_event('progress', data)
+            if progress.finished:
+                yield _sse_event('done', data)
+                return
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format a Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @merge_bp.route('/api/<reference_id>/summary', methods=['GET'])
 def get_merge_summary(reference_id):
     """
@@ -321,17 +584,27 @@ def get_merge_summary(reference_id):
 @merge_bp.route('/<reference_id>/changes', methods=['GET'])
 def get_working_set(reference_id):
     """
-    Get working set of changes for a merge session.
+    Get a page of the working set of changes for a merge session.
     
-    Returns all changes in the working set, optionally filtered by
-    classification. Changes are ordered by display_order.
+    Changes are ordered by display_order and paged with a cursor: pass the
+    next_cursor of one page as 'after' to get the next. Responses carry an
+    ETag built from the session's changes_version, which database triggers
+    bump on every write to its changes; a request whose If-None-Match still
+    matches is answered 304 Not Modified after reading only that counter.
     
     Args:
         reference_id: Session reference ID (e.g., MRG_001)
         
     Query Parameters:
+        after: Cursor - only return changes after this display_order
+        per_page: Page size (default CHANGES_PAGE_SIZE, at most
+                  CHANGES_MAX_PAGE_SIZE)
         classification: Optional comma-separated list of classifications
                        to filter (e.g., "CONFLICT,NEW")
+        status: Optional comma-separated list of review statuses
+        object_type: Optional comma-separated list of object types
+        fields: Optional comma-separated list of fields to return
+                (change_id and display_order are always returned)
         
     Returns:
         JSON response with changes:
@@ -345,80 +618,120 @@ def get_working_set(reference_id):
                         "classification": "CONFLICT",
                         "vendor_change_type": "MODIFIED",
                         "customer_change_type": "MODIFIED",
+                        "status": "pending",
+                        "ai_summary_status": "completed",
                         "object": {
                             "id": 123,
                             "uuid": "abc-123",
                             "name": "MyInterface",
-                            "object_type": "Interface",
-                            "description": "..."
+                            "object_type": "Interface"
                         }
                     },
                     ...
                 ],
                 "total": 42,
-                "filtered": 15
+                "filtered": 15,
+                "next_cursor": 15,
+                "has_more": true
             }
         }
         
     Status Codes:
         200: Success
+        304: Not modified since the ETag in If-None-Match
+        400: Invalid query parameter
         404: Session not found
         500: Server error
         
     Example:
-        >>> # Get all changes
+        >>> # Get the first page
         >>> response = requests.get(
         ...     'http://localhost:5002/merge/MRG_001/changes'
         ... )
         
-        >>> # Get only conflicts
+        >>> # Get the next page of pending conflicts
         >>> response = requests.get(
         ...     'http://localhost:5002/merge/MRG_001/changes',
-        ...     params={'classification': 'CONFLICT'}
+        ...     params={
+        ...         'classification': 'CONFLICT',
+        ...         'status': 'pending',
+        ...         'after': response.json()['data']['next_cursor']
+        ...     }
         ... )
     """
+    from config import Config
+    from domain.entities import WorkingSetRow
+    
     try:
-        # Get classification filter from query params
-        classification_param = request.args.get('classification', '')
-        classification_filter = None
+        # Only the counter is read before deciding on 304
+        session = db.session.query(
+            MergeSession.id,
+            MergeSession.total_changes,
+            MergeSession.changes_version
+        ).filter_by(
+            reference_id=reference_id
+        ).first()
         
-        if classification_param:
-            # Split comma-separated values and strip whitespace
-            classification_filter = [
-                c.strip() for c in classification_param.split(',')
-                if c.strip()
-            ]
+        if not session:
+            return controller.json_error(
+                f"Session not found: {reference_id}",
+                status_code=404
+            )
         
-        # Get orchestrator service
-        orchestrator = controller.get_service(ThreeWayMergeOrchestrator)
+        etag = f"{session.id}-{session.changes_version}"
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
         
-        # Get working set
         try:
-            changes = orchestrator.get_working_set(
-                reference_id=reference_id,
-                classification_filter=classification_filter
-            )
+            after = _int_param('after')
+            per_page = _int_param('per_page', Config.CHANGES_PAGE_SIZE)
         except ValueError as e:
+            return controller.json_error(str(e), status_code=400)
+        
+        if per_page < 1:
             return controller.json_error(
-                str(e),
-                status_code=404
+                "per_page must be a positive integer",
+                status_code=400
             )
+        per_page = min(per_page, Config.CHANGES_MAX_PAGE_SIZE)
+        
+        fields = _list_param('fields')
+        if fields is not None:
+            unknown = set(fields) - set(WorkingSetRow.FIELDS)
+            if unknown:
+                return controller.json_error(
+                    f"Unknown fields: {', '.join(sorted(unknown))}",
+                    status_code=400
+                )
         
-        # Get total count (without filter)
-        session = db.session.query(MergeSession).filter_by(
-            reference_id=reference_id
-        ).first()
-        
-        total_count = session.total_changes if session else 0
+        # Listed columns only, in one joined query; one extra row tells
+        # whether another page follows
+        change_repository = controller.get_repository(ChangeRepository)
+        rows = change_repository.get_working_set_rows(
+            session.id,
+            classifications=_list_param('classification'),
+            statuses=_list_param('status'),
+            object_types=_list_param('object_type'),
+            after_display_order=after,
+            limit=per_page + 1
+        )
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
         
-        # Return success response
-        return controller.json_success(
+        response = make_response(controller.json_success(
             data={
-                'changes': changes,
-                'total': total_count,
-                'filtered': len(changes)
+                'changes': [row.to_dict(fields=fields) for row in rows],
+                'total': session.total_changes,
+                'filtered': len(rows),
+                'next_cursor': rows[-1].display_order if has_more else None,
+                'has_more': has_more
             }
-        )
+        ))
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
         
     except Exception as e:
         logger.error(f"Error getting working set: {e}", exc_info=True)
@@ -428,6 +741,24 @@ def get_working_set(reference_id):
         )
 
 
+def _int_param(name, default=None):
+    """Parse an integer query parameter, or return default if absent."""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+
+def _list_param(name):
+    """Parse a comma-separated query parameter into a list, or None if absent."""
+    value = request.args.get(name, '')
+    values = [item.strip() for item in value.split(',') if item.strip()]
+    return values or None
+
+
 @merge_bp.route('/<reference_id>/changes/<int:change_id>', methods=['GET'])
 def get_change_detail(reference_id, change_id):
     """
@@ -1037,7 +1368,9 @@ def get_summary_progress(reference_id):
     
     Returns statistics about AI summary generation status including
     total changes, completed summaries, processing summaries, failed
-    summaries, and pending summaries.
+    summaries, and pending summaries, plus how long summary write-back
+    has held the database write lock and size and latency histograms of
+    Q agent calls (since process start).
     
     Args:
         reference_id: Session reference ID (e.g., MRG_001)
@@ -1052,7 +1385,21 @@ def get_summary_progress(reference_id):
                 "processing": 3,
                 "failed": 2,
                 "pending": 0,
-                "percentage": 90.0
+                "percentage": 90.0,
+                "write_stats": {
+                    "transactions": 12,
+                    "rows": 90,
+                    "total_lock_ms": 41.3,
+                    "avg_lock_ms": 3.44,
+                    "max_lock_ms": 9.8
+                },
+                "batch_stats": {
+                    "changes": {"count": 6, "mean": 8.5, "max": 15, "buckets": {...}},
+                    "tokens": {"count": 6, "mean": 9120.0, "max": 15870, "buckets": {...}},
+                    "latency_seconds": {"count": 6, "mean": 42.1, "max": 71.3, "buckets": {...}},
+                    "timeouts": 0,
+                    "splits": 0
+                }
             }
         }
         
@@ -1094,6 +1441,9 @@ def get_summary_progress(reference_id):
         else:
             progress['percentage'] = 0
         
+        progress['write_stats'] = merge_summary_service.get_write_stats()
+        progress['batch_stats'] = merge_summary_service.get_batch_stats()
+        
         return controller.json_success(data=progress)
         
     except Exception as e:
@@ -2,9 +2,11 @@
 Process Controller - Handle process history and details
 """
 import json
-from flask import Blueprint, request, Response
+from flask import Blueprint, request, Response, url_for
 from controllers.base_controller import BaseController
+from core.exceptions import ResourceConstraintException
 from services.request.request_service import RequestService
+from services.request.request_job_service import RequestJobService
 
 process_bp = Blueprint('process', __name__, url_prefix='/process')
 
@@ -76,7 +78,27 @@ def details(request_id):
 
     return controller.render('process_details.html',
                              request=req,
-                             timeline_data=timeline_data)
+                             timeline_data=timeline_data,
+                             rag_cache_stats=request_service.bedrock_service.get_cache_stats())
+
+
+@process_bp.route('/status/<int:request_id>')
+def request_status(request_id):
+    """
+    Get the progress of a queued breakdown/verify/create/convert request
+    
+    Returns:
+        JSON response with status ('queued', 'processing', 'completed' or
+        'error'), completed steps with durations, the current step and,
+        once finished, the output or error message
+    """
+    job_service = controller.get_service(RequestJobService)
+    
+    status = job_service.get_job_status(request_id)
+    if status is None:
+        return controller.json_error('Request not found', status_code=404)
+    
+    return controller.json_success(data=status)
 
 
 @process_bp.route('/download/<artifact_type>/<int:request_id>')
@@ -114,11 +136,13 @@ def reprocess_request(request_id):
     """Reprocess a request with the same input"""
     # Access services through base controller
     request_service = controller.get_service(RequestService)
+    job_service = controller.get_service(RequestJobService)
     
     req = request_service.get_request(request_id)
     if not req:
         return controller.json_error('Request not found', status_code=404)
     
+    new_req = None
     try:
         # Create a new request with the same input
         if req.action_type == 'breakdown':
@@ -131,14 +155,18 @@ def reprocess_request(request_id):
             # For verify, use the input_text
             new_req = request_service.create_request(
                 action_type='verify',
-                input_text=req.input_text
+                input_text=req.input_text,
+                status='queued'
             )
+            job_service.submit(new_req.id, 'verify', design_content=req.input_text)
         elif req.action_type == 'create':
             # For create, use the input_text
             new_req = request_service.create_request(
                 action_type='create',
-                input_text=req.input_text
+                input_text=req.input_text,
+                status='queued'
             )
+            job_service.submit(new_req.id, 'create', acceptance_criteria=req.input_text)
         else:
             return controller.json_error(
                 'Unknown action type',
@@ -147,10 +175,15 @@ def reprocess_request(request_id):
         
         return controller.json_success(
             data={
-                'new_request_id': new_req.id
+                'new_request_id': new_req.id,
+                'poll_url': url_for('process.request_status', request_id=new_req.id)
             },
             message='Reprocessing started'
         )
     
+    except ResourceConstraintException as e:
+        if new_req:
+            request_service.update_request_status(new_req.id, 'error')
+        return controller.json_error(str(e), status_code=503)
     except Exception as e:
         return controller.handle_error(e, return_json=True)
@@ -6,6 +6,7 @@ import tempfile
 from flask import Blueprint, send_file, request
 from controllers.base_controller import BaseController
 from services.settings_service import SettingsService
+from services.extraction_cache_service import ExtractionCacheService
 
 settings_bp = Blueprint('settings', __name__)
 
@@ -16,7 +17,10 @@ controller = BaseController()
 @settings_bp.route('/settings')
 def settings_page():
     """Render the settings page"""
-    return controller.render('settings/index.html')
+    return controller.render(
+        'settings/index.html',
+        extraction_cache_stats=controller.get_service(ExtractionCacheService).get_stats()
+    )
 
 
 @settings_bp.route('/settings/cleanup', methods=['POST'])
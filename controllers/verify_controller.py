@@ -1,10 +1,11 @@
 """
 Verify Controller - Handle design document verification
 """
-from flask import Blueprint, request
+from flask import Blueprint, request, url_for
 from controllers.base_controller import BaseController
+from core.exceptions import ResourceConstraintException
 from services.request.request_service import RequestService
-from services.ai.q_agent_service import QAgentService
+from services.request.request_job_service import RequestJobService
 import json
 
 verify_bp = Blueprint('verify', __name__, url_prefix='/verify')
@@ -25,11 +26,11 @@ def index():
 
 @verify_bp.route('/process', methods=['POST'])
 def process_verification():
-    """Process design document verification"""
+    """Queue design document verification; returns 202 with a poll URL"""
     try:
         # Access services through base controller
         request_service = controller.get_service(RequestService)
-        q_agent_service = controller.get_service(QAgentService)
+        job_service = controller.get_service(RequestJobService)
         
         data = request.get_json()
         design_content = data.get('design_content', '').strip()
@@ -38,25 +39,23 @@ def process_verification():
             return controller.json_error('No design content provided', status_code=400)
 
         # Create request
-        req = request_service.create_request('verify', input_text=design_content)
+        req = request_service.create_request('verify', input_text=design_content, status='queued')
 
-        # Process with Bedrock to get context
-        query_text = f"Find existing design documents similar to: {design_content[:500]}..."
-        bedrock_response = request_service.process_with_bedrock(req, query_text)
-
-        # Process with Q agent
-        verification_data = q_agent_service.process_verification(req.id, design_content, bedrock_response)
-
-        # Update request with results
-        request_service.update_request_status(req.id, 'completed', json.dumps(verification_data))
+        # Retrieve context and verify in the background
+        job_service.submit(req.id, 'verify', design_content=design_content)
 
         return controller.json_success(
             data={
                 'request_id': req.id,
-                'verification_data': verification_data
-            }
+                'status': 'queued',
+                'poll_url': url_for('process.request_status', request_id=req.id)
+            },
+            status_code=202
         )
 
+    except ResourceConstraintException as e:
+        request_service.update_request_status(req.id, 'error')
+        return controller.json_error(str(e), status_code=503)
     except Exception as e:
         return controller.handle_error(e, return_json=True)
 
@@ -52,6 +52,36 @@ class TransientException(NexusGenException):
     pass
 
 
+class AgentTimeoutException(TransientException):
+    """
+    Exception for AI agent invocations that exceed their time limit.
+    
+    Raised when an agent call times out; callers may retry it with a
+    smaller request.
+    """
+    pass
+
+
+class AgentWorkerException(TransientException):
+    """
+    Exception for AI agent worker processes that fail mid-request.
+    
+    Raised when a pooled agent worker exits or cannot be written to; the
+    worker is replaced, so the call may be retried.
+    """
+    pass
+
+
+class AgentCancelledException(NexusGenException):
+    """
+    Exception for AI agent invocations cancelled by the caller.
+    
+    Raised when the cancel event of an agent call is set before the
+    agent answers.
+    """
+    pass
+
+
 class XMLParsingException(ValidationException):
     """
     Exception for XML parsing errors.
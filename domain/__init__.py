@@ -17,7 +17,8 @@ from domain.entities import (
     ObjectIdentity,
     DeltaChange,
     CustomerModification,
-    ClassifiedChange
+    ClassifiedChange,
+    WorkingSetRow
 )
 
 from domain.comparison_strategies import (
@@ -35,6 +36,7 @@ __all__ = [
     'DeltaChange',
     'CustomerModification',
     'ClassifiedChange',
+    'WorkingSetRow',
     'VersionComparisonStrategy',
     'ContentComparisonStrategy',
 ]
@@ -6,7 +6,7 @@ between services without coupling to database models.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 from domain.enums import ChangeCategory, Classification, ChangeType
 
 
@@ -264,3 +264,87 @@ class ClassifiedChange:
             )
         if self.display_order < 0:
             raise ValueError("display_order must be non-negative")
+
+
+@dataclass
+class WorkingSetRow:
+    """
+    A change in the working set, as listed for review.
+
+    Holds only the columns the change list shows, read in one query joining
+    changes to object_lookup. Values are the stored strings, not enums.
+
+    Attributes:
+        change_id: Database ID of the change
+        display_order: Order for presenting changes to user
+        classification: Classification (NO_CONFLICT, CONFLICT, DELETED)
+        vendor_change_type: Type of vendor change (optional)
+        customer_change_type: Type of customer change (optional)
+        status: Review status (pending, reviewed, skipped)
+        ai_summary_status: AI summary status
+        object_id: Database ID of the object in object_lookup
+        object_uuid: UUID of the object
+        object_name: Name of the object
+        object_type: Type of Appian object
+        object_description: Description of the object, if it was loaded
+    """
+    change_id: int
+    display_order: int
+    classification: str
+    vendor_change_type: Optional[str]
+    customer_change_type: Optional[str]
+    status: Optional[str]
+    ai_summary_status: Optional[str]
+    object_id: int
+    object_uuid: str
+    object_name: str
+    object_type: str
+    object_description: Optional[str] = None
+
+    # Fields a client may select; change_id and display_order are always sent
+    FIELDS = (
+        'classification',
+        'vendor_change_type',
+        'customer_change_type',
+        'status',
+        'ai_summary_status',
+        'object'
+    )
+
+    def to_dict(
+        self,
+        include_description: bool = False,
+        fields: Optional[Iterable[str]] = None
+    ) -> dict:
+        """
+        Convert to the working set dict returned by the API.
+
+        Args:
+            include_description: Include the object description
+            fields: Only include these of FIELDS (all if None)
+
+        Returns:
+            Dict with change fields and a nested 'object' dict
+        """
+        obj = {
+            'id': self.object_id,
+            'uuid': self.object_uuid,
+            'name': self.object_name,
+            'object_type': self.object_type
+        }
+        if include_description:
+            obj['description'] = self.object_description
+        data = {
+            'change_id': self.change_id,
+            'display_order': self.display_order,
+            'classification': self.classification,
+            'vendor_change_type': self.vendor_change_type,
+            'customer_change_type': self.customer_change_type,
+            'status': self.status,
+            'ai_summary_status': self.ai_summary_status,
+            'object': obj
+        }
+        if fields is not None:
+            keep = {'change_id', 'display_order', *fields}
+            data = {key: value for key, value in data.items() if key in keep}
+        return data
@@ -0,0 +1,71 @@
+"""
+Add changes_version to merge_sessions table
+
+Migration: 010
+Created: October 16, 2026
+Purpose: Count writes to each session's changes with triggers, so the
+         working set API can answer unchanged requests with 304 Not
+         Modified after reading only the counter
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db, CHANGES_VERSION_TRIGGERS
+from app import create_app
+
+
+def upgrade():
+    """Add changes_version column and the triggers that maintain it"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: add_changes_version")
+
+        print("  Adding changes_version column...")
+        db.session.execute(text("""
+            ALTER TABLE merge_sessions
+            ADD COLUMN changes_version INTEGER NOT NULL DEFAULT 0
+        """))
+
+        print("  Creating change triggers...")
+        for trigger_sql in CHANGES_VERSION_TRIGGERS:
+            db.session.execute(text(trigger_sql))
+
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove the change triggers and changes_version column"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting rollback: add_changes_version")
+
+        print("  Dropping change triggers...")
+        for event in ('insert', 'update', 'delete'):
+            db.session.execute(text(
+                f"DROP TRIGGER IF EXISTS trg_changes_version_{event}"
+            ))
+
+        print("  Dropping changes_version column...")
+        db.session.execute(text("""
+            ALTER TABLE merge_sessions
+            DROP COLUMN changes_version
+        """))
+
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
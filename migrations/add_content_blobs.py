@@ -0,0 +1,101 @@
+"""
+Add content_blobs table and blob references
+
+Migration: 006
+Created: October 16, 2026
+Purpose: Store fields, properties and raw_xml of object versions once per
+         distinct content so re-merging the same packages does not grow the
+         database with identical copies
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+# (table, column) pairs that reference content_blobs
+BLOB_REFERENCES = [
+    ('object_versions', 'fields_hash'),
+    ('object_versions', 'properties_hash'),
+    ('object_versions', 'raw_xml_hash'),
+    ('unknown_objects', 'raw_xml_hash'),
+]
+
+
+def upgrade():
+    """Create content_blobs table and add hash columns referencing it"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting migration: add_content_blobs")
+        
+        print("  Creating content_blobs table...")
+        db.session.execute(text("""
+            CREATE TABLE IF NOT EXISTS content_blobs (
+                hash VARCHAR(64) PRIMARY KEY,
+                content TEXT NOT NULL,
+                created_at DATETIME
+            )
+        """))
+        
+        # Existing rows keep their inline content, which is still read
+        # when no blob is referenced
+        for table, column in BLOB_REFERENCES:
+            print(f"  Adding {column} column to {table}...")
+            db.session.execute(text(f"""
+                ALTER TABLE {table} 
+                ADD COLUMN {column} VARCHAR(64) REFERENCES content_blobs(hash)
+            """))
+        
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove hash columns and content_blobs table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting rollback: add_content_blobs")
+        
+        # Copy blob content back inline before dropping the references
+        print("  Restoring inline content...")
+        for table, column in BLOB_REFERENCES:
+            inline_column = column[:-len('_hash')]
+            db.session.execute(text(f"""
+                UPDATE {table} 
+                SET {inline_column} = (
+                    SELECT content FROM content_blobs 
+                    WHERE content_blobs.hash = {table}.{column}
+                )
+                WHERE {column} IS NOT NULL
+            """))
+        
+        for table, column in BLOB_REFERENCES:
+            print(f"  Dropping {column} column from {table}...")
+            db.session.execute(text(f"""
+                ALTER TABLE {table} 
+                DROP COLUMN {column}
+            """))
+        
+        print("  Dropping content_blobs table...")
+        db.session.execute(text("""
+            DROP TABLE IF EXISTS content_blobs
+        """))
+        
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,75 @@
+"""
+Add content_hash to object_versions table
+
+Migration: 005
+Created: October 16, 2026
+Purpose: Store a normalized content hash per object version so comparisons
+         can skip unchanged objects without loading their content
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+def upgrade():
+    """Add content_hash column to object_versions table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting migration: add_content_hash_to_object_versions")
+        
+        # Existing rows keep a NULL hash and are compared in full
+        print("  Adding content_hash column...")
+        db.session.execute(text("""
+            ALTER TABLE object_versions 
+            ADD COLUMN content_hash VARCHAR(64)
+        """))
+        
+        # Add index for hash lookups within a package
+        print("  Creating index on content_hash...")
+        db.session.execute(text("""
+            CREATE INDEX idx_objver_package_hash 
+            ON object_versions (package_id, content_hash)
+        """))
+        
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove content_hash column from object_versions table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting rollback: add_content_hash_to_object_versions")
+        
+        # Drop index
+        print("  Dropping index idx_objver_package_hash...")
+        db.session.execute(text("""
+            DROP INDEX IF EXISTS idx_objver_package_hash
+        """))
+        
+        # Drop column
+        print("  Dropping content_hash column...")
+        db.session.execute(text("""
+            ALTER TABLE object_versions 
+            DROP COLUMN content_hash
+        """))
+        
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,108 @@
+"""
+Add extraction cache
+
+Migration: 007
+Created: October 16, 2026
+Purpose: Reuse extracted packages when an identical ZIP is uploaded again.
+         Adds the extraction_cache table and records the ZIP hash and the
+         cache source on packages
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+def upgrade():
+    """Create extraction_cache table and add cache columns to packages"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting migration: add_extraction_cache")
+        
+        # Existing packages have no hash and never become cache entries
+        print("  Adding zip_hash and cloned_from_package_id columns to packages...")
+        db.session.execute(text("""
+            ALTER TABLE packages 
+            ADD COLUMN zip_hash VARCHAR(64)
+        """))
+        db.session.execute(text("""
+            ALTER TABLE packages 
+            ADD COLUMN cloned_from_package_id INTEGER 
+            REFERENCES packages(id) ON DELETE SET NULL
+        """))
+        db.session.execute(text("""
+            CREATE INDEX ix_packages_zip_hash 
+            ON packages (zip_hash)
+        """))
+        
+        print("  Creating extraction_cache table...")
+        db.session.execute(text("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                id INTEGER PRIMARY KEY,
+                zip_hash VARCHAR(64) NOT NULL,
+                parser_version INTEGER NOT NULL,
+                package_id INTEGER NOT NULL 
+                    REFERENCES packages(id) ON DELETE CASCADE,
+                zip_size INTEGER,
+                hit_count INTEGER,
+                created_at DATETIME,
+                last_used_at DATETIME,
+                CONSTRAINT uq_extraction_cache_zip_parser 
+                    UNIQUE (zip_hash, parser_version)
+            )
+        """))
+        db.session.execute(text("""
+            CREATE INDEX ix_extraction_cache_package_id 
+            ON extraction_cache (package_id)
+        """))
+        db.session.execute(text("""
+            CREATE INDEX ix_extraction_cache_last_used_at 
+            ON extraction_cache (last_used_at)
+        """))
+        
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Drop extraction_cache table and cache columns from packages"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting rollback: add_extraction_cache")
+        
+        print("  Dropping extraction_cache table...")
+        db.session.execute(text("""
+            DROP TABLE IF EXISTS extraction_cache
+        """))
+        
+        print("  Dropping cache columns from packages...")
+        db.session.execute(text("""
+            DROP INDEX IF EXISTS ix_packages_zip_hash
+        """))
+        db.session.execute(text("""
+            ALTER TABLE packages 
+            DROP COLUMN cloned_from_package_id
+        """))
+        db.session.execute(text("""
+            ALTER TABLE packages 
+            DROP COLUMN zip_hash
+        """))
+        
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
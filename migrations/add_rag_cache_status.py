@@ -0,0 +1,61 @@
+"""
+Add rag_cache_status to requests table
+
+Migration: 012
+Created: October 16, 2026
+Purpose: Keep the knowledge base retrieval cache status (hit, miss or
+         coalesced) of each request job, so the process details page can
+         show it after the job has finished
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+def upgrade():
+    """Add rag_cache_status column"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: add_rag_cache_status")
+
+        print("  Adding rag_cache_status column...")
+        db.session.execute(text("""
+            ALTER TABLE requests
+            ADD COLUMN rag_cache_status VARCHAR(20)
+        """))
+
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove rag_cache_status column"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting rollback: add_rag_cache_status")
+
+        print("  Dropping rag_cache_status column...")
+        db.session.execute(text("""
+            ALTER TABLE requests
+            DROP COLUMN rag_cache_status
+        """))
+
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
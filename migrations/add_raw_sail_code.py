@@ -0,0 +1,88 @@
+"""
+Add raw_sail_code_hash to object_versions and purge orphaned object rows
+
+Migration: 011
+Created: October 16, 2026
+Purpose: Keep the unformatted SAIL code of each version as a content blob,
+         so packages cloned from the extraction cache can be formatted with
+         their own session's object lookup. Also deletes object-specific
+         rows left behind by packages deleted before these rows were
+         deleted with their package
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import (
+    db, Package, ProcessModel, ProcessModelFlow,
+    PACKAGE_OBJECT_MODELS, PACKAGE_CHILD_MODELS
+)
+from app import create_app
+
+
+def upgrade():
+    """Add raw_sail_code_hash column and delete orphaned object rows"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: add_raw_sail_code")
+
+        # Existing versions have no unformatted code; the parser version
+        # bump keeps their packages out of the extraction cache
+        print("  Adding raw_sail_code_hash column to object_versions...")
+        db.session.execute(text("""
+            ALTER TABLE object_versions
+            ADD COLUMN raw_sail_code_hash VARCHAR(64)
+            REFERENCES content_blobs(hash)
+        """))
+
+        print("  Deleting object rows of deleted packages...")
+        package_ids = db.select(Package.id)
+        db.session.execute(ProcessModelFlow.__table__.delete().where(
+            ProcessModelFlow.process_model_id.not_in(
+                db.select(ProcessModel.id).where(ProcessModel.package_id.in_(package_ids))
+            )
+        ))
+        for child, parent, foreign_key in PACKAGE_CHILD_MODELS:
+            db.session.execute(child.__table__.delete().where(
+                child.__table__.c[foreign_key].not_in(
+                    db.select(parent.id).where(parent.package_id.in_(package_ids))
+                )
+            ))
+        for model in PACKAGE_OBJECT_MODELS:
+            deleted = db.session.execute(model.__table__.delete().where(
+                model.package_id.not_in(package_ids)
+            )).rowcount
+            print(f"    {model.__tablename__}: {deleted}")
+
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove raw_sail_code_hash column (deleted orphan rows are not restored)"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting rollback: add_raw_sail_code")
+
+        print("  Dropping raw_sail_code_hash column...")
+        db.session.execute(text("""
+            ALTER TABLE object_versions
+            DROP COLUMN raw_sail_code_hash
+        """))
+
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
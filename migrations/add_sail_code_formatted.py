@@ -0,0 +1,76 @@
+"""
+Add sail_code_formatted to packages table
+
+Migration: 013
+Created: October 16, 2026
+Purpose: Record whether a package's SAIL code has been formatted, so a
+         resumed session formats the packages that an earlier concurrent
+         attempt checkpointed unformatted, whatever extraction mode the
+         retry uses
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+def upgrade():
+    """Add sail_code_formatted column"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: add_sail_code_formatted")
+
+        print("  Adding sail_code_formatted column...")
+        db.session.execute(text("""
+            ALTER TABLE packages
+            ADD COLUMN sail_code_formatted BOOLEAN NOT NULL DEFAULT 0
+        """))
+
+        # Packages of sessions past step 4 were formatted there; sessions
+        # checkpointed at step 2 or 3 may have been extracted concurrently,
+        # so their packages are left to be formatted when they resume
+        print("  Marking packages of extracted sessions as formatted...")
+        updated = db.session.execute(text("""
+            UPDATE packages
+            SET sail_code_formatted = 1
+            WHERE session_id NOT IN (
+                SELECT id FROM merge_sessions
+                WHERE completed_step IN (2, 3)
+            )
+        """)).rowcount
+        print(f"    packages: {updated}")
+
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove sail_code_formatted column"""
+    app = create_app()
+
+    with app.app_context():
+        print("Starting rollback: add_sail_code_formatted")
+
+        print("  Dropping sail_code_formatted column...")
+        db.session.execute(text("""
+            ALTER TABLE packages
+            DROP COLUMN sail_code_formatted
+        """))
+
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,62 @@
+"""
+Add completed_step to merge_sessions table
+
+Migration: 009
+Created: October 16, 2026
+Purpose: Record the last merge workflow step each session committed, so a
+         failed session is retried from its first incomplete step instead
+         of re-extracting all three packages
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+def upgrade():
+    """Add completed_step column to merge_sessions table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting migration: add_session_checkpoints")
+        
+        # Existing sessions have no checkpoint and are retried from scratch
+        print("  Adding completed_step column...")
+        db.session.execute(text("""
+            ALTER TABLE merge_sessions 
+            ADD COLUMN completed_step INTEGER DEFAULT 0
+        """))
+        
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Remove completed_step column from merge_sessions table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting rollback: add_session_checkpoints")
+        
+        print("  Dropping completed_step column...")
+        db.session.execute(text("""
+            ALTER TABLE merge_sessions 
+            DROP COLUMN completed_step
+        """))
+        
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
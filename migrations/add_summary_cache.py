@@ -0,0 +1,70 @@
+"""
+Add summary cache
+
+Migration: 008
+Created: October 16, 2026
+Purpose: Reuse AI summaries when the same customer/vendor object pair is
+         summarized again in another merge session. Adds the
+         summary_cache table
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from models import db
+from app import create_app
+
+
+def upgrade():
+    """Create summary_cache table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting migration: add_summary_cache")
+        
+        print("  Creating summary_cache table...")
+        db.session.execute(text("""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                id INTEGER PRIMARY KEY,
+                cache_key VARCHAR(64) NOT NULL UNIQUE,
+                summary TEXT NOT NULL,
+                hit_count INTEGER,
+                created_at DATETIME,
+                last_used_at DATETIME
+            )
+        """))
+        db.session.execute(text("""
+            CREATE INDEX ix_summary_cache_last_used_at 
+            ON summary_cache (last_used_at)
+        """))
+        
+        db.session.commit()
+        print("✓ Migration completed successfully")
+
+
+def downgrade():
+    """Drop summary_cache table"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Starting rollback: add_summary_cache")
+        
+        print("  Dropping summary_cache table...")
+        db.session.execute(text("""
+            DROP TABLE IF EXISTS summary_cache
+        """))
+        
+        db.session.commit()
+        print("✓ Rollback completed successfully")
+
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'downgrade':
+        downgrade()
+    else:
+        upgrade()
@@ -2,12 +2,46 @@
 Database Models
 """
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
 import uuid
 
 db = SQLAlchemy()
 
 
+def blob_backed_property(name):
+    """
+    Build a property for content that is stored in content_blobs.
+    
+    The model needs a `<name>_hash` column referencing content_blobs, a
+    `<name>_blob` relationship and the legacy inline column mapped as
+    `_<name>`. Reads resolve the blob and fall back to the inline column
+    for rows stored before content was deduplicated; writes go to the
+    inline column. In queries the property resolves to the blob content,
+    so it can still be selected like a plain column.
+    """
+    inline_attr = f'_{name}'
+    hash_attr = f'{name}_hash'
+    blob_attr = f'{name}_blob'
+
+    def fget(self):
+        blob = getattr(self, blob_attr)
+        return blob.content if blob is not None else getattr(self, inline_attr)
+
+    def fset(self, value):
+        setattr(self, blob_attr, None)
+        setattr(self, inline_attr, value)
+
+    def expr(cls):
+        blob_content = db.select(ContentBlob.content).where(
+            ContentBlob.hash == getattr(cls, hash_attr)
+        ).scalar_subquery()
+        return db.func.coalesce(blob_content, getattr(cls, inline_attr)).label(name)
+
+    return hybrid_property(fget, fset, expr=expr)
+
+
 class Request(db.Model):
     """Main requests table for breakdown, verify, create actions"""
     __tablename__ = 'requests'
@@ -34,6 +68,7 @@ class Request(db.Model):
     raw_agent_output = db.Column(db.Text)  # Raw Q agent response before cleaning
     q_agent_prompt = db.Column(db.Text)  # Prompt sent to Q agent
     rag_similarity_avg = db.Column(db.Float)  # Average RAG similarity score
+    rag_cache_status = db.Column(db.String(20))  # RAG retrieval cache status: hit, miss or coalesced
     json_valid = db.Column(db.Boolean, default=True)  # JSON validity flag
     error_log = db.Column(db.Text)  # Error messages and retry attempts
 
@@ -51,6 +86,7 @@ class Request(db.Model):
             'model_name': self.model_name,
             'total_time': self.total_time,
             'rag_similarity_avg': self.rag_similarity_avg,
+            'rag_cache_status': self.rag_cache_status,
             'json_valid': self.json_valid
         }
 
@@ -96,6 +132,8 @@ class MergeSession(db.Model):
     skipped_count = db.Column(db.Integer, default=0)
     estimated_complexity = db.Column(db.String(20))
     estimated_time_hours = db.Column(db.Float)
+    completed_step = db.Column(db.Integer, default=0)  # Last merge workflow step checkpointed
+    changes_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Bumped by triggers on every change row write
 
     # Relationships
     packages = db.relationship('Package', backref='session', lazy='dynamic', cascade='all, delete-orphan')
@@ -113,6 +151,8 @@ class MergeSession(db.Model):
             'skipped_count': self.skipped_count,
             'estimated_complexity': self.estimated_complexity,
             'estimated_time_hours': self.estimated_time_hours,
+            'completed_step': self.completed_step,
+            'changes_version': self.changes_version,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
@@ -127,11 +167,15 @@ class Package(db.Model):
     package_type = db.Column(db.String(20), nullable=False)  # base, customized, new_vendor
     filename = db.Column(db.String(500), nullable=False)
     total_objects = db.Column(db.Integer, default=0)
+    zip_hash = db.Column(db.String(64), index=True)  # SHA-256 of the uploaded ZIP
+    cloned_from_package_id = db.Column(db.Integer, db.ForeignKey('packages.id', ondelete='SET NULL'))  # Set when served from the extraction cache
+    sail_code_formatted = db.Column(db.Boolean, nullable=False, default=False)  # SAIL code formatted with the session's object lookup
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
     object_mappings = db.relationship('PackageObjectMapping', backref='package', lazy='dynamic', cascade='all, delete-orphan')
     object_versions = db.relationship('ObjectVersion', backref='package', lazy='dynamic', cascade='all, delete-orphan')
+    extraction_cache_entries = db.relationship('ExtractionCacheEntry', backref='package', lazy='dynamic', cascade='all, delete-orphan')
 
     def to_dict(self):
         return {
@@ -140,10 +184,43 @@ class Package(db.Model):
             'package_type': self.package_type,
             'filename': self.filename,
             'total_objects': self.total_objects,
+            'zip_hash': self.zip_hash,
+            'cloned_from_package_id': self.cloned_from_package_id,
+            'sail_code_formatted': self.sail_code_formatted,
             'created_at': self.created_at.isoformat()
         }
 
 
+class ExtractionCacheEntry(db.Model):
+    """Extracted packages that are reused when an identical ZIP is uploaded again"""
+    __tablename__ = 'extraction_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    zip_hash = db.Column(db.String(64), nullable=False)
+    parser_version = db.Column(db.Integer, nullable=False)
+    package_id = db.Column(db.Integer, db.ForeignKey('packages.id', ondelete='CASCADE'), nullable=False, index=True)
+    zip_size = db.Column(db.Integer, default=0)  # bytes
+    hit_count = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('zip_hash', 'parser_version', name='uq_extraction_cache_zip_parser'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'zip_hash': self.zip_hash,
+            'parser_version': self.parser_version,
+            'package_id': self.package_id,
+            'zip_size': self.zip_size,
+            'hit_count': self.hit_count,
+            'created_at': self.created_at.isoformat(),
+            'last_used_at': self.last_used_at.isoformat() if self.last_used_at else None
+        }
+
+
 class ObjectLookup(db.Model):
     """Global object registry - single source of truth for all objects"""
     __tablename__ = 'object_lookup'
@@ -342,6 +419,59 @@ class Change(db.Model):
         }
 
 
+# Every insert, update or delete of a change bumps its session's
+# changes_version, whichever way the row is written (ORM, bulk or Core
+# statements), so the version can validate cached working set responses.
+CHANGES_VERSION_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_changes_version_{event.lower()}
+    AFTER {event} ON changes
+    BEGIN
+        UPDATE merge_sessions SET changes_version = changes_version + 1
+        WHERE id = {row}.session_id;
+    END
+    """
+    for event, row in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD'))
+]
+
+for trigger_sql in CHANGES_VERSION_TRIGGERS:
+    event.listen(
+        Change.__table__,
+        'after_create',
+        DDL(trigger_sql).execute_if(dialect='sqlite')
+    )
+
+
+class SummaryCacheEntry(db.Model):
+    """AI summaries reused when the same change is summarized in another session"""
+    __tablename__ = 'summary_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    cache_key = db.Column(db.String(64), nullable=False, unique=True)  # SHA-256 of prompt inputs
+    summary = db.Column(db.Text, nullable=False)  # JSON summary data returned by the agent
+    hit_count = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'cache_key': self.cache_key,
+            'hit_count': self.hit_count,
+            'created_at': self.created_at.isoformat(),
+            'last_used_at': self.last_used_at.isoformat() if self.last_used_at else None
+        }
+
+
+class ContentBlob(db.Model):
+    """Content-addressed store for immutable object content shared across packages and sessions"""
+    __tablename__ = 'content_blobs'
+
+    hash = db.Column(db.String(64), primary_key=True)  # SHA-256 of content
+    content = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
 class ObjectVersion(db.Model):
     """Package-specific versions of objects"""
     __tablename__ = 'object_versions'
@@ -351,14 +481,29 @@ class ObjectVersion(db.Model):
     package_id = db.Column(db.Integer, db.ForeignKey('packages.id', ondelete='CASCADE'), nullable=False, index=True)
     version_uuid = db.Column(db.String(255))
     sail_code = db.Column(db.Text)
-    fields = db.Column(db.Text)  # JSON string
-    properties = db.Column(db.Text)  # JSON string
-    raw_xml = db.Column(db.Text)
+    _fields = db.Column('fields', db.Text)  # JSON string, legacy inline content
+    _properties = db.Column('properties', db.Text)  # JSON string, legacy inline content
+    _raw_xml = db.Column('raw_xml', db.Text)  # Legacy inline content
+    fields_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'))
+    properties_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'))
+    raw_xml_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'))
+    raw_sail_code_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'))  # SAIL code before formatting
+    content_hash = db.Column(db.String(64))  # SHA-256 of normalized parsed content
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Relationships
+    fields_blob = db.relationship('ContentBlob', foreign_keys=[fields_hash])
+    properties_blob = db.relationship('ContentBlob', foreign_keys=[properties_hash])
+    raw_xml_blob = db.relationship('ContentBlob', foreign_keys=[raw_xml_hash])
+
+    fields = blob_backed_property('fields')
+    properties = blob_backed_property('properties')
+    raw_xml = blob_backed_property('raw_xml')
+
     __table_args__ = (
         db.UniqueConstraint('object_id', 'package_id', name='uq_object_package'),
         db.Index('idx_objver_object_package', 'object_id', 'package_id'),
+        db.Index('idx_objver_package_hash', 'package_id', 'content_hash'),
     )
 
     def to_dict(self):
@@ -367,6 +512,7 @@ class ObjectVersion(db.Model):
             'object_id': self.object_id,
             'package_id': self.package_id,
             'version_uuid': self.version_uuid,
+            'content_hash': self.content_hash,
             'created_at': self.created_at.isoformat()
         }
 
@@ -785,10 +931,16 @@ class UnknownObject(db.Model):
     uuid = db.Column(db.String(255), nullable=False, index=True)
     name = db.Column(db.String(500), nullable=False)
     version_uuid = db.Column(db.String(255))
-    raw_xml = db.Column(db.Text)
+    _raw_xml = db.Column('raw_xml', db.Text)  # Legacy inline content
+    raw_xml_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'))
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Relationships
+    raw_xml_blob = db.relationship('ContentBlob', foreign_keys=[raw_xml_hash])
+
+    raw_xml = blob_backed_property('raw_xml')
+
     __table_args__ = (
         db.UniqueConstraint('object_id', 'package_id', name='uq_unknown_object_object_package'),
         db.Index('idx_unknown_object_object_package', 'object_id', 'package_id'),
@@ -828,6 +980,66 @@ class DataStoreEntity(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 
+# Object-specific tables with one row per (object_id, package_id), and their
+# child tables as (child, parent, foreign key to the parent). Flows also
+# reference process model nodes and are handled separately.
+PACKAGE_OBJECT_MODELS = [
+    Interface, ExpressionRule, ProcessModel, RecordType, CDT,
+    Integration, WebAPI, Site, Group, Constant, ConnectedSystem,
+    UnknownObject, DataStore
+]
+
+PACKAGE_CHILD_MODELS = [
+    (InterfaceParameter, Interface, 'interface_id'),
+    (InterfaceSecurity, Interface, 'interface_id'),
+    (ExpressionRuleInput, ExpressionRule, 'rule_id'),
+    (ProcessModelNode, ProcessModel, 'process_model_id'),
+    (ProcessModelVariable, ProcessModel, 'process_model_id'),
+    (RecordTypeField, RecordType, 'record_type_id'),
+    (RecordTypeRelationship, RecordType, 'record_type_id'),
+    (RecordTypeView, RecordType, 'record_type_id'),
+    (RecordTypeAction, RecordType, 'record_type_id'),
+    (CDTField, CDT, 'cdt_id'),
+    (DataStoreEntity, DataStore, 'data_store_id'),
+]
+
+
+def delete_package_objects(connection, package_ids):
+    """
+    Delete the object-specific rows and child rows of packages.
+    
+    SQLite does not enforce the ON DELETE CASCADE of these tables, so
+    without this their rows outlive the package and clash with a later
+    package that is given the same id.
+    
+    Args:
+        connection: Connection or Session to execute the deletes on
+        package_ids: IDs of the packages
+    """
+    process_model_ids = db.select(ProcessModel.id).where(
+        ProcessModel.package_id.in_(package_ids)
+    )
+    connection.execute(ProcessModelFlow.__table__.delete().where(
+        ProcessModelFlow.process_model_id.in_(process_model_ids)
+    ))
+    for child, parent, foreign_key in PACKAGE_CHILD_MODELS:
+        connection.execute(child.__table__.delete().where(
+            child.__table__.c[foreign_key].in_(
+                db.select(parent.id).where(parent.package_id.in_(package_ids))
+            )
+        ))
+    for model in PACKAGE_OBJECT_MODELS:
+        connection.execute(model.__table__.delete().where(
+            model.package_id.in_(package_ids)
+        ))
+
+
+@event.listens_for(Package, 'after_delete')
+def _delete_package_objects(mapper, connection, package):
+    """Delete a package's object-specific rows together with the package."""
+    delete_package_objects(connection, [package.id])
+
+
 # ============================================================================
 # Comparison Result Models
 # ============================================================================
@@ -11,6 +11,7 @@ from repositories.package_object_mapping_repository import (
 )
 from repositories.delta_comparison_repository import DeltaComparisonRepository
 from repositories.change_repository import ChangeRepository
+from repositories.content_blob_repository import ContentBlobRepository
 
 # Object-specific repositories
 from repositories.interface_repository import InterfaceRepository
@@ -45,6 +46,7 @@ __all__ = [
     'PackageObjectMappingRepository',
     'DeltaComparisonRepository',
     'ChangeRepository',
+    'ContentBlobRepository',
     # Object-specific repositories
     'InterfaceRepository',
     'ExpressionRuleRepository',
@@ -8,6 +8,7 @@ Stores classified changes for user review.
 from typing import List, Optional, Dict, Any
 from sqlalchemy import func, and_
 from sqlalchemy.orm import joinedload
+from domain.entities import WorkingSetRow
 from models import db, Change, ObjectLookup
 from repositories.base_repository import BaseRepository
 
@@ -25,6 +26,7 @@ class ChangeRepository(BaseRepository[Change]):
         - get_by_session: Get all changes for a session
         - get_by_classification: Filter by classification
         - get_ordered_changes: Get changes in display order
+        - get_working_set_rows: Get the review list (columns only, paged)
     """
     
     def __init__(self):
@@ -217,6 +219,83 @@ class ChangeRepository(BaseRepository[Change]):
             Change.display_order
         ).all()
     
+    def get_working_set_rows(
+        self,
+        session_id: int,
+        classifications: Optional[List[str]] = None,
+        after_display_order: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_description: bool = False,
+        statuses: Optional[List[str]] = None,
+        object_types: Optional[List[str]] = None
+    ) -> List[WorkingSetRow]:
+        """
+        Get the working set for review in one query.
+        
+        Selects only the listed change and object columns (joined with
+        object_lookup), so no Change or ObjectLookup instances are loaded.
+        Pages are keyed on display_order, which stays cheap on the
+        (session_id, display_order) index however deep the page.
+        
+        Args:
+            session_id: Merge session ID
+            classifications: Only include these classifications
+            after_display_order: Only include changes after this position
+                                 (display_order of the previous page's last row)
+            limit: Maximum number of rows
+            include_description: Also select the object description
+            statuses: Only include these review statuses
+            object_types: Only include objects of these types
+        
+        Returns:
+            List of WorkingSetRow ordered by display_order
+        
+        Example:
+            >>> page = repo.get_working_set_rows(session_id=1, limit=50)
+            >>> next_page = repo.get_working_set_rows(
+            ...     session_id=1,
+            ...     after_display_order=page[-1].display_order,
+            ...     limit=50
+            ... )
+        """
+        columns = [
+            Change.id,
+            Change.display_order,
+            Change.classification,
+            Change.vendor_change_type,
+            Change.customer_change_type,
+            Change.status,
+            Change.ai_summary_status,
+            ObjectLookup.id,
+            ObjectLookup.uuid,
+            ObjectLookup.name,
+            ObjectLookup.object_type
+        ]
+        if include_description:
+            columns.append(ObjectLookup.description)
+        
+        query = self.db.session.query(*columns).join(
+            ObjectLookup,
+            Change.object_id == ObjectLookup.id
+        ).filter(
+            Change.session_id == session_id
+        )
+        
+        if classifications:
+            query = query.filter(Change.classification.in_(classifications))
+        if statuses:
+            query = query.filter(Change.status.in_(statuses))
+        if object_types:
+            query = query.filter(ObjectLookup.object_type.in_(object_types))
+        if after_display_order is not None:
+            query = query.filter(Change.display_order > after_display_order)
+        
+        query = query.order_by(Change.display_order)
+        if limit is not None:
+            query = query.limit(limit)
+        
+        return [WorkingSetRow(*row) for row in query]
+    
     def get_by_classification(
         self,
         session_id: int,
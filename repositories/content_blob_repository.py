@@ -0,0 +1,141 @@
+"""
+Content Blob Repository
+
+Provides data access for the content-addressed content_blobs table.
+Identical content is stored once, no matter how many object versions,
+packages or sessions reference it.
+"""
+
+import hashlib
+from typing import Optional, Dict
+from sqlalchemy import select, union
+from models import ContentBlob, ObjectVersion, UnknownObject
+from repositories.base_repository import BaseRepository
+
+
+def compute_blob_hash(content: str) -> str:
+    """
+    Compute the content address of a blob.
+    
+    Args:
+        content: Blob content
+    
+    Returns:
+        SHA-256 hex digest of the UTF-8 encoded content
+    
+    Example:
+        >>> compute_blob_hash('<xml/>')
+        'a1b2...'
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class ContentBlobRepository(BaseRepository[ContentBlob]):
+    """
+    Repository for ContentBlob entities.
+    
+    Blobs are immutable and keyed by the SHA-256 of their content, so
+    storing content that already exists is a no-op.
+    
+    Key Methods:
+        - get_content: Get the content stored under a hash
+        - bulk_store: Store many blobs, skipping ones already present
+        - delete_unreferenced: Delete blobs no row references any more
+    """
+    
+    # Maximum number of hashes per IN clause
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
+    def __init__(self):
+        """Initialize repository with ContentBlob model."""
+        super().__init__(ContentBlob)
+    
+    def get_content(self, content_hash: str) -> Optional[str]:
+        """
+        Get the content stored under a hash.
+        
+        Args:
+            content_hash: SHA-256 hex digest
+        
+        Returns:
+            Blob content or None if no blob has this hash
+        
+        Example:
+            >>> repo.get_content(compute_blob_hash('<xml/>'))
+            '<xml/>'
+        """
+        blob = self.db.session.get(ContentBlob, content_hash)
+        return blob.content if blob else None
+    
+    def bulk_store(self, blobs: Dict[str, str]) -> int:
+        """
+        Store blobs that are not in the table yet.
+        
+        Existing hashes are looked up with one query per chunk and only
+        the missing blobs are inserted, with a single executemany.
+        
+        Args:
+            blobs: Dict mapping content hash -> content
+        
+        Returns:
+            Number of blobs inserted
+        
+        Example:
+            >>> content = '<xml/>'
+            >>> repo.bulk_store({compute_blob_hash(content): content})
+            1
+        """
+        if not blobs:
+            return 0
+        
+        hashes = list(blobs)
+        existing = set()
+        for start in range(0, len(hashes), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = hashes[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            existing.update(
+                row.hash for row in self.db.session.query(ContentBlob.hash).filter(
+                    ContentBlob.hash.in_(chunk)
+                )
+            )
+        
+        new_rows = [
+            {'hash': content_hash, 'content': content}
+            for content_hash, content in blobs.items()
+            if content_hash not in existing
+        ]
+        if new_rows:
+            self.db.session.execute(ContentBlob.__table__.insert(), new_rows)
+        return len(new_rows)
+    
+    def delete_unreferenced(self) -> int:
+        """
+        Delete blobs that no object version or unknown object references.
+        
+        Blobs are shared, so they cannot be deleted together with a
+        package; call this after deleting packages or sessions instead.
+        
+        Returns:
+            Number of blobs deleted
+        
+        Example:
+            >>> db.session.delete(session)
+            >>> repo.delete_unreferenced()
+            12
+        """
+        referenced = union(
+            select(ObjectVersion.fields_hash.label('hash')),
+            select(ObjectVersion.properties_hash),
+            select(ObjectVersion.raw_xml_hash),
+            select(ObjectVersion.raw_sail_code_hash),
+            select(UnknownObject.raw_xml_hash)
+        ).subquery()
+        
+        # NOT IN must not see NULLs, or it matches nothing
+        result = self.db.session.execute(
+            ContentBlob.__table__.delete().where(
+                ContentBlob.hash.not_in(
+                    select(referenced.c.hash).where(referenced.c.hash.is_not(None))
+                )
+            )
+        )
+        return result.rowcount
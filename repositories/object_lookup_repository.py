@@ -143,8 +143,9 @@ class ObjectLookupRepository(BaseRepository[ObjectLookup]):
         
         Processes multiple objects efficiently by:
         1. Fetching all existing objects in one query
-        2. Creating only new objects
-        3. Returning all objects in order
+        2. Updating changed names/descriptions (same as find_or_create)
+        3. Creating only new objects
+        4. Returning all objects in order
         
         Args:
             objects: List of dicts with keys: uuid, name, object_type, description
@@ -173,23 +174,35 @@ class ObjectLookupRepository(BaseRepository[ObjectLookup]):
         # Create lookup map
         existing_map = {obj.uuid: obj for obj in existing_objects}
         
-        # Identify new objects
+        # Identify new objects and update changed existing ones
         new_objects = []
         for obj_data in objects:
-            if obj_data['uuid'] not in existing_map:
+            # Ensure name is never None (NOT NULL constraint)
+            name = obj_data.get('name') or 'Unknown'
+            description = obj_data.get('description')
+            
+            existing = existing_map.get(obj_data['uuid'])
+            if existing is None:
                 new_obj = ObjectLookup(
                     uuid=obj_data['uuid'],
-                    name=obj_data['name'],
+                    name=name,
                     object_type=obj_data['object_type'],
-                    description=obj_data.get('description')
+                    description=description
                 )
                 new_objects.append(new_obj)
                 existing_map[obj_data['uuid']] = new_obj
+            elif existing.id is not None:
+                if existing.name != name:
+                    existing.name = name
+                    self.cache.invalidate_by_uuid(existing.uuid)
+                if description and existing.description != description:
+                    existing.description = description
+                    self.cache.invalidate_by_uuid(existing.uuid)
         
         # Bulk insert new objects
         if new_objects:
             self.db.session.bulk_save_objects(new_objects, return_defaults=True)
-            self.db.session.flush()
+        self.db.session.flush()
         
         # Return objects in original order
         return [existing_map[obj['uuid']] for obj in objects]
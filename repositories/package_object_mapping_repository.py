@@ -5,7 +5,7 @@ Provides data access for package_object_mappings junction table.
 Tracks which objects belong to which packages.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from sqlalchemy import and_
 from sqlalchemy.orm import joinedload
 from models import db, PackageObjectMapping, ObjectLookup, Package
@@ -22,6 +22,7 @@ class PackageObjectMappingRepository(BaseRepository[PackageObjectMapping]):
     Key Methods:
         - create_mapping: Create single package-object mapping
         - bulk_create_mappings: Optimized bulk creation
+        - get_mapped_object_ids: Which of a set of objects a package contains
         - get_objects_in_package: Get all objects for a package
         - get_packages_for_object: Get all packages containing an object
     """
@@ -96,6 +97,38 @@ class PackageObjectMappingRepository(BaseRepository[PackageObjectMapping]):
         self.db.session.bulk_save_objects(mapping_objects)
         self.db.session.flush()
     
+    def get_mapped_object_ids(
+        self,
+        package_id: int,
+        object_ids: List[int]
+    ) -> Set[int]:
+        """
+        Get which of the given objects are already mapped to a package.
+        
+        Uses a single query regardless of how many object IDs are passed.
+        
+        Args:
+            package_id: Package ID
+            object_ids: Object IDs (from object_lookup) to check
+            
+        Returns:
+            Set of object IDs that already have a mapping for the package
+            
+        Example:
+            >>> repo.get_mapped_object_ids(package_id=1, object_ids=[10, 11])
+            {10}
+        """
+        if not object_ids:
+            return set()
+        
+        rows = self.db.session.query(PackageObjectMapping.object_id).filter(
+            and_(
+                PackageObjectMapping.package_id == package_id,
+                PackageObjectMapping.object_id.in_(object_ids)
+            )
+        ).all()
+        return {row.object_id for row in rows}
+    
     def get_objects_in_package(
         self,
         package_id: int
@@ -0,0 +1,387 @@
+"""
+Agent Pool
+
+Keeps warm agent worker processes and sends them prompts over stdin
+instead of starting a new process, with the prompt on argv, per call.
+
+Workers speak a line-delimited JSON protocol on stdin/stdout:
+
+    {"id": 1, "type": "run", "agent": "chat-agent", "prompt": "...", "timeout": 120}
+    {"id": 1, "returncode": 0, "stdout": "...", "stderr": ""}
+
+    {"id": 2, "type": "ping"}
+    {"id": 2, "type": "pong"}
+
+A worker that hits the timeout itself answers {"id": 1, "error": "timeout"}.
+The default worker is services.ai.agent_worker; any command speaking the
+protocol can be configured instead (see tests/stub_agent.py).
+"""
+
+import itertools
+import json
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from core.exceptions import (
+    AgentCancelledException, AgentTimeoutException, AgentWorkerException
+)
+from core.logger import get_merge_logger
+
+
+@dataclass
+class AgentResult:
+    """Output of one agent call, shaped like subprocess.CompletedProcess"""
+    returncode: int
+    stdout: str = ''
+    stderr: str = ''
+
+
+class AgentWorker:
+    """
+    One warm worker process.
+
+    Responses are read by a background thread, so requests can wait with a
+    timeout and be cancelled.
+    """
+
+    # Seconds between checks of the cancel event while waiting
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, command: List[str], cwd: Optional[str] = None):
+        """
+        Start the worker process.
+
+        Args:
+            command: Worker command line
+            cwd: Working directory of the worker
+        """
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=cwd,
+            # Own process group, so stop() also ends the agent it runs
+            start_new_session=os.name == 'posix'
+        )
+        self.calls = 0
+        self.last_used = time.monotonic()
+        self._request_ids = itertools.count(1)
+        self._responses: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    @property
+    def pid(self) -> int:
+        """Process ID of the worker"""
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running"""
+        return self.process.poll() is None
+
+    def request(
+        self,
+        message: Dict[str, Any],
+        timeout: float,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request and wait for its response.
+
+        Args:
+            message: Request without id
+            timeout: Seconds to wait for the response
+            cancel_event: Event that aborts the wait when set
+
+        Returns:
+            Response dictionary
+
+        Raises:
+            AgentTimeoutException: No response within timeout
+            AgentCancelledException: cancel_event was set
+            AgentWorkerException: The worker exited or cannot be written to
+        """
+        request_id = next(self._request_ids)
+        try:
+            self.process.stdin.write(json.dumps(dict(message, id=request_id)) + '\n')
+            self.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise AgentWorkerException(f"Agent worker {self.pid} not writable: {e}") from e
+
+        deadline = time.monotonic() + timeout
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise AgentCancelledException(f"Agent call cancelled on worker {self.pid}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AgentTimeoutException(f"Agent worker {self.pid} timed out after {timeout}s")
+            try:
+                response = self._responses.get(timeout=min(remaining, self.POLL_INTERVAL))
+            except queue.Empty:
+                continue
+            if response is None:
+                raise AgentWorkerException(
+                    f"Agent worker {self.pid} exited with code {self.process.wait()}"
+                )
+            # Responses to abandoned earlier requests are skipped
+            if response.get('id') == request_id:
+                return response
+
+    def stop(self) -> None:
+        """Stop the worker and any agent process it started."""
+        if self.alive:
+            try:
+                if os.name == 'posix':
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                else:
+                    self.process.kill()
+            except OSError:
+                pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self.process.wait()
+
+    def _read_responses(self) -> None:
+        """Queue response lines until the worker closes stdout."""
+        try:
+            for line in self.process.stdout:
+                try:
+                    self._responses.put(json.loads(line))
+                except ValueError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        self._responses.put(None)
+
+
+class AgentPool:
+    """
+    Thread-safe pool of warm agent workers.
+
+    At most `size` calls run at once; further calls wait for a worker.
+    Workers are started on demand and kept idle between calls. A worker
+    is recycled after `max_calls_per_worker` calls, replaced after a
+    timeout, cancellation or crash, and pinged before reuse when it has
+    been idle for `health_check_seconds`.
+
+    Example:
+        >>> pool = AgentPool(['python', '-m', 'services.ai.agent_worker'], size=4)
+        >>> result = pool.run('chat-agent', prompt, timeout=120)
+        >>> print(result.stdout)
+        >>> pool.close()
+    """
+
+    # Seconds a ping may take before the worker is replaced
+    HEALTH_CHECK_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        command: List[str],
+        size: int,
+        max_calls_per_worker: int = 100,
+        health_check_seconds: float = 60.0,
+        timeout_grace: float = 5.0,
+        cwd: Optional[str] = None
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            command: Worker command line
+            size: Maximum number of workers, i.e. concurrent calls
+            max_calls_per_worker: Calls after which a worker is recycled
+                (0 = never)
+            health_check_seconds: Idle time after which a worker is pinged
+                before reuse
+            timeout_grace: Seconds beyond the call timeout to wait for the
+                worker's own timeout response before killing it
+            cwd: Working directory of the workers
+        """
+        self.command = list(command)
+        self.size = max(1, size)
+        self.max_calls_per_worker = max_calls_per_worker
+        self.health_check_seconds = health_check_seconds
+        self.timeout_grace = timeout_grace
+        self.cwd = cwd
+        self.logger = get_merge_logger()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: List[AgentWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {
+            'calls': 0,
+            'timeouts': 0,
+            'cancelled': 0,
+            'worker_failures': 0,
+            'workers_started': 0,
+            'workers_recycled': 0
+        }
+
+    def run(
+        self,
+        agent_name: str,
+        prompt: str,
+        timeout: float,
+        cancel_event: Optional[threading.Event] = None
+    ) -> AgentResult:
+        """
+        Run a prompt on a warm worker.
+
+        Args:
+            agent_name: Name of the Q agent
+            prompt: Prompt text, sent over stdin
+            timeout: Seconds the agent may take
+            cancel_event: Event that cancels the call when set
+
+        Returns:
+            AgentResult of the call
+
+        Raises:
+            AgentTimeoutException: The agent exceeded the timeout
+            AgentCancelledException: cancel_event was set
+            AgentWorkerException: The worker failed mid-request
+        """
+        with self._slots:
+            worker = self._acquire_worker()
+            try:
+                response = worker.request(
+                    {'type': 'run', 'agent': agent_name, 'prompt': prompt, 'timeout': timeout},
+                    timeout + self.timeout_grace,
+                    cancel_event
+                )
+            except AgentTimeoutException:
+                self._discard(worker, 'timeouts')
+                raise
+            except AgentCancelledException:
+                self._discard(worker, 'cancelled')
+                raise
+            except AgentWorkerException:
+                self._discard(worker, 'worker_failures')
+                raise
+
+            self._release(worker)
+            if response.get('error') == 'timeout':
+                self._count('timeouts')
+                raise AgentTimeoutException(f"Q agent timed out after {timeout}s")
+            if 'error' in response:
+                raise AgentWorkerException(f"Agent worker error: {response['error']}")
+            return AgentResult(
+                returncode=response.get('returncode', 1),
+                stdout=response.get('stdout') or '',
+                stderr=response.get('stderr') or ''
+            )
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """
+        Start idle workers ahead of the first calls.
+
+        Args:
+            count: Workers to have idle (default: pool size)
+
+        Returns:
+            Number of workers started
+        """
+        started = 0
+        with self._lock:
+            missing = min(count or self.size, self.size) - len(self._idle)
+        for _ in range(max(0, missing)):
+            worker = self._start_worker()
+            with self._lock:
+                self._idle.append(worker)
+            started += 1
+        return started
+
+    def close(self) -> None:
+        """Stop all idle workers; busy workers stop when their call ends."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict with size, idle, calls, timeouts, cancelled,
+            worker_failures, workers_started and workers_recycled
+        """
+        with self._lock:
+            return dict(self._stats, size=self.size, idle=len(self._idle))
+
+    def _acquire_worker(self) -> AgentWorker:
+        """Take a healthy idle worker or start a new one."""
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise AgentWorkerException("Agent pool is closed")
+                worker = self._idle.pop() if self._idle else None
+            if worker is None:
+                return self._start_worker()
+            if self._healthy(worker):
+                return worker
+            self._discard(worker, 'worker_failures')
+
+    def _healthy(self, worker: AgentWorker) -> bool:
+        """Check a worker is running, pinging it after a long idle period."""
+        if not worker.alive:
+            return False
+        if time.monotonic() - worker.last_used < self.health_check_seconds:
+            return True
+        try:
+            response = worker.request({'type': 'ping'}, self.HEALTH_CHECK_TIMEOUT)
+        except (AgentTimeoutException, AgentWorkerException):
+            return False
+        worker.last_used = time.monotonic()
+        return response.get('type') == 'pong'
+
+    def _start_worker(self) -> AgentWorker:
+        """Start a worker process."""
+        try:
+            worker = AgentWorker(self.command, cwd=self.cwd)
+        except OSError as e:
+            raise AgentWorkerException(f"Cannot start agent worker: {e}") from e
+        self._count('workers_started')
+        self.logger.debug(f"Started agent worker {worker.pid}")
+        return worker
+
+    def _release(self, worker: AgentWorker) -> None:
+        """Return a worker after a completed call, recycling it when worn out."""
+        worker.calls += 1
+        worker.last_used = time.monotonic()
+        with self._lock:
+            self._stats['calls'] += 1
+            recycle = self._closed or (
+                self.max_calls_per_worker and worker.calls >= self.max_calls_per_worker
+            )
+            if not recycle:
+                self._idle.append(worker)
+                return
+            if not self._closed:
+                self._stats['workers_recycled'] += 1
+        self.logger.debug(f"Recycling agent worker {worker.pid} after {worker.calls} calls")
+        worker.stop()
+
+    def _discard(self, worker: AgentWorker, reason: str) -> None:
+        """Stop a worker that cannot be reused."""
+        self._count(reason)
+        self.logger.warning(f"Replacing agent worker {worker.pid} ({reason})")
+        worker.stop()
+
+    def _count(self, key: str) -> None:
+        """Increment a statistics counter."""
+        with self._lock:
+            self._stats[key] += 1
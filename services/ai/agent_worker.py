@@ -0,0 +1,89 @@
+"""
+Agent Worker
+
+Default worker process of the agent pool (see services.ai.agent_pool).
+Reads JSON requests from stdin, one per line, runs each prompt with the
+Q CLI and writes the JSON response to stdout.
+
+The prompt is passed to `q chat` on stdin rather than on the command line,
+so large prompts are not limited by the maximum argument length.
+
+Usage:
+    python -m services.ai.agent_worker
+"""
+
+import json
+import subprocess
+import sys
+from typing import Any, Dict
+
+
+def run_prompt(agent_name: str, prompt: str, timeout: float) -> Dict[str, Any]:
+    """
+    Run one prompt with the Q CLI.
+
+    Args:
+        agent_name: Name of the Q agent
+        prompt: Prompt text
+        timeout: Seconds the agent may take
+
+    Returns:
+        Response with returncode, stdout and stderr, or error 'timeout'
+    """
+    try:
+        result = subprocess.run(
+            ['q', 'chat', '--agent', agent_name, '--no-interactive'],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            input=prompt + '\n'
+        )
+    except subprocess.TimeoutExpired:
+        return {'error': 'timeout'}
+    except OSError as e:
+        return {'returncode': 127, 'stdout': '', 'stderr': str(e)}
+
+    return {
+        'returncode': result.returncode,
+        'stdout': result.stdout,
+        'stderr': result.stderr
+    }
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Handle one protocol request.
+
+    Args:
+        request: Request with id and type ('run' or 'ping')
+
+    Returns:
+        Response carrying the request id
+    """
+    if request.get('type') == 'ping':
+        response = {'type': 'pong'}
+    elif request.get('type') == 'run':
+        response = run_prompt(
+            request['agent'], request['prompt'], float(request.get('timeout', 120))
+        )
+    else:
+        response = {'error': f"unknown request type: {request.get('type')}"}
+    response['id'] = request.get('id')
+    return response
+
+
+def main() -> None:
+    """Serve requests until stdin is closed."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        sys.stdout.write(json.dumps(handle_request(request)) + '\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
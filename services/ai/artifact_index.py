@@ -0,0 +1,228 @@
+"""
+Artifact Index
+
+Loads the application artifact files (object lookup and blueprint) once
+and keeps an inverted token index over object names and descriptions, so
+prompt context is found by ranked lookup instead of scanning every object
+per keyword. Files are re-read when their modification time or size
+changes.
+"""
+
+import bisect
+import heapq
+import json
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Splits names such as "SS_EvaluationForm" into "ss", "evaluation", "form"
+_TOKEN_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+
+# Score of a keyword matching the start of a token rather than all of it
+PREFIX_MATCH_WEIGHT = 0.5
+
+# Shorter keywords only match whole tokens
+MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Object name, description or query text
+
+    Returns:
+        Tokens split at non-alphanumerics and camelCase boundaries
+
+    Example:
+        >>> tokenize("SS_EvaluationForm v2")
+        ['ss', 'evaluation', 'form', 'v', '2']
+    """
+    return [token.lower() for token in _TOKEN_PATTERN.findall(text or '')]
+
+
+class KeywordIndex:
+    """
+    Inverted token index over a list of entries.
+
+    Each field is indexed with a weight; an entry scores the weight of the
+    best field a keyword token matches, half of it when the keyword only
+    matches the start of a token (keywords of at least MIN_PREFIX_LENGTH
+    characters). Ties keep the order of the entries.
+
+    Example:
+        >>> index = KeywordIndex(objects, {'name': 2.0, 'description': 1.0})
+        >>> index.search(['evaluation', 'form'], limit=10)
+    """
+
+    def __init__(self, entries: Sequence[Dict[str, Any]], field_weights: Dict[str, float]):
+        """
+        Build the index.
+
+        Args:
+            entries: Dictionaries to index
+            field_weights: Dict mapping field name -> score of a match in it
+        """
+        self.entries = list(entries)
+        self.field_weights = dict(field_weights)
+        self._postings: Dict[str, Dict[str, List[int]]] = {
+            name: defaultdict(list) for name in self.field_weights
+        }
+        for position, entry in enumerate(self.entries):
+            for name in self.field_weights:
+                for token in set(tokenize(str(entry.get(name) or ''))):
+                    self._postings[name][token].append(position)
+        self._vocabulary = {
+            name: sorted(postings) for name, postings in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        """Number of indexed entries"""
+        return len(self.entries)
+
+    def search(
+        self,
+        keywords: Iterable[str],
+        limit: int,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the entries best matching keywords.
+
+        Args:
+            keywords: Keywords or query words (tokenized like the entries)
+            limit: Maximum number of entries returned
+            fields: Fields to search (default: all indexed fields)
+
+        Returns:
+            Matching entries, highest score first
+        """
+        tokens = {token for keyword in keywords for token in tokenize(keyword)}
+        scores: Dict[int, float] = defaultdict(float)
+
+        for token in tokens:
+            token_scores: Dict[int, float] = {}
+            for name in fields or self.field_weights:
+                weight = self.field_weights[name]
+                for matched, match_weight in self._matching_tokens(name, token):
+                    for position in self._postings[name][matched]:
+                        score = weight * match_weight
+                        if score > token_scores.get(position, 0):
+                            token_scores[position] = score
+            for position, score in token_scores.items():
+                scores[position] += score
+
+        best = heapq.nsmallest(
+            limit, scores.items(), key=lambda item: (-item[1], item[0])
+        )
+        return [self.entries[position] for position, _ in best]
+
+    def _matching_tokens(self, name: str, token: str) -> Iterable[Tuple[str, float]]:
+        """Yield indexed tokens of a field equal to or starting with token."""
+        if len(token) < MIN_PREFIX_LENGTH:
+            if token in self._postings[name]:
+                yield token, 1.0
+            return
+        vocabulary = self._vocabulary[name]
+        start = bisect.bisect_left(vocabulary, token)
+        for indexed in vocabulary[start:]:
+            if not indexed.startswith(token):
+                break
+            yield indexed, 1.0 if indexed == token else PREFIX_MATCH_WEIGHT
+
+
+@dataclass
+class ArtifactSnapshot:
+    """Parsed artifact files and their indexes at one point in time"""
+    generation: int
+    lookup: Dict[str, Any] = field(default_factory=dict)
+    blueprint: Dict[str, Any] = field(default_factory=dict)
+    objects: KeywordIndex = None
+    rules: KeywordIndex = None
+    interfaces: KeywordIndex = None
+
+
+class ApplicationArtifacts:
+    """
+    Thread-safe cache of the application artifact files.
+
+    get() stats the files on every call and only re-parses them and
+    rebuilds the indexes when a file's modification time or size changed.
+
+    Example:
+        >>> artifacts = ApplicationArtifacts(lookup_file, blueprint_file)
+        >>> snapshot = artifacts.get()
+        >>> snapshot.objects.search(['evaluation'], limit=10)
+    """
+
+    # Index weights: a name match counts twice a description match
+    FIELD_WEIGHTS = {'name': 2.0, 'description': 1.0}
+
+    def __init__(self, lookup_file: Path, blueprint_file: Path):
+        """
+        Initialize cache.
+
+        Args:
+            lookup_file: Object lookup JSON (object ID -> object data)
+            blueprint_file: Blueprint JSON with rules and interfaces lists
+        """
+        self.lookup_file = Path(lookup_file)
+        self.blueprint_file = Path(blueprint_file)
+        self.loads = 0
+        self._signature = None
+        self._snapshot: Optional[ArtifactSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ArtifactSnapshot:
+        """
+        Get the current artifacts, re-loading changed files.
+
+        Returns:
+            ArtifactSnapshot (empty indexes for missing files)
+
+        Raises:
+            ValueError: If a file is not valid JSON
+        """
+        signature = (self._file_signature(self.lookup_file),
+                     self._file_signature(self.blueprint_file))
+        with self._lock:
+            if self._snapshot is None or signature != self._signature:
+                self._snapshot = self._load(self.loads + 1)
+                self._signature = signature
+                self.loads += 1
+            return self._snapshot
+
+    def _load(self, generation: int) -> ArtifactSnapshot:
+        """Parse the files and build their indexes."""
+        lookup = self._read_json(self.lookup_file)
+        blueprint = self._read_json(self.blueprint_file)
+        return ArtifactSnapshot(
+            generation=generation,
+            lookup=lookup,
+            blueprint=blueprint,
+            objects=KeywordIndex(list(lookup.values()), self.FIELD_WEIGHTS),
+            rules=KeywordIndex(blueprint.get('rules') or [], self.FIELD_WEIGHTS),
+            interfaces=KeywordIndex(blueprint.get('interfaces') or [], self.FIELD_WEIGHTS)
+        )
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Any]:
+        """Read a JSON file, or an empty dict when it does not exist."""
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Modification time and size of a file, None when missing."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
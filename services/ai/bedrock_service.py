@@ -1,9 +1,12 @@
 """
 Bedrock Knowledge Base RAG Service
 """
+import threading
 from typing import Dict, Any, Optional
 from core.base_service import BaseService
 from core.dependency_container import DependencyContainer
+from core.exceptions import ServiceException
+from services.ai.retrieval_cache import RetrievalCache
 
 try:
     import boto3
@@ -15,20 +18,62 @@ except ImportError:
     ClientError = Exception
 
 
-class BedrockRAGService(BaseService):
-    """Bedrock Knowledge Base RAG service with dependency injection"""
+def normalize_query(query_text: str) -> str:
+    """
+    Normalize query text for the retrieval cache key
+    
+    Args:
+        query_text: Query text as entered
+        
+    Returns:
+        Case-folded query with whitespace collapsed
+    """
+    return ' '.join((query_text or '').split()).casefold()
 
-    def __init__(self, container: Optional[DependencyContainer] = None):
+
+class BedrockRAGService(BaseService):
+    """
+    Bedrock Knowledge Base RAG service with dependency injection
+    
+    Retrievals are cached by (knowledge base, action type, normalized
+    query) for BEDROCK_CACHE_TTL_SECONDS in a cache shared by all
+    instances, and identical concurrent queries share one retrieve call.
+    Responses carry a 'cache' key: 'hit', 'miss' or 'coalesced'.
+    """
+
+    # Shared by all instances; DataSourceFactory creates one per consumer
+    _shared_retrieval_cache: Optional[RetrievalCache] = None
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        container: Optional[DependencyContainer] = None,
+        retrieval_cache: Optional[RetrievalCache] = None
+    ):
         """
         Initialize Bedrock RAG service
         
         Args:
             container: Dependency injection container
+            retrieval_cache: Cache to use instead of the shared one
         """
         super().__init__(container)
         self.bedrock_client = None
+        self.retrieval_cache = retrieval_cache or self._get_shared_retrieval_cache()
         self._initialize_bedrock_client()
 
+    @classmethod
+    def _get_shared_retrieval_cache(cls) -> RetrievalCache:
+        """Get the process-wide retrieval cache, creating it from Config"""
+        with cls._cache_lock:
+            if cls._shared_retrieval_cache is None:
+                from config import Config
+                cls._shared_retrieval_cache = RetrievalCache(
+                    ttl_seconds=Config.BEDROCK_CACHE_TTL_SECONDS,
+                    max_entries=Config.BEDROCK_CACHE_MAX_ENTRIES
+                )
+            return cls._shared_retrieval_cache
+
     def _initialize_dependencies(self):
         """Initialize service dependencies"""
         # Get configuration from container if needed
@@ -61,25 +106,20 @@ class BedrockRAGService(BaseService):
             query_text: Query text to search for
             
         Returns:
-            Dictionary containing query results with status, results, and summary
+            Dictionary containing query results with status, results, summary
+            and cache status (fallback responses are never cached)
         """
         if not self.bedrock_client:
             return self._get_fallback_response(action_type)
 
         try:
             from config import Config
-            # Use retrieve method to get detailed KB results like direct testing
-            response = self.bedrock_client.retrieve(
-                knowledgeBaseId=Config.BEDROCK_KB_ID,
-                retrievalQuery={'text': query_text},
-                retrievalConfiguration={
-                    'vectorSearchConfiguration': {
-                        'numberOfResults': 10
-                    }
-                }
+            response, cache_status = self.retrieval_cache.get_or_load(
+                (Config.BEDROCK_KB_ID, action_type, normalize_query(query_text)),
+                lambda: self._retrieve(action_type, query_text)
             )
-
-            return self._format_retrieve_response(response, action_type)
+            response['cache'] = cache_status
+            return response
 
         except ClientError:
             # Bedrock API error
@@ -88,6 +128,47 @@ class BedrockRAGService(BaseService):
             # Unexpected error
             return self._get_fallback_response(action_type)
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get retrieval cache statistics
+        
+        Returns:
+            Dict with entries, hits, misses, coalesced, expired, evicted
+            and hit_rate (since process start)
+        """
+        return self.retrieval_cache.get_stats()
+
+    def _retrieve(self, action_type: str, query_text: str) -> Dict[str, Any]:
+        """
+        Retrieve and format Knowledge Base results
+        
+        Args:
+            action_type: Type of action for context
+            query_text: Query text to search for
+            
+        Returns:
+            Formatted response dictionary
+            
+        Raises:
+            ServiceException: If the response cannot be formatted
+        """
+        from config import Config
+        # Use retrieve method to get detailed KB results like direct testing
+        response = self.bedrock_client.retrieve(
+            knowledgeBaseId=Config.BEDROCK_KB_ID,
+            retrievalQuery={'text': query_text},
+            retrievalConfiguration={
+                'vectorSearchConfiguration': {
+                    'numberOfResults': 10
+                }
+            }
+        )
+
+        formatted = self._format_retrieve_response(response, action_type)
+        if formatted.get('status') != 'success':
+            raise ServiceException("Unusable Bedrock retrieve response")
+        return formatted
+
     def _format_retrieve_response(self, bedrock_response: dict, action_type: str) -> Dict[str, Any]:
         """
         Format Bedrock retrieve response to match expected structure
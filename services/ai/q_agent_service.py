@@ -1,13 +1,33 @@
 """
 Q Agent Service - Handle Amazon Q CLI agent interactions
 """
+import atexit
+import shlex
 import subprocess
 import json
+import sys
 import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from core.base_service import BaseService
 from core.dependency_container import DependencyContainer
+from core.exceptions import AgentTimeoutException, TransientException
+from services.ai.agent_pool import AgentPool, AgentResult
+from services.ai.artifact_index import ApplicationArtifacts
+
+
+# Q agent that writes merge summaries
+MERGE_SUMMARY_AGENT = "merge-summary-agent"
+
+# Keywords that make artifact objects relevant to every request
+RELEVANT_OBJECT_KEYWORDS = ['evaluation', 'create', 'form', 'settings', 'award', 'type']
+BLUEPRINT_KEYWORDS = ['evaluation', 'create', 'form', 'settings']
+ARTIFACTS_SUMMARY_KEYWORDS = ['evaluation', 'create', 'form']
+
+# Version of the merge summary prompt. Bump it whenever
+# _create_merge_summary_prompt changes, so cached summaries are not reused.
+MERGE_SUMMARY_PROMPT_VERSION = 1
 
 
 class QAgentService(BaseService):
@@ -22,19 +42,59 @@ class QAgentService(BaseService):
         """
         super().__init__(container)
         self._artifacts_context = None
+        self._artifacts_context_generation = None
+        self._artifacts_summary_generation = None
+        self._application_artifacts = None
+        self._agent_pool = None
+        self._agent_pool_lock = threading.Lock()
 
     def _initialize_dependencies(self):
         """Initialize service dependencies"""
         # Get configuration from container if needed
         pass
 
+    @property
+    def application_artifacts(self) -> ApplicationArtifacts:
+        """Parsed and indexed application artifact files"""
+        if self._application_artifacts is None:
+            artifacts_dir = self._artifacts_dir()
+            self._application_artifacts = ApplicationArtifacts(
+                artifacts_dir / "SourceSelectionv2.6.0_object_lookup.json",
+                artifacts_dir / "SourceSelectionv2.6.0_blueprint.json"
+            )
+        return self._application_artifacts
+
     @property
     def artifacts_context(self) -> str:
-        """Lazy load application artifacts"""
-        if self._artifacts_context is None:
+        """Lazy load application artifacts, rebuilt when the files change"""
+        try:
+            generation = self.application_artifacts.get().generation
+        except Exception:
+            generation = None
+        if self._artifacts_context is None or generation != self._artifacts_context_generation:
             self._artifacts_context = self._load_application_artifacts()
+            self._artifacts_context_generation = generation
         return self._artifacts_context
 
+    @property
+    def agent_pool(self) -> AgentPool:
+        """Lazily started pool of warm Q agent workers"""
+        with self._agent_pool_lock:
+            if self._agent_pool is None:
+                from config import Config
+                command = shlex.split(Config.Q_AGENT_WORKER_COMMAND) or [
+                    sys.executable, '-m', 'services.ai.agent_worker'
+                ]
+                self._agent_pool = AgentPool(
+                    command,
+                    size=Config.Q_AGENT_POOL_SIZE,
+                    max_calls_per_worker=Config.Q_AGENT_MAX_CALLS_PER_WORKER,
+                    health_check_seconds=Config.Q_AGENT_HEALTH_CHECK_SECONDS,
+                    cwd=str(Config.BASE_DIR)
+                )
+                atexit.register(self._agent_pool.close)
+            return self._agent_pool
+
     def process_breakdown(self, request_id: int, file_content: str, bedrock_context: dict) -> dict:
         """
         Process spec breakdown using Q agent
@@ -243,13 +303,22 @@ class QAgentService(BaseService):
             self._update_request_field(request_id, 'error_log', error_msg)
             return self._generate_fallback_conversion(maria_sql)
 
-    def process_merge_summaries(self, session_id: int, changes_data: list) -> dict:
+    def process_merge_summaries(
+        self,
+        session_id: int,
+        changes_data: list,
+        use_fallback: bool = True
+    ) -> dict:
         """
         Process merge changes and generate AI summaries
         
         Args:
             session_id: Merge session ID
             changes_data: List of change dictionaries with version data
+            use_fallback: Return fallback summaries when the agent fails.
+                When False, failures are raised instead; timeouts raise
+                AgentTimeoutException and unusable agent output raises
+                TransientException.
             
         Returns:
             Dict mapping change_id to summary data
@@ -264,7 +333,7 @@ class QAgentService(BaseService):
             prompt = self._create_merge_summary_prompt(changes_data)
             
             # Execute Q agent
-            result = self._execute_q_agent("merge-summary-agent", prompt)
+            result = self._execute_q_agent(MERGE_SUMMARY_AGENT, prompt)
             
             # Parse JSON from output
             json_output = self._extract_json_from_output(result)
@@ -277,45 +346,83 @@ class QAgentService(BaseService):
                     if change_id:
                         summaries_dict[change_id] = summary
                 return summaries_dict
-            else:
-                # Generate fallback summaries
-                return self._generate_fallback_summaries(changes_data)
+            
+            raise TransientException(
+                f"Q agent returned no summaries (exit code {result.returncode})"
+            )
                 
         except Exception as e:
+            if not use_fallback:
+                raise
             print(f"Merge summary generation failed: {e}")
             return self._generate_fallback_summaries(changes_data)
 
-    def _execute_q_agent(self, agent_name: str, prompt: str) -> subprocess.CompletedProcess:
+    def fallback_merge_summaries(self, changes_data: list) -> dict:
+        """
+        Generate classification-based summaries without calling the agent
+        
+        Args:
+            changes_data: List of change dictionaries
+            
+        Returns:
+            Dict mapping change_id to summary data
+        """
+        return self._generate_fallback_summaries(changes_data)
+
+    def _execute_q_agent(
+        self,
+        agent_name: str,
+        prompt: str,
+        cancel_event: Optional[threading.Event] = None
+    ) -> AgentResult:
         """
         Execute Q CLI agent with prompt
         
+        Runs on a warm worker of the agent pool, or in a new q process
+        when Q_AGENT_POOL_SIZE is 0.
+        
         Args:
             agent_name: Name of the Q agent to execute
             prompt: Prompt text for the agent
+            cancel_event: Event that cancels a pooled call when set
             
         Returns:
-            Completed process result
+            Agent call result
+            
+        Raises:
+            AgentTimeoutException: The agent exceeded Q_AGENT_TIMEOUT_SECONDS
         """
         from config import Config
-        cmd = ['q', 'chat', '--agent', agent_name, '--no-interactive', prompt]
+        if Config.Q_AGENT_POOL_SIZE > 0:
+            return self.agent_pool.run(
+                agent_name,
+                prompt,
+                timeout=Config.Q_AGENT_TIMEOUT_SECONDS,
+                cancel_event=cancel_event
+            )
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(Config.BASE_DIR),
-            timeout=120,  # Increased from 60 to 120 seconds
-            input='\n'  # Send newline to handle any interactive prompts
-        )
-
-        return result
+        cmd = ['q', 'chat', '--agent', agent_name, '--no-interactive', prompt]
 
-    def _extract_json_from_output(self, result: subprocess.CompletedProcess) -> dict:
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=str(Config.BASE_DIR),
+                timeout=Config.Q_AGENT_TIMEOUT_SECONDS,
+                input='\n'  # Send newline to handle any interactive prompts
+            )
+        except subprocess.TimeoutExpired as e:
+            raise AgentTimeoutException(f"Q agent timed out after {e.timeout}s") from e
+
+        return AgentResult(result.returncode, result.stdout, result.stderr)
+
+    def _extract_json_from_output(self, result: AgentResult) -> dict:
         """
         Extract JSON from Q agent output
         
         Args:
-            result: Completed process result
+            result: Agent call result
             
         Returns:
             Parsed JSON dictionary or None if extraction fails
@@ -360,12 +467,12 @@ class QAgentService(BaseService):
             print(f"Clean output preview: {clean_output[:500]}")
             return None
 
-    def _extract_sql_from_output(self, result: subprocess.CompletedProcess) -> str:
+    def _extract_sql_from_output(self, result: AgentResult) -> str:
         """
         Extract SQL from Q agent output
         
         Args:
-            result: Completed process result
+            result: Agent call result
             
         Returns:
             Extracted SQL string or None if extraction fails
@@ -712,44 +819,38 @@ OUTPUT FORMAT:
                 "information available in the knowledge base to provide a detailed answer. "
                 "Could you try rephrasing your question or provide more context?")
 
+    def _artifacts_dir(self) -> Path:
+        """Directory of the application artifact files"""
+        from config import Config
+        return Path(Config.BASE_DIR) / "applicationArtifacts" / "Source Selection"
+
     def _load_application_artifacts(self) -> str:
         """Load application artifacts for object definitions and dependencies"""
         try:
-            from config import Config
-            artifacts_dir = Path(Config.BASE_DIR) / "applicationArtifacts" / "Source Selection"
-            blueprint_file = artifacts_dir / "SourceSelectionv2.6.0_blueprint.json"
-            lookup_file = artifacts_dir / "SourceSelectionv2.6.0_object_lookup.json"
+            artifacts = self.application_artifacts.get()
             
             artifacts_info = "APPLICATION ARTIFACTS - SOURCE SELECTION v2.6.0:\n"
             
-            if blueprint_file.exists():
-                with open(blueprint_file, 'r', encoding='utf-8') as f:
-                    blueprint_data = json.load(f)
-                    
-                    # Add sample rule names if available
-                    if 'rules' in blueprint_data and blueprint_data['rules']:
-                        sample_rules = [rule.get('name', 'Unnamed') for rule in blueprint_data['rules'][:3]]
-                        artifacts_info += f"Sample Rules: {', '.join(sample_rules)}\n"
+            # Add sample rule names if available
+            if artifacts.blueprint.get('rules'):
+                sample_rules = [rule.get('name', 'Unnamed') for rule in artifacts.blueprint['rules'][:3]]
+                artifacts_info += f"Sample Rules: {', '.join(sample_rules)}\n"
             
-            if lookup_file.exists():
-                with open(lookup_file, 'r', encoding='utf-8') as f:
-                    lookup_data = json.load(f)
-                    
-                    # Get sample objects by type
-                    sample_objects = {}
-                    for obj_id, obj_data in list(lookup_data.items())[:50]:  # Sample first 50
-                        obj_type = obj_data.get('object_type', 'Unknown')
-                        obj_name = obj_data.get('name', 'Unnamed')
-                        
-                        if obj_type not in sample_objects:
-                            sample_objects[obj_type] = []
-                        if len(sample_objects[obj_type]) < 2:
-                            sample_objects[obj_type].append(obj_name)
-                    
-                    # Add key object types
-                    for obj_type in ['Expression Rule', 'Interface', 'Constant']:
-                        if obj_type in sample_objects:
-                            artifacts_info += f"{obj_type}s: {', '.join(sample_objects[obj_type])}\n"
+            # Get sample objects by type
+            sample_objects = {}
+            for obj_data in artifacts.objects.entries[:50]:  # Sample first 50
+                obj_type = obj_data.get('object_type', 'Unknown')
+                obj_name = obj_data.get('name', 'Unnamed')
+                
+                if obj_type not in sample_objects:
+                    sample_objects[obj_type] = []
+                if len(sample_objects[obj_type]) < 2:
+                    sample_objects[obj_type].append(obj_name)
+            
+            # Add key object types
+            for obj_type in ['Expression Rule', 'Interface', 'Constant']:
+                if obj_type in sample_objects:
+                    artifacts_info += f"{obj_type}s: {', '.join(sample_objects[obj_type])}\n"
             
             artifacts_info += "Use these artifacts for specific object names and relationships.\n"
             return artifacts_info
@@ -758,75 +859,41 @@ OUTPUT FORMAT:
             return f"APPLICATION ARTIFACTS: Error loading - {str(e)}\n"
 
     def _get_relevant_objects(self, query_text: str, max_objects: int = 10) -> str:
-        """Get relevant objects from artifacts based on query text"""
+        """
+        Get relevant objects from artifacts based on query text
+        
+        Objects are ranked by how many keywords match their name or
+        description, using the keyword index of the cached artifacts.
+        """
         try:
-            from config import Config
-            artifacts_dir = Path(Config.BASE_DIR) / "applicationArtifacts" / "Source Selection"
-            lookup_file = artifacts_dir / "SourceSelectionv2.6.0_object_lookup.json"
-            blueprint_file = artifacts_dir / "SourceSelectionv2.6.0_blueprint.json"
+            artifacts = self.application_artifacts.get()
             
             result = "DETAILED ARTIFACTS INFORMATION:\n\n"
             
             # Get relevant objects from lookup
-            if lookup_file.exists():
-                with open(lookup_file, 'r', encoding='utf-8') as f:
-                    lookup_data = json.load(f)
-                
-                keywords = ['evaluation', 'create', 'form', 'settings', 'award', 'type'] + query_text.lower().split()
-                relevant_objects = []
-                
-                for obj_id, obj_data in lookup_data.items():
-                    obj_name = obj_data.get('name', '').lower()
-                    obj_desc = obj_data.get('description', '').lower()
-                    
-                    if any(keyword in obj_name or keyword in obj_desc for keyword in keywords):
-                        relevant_objects.append({
-                            'name': obj_data.get('name', 'Unnamed'),
-                            'type': obj_data.get('object_type', 'Unknown'),
-                            'description': obj_data.get('description', 'No description')
-                        })
-                    
-                    if len(relevant_objects) >= max_objects:
-                        break
-                
-                if relevant_objects:
-                    result += "RELEVANT OBJECTS FROM LOOKUP:\n"
-                    for obj in relevant_objects:
-                        result += f"- {obj['name']} ({obj['type']})\n"
-                        result += f"  Description: {obj['description'][:150]}...\n\n"
+            keywords = RELEVANT_OBJECT_KEYWORDS + query_text.lower().split()
+            relevant_objects = artifacts.objects.search(keywords, max_objects)
             
-            # Get relevant rules from blueprint
-            if blueprint_file.exists():
-                with open(blueprint_file, 'r', encoding='utf-8') as f:
-                    blueprint_data = json.load(f)
-                
-                if 'rules' in blueprint_data:
-                    result += "RELEVANT RULES FROM BLUEPRINT:\n"
-                    rule_count = 0
-                    for rule in blueprint_data['rules']:
-                        rule_name = rule.get('name', '').lower()
-                        if any(keyword in rule_name for keyword in ['evaluation', 'create', 'form', 'settings']):
-                            result += f"- {rule.get('name', 'Unnamed Rule')}\n"
-                            if 'description' in rule:
-                                result += f"  Description: {rule['description'][:100]}...\n"
-                            result += "\n"
-                            rule_count += 1
-                            if rule_count >= 5:
-                                break
-                
-                if 'interfaces' in blueprint_data:
-                    result += "RELEVANT INTERFACES FROM BLUEPRINT:\n"
-                    interface_count = 0
-                    for interface in blueprint_data['interfaces']:
-                        interface_name = interface.get('name', '').lower()
-                        if any(keyword in interface_name for keyword in ['evaluation', 'create', 'form', 'settings']):
-                            result += f"- {interface.get('name', 'Unnamed Interface')}\n"
-                            if 'description' in interface:
-                                result += f"  Description: {interface['description'][:100]}...\n"
-                            result += "\n"
-                            interface_count += 1
-                            if interface_count >= 5:
-                                break
+            if relevant_objects:
+                result += "RELEVANT OBJECTS FROM LOOKUP:\n"
+                for obj_data in relevant_objects:
+                    result += f"- {obj_data.get('name', 'Unnamed')} ({obj_data.get('object_type', 'Unknown')})\n"
+                    result += f"  Description: {obj_data.get('description', 'No description')[:150]}...\n\n"
+            
+            # Get relevant rules and interfaces from blueprint
+            for section, label, index in [
+                ('rules', 'RULES', artifacts.rules),
+                ('interfaces', 'INTERFACES', artifacts.interfaces)
+            ]:
+                if section not in artifacts.blueprint:
+                    continue
+                result += f"RELEVANT {label} FROM BLUEPRINT:\n"
+                default_name = f"Unnamed {label[:-1].title()}"
+                for item in index.search(BLUEPRINT_KEYWORDS, 5, fields=('name',)):
+                    result += f"- {item.get('name', default_name)}\n"
+                    if 'description' in item:
+                        result += f"  Description: {item['description'][:100]}...\n"
+                    result += "\n"
             
             return result
             
@@ -834,46 +901,39 @@ OUTPUT FORMAT:
             return f"ARTIFACTS ERROR: {str(e)}\n"
 
     def _prepare_artifacts_for_q(self, query_text: str) -> str:
-        """Prepare artifacts information in a format Q can access"""
+        """
+        Prepare artifacts information in a format Q can access
+        
+        The summary file only depends on the artifact files, so it is
+        rewritten only when they change.
+        """
         try:
             from config import Config
-            artifacts_dir = Path(Config.BASE_DIR) / "applicationArtifacts" / "Source Selection"
+            artifacts_dir = self._artifacts_dir()
+            temp_file = Path(Config.BASE_DIR) / "temp_artifacts_summary.txt"
+            artifacts = self.application_artifacts.get()
             
-            # Create a summary file for Q to reference
-            summary_content = f"""SOURCE SELECTION APPLICATION ARTIFACTS SUMMARY
+            if artifacts.generation != self._artifacts_summary_generation or not temp_file.exists():
+                # Create a summary file for Q to reference
+                summary_content = f"""SOURCE SELECTION APPLICATION ARTIFACTS SUMMARY
 
 BLUEPRINT FILE: {artifacts_dir}/SourceSelectionv2.6.0_blueprint.json
 LOOKUP FILE: {artifacts_dir}/SourceSelectionv2.6.0_object_lookup.json
 
 KEY EVALUATION-RELATED OBJECTS TO REFERENCE:
 """
-            
-            # Add specific objects from lookup
-            lookup_file = artifacts_dir / "SourceSelectionv2.6.0_object_lookup.json"
-            if lookup_file.exists():
-                with open(lookup_file, 'r', encoding='utf-8') as f:
-                    lookup_data = json.load(f)
                 
-                eval_objects = []
-                for obj_id, obj_data in lookup_data.items():
-                    obj_name = obj_data.get('name', '').lower()
-                    if 'evaluation' in obj_name or 'create' in obj_name or 'form' in obj_name:
-                        eval_objects.append({
-                            'name': obj_data.get('name'),
-                            'type': obj_data.get('object_type'),
-                            'description': obj_data.get('description', '')[:200]
-                        })
-                    if len(eval_objects) >= 15:
-                        break
+                # Add specific objects from lookup
+                for obj_data in artifacts.objects.search(
+                    ARTIFACTS_SUMMARY_KEYWORDS, 15, fields=('name',)
+                ):
+                    summary_content += f"\n{obj_data.get('name')} ({obj_data.get('object_type')})\n"
+                    summary_content += f"Description: {obj_data.get('description', '')[:200]}\n"
                 
-                for obj in eval_objects:
-                    summary_content += f"\n{obj['name']} ({obj['type']})\n"
-                    summary_content += f"Description: {obj['description']}\n"
-            
-            # Write to temp file
-            temp_file = Path(Config.BASE_DIR) / "temp_artifacts_summary.txt"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(summary_content)
+                # Write to temp file
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(summary_content)
+                self._artifacts_summary_generation = artifacts.generation
             
             return f"ARTIFACTS REFERENCE: See {temp_file} for detailed object information.\n"
             
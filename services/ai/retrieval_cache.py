@@ -0,0 +1,158 @@
+"""
+Retrieval Cache
+
+In-memory TTL/LRU cache for knowledge base retrievals. Concurrent lookups
+of a key that is being loaded wait for that load instead of starting
+their own, so identical in-flight queries result in one call.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+# Status of a lookup, reported to callers
+CACHE_HIT = 'hit'
+CACHE_MISS = 'miss'
+CACHE_COALESCED = 'coalesced'
+
+
+class _InflightLoad:
+    """A load other threads can wait for"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RetrievalCache:
+    """
+    Thread-safe cache with TTL expiry, LRU eviction and request coalescing.
+
+    Values are deep-copied on the way in and out, so callers may modify
+    what they get. Loads that raise are not cached; threads waiting for
+    them get the same exception.
+
+    Example:
+        >>> cache = RetrievalCache(ttl_seconds=300, max_entries=256)
+        >>> response, status = cache.get_or_load(key, lambda: client.retrieve(...))
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Seconds an entry is served (0 disables caching,
+                but identical in-flight loads are still coalesced)
+            max_entries: Maximum entries kept; least recently used
+                entries are evicted beyond it
+            clock: Monotonic time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, _InflightLoad] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'expired': 0,
+            'evicted': 0
+        }
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Tuple[Any, str]:
+        """
+        Get a cached value or load it.
+
+        Args:
+            key: Cache key
+            load: Callable producing the value on a miss
+
+        Returns:
+            Tuple of (value, status) where status is CACHE_HIT, CACHE_MISS
+            or CACHE_COALESCED
+
+        Raises:
+            Exception: Whatever load raised
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return copy.deepcopy(value), CACHE_HIT
+                del self._entries[key]
+                self._stats['expired'] += 1
+
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self._stats['coalesced'] += 1
+                leader = False
+            else:
+                inflight = self._inflight[key] = _InflightLoad()
+                self._stats['misses'] += 1
+                leader = True
+
+        if not leader:
+            inflight.done.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return copy.deepcopy(inflight.value), CACHE_COALESCED
+
+        try:
+            value = load()
+        except BaseException as e:
+            inflight.error = e
+            raise
+        else:
+            inflight.value = copy.deepcopy(value)
+            self._store(key, inflight.value)
+            return value, CACHE_MISS
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            inflight.done.set()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, hits, misses, coalesced, expired, evicted
+            and hit_rate (coalesced lookups count as hits)
+        """
+        with self._lock:
+            stats = dict(self._stats, entries=len(self._entries))
+        served = stats['hits'] + stats['coalesced']
+        lookups = served + stats['misses']
+        stats['hit_rate'] = f"{(served / lookups * 100) if lookups else 0:.2f}%"
+        return stats
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Cache a loaded value and evict beyond max_entries."""
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evicted'] += 1
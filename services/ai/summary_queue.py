@@ -0,0 +1,202 @@
+"""
+Summary Priority Queue
+
+Orders pending AI summary work so the changes a reviewer needs next are
+summarized first: CONFLICT changes, then the order they are reviewed in,
+then the most complex objects. Changes a reviewer opens while summaries
+are being generated can be promoted to the front of the queue.
+"""
+
+import heapq
+import itertools
+import json
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Summary order of classifications; unknown classifications go last
+CLASSIFICATION_PRIORITY = {
+    'CONFLICT': 0,
+    'DELETED': 1,
+    'NO_CONFLICT': 2,
+    'NEW': 3,
+}
+
+
+# Rough number of prompt characters per token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(change: Dict[str, Any]) -> int:
+    """
+    Estimate the prompt tokens a change adds to a merge summary prompt.
+
+    The prompt embeds the changes as indented JSON, so the estimate is
+    based on the length of that JSON.
+
+    Args:
+        change: Change dictionary prepared for the Q agent
+
+    Returns:
+        Estimated token count
+    """
+    return len(json.dumps(change, indent=2, default=str)) // CHARS_PER_TOKEN + 1
+
+
+def summary_complexity(change: Dict[str, Any]) -> int:
+    """
+    Estimate how complex a change is to review.
+
+    Args:
+        change: Change dictionary prepared for the Q agent
+
+    Returns:
+        Total SAIL code length and field count of the customer and
+        vendor versions
+    """
+    complexity = 0
+    for key in ('customer_version', 'new_vendor_version'):
+        version = change.get(key) or {}
+        complexity += len(version.get('sail_code') or '')
+        complexity += len(version.get('fields') or {})
+    return complexity
+
+
+class SummaryPriorityQueue:
+    """
+    Thread-safe priority queue of changes awaiting an AI summary.
+
+    Changes are ordered by classification (CONFLICT first), display_order
+    and then complexity (most complex first). promote() moves a queued
+    change ahead of everything that was not promoted; the most recently
+    promoted change comes first.
+
+    Batches can be limited by a token budget as well as by size: changes
+    are packed in priority order until the next one would exceed it.
+
+    Example:
+        >>> queue = SummaryPriorityQueue(changes_data, display_orders)
+        >>> queue.promote(42)
+        True
+        >>> for batch in queue.iter_batches(15, token_budget=16000):
+        ...     process(batch)
+    """
+
+    def __init__(
+        self,
+        changes: List[Dict[str, Any]],
+        display_orders: Optional[Dict[int, int]] = None
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            changes: Change dictionaries with a change_id key
+            display_orders: Dict mapping change_id -> display_order
+        """
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[Tuple, int]] = []
+        self._changes: Dict[int, Dict[str, Any]] = {}
+        self._priorities: Dict[int, Tuple] = {}
+        self._tokens: Dict[int, int] = {}
+        self._promotions = itertools.count(-1, -1)
+
+        display_orders = display_orders or {}
+        for change in changes:
+            change_id = change['change_id']
+            priority = (
+                0,
+                CLASSIFICATION_PRIORITY.get(
+                    change.get('classification'), len(CLASSIFICATION_PRIORITY)
+                ),
+                display_orders.get(change_id, 0),
+                -summary_complexity(change),
+                change_id
+            )
+            self._changes[change_id] = change
+            self._tokens[change_id] = estimate_tokens(change)
+            self._priorities[change_id] = priority
+            self._heap.append((priority, change_id))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        """Number of changes still queued"""
+        with self._lock:
+            return len(self._changes)
+
+    def promote(self, change_id: int) -> bool:
+        """
+        Move a queued change to the front of the queue.
+
+        Args:
+            change_id: Change ID
+
+        Returns:
+            True if the change was queued, False if it was already taken
+        """
+        with self._lock:
+            if change_id not in self._changes:
+                return False
+            # Stale heap entries are skipped in pop_batch()
+            priority = (next(self._promotions),) + self._priorities[change_id][1:]
+            self._priorities[change_id] = priority
+            heapq.heappush(self._heap, (priority, change_id))
+            return True
+
+    def pop_batch(
+        self,
+        size: int,
+        token_budget: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Take up to `size` changes with the highest priority.
+
+        Args:
+            size: Maximum batch size
+            token_budget: Maximum estimated tokens of the batch. The first
+                change is always taken, even if it exceeds the budget.
+
+        Returns:
+            List of change dictionaries (empty when the queue is empty)
+        """
+        batch = []
+        tokens = 0
+        with self._lock:
+            while self._heap and len(batch) < size:
+                priority, change_id = self._heap[0]
+                if self._priorities.get(change_id) != priority:
+                    heapq.heappop(self._heap)
+                    continue
+                change_tokens = self._tokens[change_id]
+                if batch and token_budget and tokens + change_tokens > token_budget:
+                    break
+                heapq.heappop(self._heap)
+                del self._priorities[change_id]
+                del self._tokens[change_id]
+                tokens += change_tokens
+                batch.append(self._changes.pop(change_id))
+        return batch
+
+    def iter_batches(
+        self,
+        size: int,
+        token_budget: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield batches until the queue is empty.
+
+        Each batch is only taken from the queue when the next one is
+        requested, so promotions made in between are honoured.
+
+        Args:
+            size: Maximum batch size
+            token_budget: Maximum estimated tokens per batch
+
+        Yields:
+            Lists of change dictionaries
+        """
+        while True:
+            batch = self.pop_batch(size, token_budget)
+            if not batch:
+                return
+            yield batch
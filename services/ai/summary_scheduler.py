@@ -0,0 +1,358 @@
+"""
+Summary Scheduler
+
+Runs AI summary batches concurrently with a cap on parallel agent
+invocations, a token-bucket rate limit and per-batch retries. Batches that
+time out are split in half and retried, and every agent call is recorded
+in size and latency histograms.
+
+Workers only run the batch callable (a Q agent subprocess); outcomes are
+yielded back to the calling thread, which owns the database session.
+"""
+
+import bisect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from core.exceptions import AgentTimeoutException, TransientException
+from core.logger import get_merge_logger
+from services.ai.summary_queue import estimate_tokens
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens are added continuously at `rate_per_minute / 60` per second, up
+    to `capacity`. acquire() blocks until a token is available.
+
+    Example:
+        >>> bucket = TokenBucket(rate_per_minute=30, capacity=4)
+        >>> bucket.acquire()  # returns immediately while tokens remain
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        """
+        Initialize bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute (0 or less = unlimited)
+            capacity: Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if necessary.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed bucket upper bounds.
+
+    Example:
+        >>> histogram = Histogram([1, 5, 10])
+        >>> histogram.observe(3)
+        >>> histogram.to_dict()['buckets']
+        {'<=1': 0, '<=5': 1, '<=10': 0, '>10': 0}
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize histogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds (inclusive)
+        """
+        self.bounds = list(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        with self._lock:
+            self._counts[bisect.bisect_left(self.bounds, value)] += 1
+            self._count += 1
+            self._total += value
+            self._max = max(self._max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the histogram as a dict.
+
+        Returns:
+            Dict with count, mean, max and per-bucket counts
+        """
+        with self._lock:
+            buckets = {
+                f"<={bound:g}": count
+                for bound, count in zip(self.bounds, self._counts)
+            }
+            buckets[f">{self.bounds[-1]:g}"] = self._counts[-1]
+            return {
+                'count': self._count,
+                'mean': round(self._total / self._count, 2) if self._count else 0,
+                'max': round(self._max, 2),
+                'buckets': buckets
+            }
+
+
+class BatchStats:
+    """
+    Size and latency histograms of agent calls.
+
+    Every agent call is recorded, including retries and the halves of
+    split batches, so the histograms show which batch sizes the agent
+    handles well.
+    """
+
+    def __init__(self):
+        """Initialize empty histograms."""
+        self.changes = Histogram([1, 2, 5, 10, 15, 25])
+        self.tokens = Histogram([1000, 2000, 4000, 8000, 16000, 32000])
+        self.latency_seconds = Histogram([5, 10, 20, 30, 60, 90, 120])
+        self.timeouts = 0
+        self.splits = 0
+        self._lock = threading.Lock()
+
+    def observe(self, batch: List[Dict[str, Any]], seconds: float) -> None:
+        """
+        Record one agent call.
+
+        Args:
+            batch: Changes sent to the agent
+            seconds: Call latency
+        """
+        self.changes.observe(len(batch))
+        self.tokens.observe(sum(estimate_tokens(change) for change in batch))
+        self.latency_seconds.observe(seconds)
+
+    def observe_timeout(self, split: bool) -> None:
+        """
+        Record an agent timeout.
+
+        Args:
+            split: Whether the timed out batch was split
+        """
+        with self._lock:
+            self.timeouts += 1
+            if split:
+                self.splits += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get all statistics.
+
+        Returns:
+            Dict with changes, tokens and latency_seconds histograms and
+            timeout and split counts
+        """
+        return {
+            'changes': self.changes.to_dict(),
+            'tokens': self.tokens.to_dict(),
+            'latency_seconds': self.latency_seconds.to_dict(),
+            'timeouts': self.timeouts,
+            'splits': self.splits
+        }
+
+
+@dataclass
+class BatchOutcome:
+    """Result of running one batch through the scheduler"""
+    batch_num: int
+    batch: List[Dict[str, Any]]
+    summaries: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    failed: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[Exception] = None
+    attempts: int = 0
+    splits: int = 0
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every change of the batch went through the agent"""
+        return not self.failed
+
+    @property
+    def summarized(self) -> List[Dict[str, Any]]:
+        """Changes of the batch the agent processed"""
+        failed_ids = {change['change_id'] for change in self.failed}
+        return [change for change in self.batch if change['change_id'] not in failed_ids]
+
+
+class SummaryScheduler:
+    """
+    Runs summary batches on a bounded thread pool.
+
+    At most `max_concurrency` batches are in flight at once. The next batch
+    is only taken from `batches` when a worker is free, so batches reported
+    as started are really being processed, and lazily built batches (see
+    SummaryPriorityQueue.iter_batches) reflect the latest priorities.
+    Every agent invocation, including retries, takes a token from the rate
+    limiter first. A batch of several changes that times out is split in
+    half and each half is processed on its own; other TransientException
+    failures are retried with exponential backoff. Changes that still fail
+    are reported in BatchOutcome.failed.
+
+    Example:
+        >>> scheduler = SummaryScheduler(process_batch, max_concurrency=4)
+        >>> for outcome in scheduler.run(batches, on_start=mark_processing):
+        ...     save(outcome)
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Dict[str, Any]]], Dict[int, Dict[str, Any]]],
+        max_concurrency: int = 4,
+        rate_per_minute: float = 0,
+        max_retries: int = 2,
+        backoff_seconds: float = 2.0,
+        stats: Optional[BatchStats] = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            process_batch: Callable generating summaries for one batch
+            max_concurrency: Maximum batches processed at the same time
+            rate_per_minute: Maximum agent invocations per minute (0 = unlimited)
+            max_retries: Retries of a batch after a transient failure
+            backoff_seconds: Delay before the first retry, doubled per retry
+            stats: Histograms every agent call is recorded in
+        """
+        self.logger = get_merge_logger()
+        self.process_batch = process_batch
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = TokenBucket(rate_per_minute, capacity=self.max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self.stats = stats or BatchStats()
+
+    def run(
+        self,
+        batches: Iterable[List[Dict[str, Any]]],
+        on_start: Optional[Callable[[int, List[Dict[str, Any]]], None]] = None
+    ) -> Iterator[BatchOutcome]:
+        """
+        Process batches concurrently, yielding outcomes as they complete.
+
+        Args:
+            batches: Batches of change dictionaries, consumed lazily
+            on_start: Called in the calling thread with (batch_num, batch)
+                right before a batch is handed to a worker
+
+        Yields:
+            BatchOutcome per batch, in completion order
+        """
+        pending = enumerate(batches, 1)
+        exhausted = False
+        in_flight: Dict[Future, None] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="SummaryWorker"
+        ) as executor:
+            while True:
+                while not exhausted and len(in_flight) < self.max_concurrency:
+                    next_batch = next(pending, None)
+                    if next_batch is None:
+                        exhausted = True
+                        break
+                    batch_num, batch = next_batch
+                    if on_start:
+                        on_start(batch_num, batch)
+                    in_flight[executor.submit(self._run_batch, batch_num, batch)] = None
+
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del in_flight[future]
+                    yield future.result()
+
+    def _run_batch(self, batch_num: int, batch: List[Dict[str, Any]]) -> BatchOutcome:
+        """Process one batch in a worker thread."""
+        outcome = BatchOutcome(batch_num=batch_num, batch=batch)
+        start = time.monotonic()
+        self._process(batch, outcome)
+        outcome.duration = time.monotonic() - start
+        return outcome
+
+    def _process(self, batch: List[Dict[str, Any]], outcome: BatchOutcome) -> None:
+        """Process changes, splitting on timeout and retrying transient failures."""
+        attempts = 0
+
+        while True:
+            attempts += 1
+            outcome.attempts += 1
+            waited = self.rate_limiter.acquire()
+            if waited:
+                self.logger.debug(
+                    f"Batch {outcome.batch_num}: rate limited for {waited:.2f}s"
+                )
+
+            call_start = time.monotonic()
+            try:
+                outcome.summaries.update(self.process_batch(batch))
+                self.stats.observe(batch, time.monotonic() - call_start)
+                return
+            except TransientException as e:
+                self.stats.observe(batch, time.monotonic() - call_start)
+                if isinstance(e, AgentTimeoutException):
+                    self.stats.observe_timeout(split=len(batch) > 1)
+                    if len(batch) > 1:
+                        middle = len(batch) // 2
+                        outcome.splits += 1
+                        self.logger.warning(
+                            f"Batch {outcome.batch_num}: {len(batch)} changes timed out - "
+                            f"splitting into {middle} and {len(batch) - middle}"
+                        )
+                        self._process(batch[:middle], outcome)
+                        self._process(batch[middle:], outcome)
+                        return
+                if attempts > self.max_retries:
+                    outcome.error = e
+                    outcome.failed.extend(batch)
+                    return
+                delay = self.backoff_seconds * (2 ** (attempts - 1))
+                self.logger.warning(
+                    f"Batch {outcome.batch_num} attempt {attempts} failed: {e} - "
+                    f"retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            except Exception as e:
+                outcome.error = e
+                outcome.failed.extend(batch)
+                return
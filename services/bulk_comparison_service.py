@@ -0,0 +1,429 @@
+"""
+Bulk Comparison Service
+
+Compares the versions of many objects between two packages using a fixed
+number of queries. Shared by DeltaComparisonService (A→C) and
+CustomerComparisonService (A→B).
+"""
+
+import json
+import logging
+from typing import List, Dict, Any, Iterable, Tuple
+
+from sqlalchemy import func
+
+from core.base_service import BaseService
+from models import db, ObjectLookup, ObjectVersion
+from domain.comparison_strategies import (
+    SimpleVersionComparisonStrategy,
+    SAILCodeComparisonStrategy
+)
+
+
+class BulkComparisonService(BaseService):
+    """
+    Service for comparing objects between two packages in bulk.
+    
+    Instead of querying versions and object-specific rows per object, this
+    service loads everything it needs for both packages up front:
+    - All object_versions rows of both packages in one query
+    - Object-specific rows for the object types being compared, plus child
+      row counts grouped by parent (one query per table)
+    
+    The comparison strategies then run over in-memory maps keyed by
+    (object_id, package_id).
+    
+    Object-specific content is compared through a "signature" per object:
+    - Process Models: node, flow and variable counts plus variable names/types
+    - Constants: constant_value, constant_type
+    - Record Types: field, relationship, view and action counts
+    - Interfaces: parameter and security counts
+    - Expression Rules: input count
+    - Data Types: field count
+    
+    Two objects have different object-specific content when both have a
+    signature and the signatures differ.
+    
+    Versions stored with a content_hash (see compute_content_hash in
+    package_extraction_service) are compared by hash first; content and
+    signatures are only loaded for objects whose hashes differ or are
+    missing.
+    """
+    
+    # Maximum number of object IDs per IN (...) clause
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
+    def __init__(self, container=None):
+        """Initialize service with dependencies."""
+        super().__init__(container)
+        self.logger = logging.getLogger(__name__)
+    
+    def _initialize_dependencies(self) -> None:
+        """Initialize service dependencies."""
+        # Initialize comparison strategies
+        self.version_strategy = SimpleVersionComparisonStrategy()
+        self.content_strategy = SAILCodeComparisonStrategy(
+            critical_fields=['sail_code', 'fields', 'properties']
+        )
+    
+    def compare_objects(
+        self,
+        objects: List[ObjectLookup],
+        old_package_id: int,
+        new_package_id: int
+    ) -> Dict[int, Tuple[bool, bool]]:
+        """
+        Compare objects present in both packages.
+        
+        For each object:
+        1. Compares version UUIDs using the version comparison strategy
+        2. If both versions have the same content_hash, the content is the
+           same and nothing else is loaded for the object
+        3. Otherwise ALWAYS compares object_versions content (version UUID
+           can change without content changes, e.g. re-export or metadata
+           updates) and object-specific content signatures
+        
+        Args:
+            objects: ObjectLookup entities present in both packages
+            old_package_id: Package the objects are compared from (e.g. A)
+            new_package_id: Package the objects are compared to (e.g. B or C)
+        
+        Returns:
+            Dict mapping object_id -> (version_changed, content_changed).
+            Objects with missing version data map to (False, False).
+        
+        Example:
+            >>> results = service.compare_objects(common_objects, 1, 3)
+            >>> version_changed, content_changed = results[obj.id]
+        """
+        if not objects:
+            return {}
+        
+        package_ids = [old_package_id, new_package_id]
+        versions = self._load_versions(package_ids)
+        
+        results = {}
+        full_comparisons = []
+        for obj in objects:
+            old_version = versions.get((obj.id, old_package_id))
+            new_version = versions.get((obj.id, new_package_id))
+            
+            # If either version is missing, treat as no change
+            # (This shouldn't happen in normal operation)
+            if not old_version or not new_version:
+                self.logger.warning(
+                    f"Missing version data for object {obj.uuid} "
+                    f"(old: {old_version is not None}, new: {new_version is not None})"
+                )
+                results[obj.id] = (False, False)
+                continue
+            
+            version_changed = self.version_strategy.compare(
+                old_version.version_uuid,
+                new_version.version_uuid
+            )
+            
+            if old_version.content_hash and old_version.content_hash == new_version.content_hash:
+                results[obj.id] = (version_changed, False)
+            else:
+                full_comparisons.append((obj, version_changed))
+        
+        self.logger.debug(
+            f"{len(objects) - len(full_comparisons)} of {len(objects)} objects "
+            f"resolved by version data and content hash"
+        )
+        
+        if not full_comparisons:
+            return results
+        
+        contents = self._load_version_contents(
+            [obj.id for obj, _ in full_comparisons],
+            package_ids
+        )
+        signatures = self._load_content_signatures(
+            {obj.object_type for obj, _ in full_comparisons},
+            package_ids
+        )
+        
+        for obj, version_changed in full_comparisons:
+            content_changed = self.content_strategy.compare(
+                self._extract_content(contents[(obj.id, old_package_id)]),
+                self._extract_content(contents[(obj.id, new_package_id)])
+            )
+            
+            # Many object types store their actual content in dedicated tables
+            old_signature = signatures.get((obj.id, old_package_id))
+            new_signature = signatures.get((obj.id, new_package_id))
+            object_specific_changed = (
+                old_signature is not None
+                and new_signature is not None
+                and old_signature != new_signature
+            )
+            
+            # Content is changed if EITHER object_versions OR object-specific tables differ
+            results[obj.id] = (version_changed, content_changed or object_specific_changed)
+        
+        return results
+    
+    def _load_versions(self, package_ids: List[int]) -> Dict[Tuple[int, int], Any]:
+        """
+        Load version UUIDs and content hashes for all objects in the packages.
+        
+        Args:
+            package_ids: Package IDs to load
+        
+        Returns:
+            Dict mapping (object_id, package_id) -> version row
+        """
+        rows = db.session.query(
+            ObjectVersion.object_id,
+            ObjectVersion.package_id,
+            ObjectVersion.version_uuid,
+            ObjectVersion.content_hash
+        ).filter(
+            ObjectVersion.package_id.in_(package_ids)
+        ).order_by(ObjectVersion.id).all()
+        
+        versions = {}
+        for row in rows:
+            versions.setdefault((row.object_id, row.package_id), row)
+        return versions
+    
+    def _load_version_contents(
+        self,
+        object_ids: List[int],
+        package_ids: List[int]
+    ) -> Dict[Tuple[int, int], Any]:
+        """
+        Load comparable content columns for the given objects.
+        
+        raw_xml is not loaded; it is not used for comparison.
+        
+        Args:
+            object_ids: Object IDs whose content needs a full comparison
+            package_ids: Package IDs to load
+        
+        Returns:
+            Dict mapping (object_id, package_id) -> content row
+        """
+        contents = {}
+        for start in range(0, len(object_ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = object_ids[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            rows = db.session.query(
+                ObjectVersion.object_id,
+                ObjectVersion.package_id,
+                ObjectVersion.sail_code,
+                ObjectVersion.fields,
+                ObjectVersion.properties
+            ).filter(
+                ObjectVersion.package_id.in_(package_ids),
+                ObjectVersion.object_id.in_(chunk)
+            ).order_by(ObjectVersion.id).all()
+            
+            for row in rows:
+                contents.setdefault((row.object_id, row.package_id), row)
+        return contents
+    
+    def _extract_content(self, version: Any) -> Dict[str, Any]:
+        """
+        Extract content from a version row for comparison.
+        
+        Args:
+            version: ObjectVersion or version row
+        
+        Returns:
+            Dict with content fields (sail_code, fields, properties)
+        """
+        content = {}
+        
+        # Add SAIL code if present
+        if version.sail_code:
+            content['sail_code'] = version.sail_code
+        
+        # Add fields if present (parse JSON)
+        if version.fields:
+            try:
+                content['fields'] = json.loads(version.fields)
+            except json.JSONDecodeError:
+                content['fields'] = version.fields
+        
+        # Add properties if present (parse JSON)
+        if version.properties:
+            try:
+                content['properties'] = json.loads(version.properties)
+            except json.JSONDecodeError:
+                content['properties'] = version.properties
+        
+        return content
+    
+    def _load_content_signatures(
+        self,
+        object_types: Iterable[str],
+        package_ids: List[int]
+    ) -> Dict[Tuple[int, int], tuple]:
+        """
+        Load object-specific content signatures for the given object types.
+        
+        Args:
+            object_types: Object types being compared
+            package_ids: Package IDs to load
+        
+        Returns:
+            Dict mapping (object_id, package_id) -> signature tuple
+        """
+        from models import (
+            Interface, InterfaceParameter, InterfaceSecurity,
+            ExpressionRule, ExpressionRuleInput,
+            ProcessModel, ProcessModelNode, ProcessModelFlow, ProcessModelVariable,
+            RecordType, RecordTypeField, RecordTypeRelationship,
+            RecordTypeView, RecordTypeAction,
+            CDT, CDTField,
+            Constant
+        )
+        
+        # Object types whose signature is the number of rows in child tables
+        counted_children = {
+            'Process Model': (ProcessModel, [
+                ProcessModelNode.process_model_id,
+                ProcessModelFlow.process_model_id,
+                ProcessModelVariable.process_model_id
+            ]),
+            'Record Type': (RecordType, [
+                RecordTypeField.record_type_id,
+                RecordTypeRelationship.record_type_id,
+                RecordTypeView.record_type_id,
+                RecordTypeAction.record_type_id
+            ]),
+            'Interface': (Interface, [
+                InterfaceParameter.interface_id,
+                InterfaceSecurity.interface_id
+            ]),
+            'Expression Rule': (ExpressionRule, [ExpressionRuleInput.rule_id]),
+            'Data Type': (CDT, [CDTField.cdt_id]),
+        }
+        
+        signatures = {}
+        object_types = set(object_types)
+        
+        for object_type, (model, foreign_keys) in counted_children.items():
+            if object_type not in object_types:
+                continue
+            
+            parents = self._load_parent_keys(model, package_ids)
+            counts = [
+                self._count_children(foreign_key, model, package_ids)
+                for foreign_key in foreign_keys
+            ]
+            
+            # Process model variable names/types are compared, not just counted
+            variables = None
+            if object_type == 'Process Model':
+                variables = self._load_process_model_variables(package_ids)
+            
+            for parent_id, key in parents.items():
+                signature = tuple(count.get(parent_id, 0) for count in counts)
+                if variables is not None:
+                    signature += (variables.get(parent_id, frozenset()),)
+                signatures[key] = signature
+        
+        if 'Constant' in object_types:
+            rows = db.session.query(
+                Constant.object_id,
+                Constant.package_id,
+                Constant.constant_value,
+                Constant.constant_type
+            ).filter(
+                Constant.package_id.in_(package_ids)
+            ).order_by(Constant.id).all()
+            
+            for row in rows:
+                signatures.setdefault(
+                    (row.object_id, row.package_id),
+                    (row.constant_value, row.constant_type)
+                )
+        
+        return signatures
+    
+    def _load_parent_keys(self, model, package_ids: List[int]) -> Dict[int, Tuple[int, int]]:
+        """
+        Map object-specific row ids to (object_id, package_id).
+        
+        Only the first row per object and package is kept.
+        
+        Args:
+            model: Object-specific model (ProcessModel, Interface, ...)
+            package_ids: Package IDs to load
+        
+        Returns:
+            Dict mapping row id -> (object_id, package_id)
+        """
+        rows = db.session.query(
+            model.id,
+            model.object_id,
+            model.package_id
+        ).filter(
+            model.package_id.in_(package_ids)
+        ).order_by(model.id).all()
+        
+        parents = {}
+        seen = set()
+        for row in rows:
+            key = (row.object_id, row.package_id)
+            if key not in seen:
+                seen.add(key)
+                parents[row.id] = key
+        return parents
+    
+    def _count_children(self, foreign_key, parent_model, package_ids: List[int]) -> Dict[int, int]:
+        """
+        Count child rows per parent for all parents in the packages.
+        
+        Args:
+            foreign_key: Child column referencing the parent id
+            parent_model: Parent model the foreign key references
+            package_ids: Package IDs to load
+        
+        Returns:
+            Dict mapping parent id -> child row count
+        """
+        rows = db.session.query(
+            foreign_key,
+            func.count()
+        ).join(
+            parent_model,
+            parent_model.id == foreign_key
+        ).filter(
+            parent_model.package_id.in_(package_ids)
+        ).group_by(foreign_key).all()
+        
+        return {parent_id: count for parent_id, count in rows}
+    
+    def _load_process_model_variables(self, package_ids: List[int]) -> Dict[int, frozenset]:
+        """
+        Load variable (name, type) pairs per process model.
+        
+        Args:
+            package_ids: Package IDs to load
+        
+        Returns:
+            Dict mapping process model id -> frozenset of (name, type)
+        """
+        from models import ProcessModel, ProcessModelVariable
+        
+        rows = db.session.query(
+            ProcessModelVariable.process_model_id,
+            ProcessModelVariable.variable_name,
+            ProcessModelVariable.variable_type
+        ).join(
+            ProcessModel,
+            ProcessModel.id == ProcessModelVariable.process_model_id
+        ).filter(
+            ProcessModel.package_id.in_(package_ids)
+        ).all()
+        
+        variables = {}
+        for row in rows:
+            variables.setdefault(row.process_model_id, set()).add(
+                (row.variable_name, row.variable_type)
+            )
+        return {pm_id: frozenset(pairs) for pm_id, pairs in variables.items()}
@@ -14,6 +14,7 @@ from models import (
     db, MergeSession, Change, Package, ObjectVersion
 )
 from repositories.change_repository import ChangeRepository
+from services.merge_summary_service import MergeSummaryService
 
 
 class ChangeNavigationService(BaseService):
@@ -42,6 +43,7 @@ class ChangeNavigationService(BaseService):
     def _initialize_dependencies(self) -> None:
         """Initialize service dependencies."""
         self.change_repository = self._get_repository(ChangeRepository)
+        self.merge_summary_service = self._get_service(MergeSummaryService)
     
     def get_change_detail(
         self,
@@ -51,6 +53,9 @@ class ChangeNavigationService(BaseService):
         """
         Get detailed information for a specific change.
         
+        Opening a change whose AI summary is still pending moves it to the
+        front of the summary queue.
+        
         Returns comprehensive information including:
         - Change details (classification, change types, status, notes)
         - Object details (name, type, UUID, description)
@@ -98,6 +103,10 @@ class ChangeNavigationService(BaseService):
                 f"Change {change_id} not found in session {reference_id}"
             )
         
+        # The reviewer needs this summary next
+        if change.ai_summary_status == 'pending':
+            self.merge_summary_service.prioritize_change(session.id, change.id)
+        
         # Get navigation
         next_change_id = self.get_next_change(reference_id, change_id)
         previous_change_id = self.get_previous_change(reference_id, change_id)
@@ -390,7 +399,11 @@ class ChangeNavigationService(BaseService):
             if not package_id:
                 continue
             
-            version = db.session.query(ObjectVersion).filter_by(
+            version = db.session.query(ObjectVersion).options(
+                joinedload(ObjectVersion.fields_blob),
+                joinedload(ObjectVersion.properties_blob),
+                joinedload(ObjectVersion.raw_xml_blob)
+            ).filter_by(
                 object_id=object_id,
                 package_id=package_id
             ).first()
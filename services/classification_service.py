@@ -11,11 +11,12 @@ Key Concept:
 """
 
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
+from sqlalchemy.orm import joinedload
 
 from core.base_service import BaseService
 from repositories.change_repository import ChangeRepository
-from models import db, ObjectVersion
+from models import db, Change, ObjectVersion
 from domain.entities import VendorChange, CustomerChange, MergeAnalysis, ClassifiedChange
 from domain.enums import Classification, ChangeCategory
 from domain.comparison_strategies import SAILCodeComparisonStrategy
@@ -77,6 +78,14 @@ class ContentComparator:
         
         # First check: version UUIDs
         if customer_version.version_uuid != new_vendor_version.version_uuid:
+            # Same content hash - same content (including object-specific children)
+            if (customer_version.content_hash and
+                    customer_version.content_hash == new_vendor_version.content_hash):
+                self.logger.debug(
+                    f"Object {object_id}: B == C (same content hash despite different version UUIDs)"
+                )
+                return False
+            
             # Different version UUIDs - need to check content
             customer_content = self._extract_content(customer_version)
             new_vendor_content = self._extract_content(new_vendor_version)
@@ -120,8 +129,11 @@ class ContentComparator:
         object_id: int,
         package_id: int
     ) -> Optional[ObjectVersion]:
-        """Get object version for a specific package."""
-        return db.session.query(ObjectVersion).filter_by(
+        """Get object version for a specific package, with the blobs compared."""
+        return db.session.query(ObjectVersion).options(
+            joinedload(ObjectVersion.fields_blob),
+            joinedload(ObjectVersion.properties_blob)
+        ).filter_by(
             object_id=object_id,
             package_id=package_id
         ).first()
@@ -415,6 +427,13 @@ class ClassificationService(BaseService):
     4. Sets display_order for consistent presentation
     """
     
+    # Display priority by classification (lower is shown first)
+    PRIORITY = {
+        Classification.CONFLICT: 1,
+        Classification.DELETED: 2,
+        Classification.NO_CONFLICT: 3
+    }
+    
     def __init__(self, container=None):
         """Initialize service with dependencies."""
         super().__init__(container)
@@ -464,7 +483,96 @@ class ClassificationService(BaseService):
         # Apply set-based classification
         analyses = self.classifier.classify(vendor_changes, customer_changes)
         
-        # Convert to ClassifiedChange entities
+        classified_changes = self._to_classified_changes(analyses)
+        
+        # Sort by classification priority for display order
+        classified_changes = self._sort_by_priority(classified_changes)
+        
+        # Assign display order
+        for i, change in enumerate(classified_changes, start=1):
+            change.display_order = i
+        
+        # Create Change records in database
+        self._create_change_records(session_id, classified_changes)
+        
+        # Log statistics
+        stats = self._get_classification_stats(classified_changes)
+        self.logger.info(
+            f"Classification complete for session {session_id}: "
+            f"CONFLICT={stats['CONFLICT']}, "
+            f"NO_CONFLICT={stats['NO_CONFLICT']}, "
+            f"DELETED={stats['DELETED']}"
+        )
+        
+        return classified_changes
+    
+    def reclassify_objects(
+        self,
+        session_id: int,
+        vendor_changes: List[VendorChange],
+        customer_changes: List[CustomerChange],
+        customer_package_id: int,
+        new_vendor_package_id: int,
+        object_ids: Set[int]
+    ) -> List[ClassifiedChange]:
+        """
+        Re-classify some objects of an already classified session.
+        
+        Change records of the given objects are replaced; all other change
+        records, including their review status and notes, are kept. Display
+        order is reassigned by priority, keeping the existing order within
+        each classification and placing re-classified objects last.
+        
+        Args:
+            session_id: Merge session ID
+            vendor_changes: List of VendorChange entities (Set D)
+            customer_changes: List of CustomerChange entities (Set E)
+            customer_package_id: Package B (Customer) ID
+            new_vendor_package_id: Package C (New Vendor) ID
+            object_ids: IDs of the objects to re-classify
+        
+        Returns:
+            ClassifiedChange entities of the re-classified objects that
+            are still changes
+        """
+        self.logger.info(
+            f"Re-classifying {len(object_ids)} objects for session {session_id}"
+        )
+        
+        self.classifier.content_comparator = ContentComparator(
+            customer_package_id,
+            new_vendor_package_id
+        )
+        analyses = self.classifier.classify(
+            [change for change in vendor_changes if change.object_id in object_ids],
+            [change for change in customer_changes if change.object_id in object_ids]
+        )
+        classified_changes = self._sort_by_priority(
+            self._to_classified_changes(analyses)
+        )
+        
+        db.session.query(Change).filter(
+            Change.session_id == session_id,
+            Change.object_id.in_(object_ids)
+        ).delete(synchronize_session=False)
+        self._create_change_records(session_id, classified_changes)
+        self._renumber_display_order(session_id, object_ids)
+        
+        stats = self._get_classification_stats(classified_changes)
+        self.logger.info(
+            f"Re-classification complete for session {session_id}: "
+            f"CONFLICT={stats['CONFLICT']}, "
+            f"NO_CONFLICT={stats['NO_CONFLICT']}, "
+            f"DELETED={stats['DELETED']}"
+        )
+        
+        return classified_changes
+    
+    def _to_classified_changes(
+        self,
+        analyses: List[MergeAnalysis]
+    ) -> List[ClassifiedChange]:
+        """Convert merge analyses to ClassifiedChange entities."""
         classified_changes = []
         
         for analysis in analyses:
@@ -490,26 +598,29 @@ class ClassificationService(BaseService):
             
             classified_changes.append(classified_change)
         
-        # Sort by classification priority for display order
-        classified_changes = self._sort_by_priority(classified_changes)
+        return classified_changes
+    
+    def _renumber_display_order(
+        self,
+        session_id: int,
+        new_object_ids: Set[int]
+    ) -> None:
+        """Reassign display order by priority after some changes were replaced."""
+        changes = db.session.query(Change).filter_by(session_id=session_id).all()
+        priority = {
+            classification.value: value
+            for classification, value in self.PRIORITY.items()
+        }
         
-        # Assign display order
-        for i, change in enumerate(classified_changes, start=1):
+        changes.sort(key=lambda c: (
+            priority[c.classification],
+            c.object_id in new_object_ids,
+            c.display_order,
+            c.id
+        ))
+        for i, change in enumerate(changes, start=1):
             change.display_order = i
-        
-        # Create Change records in database
-        self._create_change_records(session_id, classified_changes)
-        
-        # Log statistics
-        stats = self._get_classification_stats(classified_changes)
-        self.logger.info(
-            f"Classification complete for session {session_id}: "
-            f"CONFLICT={stats['CONFLICT']}, "
-            f"NO_CONFLICT={stats['NO_CONFLICT']}, "
-            f"DELETED={stats['DELETED']}"
-        )
-        
-        return classified_changes
+        db.session.flush()
     
     def _sort_by_priority(
         self,
@@ -523,15 +634,9 @@ class ClassificationService(BaseService):
         2. DELETED (vendor deleted, customer modified)
         3. NO_CONFLICT (lowest priority - can be auto-merged)
         """
-        priority_map = {
-            Classification.CONFLICT: 1,
-            Classification.DELETED: 2,
-            Classification.NO_CONFLICT: 3
-        }
-        
         return sorted(
             classified_changes,
-            key=lambda c: priority_map[c.classification]
+            key=lambda c: self.PRIORITY[c.classification]
         )
     
     def _create_change_records(
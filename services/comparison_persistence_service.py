@@ -13,7 +13,7 @@ This service computes and stores object-specific differences for:
 
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 
 from core.base_service import BaseService
 from models import (
@@ -158,6 +158,54 @@ class ComparisonPersistenceService(BaseService):
         
         return counts
     
+    def delete_comparisons(
+        self,
+        session_id: int,
+        object_ids: Set[int]
+    ) -> int:
+        """
+        Delete the persisted comparisons of some objects in a session.
+        
+        Used before their changes are re-classified, so that the next
+        persist_all_comparisons() call computes them again.
+        
+        Args:
+            session_id: Merge session ID
+            object_ids: IDs of the objects whose comparisons are stale
+        
+        Returns:
+            Number of comparison records deleted
+        """
+        change_ids = [
+            change_id for (change_id,) in db.session.query(Change.id).filter(
+                Change.session_id == session_id,
+                Change.object_id.in_(object_ids)
+            )
+        ]
+        
+        deleted = 0
+        for model in (
+            InterfaceComparison, ProcessModelComparison, RecordTypeComparison
+        ):
+            deleted += db.session.query(model).filter(
+                model.change_id.in_(change_ids)
+            ).delete(synchronize_session=False)
+        for model in (
+            ExpressionRuleComparison, CDTComparison, ConstantComparison
+        ):
+            deleted += db.session.query(model).filter(
+                model.session_id == session_id,
+                model.object_id.in_(object_ids)
+            ).delete(synchronize_session=False)
+        db.session.flush()
+        
+        self.logger.info(
+            f"Deleted {deleted} comparisons of {len(object_ids)} objects "
+            f"in session {session_id}"
+        )
+        
+        return deleted
+    
     def _persist_interface_comparison(
         self,
         change: Change,
@@ -6,19 +6,15 @@ to identify customer changes (Set E).
 """
 
 import logging
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List
 
 from core.base_service import BaseService
-from models import db, ObjectLookup, ObjectVersion
+from services.bulk_comparison_service import BulkComparisonService
 from repositories.object_lookup_repository import ObjectLookupRepository
 from repositories.package_object_mapping_repository import PackageObjectMappingRepository
 from repositories.customer_comparison_repository import CustomerComparisonRepository
 from domain.entities import CustomerChange
 from domain.enums import ChangeCategory, ChangeType
-from domain.comparison_strategies import (
-    SimpleVersionComparisonStrategy,
-    SAILCodeComparisonStrategy
-)
 
 
 class CustomerComparisonService(BaseService):
@@ -49,12 +45,7 @@ class CustomerComparisonService(BaseService):
         self.customer_comparison_repo = self._get_repository(
             CustomerComparisonRepository
         )
-        
-        # Initialize comparison strategies
-        self.version_strategy = SimpleVersionComparisonStrategy()
-        self.content_strategy = SAILCodeComparisonStrategy(
-            critical_fields=['sail_code', 'fields', 'properties']
-        )
+        self.bulk_comparison_service = self._get_service(BulkComparisonService)
     
     def compare(
         self,
@@ -149,15 +140,16 @@ class CustomerComparisonService(BaseService):
         common_uuids = set(base_map.keys()) & set(customer_map.keys())
         modified_count = 0
         
+        # Load versions and object-specific content for all common objects at once
+        comparisons = self.bulk_comparison_service.compare_objects(
+            [base_map[uuid] for uuid in common_uuids],
+            base_package_id,
+            customer_package_id
+        )
+        
         for uuid in common_uuids:
             base_obj = base_map[uuid]
-            
-            # Compare versions
-            version_changed, content_changed = self._compare_versions(
-                base_obj,
-                base_package_id,
-                customer_package_id
-            )
+            version_changed, content_changed = comparisons[base_obj.id]
             
             # Only store if content actually changed
             if content_changed:
@@ -200,212 +192,3 @@ class CustomerComparisonService(BaseService):
         )
         
         return domain_entities
-    
-    def _compare_versions(
-        self,
-        obj_lookup: ObjectLookup,
-        base_package_id: int,
-        customer_package_id: int
-    ) -> Tuple[bool, bool]:
-        """Compare versions between base and customer packages."""
-        base_version = self._get_object_version(obj_lookup.id, base_package_id)
-        customer_version = self._get_object_version(obj_lookup.id, customer_package_id)
-        
-        if not base_version or not customer_version:
-            return False, False
-        
-        version_changed = self.version_strategy.compare(
-            base_version.version_uuid,
-            customer_version.version_uuid
-        )
-        
-        base_content = self._extract_content(base_version)
-        customer_content = self._extract_content(customer_version)
-        
-        content_changed = self.content_strategy.compare(
-            base_content,
-            customer_content
-        )
-        
-        # CRITICAL FIX: Also check object-specific tables
-        # Same fix as DeltaComparisonService
-        object_specific_changed = self._compare_object_specific_content(
-            obj_lookup,
-            base_package_id,
-            customer_package_id
-        )
-        
-        # Content is changed if EITHER object_versions OR object-specific tables differ
-        content_changed = content_changed or object_specific_changed
-        
-        return version_changed, content_changed
-    
-    def _get_object_version(
-        self,
-        object_id: int,
-        package_id: int
-    ) -> Optional[ObjectVersion]:
-        """Get object version for a specific package."""
-        return db.session.query(ObjectVersion).filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-    
-    def _extract_content(self, version: ObjectVersion) -> Dict[str, Any]:
-        """Extract content from ObjectVersion for comparison."""
-        import json
-        
-        content = {}
-        
-        if version.sail_code:
-            content['sail_code'] = version.sail_code
-        
-        if version.fields:
-            try:
-                content['fields'] = json.loads(version.fields)
-            except json.JSONDecodeError:
-                content['fields'] = version.fields
-        
-        if version.properties:
-            try:
-                content['properties'] = json.loads(version.properties)
-            except json.JSONDecodeError:
-                content['properties'] = version.properties
-        
-        return content
-    
-    def _compare_object_specific_content(
-        self,
-        obj_lookup: ObjectLookup,
-        base_package_id: int,
-        customer_package_id: int
-    ) -> bool:
-        """
-        Compare object-specific table content between base and customer packages.
-        Same logic as DeltaComparisonService but for A→B comparison.
-        """
-        object_type = obj_lookup.object_type
-        
-        if object_type == "Process Model":
-            return self._compare_process_model_content(obj_lookup.id, base_package_id, customer_package_id)
-        elif object_type == "Constant":
-            return self._compare_constant_content(obj_lookup.id, base_package_id, customer_package_id)
-        elif object_type == "Record Type":
-            return self._compare_record_type_content(obj_lookup.id, base_package_id, customer_package_id)
-        elif object_type == "Interface":
-            return self._compare_interface_content(obj_lookup.id, base_package_id, customer_package_id)
-        elif object_type == "Expression Rule":
-            return self._compare_expression_rule_content(obj_lookup.id, base_package_id, customer_package_id)
-        elif object_type == "Data Type":
-            return self._compare_cdt_content(obj_lookup.id, base_package_id, customer_package_id)
-        
-        return False
-    
-    def _compare_process_model_content(self, object_id: int, base_package_id: int, customer_package_id: int) -> bool:
-        """Compare process model nodes, flows, and variables."""
-        from models import ProcessModel
-        
-        base_pm = db.session.query(ProcessModel).filter_by(object_id=object_id, package_id=base_package_id).first()
-        customer_pm = db.session.query(ProcessModel).filter_by(object_id=object_id, package_id=customer_package_id).first()
-        
-        if not base_pm or not customer_pm:
-            return False
-        
-        if base_pm.nodes.count() != customer_pm.nodes.count():
-            return True
-        if base_pm.flows.count() != customer_pm.flows.count():
-            return True
-        if base_pm.variables.count() != customer_pm.variables.count():
-            return True
-        
-        base_vars = {(v.variable_name, v.variable_type) for v in base_pm.variables}
-        customer_vars = {(v.variable_name, v.variable_type) for v in customer_pm.variables}
-        if base_vars != customer_vars:
-            return True
-        
-        return False
-    
-    def _compare_constant_content(self, object_id: int, base_package_id: int, customer_package_id: int) -> bool:
-        """Compare constant value and type."""
-        from models import Constant
-        
-        base_const = db.session.query(Constant).filter_by(object_id=object_id, package_id=base_package_id).first()
-        customer_const = db.session.query(Constant).filter_by(object_id=object_id, package_id=customer_package_id).first()
-        
-        if not base_const or not customer_const:
-            return False
-        
-        if base_const.constant_value != customer_const.constant_value:
-            return True
-        if base_const.constant_type != customer_const.constant_type:
-            return True
-        
-        return False
-    
-    def _compare_record_type_content(self, object_id: int, base_package_id: int, customer_package_id: int) -> bool:
-        """Compare record type fields, relationships, views, and actions."""
-        from models import RecordType
-        
-        base_rt = db.session.query(RecordType).filter_by(object_id=object_id, package_id=base_package_id).first()
-        customer_rt = db.session.query(RecordType).filter_by(object_id=object_id, package_id=customer_package_id).first()
-        
-        if not base_rt or not customer_rt:
-            return False
-        
-        if base_rt.fields.count() != customer_rt.fields.count():
-            return True
-        if base_rt.relationships.count() != customer_rt.relationships.count():
-            return True
-        if base_rt.views.count() != customer_rt.views.count():
-            return True
-        if base_rt.actions.count() != customer_rt.actions.count():
-            return True
-        
-        return False
-    
-    def _compare_interface_content(self, object_id: int, base_package_id: int, customer_package_id: int) -> bool:
-        """Compare interface parameters and security."""
-        from models import Interface
-        
-        base_intf = db.session.query(Interface).filter_by(object_id=object_id, package_id=base_package_id).first()
-        customer_intf = db.session.query(Interface).filter_by(object_id=object_id, package_id=customer_package_id).first()
-        
-        if not base_intf or not customer_intf:
-            return False
-        
-        if base_intf.parameters.count() != customer_intf.parameters.count():
-            return True
-        if base_intf.security.count() != customer_intf.security.count():
-            return True
-        
-        return False
-    
-    def _compare_expression_rule_content(self, object_id: int, base_package_id: int, customer_package_id: int) -> bool:
-        """Compare expression rule inputs."""
-        from models import ExpressionRule
-        
-        base_er = db.session.query(ExpressionRule).filter_by(object_id=object_id, package_id=base_package_id).first()
-        customer_er = db.session.query(ExpressionRule).filter_by(object_id=object_id, package_id=customer_package_id).first()
-        
-        if not base_er or not customer_er:
-            return False
-        
-        if base_er.inputs.count() != customer_er.inputs.count():
-            return True
-        
-        return False
-    
-    def _compare_cdt_content(self, object_id: int, base_package_id: int, customer_package_id: int) -> bool:
-        """Compare CDT fields."""
-        from models import CDT
-        
-        base_cdt = db.session.query(CDT).filter_by(object_id=object_id, package_id=base_package_id).first()
-        customer_cdt = db.session.query(CDT).filter_by(object_id=object_id, package_id=customer_package_id).first()
-        
-        if not base_cdt or not customer_cdt:
-            return False
-        
-        if base_cdt.fields.count() != customer_cdt.fields.count():
-            return True
-        
-        return False
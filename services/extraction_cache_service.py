@@ -0,0 +1,358 @@
+"""
+Extraction Cache Service
+
+Reuses extracted packages when the exact same ZIP is uploaded again.
+
+Entries are keyed by the SHA-256 of the ZIP plus the parser version. On a
+hit, every row extracted for the cached package (mappings, versions,
+object-specific rows and their children) is copied to the new package with
+INSERT ... SELECT statements, so parsing is skipped. SAIL code is copied
+unformatted, to be formatted with the new session's object lookup.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, func, literal, select
+
+from core.base_service import BaseService
+from core.logger import get_merge_logger
+from models import (
+    db, Package, PackageObjectMapping, ObjectVersion, ExtractionCacheEntry,
+    ContentBlob, ProcessModel, ProcessModelNode, ProcessModelFlow,
+    PACKAGE_OBJECT_MODELS, PACKAGE_CHILD_MODELS, delete_package_objects
+)
+from services.parsers.xml_parser_factory import PARSER_VERSION
+
+
+# Tables with one row per (object_id, package_id), written by extraction
+PACKAGE_TABLES = [PackageObjectMapping, ObjectVersion] + PACKAGE_OBJECT_MODELS
+
+
+class ExtractionCacheService(BaseService):
+    """
+    Service for the package extraction cache.
+    
+    A package becomes a cache entry once it has been extracted; the entry
+    is removed together with the package when its session is deleted.
+    Evicting an entry only stops the package from being reused, the
+    package itself still belongs to its session.
+    
+    Eviction removes entries not used for EXTRACTION_CACHE_MAX_AGE_DAYS,
+    entries for another parser version, and then the least recently used
+    entries until the cached ZIPs total at most EXTRACTION_CACHE_MAX_SIZE_MB.
+    
+    Example:
+        >>> cache = ExtractionCacheService()
+        >>> entry = cache.get_entry(zip_hash)
+        >>> if entry:
+        ...     package = cache.clone_package(entry, session_id, 'base', 'a.zip')
+    """
+    
+    def __init__(self, container=None):
+        """Initialize service with dependencies."""
+        super().__init__(container)
+        self.logger = get_merge_logger()
+        self.hits = 0
+        self.misses = 0
+    
+    def _initialize_dependencies(self) -> None:
+        """Initialize service dependencies."""
+        pass
+    
+    def get_entry(self, zip_hash: str) -> Optional[ExtractionCacheEntry]:
+        """
+        Find the cache entry for a ZIP extracted with the current parsers.
+        
+        Args:
+            zip_hash: SHA-256 hex digest of the ZIP
+        
+        Returns:
+            ExtractionCacheEntry, or None if the cache is disabled or the
+            ZIP has not been extracted before
+        """
+        from config import Config
+        
+        if not Config.EXTRACTION_CACHE_ENABLED:
+            return None
+        
+        # The join skips entries whose package was deleted outside the ORM,
+        # including when its id was since reused by a package of another ZIP
+        return ExtractionCacheEntry.query.join(
+            Package, and_(
+                Package.id == ExtractionCacheEntry.package_id,
+                Package.zip_hash == ExtractionCacheEntry.zip_hash
+            )
+        ).filter(
+            ExtractionCacheEntry.zip_hash == zip_hash,
+            ExtractionCacheEntry.parser_version == PARSER_VERSION
+        ).first()
+    
+    def clone_package(
+        self,
+        entry: ExtractionCacheEntry,
+        session_id: int,
+        package_type: str,
+        filename: str
+    ) -> Package:
+        """
+        Create a package with a copy of everything extracted for a cached one.
+        
+        SAIL code is copied as extracted, before formatting; the caller
+        formats it (see PackageExtractionService.format_sail_code_for_packages).
+        
+        Args:
+            entry: Cache entry returned by get_entry()
+            session_id: Merge session ID of the new package
+            package_type: Package type (base, customized, new_vendor)
+            filename: Uploaded ZIP file name
+        
+        Returns:
+            Flushed Package with the cloned rows
+        """
+        source = entry.package
+        package = Package(
+            session_id=session_id,
+            package_type=package_type,
+            filename=filename,
+            total_objects=source.total_objects,
+            zip_hash=entry.zip_hash,
+            cloned_from_package_id=source.id
+        )
+        db.session.add(package)
+        db.session.flush()
+        
+        # Rows left behind under a reused package id would clash with the clone
+        delete_package_objects(db.session, [package.id])
+        
+        for model in PACKAGE_TABLES:
+            self._clone_package_rows(model, source.id, package.id)
+        for child, parent, foreign_key in PACKAGE_CHILD_MODELS:
+            self._clone_child_rows(child, parent, foreign_key, source.id, package.id)
+        self._clone_process_model_flows(source.id, package.id)
+        
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_used_at = datetime.utcnow()
+        db.session.flush()
+        
+        self.hits += 1
+        self.logger.info(
+            f"Extraction cache hit: cloned package {source.id} into "
+            f"package {package.id} ({package.total_objects} objects)"
+        )
+        return package
+    
+    def register(self, package: Package, zip_size: int) -> None:
+        """
+        Record a freshly extracted package so identical ZIPs can reuse it.
+        
+        Counts as a cache miss and runs eviction afterwards.
+        
+        Args:
+            package: Extracted package with zip_hash set
+            zip_size: Size of the ZIP in bytes
+        """
+        from config import Config
+        
+        if not Config.EXTRACTION_CACHE_ENABLED or not package.zip_hash:
+            return
+        
+        self.misses += 1
+        entry = ExtractionCacheEntry.query.filter_by(
+            zip_hash=package.zip_hash,
+            parser_version=PARSER_VERSION
+        ).first()
+        if entry is None:
+            entry = ExtractionCacheEntry(
+                zip_hash=package.zip_hash,
+                parser_version=PARSER_VERSION
+            )
+            db.session.add(entry)
+        
+        entry.package_id = package.id
+        entry.zip_size = zip_size
+        entry.last_used_at = datetime.utcnow()
+        db.session.flush()
+        
+        self.evict()
+    
+    def evict(self) -> int:
+        """
+        Remove stale entries and keep the cache within its size limit.
+        
+        Returns:
+            Number of entries removed
+        """
+        from config import Config
+        
+        cutoff = datetime.utcnow() - timedelta(days=Config.EXTRACTION_CACHE_MAX_AGE_DAYS)
+        max_size = Config.EXTRACTION_CACHE_MAX_SIZE_MB * 1024 * 1024
+        
+        evicted = []
+        total_size = 0
+        entries = ExtractionCacheEntry.query.order_by(
+            ExtractionCacheEntry.last_used_at.desc()
+        ).all()
+        for entry in entries:
+            if (entry.parser_version != PARSER_VERSION or
+                    entry.last_used_at < cutoff or
+                    total_size + (entry.zip_size or 0) > max_size):
+                evicted.append(entry)
+                continue
+            total_size += entry.zip_size or 0
+        
+        for entry in evicted:
+            db.session.delete(entry)
+        if evicted:
+            db.session.flush()
+            self.logger.info(f"Evicted {len(evicted)} extraction cache entries")
+        
+        return len(evicted)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with entries, total_size_mb, hits, misses and hit_rate
+            (hits and misses are counted since process start)
+        """
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+        total_size = db.session.query(
+            db.func.coalesce(db.func.sum(ExtractionCacheEntry.zip_size), 0)
+        ).scalar()
+        
+        return {
+            'entries': ExtractionCacheEntry.query.count(),
+            'total_size_mb': round(total_size / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': f"{hit_rate:.2f}%"
+        }
+    
+    def _clone_package_rows(self, model: Any, source_id: int, target_id: int) -> None:
+        """Copy the rows of a package-scoped table to another package."""
+        table = model.__table__
+        columns = self._copied_columns(table)
+        overrides = {
+            'package_id': literal(target_id),
+            'created_at': literal(datetime.utcnow())
+        }
+        if 'sail_code' in table.c:
+            overrides['sail_code'] = self._unformatted_sail_code(table, source_id)
+        
+        db.session.execute(table.insert().from_select(
+            [column.name for column in columns],
+            select(*[overrides.get(column.name, column) for column in columns]).where(
+                table.c.package_id == source_id
+            )
+        ))
+    
+    def _unformatted_sail_code(self, table: Any, source_id: int) -> Any:
+        """
+        Get the SAIL code of a source row as it was before formatting.
+        
+        The unformatted code is stored as a blob referenced by the object's
+        version in the source package; rows without one keep their code.
+        """
+        versions = ObjectVersion.__table__.alias('source_version')
+        raw_code = select(ContentBlob.content).select_from(
+            versions.join(
+                ContentBlob.__table__,
+                ContentBlob.hash == versions.c.raw_sail_code_hash
+            )
+        ).where(
+            versions.c.package_id == source_id,
+            versions.c.object_id == table.c.object_id
+        ).scalar_subquery()
+        return func.coalesce(raw_code, table.c.sail_code)
+    
+    def _clone_child_rows(
+        self,
+        child: Any,
+        parent: Any,
+        foreign_key: str,
+        source_id: int,
+        target_id: int
+    ) -> None:
+        """Copy child rows, pointing them at the cloned parent of the same object."""
+        table = child.__table__
+        old_parent = parent.__table__.alias('old_parent')
+        new_parent = parent.__table__.alias('new_parent')
+        columns = self._copied_columns(table)
+        overrides = {
+            foreign_key: new_parent.c.id,
+            'created_at': literal(datetime.utcnow())
+        }
+        
+        query = select(
+            *[overrides.get(column.name, column) for column in columns]
+        ).select_from(
+            table.join(old_parent, table.c[foreign_key] == old_parent.c.id).join(
+                new_parent,
+                and_(
+                    new_parent.c.object_id == old_parent.c.object_id,
+                    new_parent.c.package_id == target_id
+                )
+            )
+        ).where(old_parent.c.package_id == source_id)
+        
+        db.session.execute(table.insert().from_select(
+            [column.name for column in columns], query
+        ))
+    
+    def _clone_process_model_flows(self, source_id: int, target_id: int) -> None:
+        """Copy process model flows, pointing them at the cloned nodes."""
+        flows = ProcessModelFlow.__table__
+        nodes = ProcessModelNode.__table__
+        old_pm = ProcessModel.__table__.alias('old_pm')
+        new_pm = ProcessModel.__table__.alias('new_pm')
+        old_from = nodes.alias('old_from')
+        new_from = nodes.alias('new_from')
+        old_to = nodes.alias('old_to')
+        new_to = nodes.alias('new_to')
+        columns = self._copied_columns(flows)
+        overrides = {
+            'process_model_id': new_pm.c.id,
+            'from_node_id': new_from.c.id,
+            'to_node_id': new_to.c.id,
+            'created_at': literal(datetime.utcnow())
+        }
+        
+        query = select(
+            *[overrides.get(column.name, column) for column in columns]
+        ).select_from(
+            flows.join(old_pm, flows.c.process_model_id == old_pm.c.id).join(
+                new_pm,
+                and_(
+                    new_pm.c.object_id == old_pm.c.object_id,
+                    new_pm.c.package_id == target_id
+                )
+            ).join(
+                old_from, flows.c.from_node_id == old_from.c.id
+            ).join(
+                new_from,
+                and_(
+                    new_from.c.process_model_id == new_pm.c.id,
+                    new_from.c.node_id == old_from.c.node_id
+                )
+            ).join(
+                old_to, flows.c.to_node_id == old_to.c.id
+            ).join(
+                new_to,
+                and_(
+                    new_to.c.process_model_id == new_pm.c.id,
+                    new_to.c.node_id == old_to.c.node_id
+                )
+            )
+        ).where(old_pm.c.package_id == source_id)
+        
+        db.session.execute(flows.insert().from_select(
+            [column.name for column in columns], query
+        ))
+    
+    @staticmethod
+    def _copied_columns(table: Any) -> List[Any]:
+        """Columns copied when cloning a row (everything but the primary key)."""
+        return [column for column in table.columns if not column.primary_key]
@@ -7,6 +7,7 @@ in the working set.
 
 import logging
 from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import joinedload
 
 from core.base_service import BaseService
 from models import db
@@ -374,7 +375,11 @@ class MergeGuidanceService(BaseService):
             }
         
         # Get all versions from object_versions (package-specific)
-        versions = db.session.query(ObjectVersion).filter_by(
+        versions = db.session.query(ObjectVersion).options(
+            joinedload(ObjectVersion.fields_blob),
+            joinedload(ObjectVersion.properties_blob),
+            joinedload(ObjectVersion.raw_xml_blob)
+        ).filter_by(
             object_id=object_id
         ).all()
         
@@ -0,0 +1,274 @@
+"""
+Merge Job Service
+
+Runs three-way merge workflows and customer package re-merges on a
+bounded executor so POST /merge/create and POST /merge/<reference_id>/remerge
+can return straight away. Step progress is kept in memory for polling and
+streaming.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from flask import current_app
+
+from core.base_service import BaseService
+from core.exceptions import ResourceConstraintException
+from core.logger import get_merge_logger
+from domain.enums import SessionStatus
+from models import db, MergeSession
+from services.merge_progress import (
+    MergeProgress,
+    PROGRESS_ERROR,
+    PROGRESS_READY
+)
+from services.three_way_merge_orchestrator import (
+    ThreeWayMergeOrchestrator,
+    REMERGE_STEPS,
+    WORKFLOW_STEPS
+)
+
+
+class MergeJobService(BaseService):
+    """
+    Service for running merge workflows in the background.
+    
+    At most MERGE_JOB_WORKERS workflows run at once; submissions beyond
+    MERGE_JOB_MAX_PENDING unfinished workflows are rejected. Progress of
+    the last FINISHED_JOBS_KEPT finished workflows stays available; older
+    (or pre-restart) sessions report their stored status without steps.
+    
+    Example:
+        >>> job_service = MergeJobService()
+        >>> progress = job_service.submit(base_path, customized_path, new_vendor_path)
+        >>> job_service.get_progress(progress.reference_id)['current_step']
+        3
+    """
+    
+    # Finished workflows whose step progress is kept
+    FINISHED_JOBS_KEPT = 50
+    
+    # Progress by reference_id, shared so any request thread can report it
+    _jobs: "OrderedDict[str, MergeProgress]" = OrderedDict()
+    _jobs_lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+    
+    def __init__(self, container=None):
+        """Initialize service with dependencies."""
+        super().__init__(container)
+        self.logger = get_merge_logger()
+    
+    def _initialize_dependencies(self) -> None:
+        """Initialize service dependencies."""
+        self.orchestrator = self._get_service(ThreeWayMergeOrchestrator)
+    
+    def submit(
+        self,
+        base_zip_path: str,
+        customized_zip_path: str,
+        new_vendor_zip_path: str
+    ) -> MergeProgress:
+        """
+        Create a merge session and process it in the background.
+        
+        Must be called inside a Flask application context; the workflow
+        runs in that application.
+        
+        Args:
+            base_zip_path: Path to Package A (Base Version) ZIP file
+            customized_zip_path: Path to Package B (Customer Version) ZIP file
+            new_vendor_zip_path: Path to Package C (New Vendor Version) ZIP file
+        
+        Returns:
+            MergeProgress of the new session (reference_id is set)
+        
+        Raises:
+            ResourceConstraintException: If too many workflows are unfinished
+        """
+        with self._jobs_lock:
+            self._check_capacity()
+            session = self.orchestrator.create_session_record()
+            progress = MergeProgress(session.reference_id, WORKFLOW_STEPS)
+            self._jobs[session.reference_id] = progress
+            executor = self._get_executor()
+        
+        workflow = partial(
+            self.orchestrator.create_merge_session,
+            base_zip_path=base_zip_path,
+            customized_zip_path=customized_zip_path,
+            new_vendor_zip_path=new_vendor_zip_path,
+            reference_id=session.reference_id,
+            progress=progress
+        )
+        executor.submit(self._run_job, current_app._get_current_object(), progress, workflow)
+        self.logger.info(f"Queued merge workflow for session {session.reference_id}")
+        return progress
+    
+    def submit_remerge(
+        self,
+        reference_id: str,
+        customized_zip_path: str
+    ) -> MergeProgress:
+        """
+        Re-merge a ready session against a new Package B in the background.
+        
+        See ThreeWayMergeOrchestrator.remerge_customer_package(). Must be
+        called inside a Flask application context.
+        
+        Args:
+            reference_id: Session reference ID
+            customized_zip_path: Path to the new Package B ZIP file
+        
+        Returns:
+            MergeProgress of the re-merge
+        
+        Raises:
+            ValueError: If the session does not exist, is not ready or is
+                        already being re-merged
+            ResourceConstraintException: If too many workflows are unfinished
+        """
+        session = db.session.query(MergeSession).filter_by(
+            reference_id=reference_id
+        ).first()
+        if not session:
+            raise ValueError(f"Session not found: {reference_id}")
+        if session.status != SessionStatus.READY.value:
+            raise ValueError(
+                f"Session {reference_id} cannot be re-merged (status: {session.status})"
+            )
+        
+        with self._jobs_lock:
+            running = self._jobs.get(reference_id)
+            if running is not None and not running.finished:
+                raise ValueError(f"Session {reference_id} is already being processed")
+            self._check_capacity()
+            progress = MergeProgress(reference_id, REMERGE_STEPS)
+            self._jobs[reference_id] = progress
+            self._jobs.move_to_end(reference_id)
+            executor = self._get_executor()
+        
+        workflow = partial(
+            self.orchestrator.remerge_customer_package,
+            reference_id=reference_id,
+            customized_zip_path=customized_zip_path,
+            progress=progress
+        )
+        executor.submit(self._run_job, current_app._get_current_object(), progress, workflow)
+        self.logger.info(f"Queued customer package re-merge for session {reference_id}")
+        return progress
+    
+    def get_job(self, reference_id: str) -> Optional[MergeProgress]:
+        """
+        Get the in-memory progress of a recent workflow.
+        
+        Args:
+            reference_id: Session reference ID
+        
+        Returns:
+            MergeProgress, or None if it is not (or no longer) tracked
+        """
+        with self._jobs_lock:
+            return self._jobs.get(reference_id)
+    
+    def get_progress(self, reference_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the progress of a merge workflow.
+        
+        Args:
+            reference_id: Session reference ID
+        
+        Returns:
+            MergeProgress.to_dict() of a tracked workflow, the stored
+            session status of an untracked one, or None if the session
+            does not exist
+        """
+        progress = self.get_job(reference_id)
+        if progress is not None:
+            return progress.to_dict()
+        
+        session = db.session.query(MergeSession).filter_by(
+            reference_id=reference_id
+        ).first()
+        if not session:
+            return None
+        
+        data = {
+            'reference_id': session.reference_id,
+            'status': session.status,
+            'current_step': None,
+            'total_steps': WORKFLOW_STEPS,
+            'steps': [],
+            'elapsed_seconds': None,
+            'version': 0
+        }
+        if session.status == SessionStatus.READY.value:
+            data['total_changes'] = session.total_changes
+        elif session.status == SessionStatus.ERROR.value:
+            data['error'] = 'Merge workflow failed'
+        return data
+    
+    def _check_capacity(self) -> None:
+        """Reject a submission if too many workflows are unfinished (lock held)."""
+        from config import Config
+        
+        pending = sum(1 for job in self._jobs.values() if not job.finished)
+        if pending >= Config.MERGE_JOB_MAX_PENDING:
+            raise ResourceConstraintException(
+                "Too many merge sessions are being processed - please try again shortly"
+            )
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared executor, creating it on first use (lock held)."""
+        from config import Config
+        
+        if MergeJobService._executor is None:
+            MergeJobService._executor = ThreadPoolExecutor(
+                max_workers=Config.MERGE_JOB_WORKERS,
+                thread_name_prefix='MergeJob'
+            )
+        return MergeJobService._executor
+    
+    def _run_job(
+        self,
+        app,
+        progress: MergeProgress,
+        workflow: Callable[[], MergeSession]
+    ) -> None:
+        """Run a workflow in a worker thread and record its outcome."""
+        with app.app_context():
+            try:
+                session = workflow()
+                progress.finish(PROGRESS_READY, total_changes=session.total_changes)
+            except Exception as e:
+                self.logger.error(
+                    f"Merge workflow for session {progress.reference_id} failed: {e}"
+                )
+                self._mark_failed(progress.reference_id)
+                progress.finish(PROGRESS_ERROR, error=str(e))
+            finally:
+                db.session.remove()
+                self._forget_finished()
+    
+    def _mark_failed(self, reference_id: str) -> None:
+        """Mark a session as ERROR if the workflow left it processing."""
+        try:
+            db.session.rollback()
+            session = db.session.query(MergeSession).filter_by(
+                reference_id=reference_id
+            ).first()
+            if session and session.status == SessionStatus.PROCESSING.value:
+                session.status = SessionStatus.ERROR.value
+                db.session.commit()
+        except Exception as e:
+            self.logger.error(f"Failed to mark session {reference_id} as error: {e}")
+    
+    def _forget_finished(self) -> None:
+        """Drop the oldest finished workflows beyond FINISHED_JOBS_KEPT."""
+        with self._jobs_lock:
+            finished = [ref for ref, job in self._jobs.items() if job.finished]
+            excess = len(finished) - self.FINISHED_JOBS_KEPT
+            for reference_id in finished[:max(excess, 0)]:
+                del self._jobs[reference_id]
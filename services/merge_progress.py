@@ -0,0 +1,183 @@
+"""
+Merge Progress
+
+Step progress of a three-way merge workflow run. The orchestrator records
+each step it logs with LoggerConfig.log_step, so progress can be polled
+or streamed while the workflow runs in the background.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+# Workflow states reported to clients
+PROGRESS_PROCESSING = 'processing'
+PROGRESS_READY = 'ready'
+PROGRESS_ERROR = 'error'
+
+
+class MergeProgress:
+    """
+    Thread-safe progress of one merge workflow run.
+
+    Every change increments a version, so readers can wait for the next
+    change with wait_for_change() instead of polling.
+
+    Example:
+        >>> progress = MergeProgress('MRG_001', total_steps=10)
+        >>> progress.start_step(2, "Extracting Package A (Base Version)")
+        >>> progress.complete_step(2, duration=3.2, objects_processed=412)
+        >>> progress.to_dict()['current_step']
+        2
+    """
+
+    def __init__(self, reference_id: Optional[str] = None, total_steps: int = 10):
+        """
+        Initialize progress.
+
+        Args:
+            reference_id: Session reference ID (None until the session exists)
+            total_steps: Number of workflow steps
+        """
+        self.reference_id = reference_id
+        self.total_steps = total_steps
+        self.status = PROGRESS_PROCESSING
+        self.error: Optional[str] = None
+        self.total_changes: Optional[int] = None
+        self.version = 0
+        self._steps: Dict[int, Dict[str, Any]] = {}
+        self._current_step: Optional[int] = None
+        self._start_time = time.time()
+        self._finish_time: Optional[float] = None
+        self._condition = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the workflow completed or failed"""
+        return self.status != PROGRESS_PROCESSING
+
+    def start_step(self, step_number: int, description: str) -> None:
+        """
+        Record that a step started.
+
+        Args:
+            step_number: Step number (1-based)
+            description: Step description as logged
+        """
+        with self._condition:
+            self._steps[step_number] = {
+                'step': step_number,
+                'description': description,
+                'status': 'running',
+                'objects_processed': None,
+                'elapsed_seconds': None,
+                '_started_at': time.time()
+            }
+            self._current_step = step_number
+            self._changed()
+
+    def complete_step(
+        self,
+        step_number: int,
+        duration: float,
+        objects_processed: Optional[int] = None
+    ) -> None:
+        """
+        Record that a step completed.
+
+        Args:
+            step_number: Step number (1-based)
+            duration: Seconds the step took, as logged
+            objects_processed: Objects or changes the step produced
+        """
+        with self._condition:
+            step = self._steps.get(step_number)
+            if step is None:
+                return
+            step['status'] = 'completed'
+            step['elapsed_seconds'] = round(duration, 2)
+            step['objects_processed'] = objects_processed
+            self._changed()
+
+    def finish(
+        self,
+        status: str,
+        total_changes: Optional[int] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Record the outcome of the workflow.
+
+        Args:
+            status: PROGRESS_READY or PROGRESS_ERROR
+            total_changes: Changes found (on success)
+            error: Error message (on failure)
+        """
+        with self._condition:
+            self.status = status
+            self.total_changes = total_changes
+            self.error = error
+            self._finish_time = time.time()
+            if status == PROGRESS_ERROR and self._current_step in self._steps:
+                step = self._steps[self._current_step]
+                if step['status'] == 'running':
+                    step['status'] = 'failed'
+            self._changed()
+
+    def wait_for_change(self, version: int, timeout: float) -> int:
+        """
+        Wait until the progress changes past a version.
+
+        Args:
+            version: Version the caller has seen
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Current version (equal to version on timeout)
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.version != version or self.finished,
+                timeout=timeout
+            )
+            return self.version
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the progress as a JSON-serializable dict.
+
+        Returns:
+            Dict with reference_id, status, current_step, total_steps,
+            steps (step, description, status, objects_processed,
+            elapsed_seconds), elapsed_seconds, version and, once
+            finished, total_changes or error
+        """
+        with self._condition:
+            now = time.time()
+            steps: List[Dict[str, Any]] = []
+            for number in sorted(self._steps):
+                step = {k: v for k, v in self._steps[number].items() if not k.startswith('_')}
+                if step['status'] == 'running':
+                    step['elapsed_seconds'] = round(now - self._steps[number]['_started_at'], 2)
+                steps.append(step)
+
+            data = {
+                'reference_id': self.reference_id,
+                'status': self.status,
+                'current_step': self._current_step,
+                'total_steps': self.total_steps,
+                'steps': steps,
+                'elapsed_seconds': round((self._finish_time or now) - self._start_time, 2),
+                'version': self.version
+            }
+            if self.status == PROGRESS_READY:
+                data['total_changes'] = self.total_changes
+            elif self.status == PROGRESS_ERROR:
+                data['error'] = self.error
+            return data
+
+    def _changed(self) -> None:
+        """Bump the version and wake waiting readers (lock held)."""
+        self.version += 1
+        self._condition.notify_all()
@@ -5,14 +5,22 @@ Generates AI-powered summaries for merge changes asynchronously.
 """
 import logging
 import threading
+import time
 import json
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import joinedload
+
 from core.base_service import BaseService
 from core.logger import LoggerConfig, get_merge_logger
 from models import db, Change, ObjectLookup, ObjectVersion, Package
 from services.ai.q_agent_service import QAgentService
+from services.ai.summary_queue import SummaryPriorityQueue
+from services.ai.summary_scheduler import BatchStats, SummaryScheduler
+from services.summary_cache_service import SummaryCacheService
 from repositories.change_repository import ChangeRepository
 
 
@@ -23,9 +31,11 @@ class MergeSummaryService(BaseService):
     This service:
     1. Fetches change data with customer and vendor versions
     2. Formats data for Q agent consumption
-    3. Calls Q agent asynchronously in batches
-    4. Updates changes table with summaries
-    5. Tracks progress and handles errors
+    3. Reuses cached summaries of identical changes from earlier sessions
+    4. Queues the rest CONFLICT first and calls Q agent in concurrent,
+       rate-limited batches
+    5. Updates changes table with summaries
+    6. Tracks progress and handles errors
     
     Example:
         >>> service = MergeSummaryService()
@@ -35,21 +45,39 @@ class MergeSummaryService(BaseService):
         >>> print(f"Progress: {progress['completed']}/{progress['total']}")
     """
     
-    BATCH_SIZE = 15  # Process 15 changes per Q agent call
+    BATCH_SIZE = 15  # Process up to 15 changes per Q agent call
     MAX_SAIL_CODE_LENGTH = 5000  # Truncate SAIL code to prevent prompt overflow
     
+    # Summary queues of running generations, shared so a reviewer opening
+    # a change can promote it from any request thread
+    _active_queues: Dict[int, SummaryPriorityQueue] = {}
+    _queues_lock = threading.Lock()
+    
     def __init__(self, container=None):
         """Initialize service with dependencies."""
         super().__init__(container)
         self.logger = get_merge_logger()
         self.app = None  # Will be set when needed for threading
+        self._write_stats = {
+            'transactions': 0,
+            'rows': 0,
+            'total_lock_seconds': 0.0,
+            'max_lock_seconds': 0.0
+        }
+        self._write_stats_lock = threading.Lock()
+        self.batch_stats = BatchStats()
     
     def _initialize_dependencies(self) -> None:
         """Initialize service dependencies."""
         self.q_agent_service = self._get_service(QAgentService)
         self.change_repository = self._get_repository(ChangeRepository)
+        self.summary_cache = self._get_service(SummaryCacheService)
     
-    def generate_summaries_async(self, session_id: int) -> None:
+    def generate_summaries_async(
+        self,
+        session_id: int,
+        change_ids: Optional[List[int]] = None
+    ) -> None:
         """
         Trigger asynchronous AI summary generation for all changes in session.
         
@@ -59,7 +87,8 @@ class MergeSummaryService(BaseService):
         
         Args:
             session_id: Merge session ID
-            
+            change_ids: Only summarize these changes (default: all changes)
+        
         Example:
             >>> service.generate_summaries_async(session_id=1)
             >>> # Returns immediately, processing continues in background
@@ -78,7 +107,7 @@ class MergeSummaryService(BaseService):
         # Start background thread
         thread = threading.Thread(
             target=self._generate_summaries_background,
-            args=(session_id,),
+            args=(session_id, change_ids),
             daemon=True,
             name=f"MergeSummary-{session_id}"
         )
@@ -94,19 +123,24 @@ class MergeSummaryService(BaseService):
             result="Background thread started"
         )
     
-    def _generate_summaries_background(self, session_id: int) -> None:
+    def _generate_summaries_background(
+        self,
+        session_id: int,
+        change_ids: Optional[List[int]] = None
+    ) -> None:
         """
         Background worker for summary generation.
         
         This runs in a separate thread and:
         1. Fetches all changes for the session
         2. Prepares data with customer and vendor versions
-        3. Batches changes for efficient processing
-        4. Calls Q agent for each batch
-        5. Updates database with results
+        3. Queues changes by priority and batches them for processing
+        4. Calls Q agent for up to SUMMARY_MAX_CONCURRENCY batches at once
+        5. Updates database with results as each batch completes
         
         Args:
             session_id: Merge session ID
+            change_ids: Only summarize these changes (default: all changes)
         """
         start_time = datetime.utcnow()
         self.logger.info("="*80)
@@ -123,7 +157,7 @@ class MergeSummaryService(BaseService):
                 # Fetch and prepare change data
                 self.logger.info(f"Step 1/4: Fetching and preparing change data...")
                 prep_start = datetime.utcnow()
-                changes_data = self._prepare_changes_data(session_id)
+                changes_data = self._prepare_changes_data(session_id, change_ids)
                 prep_duration = (datetime.utcnow() - prep_start).total_seconds()
                 
                 if not changes_data:
@@ -145,74 +179,106 @@ class MergeSummaryService(BaseService):
                         f"Classification: {change['classification']}"
                     )
                 
-                # Create batches
-                self.logger.info(f"Step 2/4: Creating batches...")
-                batches = self._create_batches(changes_data, self.BATCH_SIZE)
+                # Fill summaries of changes seen in earlier sessions
+                cached = self.summary_cache.lookup(changes_data)
+                if cached:
+                    self._update_change_summaries(cached)
+                    changes_data = [
+                        c for c in changes_data if c['change_id'] not in cached
+                    ]
+                    self.logger.info(
+                        f"✓ Reused {len(cached)} cached summaries, "
+                        f"{len(changes_data)} changes left"
+                    )
+                    if not changes_data:
+                        return
+                
+                # Queue changes by priority; batches are taken from the
+                # queue as workers free up, so promotions are honoured
+                from config import Config
+                
+                self.logger.info(f"Step 2/4: Queueing changes by priority...")
+                queue = SummaryPriorityQueue(
+                    changes_data,
+                    self._get_display_orders(session_id)
+                )
+                with self._queues_lock:
+                    self._active_queues[session_id] = queue
+                batches = queue.iter_batches(
+                    self.BATCH_SIZE, Config.SUMMARY_PROMPT_TOKEN_BUDGET
+                )
                 self.logger.info(
-                    f"✓ Created {len(batches)} batches (size={self.BATCH_SIZE})"
+                    f"✓ Queued {len(changes_data)} changes "
+                    f"(batch size={self.BATCH_SIZE}, "
+                    f"token budget={Config.SUMMARY_PROMPT_TOKEN_BUDGET})"
                 )
                 
-                # Process each batch
-                self.logger.info(f"Step 3/4: Processing batches...")
+                scheduler = self._create_scheduler(session_id)
+                
+                # Process batches concurrently
+                self.logger.info(
+                    f"Step 3/4: Processing batches "
+                    f"(concurrency={scheduler.max_concurrency})..."
+                )
                 successful_batches = 0
                 failed_batches = 0
                 total_summaries = 0
+                batch_count = 0
                 
-                for batch_num, batch in enumerate(batches, 1):
-                    batch_start = datetime.utcnow()
+                for outcome in scheduler.run(batches, on_start=self._start_batch):
+                    batch_num = outcome.batch_num
+                    batch = outcome.batch
+                    batch_count += 1
                     self.logger.info("-"*60)
-                    self.logger.info(
-                        f"Batch {batch_num}/{len(batches)}: "
-                        f"Processing {len(batch)} changes"
-                    )
-                    
-                    # Log batch contents
-                    change_ids = [c['change_id'] for c in batch]
-                    self.logger.debug(f"  Change IDs: {change_ids}")
                     
                     try:
-                        # Mark changes as processing
-                        self.logger.debug(f"  Marking batch as 'processing'...")
-                        self._update_batch_status(batch, 'processing')
-                        self.logger.debug(f"  ✓ Status updated")
-                        
-                        # Call Q agent
-                        self.logger.info(f"  Calling Q Agent for summary generation...")
-                        agent_start = datetime.utcnow()
-                        summaries = self.q_agent_service.process_merge_summaries(
-                            session_id, batch
-                        )
-                        agent_duration = (datetime.utcnow() - agent_start).total_seconds()
-                        
-                        self.logger.info(
-                            f"  ✓ Q Agent returned {len(summaries)} summaries "
-                            f"in {agent_duration:.2f}s"
-                        )
+                        summaries = dict(outcome.summaries)
+                        if outcome.succeeded:
+                            self.logger.info(
+                                f"  ✓ Batch {batch_num} ({len(batch)} changes): Q Agent "
+                                f"returned {len(summaries)} summaries in "
+                                f"{outcome.duration:.2f}s ({outcome.attempts} call(s), "
+                                f"{outcome.splits} split(s))"
+                            )
+                        else:
+                            self.logger.warning(
+                                f"  Batch {batch_num} ({len(batch)} changes): Q Agent failed "
+                                f"for {len(outcome.failed)} changes after "
+                                f"{outcome.attempts} call(s): {outcome.error} - "
+                                f"using fallback summaries"
+                            )
+                            summaries.update(
+                                self.q_agent_service.fallback_merge_summaries(outcome.failed)
+                            )
                         
-                        # Update changes with summaries
+                        # Update changes with summaries; only agent summaries are cached
                         self.logger.debug(f"  Updating changes with summaries...")
                         update_start = datetime.utcnow()
-                        self._update_change_summaries(summaries)
+                        self._update_change_summaries(
+                            summaries,
+                            cache_batch=outcome.summarized
+                        )
                         update_duration = (datetime.utcnow() - update_start).total_seconds()
                         
-                        batch_duration = (datetime.utcnow() - batch_start).total_seconds()
-                        
                         self.logger.info(
-                            f"  ✓ Batch {batch_num} completed in {batch_duration:.2f}s "
-                            f"(agent: {agent_duration:.2f}s, update: {update_duration:.2f}s)"
+                            f"  ✓ Batch {batch_num} completed "
+                            f"(agent: {outcome.duration:.2f}s, update: {update_duration:.2f}s)"
                         )
                         
-                        successful_batches += 1
+                        if outcome.succeeded:
+                            successful_batches += 1
+                        else:
+                            failed_batches += 1
                         total_summaries += len(summaries)
-                        
+                    
                     except Exception as batch_error:
-                        batch_duration = (datetime.utcnow() - batch_start).total_seconds()
                         self.logger.error(
-                            f"  ✗ Batch {batch_num} FAILED after {batch_duration:.2f}s: {batch_error}",
+                            f"  ✗ Batch {batch_num} FAILED: {batch_error}",
                             exc_info=True
                         )
                         # Mark batch changes as failed
                         self.logger.debug(f"  Marking batch as 'failed'...")
+                        db.session.rollback()
                         self._mark_batch_failed(batch, str(batch_error))
                         failed_batches += 1
                 
@@ -221,12 +287,12 @@ class MergeSummaryService(BaseService):
                 self.logger.info("="*80)
                 self.logger.info(f"AI SUMMARY GENERATION COMPLETED - Session {session_id}")
                 self.logger.info(f"Total Duration: {total_duration:.2f}s")
-                self.logger.info(f"Successful Batches: {successful_batches}/{len(batches)}")
-                self.logger.info(f"Failed Batches: {failed_batches}/{len(batches)}")
+                self.logger.info(f"Successful Batches: {successful_batches}/{batch_count}")
+                self.logger.info(f"Failed Batches: {failed_batches}/{batch_count}")
                 self.logger.info(f"Total Summaries Generated: {total_summaries}")
                 self.logger.info(f"Average Time per Summary: {total_duration/total_summaries:.2f}s" if total_summaries > 0 else "N/A")
                 self.logger.info("="*80)
-                
+        
         except Exception as e:
             total_duration = (datetime.utcnow() - start_time).total_seconds()
             self.logger.error("="*80)
@@ -237,8 +303,101 @@ class MergeSummaryService(BaseService):
             self.logger.error(f"Failed after {total_duration:.2f}s")
             self.logger.error(f"Error: {e}")
             self.logger.error("="*80)
+        finally:
+            with self._queues_lock:
+                self._active_queues.pop(session_id, None)
     
-    def _prepare_changes_data(self, session_id: int) -> List[Dict]:
+    def prioritize_change(self, session_id: int, change_id: int) -> bool:
+        """
+        Move a change to the front of the session's summary queue.
+        
+        Called when a reviewer opens a change, so its summary is generated
+        next if it has not been picked up yet.
+        
+        Args:
+            session_id: Merge session ID
+            change_id: Change ID
+        
+        Returns:
+            True if the change was waiting in a running summary queue
+        
+        Example:
+            >>> service.prioritize_change(session_id=1, change_id=42)
+            True
+        """
+        with self._queues_lock:
+            queue = self._active_queues.get(session_id)
+        
+        if queue is None or not queue.promote(change_id):
+            return False
+        
+        self.logger.info(
+            f"Prioritized AI summary of change {change_id} in session {session_id}"
+        )
+        return True
+    
+    def _get_display_orders(self, session_id: int) -> Dict[int, int]:
+        """
+        Get the display order of every change in a session.
+        
+        Args:
+            session_id: Merge session ID
+        
+        Returns:
+            Dict mapping change_id -> display_order
+        """
+        return dict(
+            db.session.query(Change.id, Change.display_order).filter(
+                Change.session_id == session_id
+            ).all()
+        )
+    
+    def _create_scheduler(self, session_id: int) -> SummaryScheduler:
+        """
+        Create the scheduler that runs Q agent batches concurrently.
+        
+        Args:
+            session_id: Merge session ID
+        
+        Returns:
+            SummaryScheduler configured from Config
+        """
+        from config import Config
+        
+        def process_batch(batch: List[Dict]) -> Dict[int, Dict]:
+            return self.q_agent_service.process_merge_summaries(
+                session_id, batch, use_fallback=False
+            )
+        
+        return SummaryScheduler(
+            process_batch,
+            max_concurrency=Config.SUMMARY_MAX_CONCURRENCY,
+            rate_per_minute=Config.SUMMARY_RATE_LIMIT_PER_MINUTE,
+            max_retries=Config.SUMMARY_MAX_RETRIES,
+            backoff_seconds=Config.SUMMARY_RETRY_BACKOFF_SECONDS,
+            stats=self.batch_stats
+        )
+    
+    def _start_batch(self, batch_num: int, batch: List[Dict]) -> None:
+        """
+        Mark a batch as processing when it is handed to a worker.
+        
+        Args:
+            batch_num: 1-based batch number
+            batch: List of change dictionaries
+        """
+        change_ids = [c['change_id'] for c in batch]
+        self.logger.info(
+            f"Batch {batch_num}: Processing {len(batch)} changes"
+        )
+        self.logger.debug(f"  Change IDs: {change_ids}")
+        self._update_batch_status(batch, 'processing')
+    
+    def _prepare_changes_data(
+        self,
+        session_id: int,
+        change_ids: Optional[List[int]] = None
+    ) -> List[Dict]:
         """
         Prepare change data with customer and vendor versions.
         
@@ -252,7 +411,8 @@ class MergeSummaryService(BaseService):
         
         Args:
             session_id: Merge session ID
-            
+            change_ids: Only prepare these changes (default: all changes)
+        
         Returns:
             List of change dictionaries ready for Q agent
         """
@@ -260,30 +420,12 @@ class MergeSummaryService(BaseService):
         
         # Get all changes for session
         changes = self.change_repository.get_by_session(session_id)
+        if change_ids is not None:
+            wanted = set(change_ids)
+            changes = [change for change in changes if change.id in wanted]
         self.logger.info(f"Found {len(changes)} changes in database")
         
-        # Get packages for this session
-        self.logger.debug(f"Fetching packages for session {session_id}...")
-        packages = db.session.query(Package).filter_by(
-            session_id=session_id
-        ).all()
-        self.logger.info(f"Found {len(packages)} packages")
-        
-        for pkg in packages:
-            self.logger.debug(
-                f"  Package: {pkg.package_type} - {pkg.filename} "
-                f"({pkg.total_objects} objects)"
-            )
-        
-        package_map = {
-            'customized': next((p for p in packages if p.package_type == 'customized'), None),
-            'new_vendor': next((p for p in packages if p.package_type == 'new_vendor'), None)
-        }
-        
-        if not package_map['customized']:
-            self.logger.warning("No 'customized' package found!")
-        if not package_map['new_vendor']:
-            self.logger.warning("No 'new_vendor' package found!")
+        package_map = self._get_package_map(session_id)
         
         changes_data = []
         failed_count = 0
@@ -295,34 +437,13 @@ class MergeSummaryService(BaseService):
                 if idx % 10 == 0:
                     self.logger.debug(f"  Processing change {idx}/{len(changes)}...")
                 
-                # Get object details
-                obj = change.object
-                
-                if not obj:
-                    self.logger.error(f"Change {change.id} has no associated object!")
+                change_dict = self._build_change_data(change, package_map)
+                if not change_dict:
                     failed_count += 1
                     continue
                 
-                # Fetch versions for customer and vendor packages only
-                versions = self._fetch_object_versions(
-                    change.object_id,
-                    package_map
-                )
-                
-                change_dict = {
-                    'change_id': change.id,
-                    'object_name': obj.name,
-                    'object_type': obj.object_type,
-                    'object_uuid': obj.uuid,
-                    'classification': change.classification,
-                    'vendor_change_type': change.vendor_change_type,
-                    'customer_change_type': change.customer_change_type,
-                    'customer_version': versions.get('customized'),
-                    'new_vendor_version': versions.get('new_vendor')
-                }
-                
                 changes_data.append(change_dict)
-                
+            
             except Exception as e:
                 self.logger.error(
                     f"Failed to prepare change {change.id}: {e}",
@@ -338,6 +459,98 @@ class MergeSummaryService(BaseService):
         
         return changes_data
     
+    def _prepare_change_data(self, change: Change) -> Optional[Dict]:
+        """
+        Prepare data for a single change.
+        
+        Loads only this change's object and its customer and vendor
+        versions, instead of the whole session like _prepare_changes_data().
+        
+        Args:
+            change: Change to prepare
+        
+        Returns:
+            Change dictionary ready for Q agent, or None if the change has
+            no object
+        """
+        package_map = self._get_package_map(change.session_id)
+        return self._build_change_data(change, package_map)
+    
+    def _get_package_map(self, session_id: int) -> Dict[str, Optional[Package]]:
+        """
+        Get the customer and vendor packages of a session.
+        
+        Args:
+            session_id: Merge session ID
+        
+        Returns:
+            Dict with 'customized' and 'new_vendor' Package (or None)
+        """
+        self.logger.debug(f"Fetching packages for session {session_id}...")
+        packages = db.session.query(Package).filter(
+            Package.session_id == session_id,
+            Package.package_type.in_(['customized', 'new_vendor'])
+        ).all()
+        self.logger.debug(f"Found {len(packages)} packages")
+        
+        for pkg in packages:
+            self.logger.debug(
+                f"  Package: {pkg.package_type} - {pkg.filename} "
+                f"({pkg.total_objects} objects)"
+            )
+        
+        package_map = {
+            'customized': next((p for p in packages if p.package_type == 'customized'), None),
+            'new_vendor': next((p for p in packages if p.package_type == 'new_vendor'), None)
+        }
+        
+        if not package_map['customized']:
+            self.logger.warning("No 'customized' package found!")
+        if not package_map['new_vendor']:
+            self.logger.warning("No 'new_vendor' package found!")
+        
+        return package_map
+    
+    def _build_change_data(
+        self,
+        change: Change,
+        package_map: Dict[str, Optional[Package]]
+    ) -> Optional[Dict]:
+        """
+        Build the Q agent dictionary for one change.
+        
+        Args:
+            change: Change to describe
+            package_map: Dict from _get_package_map()
+        
+        Returns:
+            Change dictionary, or None if the change has no object
+        """
+        # Get object details
+        obj = change.object
+        
+        if not obj:
+            self.logger.error(f"Change {change.id} has no associated object!")
+            return None
+        
+        # Fetch versions for customer and vendor packages only
+        versions = self._fetch_object_versions(
+            change.object_id,
+            package_map
+        )
+        
+        return {
+            'change_id': change.id,
+            'object_name': obj.name,
+            'object_type': obj.object_type,
+            'object_uuid': obj.uuid,
+            'classification': change.classification,
+            'vendor_change_type': change.vendor_change_type,
+            'customer_change_type': change.customer_change_type,
+            'customer_version': versions.get('customized'),
+            'new_vendor_version': versions.get('new_vendor')
+        }
+    
     def _fetch_object_versions(
         self,
         object_id: int,
@@ -352,12 +565,25 @@ class MergeSummaryService(BaseService):
             object_id: Object ID from object_lookup
             package_map: Dict mapping package type to Package instance
                         (only 'customized' and 'new_vendor')
-            
+        
         Returns:
             Dict with 'customized' and 'new_vendor' version data
         """
         versions = {}
         
+        # Both versions in one query, with their fields and properties blobs
+        package_ids = [package.id for package in package_map.values() if package]
+        versions_by_package = {
+            version.package_id: version
+            for version in db.session.query(ObjectVersion).options(
+                joinedload(ObjectVersion.fields_blob),
+                joinedload(ObjectVersion.properties_blob)
+            ).filter(
+                ObjectVersion.object_id == object_id,
+                ObjectVersion.package_id.in_(package_ids)
+            )
+        } if package_ids else {}
+        
         for package_type, package in package_map.items():
             if not package:
                 self.logger.debug(
@@ -366,11 +592,7 @@ class MergeSummaryService(BaseService):
                 versions[package_type] = None
                 continue
             
-            # Query object_versions table
-            version = db.session.query(ObjectVersion).filter_by(
-                object_id=object_id,
-                package_id=package.id
-            ).first()
+            version = versions_by_package.get(package.id)
             
             if version:
                 # Truncate SAIL code if too long
@@ -404,27 +626,6 @@ class MergeSummaryService(BaseService):
         
         return versions
     
-    def _create_batches(
-        self,
-        changes_data: List[Dict],
-        batch_size: int
-    ) -> List[List[Dict]]:
-        """
-        Create batches of changes for processing.
-        
-        Args:
-            changes_data: List of change dictionaries
-            batch_size: Number of changes per batch
-            
-        Returns:
-            List of batches (each batch is a list of changes)
-        """
-        batches = []
-        for i in range(0, len(changes_data), batch_size):
-            batch = changes_data[i:i + batch_size]
-            batches.append(batch)
-        return batches
-    
     def _update_batch_status(
         self,
         batch: List[Dict],
@@ -443,74 +644,182 @@ class MergeSummaryService(BaseService):
             f"Updating {len(change_ids)} changes to status '{status}'"
         )
         
-        result = db.session.query(Change).filter(
-            Change.id.in_(change_ids)
-        ).update(
-            {'ai_summary_status': status},
-            synchronize_session=False
-        )
-        
-        db.session.commit()
+        with self._write_transaction('status') as write:
+            result = db.session.execute(
+                update(Change).where(
+                    Change.id.in_(change_ids)
+                ).values(ai_summary_status=status)
+            ).rowcount
+            write['rows'] = result
         
         self.logger.debug(f"Updated {result} changes to status '{status}'")
     
-    def _update_change_summaries(self, summaries: Dict[int, Dict]) -> None:
+    def _update_change_summaries(
+        self,
+        summaries: Dict[int, Dict],
+        cache_batch: Optional[List[Dict]] = None
+    ) -> None:
         """
         Update changes with AI-generated summaries.
         
+        All summaries are written with one executemany UPDATE in a single
+        transaction, so the database write lock is taken once per batch.
+        
         Args:
             summaries: Dict mapping change_id to summary data
+            cache_batch: Change dictionaries the summaries were generated
+                for by the agent; stored in the summary cache in the same
+                transaction
         """
         self.logger.debug(f"Updating {len(summaries)} changes with summaries...")
         
-        success_count = 0
+        rows = []
         fail_count = 0
-        
         for change_id, summary_data in summaries.items():
             try:
-                change = db.session.query(Change).get(change_id)
-                if not change:
-                    self.logger.warning(f"Change {change_id} not found in database")
-                    fail_count += 1
-                    continue
-                
-                # Format summary text
-                summary_text = self._format_summary(summary_data)
-                
-                self.logger.debug(
-                    f"Formatted summary for change {change_id}: "
-                    f"{len(summary_text)} chars"
-                )
-                
-                # Update change
-                change.ai_summary = summary_text
-                change.ai_summary_status = 'completed'
-                change.ai_summary_generated_at = datetime.utcnow()
-                
-                db.session.commit()
-                
-                self.logger.debug(f"✓ Updated summary for change {change_id}")
-                success_count += 1
-                
+                rows.append({
+                    'b_change_id': int(change_id),
+                    'b_ai_summary': self._format_summary(summary_data)
+                })
             except Exception as e:
                 self.logger.error(
-                    f"✗ Failed to update change {change_id}: {e}",
+                    f"✗ Failed to format summary for change {change_id}: {e}",
                     exc_info=True
                 )
-                db.session.rollback()
                 fail_count += 1
         
+        success_count = 0
+        if rows:
+            statement = update(Change.__table__).where(
+                Change.__table__.c.id == bindparam('b_change_id')
+            ).values(
+                ai_summary=bindparam('b_ai_summary'),
+                ai_summary_status='completed',
+                ai_summary_generated_at=datetime.utcnow()
+            )
+            with self._write_transaction('summaries') as write:
+                success_count = db.session.execute(statement, rows).rowcount
+                write['rows'] = success_count
+                if cache_batch:
+                    self._cache_summaries(cache_batch, summaries)
+        
+        not_found = len(rows) - success_count
+        if not_found:
+            self.logger.warning(f"{not_found} summarized changes not found in database")
+        
         self.logger.info(
-            f"Summary updates: {success_count} succeeded, {fail_count} failed"
+            f"Summary updates: {success_count} succeeded, "
+            f"{fail_count + not_found} failed"
         )
     
+    def _cache_summaries(
+        self,
+        changes_data: List[Dict[str, Any]],
+        summaries: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """
+        Cache agent summaries in a savepoint of the summary write.
+        
+        A caching failure is only logged: it rolls back the savepoint, never
+        the summaries written to the changes.
+        """
+        try:
+            with db.session.begin_nested():
+                self.summary_cache.store(changes_data, summaries)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to cache {len(changes_data)} summaries: {e}",
+                exc_info=True
+            )
+    
+    @contextmanager
+    def _write_transaction(self, operation: str) -> Iterator[Dict[str, int]]:
+        """
+        Run writes in one transaction and record how long it held the lock.
+        
+        SQLite takes its write lock at the first write and releases it at
+        commit, so the time from entering the block to the end of the
+        commit is the lock hold time.
+        
+        Args:
+            operation: Name the timing is logged under
+        
+        Yields:
+            Dict whose 'rows' entry the caller sets to the rows written
+        """
+        write = {'rows': 0}
+        start = time.perf_counter()
+        try:
+            yield write
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            held = time.perf_counter() - start
+            with self._write_stats_lock:
+                self._write_stats['transactions'] += 1
+                self._write_stats['rows'] += write['rows']
+                self._write_stats['total_lock_seconds'] += held
+                self._write_stats['max_lock_seconds'] = max(
+                    self._write_stats['max_lock_seconds'], held
+                )
+            self.logger.debug(
+                f"Write transaction '{operation}': {write['rows']} rows, "
+                f"lock held {held * 1000:.1f}ms"
+            )
+    
+    def get_write_stats(self) -> Dict[str, Any]:
+        """
+        Get write lock statistics of summary write-back.
+        
+        Returns:
+            Dict with transactions, rows, total_lock_ms, avg_lock_ms and
+            max_lock_ms (counted since process start)
+        
+        Example:
+            >>> service.get_write_stats()
+            {'transactions': 12, 'rows': 90, 'total_lock_ms': 41.3,
+             'avg_lock_ms': 3.44, 'max_lock_ms': 9.8}
+        """
+        with self._write_stats_lock:
+            stats = dict(self._write_stats)
+        
+        transactions = stats['transactions']
+        return {
+            'transactions': transactions,
+            'rows': stats['rows'],
+            'total_lock_ms': round(stats['total_lock_seconds'] * 1000, 2),
+            'avg_lock_ms': round(
+                stats['total_lock_seconds'] * 1000 / transactions, 2
+            ) if transactions else 0,
+            'max_lock_ms': round(stats['max_lock_seconds'] * 1000, 2)
+        }
+    
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """
+        Get size and latency histograms of Q agent summary calls.
+        
+        Every agent call is counted, including retries and the halves of
+        batches split after a timeout.
+        
+        Returns:
+            Dict with changes, tokens and latency_seconds histograms and
+            timeout and split counts (counted since process start)
+        
+        Example:
+            >>> service.get_batch_stats()['latency_seconds']['mean']
+            42.5
+        """
+        return self.batch_stats.to_dict()
+    
     def _format_summary(self, summary_data: Dict) -> str:
         """
         Format summary data into readable text.
         
         Args:
             summary_data: Dict with summary, complexity, recommendations, etc.
-            
+        
         Returns:
             Formatted summary text
         """
@@ -560,17 +869,16 @@ class MergeSummaryService(BaseService):
             f"Marking {len(change_ids)} changes as failed: {error_msg}"
         )
         
-        result = db.session.query(Change).filter(
-            Change.id.in_(change_ids)
-        ).update(
-            {
-                'ai_summary_status': 'failed',
-                'ai_summary': f"Summary generation failed: {error_msg}"
-            },
-            synchronize_session=False
-        )
-        
-        db.session.commit()
+        with self._write_transaction('failed') as write:
+            result = db.session.execute(
+                update(Change).where(
+                    Change.id.in_(change_ids)
+                ).values(
+                    ai_summary_status='failed',
+                    ai_summary=f"Summary generation failed: {error_msg}"
+                )
+            ).rowcount
+            write['rows'] = result
         
         self.logger.debug(f"Marked {result} changes as failed")
     
@@ -580,10 +888,10 @@ class MergeSummaryService(BaseService):
         
         Args:
             session_id: Merge session ID
-            
+        
         Returns:
             Dict with total, completed, processing, failed, pending counts
-            
+        
         Example:
             >>> progress = service.get_summary_progress(1)
             >>> print(progress)
@@ -626,7 +934,7 @@ class MergeSummaryService(BaseService):
         
         Args:
             change_id: Change ID
-            
+        
         Example:
             >>> service.regenerate_summary(change_id=123)
         """
@@ -642,13 +950,9 @@ class MergeSummaryService(BaseService):
             f"Classification: {change.classification}"
         )
         
-        # Prepare data for this single change
-        self.logger.debug(f"Preparing change data for session {change.session_id}...")
-        changes_data = self._prepare_changes_data(change.session_id)
-        change_data = next(
-            (c for c in changes_data if c['change_id'] == change_id),
-            None
-        )
+        # Prepare data for this single change only
+        self.logger.debug(f"Preparing data for change {change_id}...")
+        change_data = self._prepare_change_data(change)
         
         if not change_data:
             self.logger.error(f"Could not prepare data for change {change_id}")
@@ -666,10 +970,21 @@ class MergeSummaryService(BaseService):
             self.logger.info(f"Calling Q Agent for change {change_id}...")
             agent_start = datetime.utcnow()
             
-            summaries = self.q_agent_service.process_merge_summaries(
-                change.session_id,
-                [change_data]
-            )
+            # The cache is not consulted, regeneration asks for a new summary
+            try:
+                summaries = self.q_agent_service.process_merge_summaries(
+                    change.session_id,
+                    [change_data],
+                    use_fallback=False
+                )
+                cache_batch = [change_data]
+            except Exception as agent_error:
+                self.logger.warning(
+                    f"Q Agent failed for change {change_id}: {agent_error} - "
+                    f"using fallback summary"
+                )
+                summaries = self.q_agent_service.fallback_merge_summaries([change_data])
+                cache_batch = None
             
             agent_duration = (datetime.utcnow() - agent_start).total_seconds()
             self.logger.info(
@@ -679,10 +994,10 @@ class MergeSummaryService(BaseService):
             
             # Update change
             self.logger.debug(f"Updating change {change_id} with summary...")
-            self._update_change_summaries(summaries)
+            self._update_change_summaries(summaries, cache_batch=cache_batch)
             
             self.logger.info(f"✓ Successfully regenerated summary for change {change_id}")
-            
+        
         except Exception as e:
             self.logger.error(
                 f"✗ Failed to regenerate summary for change {change_id}: {e}",
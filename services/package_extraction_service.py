@@ -3,30 +3,335 @@ Package Extraction Service
 
 Handles extraction and parsing of Appian packages (ZIP files).
 Stores objects in the global object_lookup registry and creates package-object mappings.
+
+XML/XSD files are read straight out of the ZIP's central directory; nothing
+is written to disk during extraction.
 """
 
 import os
+import sys
 import json
-import tempfile
+import hashlib
 import zipfile
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
 
 from core.base_service import BaseService
 from core.logger import get_merge_logger, LoggerConfig
-from models import db, Package, ObjectLookup, ObjectVersion, PackageObjectMapping
+from models import (
+    db, Package, ObjectLookup, ObjectVersion, PackageObjectMapping,
+    delete_package_objects
+)
+from repositories.content_blob_repository import ContentBlobRepository, compute_blob_hash
 from repositories.object_lookup_repository import ObjectLookupRepository
 from repositories.package_object_mapping_repository import PackageObjectMappingRepository
-from services.parsers.xml_parser_factory import XMLParserFactory
+from services.extraction_cache_service import ExtractionCacheService
+from services.parsers.base_parser import XMLDocument
+from services.parsers.xml_parser_factory import XMLParserFactory, get_parser_factory
 from services.sail_formatter import SAILFormatter
 
 
+# File extensions parsed from a package (CDTs are .xsd, everything else .xml)
+XML_FILE_EXTENSIONS = ('.xml', '.xsd')
+
+# Parsed data keys that identify an export rather than describe its content
+CONTENT_HASH_EXCLUDED_KEYS = frozenset({'uuid', 'version_uuid', 'raw_xml'})
+
+# Bytes read at a time when hashing a package ZIP
+ZIP_HASH_CHUNK_SIZE = 1024 * 1024
+
+# ZIP opened once per parse worker process (see _init_archive_worker)
+_worker_archive: Optional[zipfile.ZipFile] = None
+
+
+def _parse_loaded_document(
+    source: str,
+    load_document: Callable[[], XMLDocument],
+    parser_factory: Optional[XMLParserFactory] = None
+) -> Dict[str, Any]:
+    """
+    Load, detect and parse a single document into a parse result dict.
+    
+    Args:
+        source: File path or archive member name of the document
+        load_document: Callable returning the parsed XMLDocument
+        parser_factory: Parser factory to use (defaults to the process-wide
+                        singleton)
+        
+    Returns:
+        Parse result dict (see parse_xml_file())
+    """
+    factory = parser_factory or get_parser_factory()
+    
+    try:
+        document = load_document()
+    except Exception as e:
+        return {'source': source, 'object_type': None, 'data': None, 'error': str(e)}
+    
+    object_type = factory.detect_object_type(document)
+    
+    try:
+        data = factory.get_parser(object_type).parse_document(document)
+    except Exception as e:
+        return {'source': source, 'object_type': object_type, 'data': None, 'error': str(e)}
+    
+    return {'source': source, 'object_type': object_type, 'data': data, 'error': None}
+
+
+def parse_xml_file(
+    xml_path: str,
+    parser_factory: Optional[XMLParserFactory] = None
+) -> Dict[str, Any]:
+    """
+    Parse a single XML/XSD file into plain data.
+    
+    This performs no database access and returns only picklable values.
+    
+    Args:
+        xml_path: Path to XML or XSD file
+        parser_factory: Parser factory to use (defaults to the process-wide
+                        singleton)
+        
+    Returns:
+        Dict containing:
+        - source: The xml_path that was parsed
+        - object_type: Detected object type (None if the file is malformed)
+        - data: Parsed object data (None if parsing failed)
+        - error: Error message (None on success)
+    """
+    return _parse_loaded_document(
+        xml_path,
+        lambda: XMLDocument.from_path(xml_path),
+        parser_factory
+    )
+
+
+def parse_xml_member(
+    archive: zipfile.ZipFile,
+    member_name: str,
+    parser_factory: Optional[XMLParserFactory] = None
+) -> Dict[str, Any]:
+    """
+    Parse a single XML/XSD member of an open package ZIP.
+    
+    The member is decompressed from a ZipFile.open() stream in memory.
+    
+    Args:
+        archive: Open package ZIP
+        member_name: Name of the member in the ZIP central directory
+        parser_factory: Parser factory to use (defaults to the process-wide
+                        singleton)
+        
+    Returns:
+        Parse result dict as returned by parse_xml_file(), with the member
+        name as source
+    """
+    def load_document() -> XMLDocument:
+        with archive.open(member_name) as stream:
+            return XMLDocument.from_bytes(stream.read(), member_name)
+    
+    return _parse_loaded_document(member_name, load_document, parser_factory)
+
+
+def find_xml_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """
+    List the XML and XSD members of a package ZIP.
+    
+    Only the central directory is read; no member is decompressed.
+    
+    Args:
+        archive: Open package ZIP
+        
+    Returns:
+        ZipInfo entries for XML/XSD files, in archive order
+    """
+    return [
+        info for info in archive.infolist()
+        if not info.is_dir() and info.filename.endswith(XML_FILE_EXTENSIONS)
+    ]
+
+
+def _init_archive_worker(zip_path: str) -> None:
+    """Open the package ZIP once in a parse worker process."""
+    global _worker_archive
+    _worker_archive = zipfile.ZipFile(zip_path, 'r')
+
+
+def _parse_worker_member(member_name: str) -> Dict[str, Any]:
+    """Parse a member of the ZIP opened by _init_archive_worker()."""
+    return parse_xml_member(_worker_archive, member_name)
+
+
+def iter_parsed_xml_members(
+    archive: zipfile.ZipFile,
+    member_names: List[str],
+    workers: int = 0,
+    parser_factory: Optional[XMLParserFactory] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse XML members of a package ZIP, optionally across a process pool.
+    
+    Results are yielded in member order as soon as they are available, so
+    the caller can persist earlier objects while later members are still
+    being parsed. Each worker process opens the ZIP itself, so only member
+    names cross the process boundary.
+    
+    Args:
+        archive: Open package ZIP
+        member_names: Names of XML/XSD members to parse
+        workers: Number of worker processes (0 or 1 parses serially)
+        parser_factory: Parser factory for serial parsing (defaults to the
+                        process-wide singleton)
+        
+    Yields:
+        Parse result dicts as returned by parse_xml_member()
+    """
+    if workers and workers > 1 and len(member_names) > 1:
+        chunksize = max(1, len(member_names) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_archive_worker,
+            initargs=(archive.filename,)
+        ) as executor:
+            yield from executor.map(_parse_worker_member, member_names, chunksize=chunksize)
+    else:
+        for member_name in member_names:
+            yield parse_xml_member(archive, member_name, parser_factory)
+
+
+def compute_content_hash(parsed_data: Dict[str, Any]) -> str:
+    """
+    Compute a normalized content hash for a parsed object.
+    
+    The hash covers everything the parser extracted (SAIL code, fields,
+    properties and type-specific children such as parameters, nodes and
+    flows) except the keys in CONTENT_HASH_EXCLUDED_KEYS. Keys are sorted so
+    the hash does not depend on parser dict ordering.
+    
+    Two versions with the same hash have the same content; versions with
+    different hashes may still compare equal (e.g. only the name changed),
+    so a full comparison is needed when hashes differ.
+    
+    Args:
+        parsed_data: Parsed data from XML
+        
+    Returns:
+        SHA-256 hex digest
+        
+    Example:
+        >>> a = compute_content_hash({'uuid': 'a', 'sail_code': 'a!x()'})
+        >>> b = compute_content_hash({'uuid': 'b', 'sail_code': 'a!x()'})
+        >>> a == b
+        True
+    """
+    content = {
+        key: value for key, value in parsed_data.items()
+        if key not in CONTENT_HASH_EXCLUDED_KEYS
+    }
+    normalized = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Group an iterable into lists of at most batch_size items.
+    
+    Args:
+        items: Items to group (consumed lazily)
+        batch_size: Maximum number of items per batch
+        
+    Yields:
+        Lists of consecutive items
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def get_peak_rss_mb(include_children: bool = False) -> Optional[float]:
+    """
+    Peak resident set size of this process in MB.
+    
+    Args:
+        include_children: Also consider terminated child processes (e.g.
+                          parse workers) and return the larger peak
+        
+    Returns:
+        Peak RSS in MB, or None where the resource module is unavailable
+        (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def get_archive_read_stats(members: List[zipfile.ZipInfo]) -> Dict[str, int]:
+    """
+    Byte counts for reading the given members out of a ZIP.
+    
+    Args:
+        members: ZipInfo entries that are parsed
+        
+    Returns:
+        Dict with compressed_bytes_read and uncompressed_bytes_read
+    """
+    return {
+        'compressed_bytes_read': sum(info.compress_size for info in members),
+        'uncompressed_bytes_read': sum(info.file_size for info in members)
+    }
+
+
+def compute_zip_hash(zip_path: str) -> str:
+    """
+    SHA-256 of a package ZIP, used as the extraction cache key.
+    
+    Hashes are memoized per path, size and modification time, so checking
+    the cache before extracting does not read the ZIP twice.
+    
+    Args:
+        zip_path: Path to ZIP file
+        
+    Returns:
+        SHA-256 hex digest of the file
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    stat = os.stat(zip_path)
+    return _compute_file_hash(os.path.abspath(zip_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _compute_file_hash(path: str, size: int, mtime_ns: int) -> str:
+    """Hash a file; size and mtime_ns only take part in the memoization key."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(ZIP_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class PackageExtractionService(BaseService):
     """
     Service for extracting and parsing Appian packages.
     
     This service handles the complete workflow of:
-    1. Extracting ZIP files
+    1. Reading XML files straight out of the ZIP
     2. Parsing XML files
     3. Storing objects in object_lookup (NO DUPLICATES!)
     4. Creating package_object_mappings
@@ -34,7 +339,7 @@ class PackageExtractionService(BaseService):
     6. Storing version data
     
     Key Design Principles:
-    - Each object stored once in object_lookup (use find_or_create)
+    - Each object stored once in object_lookup (bulk_find_or_create per batch)
     - Package-object relationships tracked via package_object_mappings
     - Object-specific data stored in type-specific tables
     - Version data stored in object_versions
@@ -50,10 +355,9 @@ class PackageExtractionService(BaseService):
         """Initialize service dependencies."""
         self.object_lookup_repo = self._get_repository(ObjectLookupRepository)
         self.package_object_mapping_repo = self._get_repository(PackageObjectMappingRepository)
+        self.content_blob_repo = self._get_repository(ContentBlobRepository)
+        self.extraction_cache = self._get_service(ExtractionCacheService)
         self.parser_factory = XMLParserFactory()
-        # Initialize SAIL formatter (not a service, just a utility class)
-        self.sail_formatter = SAILFormatter()
-        self.sail_formatter._initialize_dependencies()
     
     def _ensure_not_none(self, value: Any, default: str = 'Unknown') -> str:
         """
@@ -76,28 +380,41 @@ class PackageExtractionService(BaseService):
         self,
         session_id: int,
         zip_path: str,
-        package_type: str
+        package_type: str,
+        workers: Optional[int] = None,
+        format_sail_code: bool = True
     ) -> Package:
         """
         Extract package and store all objects.
         
-        This is the main entry point for package extraction. It follows a 7-step workflow:
+        This is the main entry point for package extraction. When the same ZIP
+        was extracted before (see ExtractionCacheService), the earlier package
+        is cloned instead and parsing is skipped.
+        Otherwise it follows a 6-step workflow:
         1. Create package record
-        2. Extract ZIP to temp directory
-        3. Find all XML files
-        4. Parse each XML file
+        2. Open the ZIP (no temp directory is used)
+        3. Find all XML members in the ZIP central directory
+        4. Parse each XML member from its ZipFile.open() stream
         5. For each object:
            a. Find or create in object_lookup (NO DUPLICATES!)
            b. Create package_object_mapping
            c. Store object-specific data in object tables
            d. Store version data in object_versions
-        6. Update package statistics
-        7. Clean up temp directory
+        6. Update package statistics and log bytes read and peak RSS
         
         Args:
             session_id: Merge session ID
             zip_path: Path to ZIP file
             package_type: Package type (base, customized, new_vendor)
+            workers: Number of worker processes used to parse XML files.
+                     Defaults to Config.EXTRACTION_WORKERS; 0 or 1 parses
+                     serially in the calling thread. Parsed results are
+                     always persisted by the calling thread, which acts
+                     as the single DB writer.
+            format_sail_code: Format SAIL code with UUID resolution once the
+                              objects are stored. Pass False when formatting
+                              is done later for several packages at once
+                              (see format_sail_code_for_packages).
             
         Returns:
             Package object with total_objects count
@@ -116,119 +433,66 @@ class PackageExtractionService(BaseService):
         """
         extraction_start = time.time()
         
+        if workers is None:
+            from config import Config
+            workers = Config.EXTRACTION_WORKERS
+        
         LoggerConfig.log_function_entry(
             self.logger,
             'extract_package',
             session_id=session_id,
             zip_path=zip_path,
-            package_type=package_type
+            package_type=package_type,
+            workers=workers
         )
         
         self.logger.info(f"Starting extraction of {package_type} package: {zip_path}")
         
+        # Reuse an earlier extraction of the same ZIP
+        zip_hash = self._hash_zip(zip_path)
+        cache_entry = self.extraction_cache.get_entry(zip_hash)
+        if cache_entry:
+            return self._clone_cached_package(
+                cache_entry, session_id, zip_path, package_type, extraction_start,
+                format_sail_code
+            )
+        
         # Step 1: Create package record
-        self.logger.debug(f"Creating package record for session_id={session_id}")
-        package = Package(
-            session_id=session_id,
-            package_type=package_type,
-            filename=os.path.basename(zip_path),
-            total_objects=0
-        )
-        db.session.add(package)
-        db.session.flush()
-        self.logger.debug(f"Package record created with id={package.id}")
+        package = self._create_package_record(session_id, zip_path, package_type, zip_hash)
         
-        temp_dir = None
         try:
-            # Step 2: Extract ZIP to temp directory
-            step_start = time.time()
-            temp_dir = tempfile.mkdtemp(prefix=f"appian_pkg_{package.id}_")
-            self.logger.debug(f"Created temp directory: {temp_dir}")
-            
-            self._extract_zip(zip_path, temp_dir)
-            
-            step_duration = time.time() - step_start
-            self.logger.debug(f"ZIP extraction completed in {step_duration:.2f}s")
-            
-            # Step 3: Find all XML files
-            step_start = time.time()
-            xml_files = self._find_xml_files(temp_dir)
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"Found {len(xml_files)} XML/XSD files in {step_duration:.2f}s"
-            )
-            
-            # Step 4-5: Parse each XML file and process objects
-            objects_processed = 0
-            objects_failed = 0
-            object_type_counts = {}
-            
-            self.logger.debug("Starting object processing")
-            
-            for idx, xml_file in enumerate(xml_files, 1):
-                try:
-                    if idx % 10 == 0:
-                        self.logger.debug(f"Processing file {idx}/{len(xml_files)}")
-                    
-                    obj_lookup = self._process_object(package.id, xml_file)
-                    
-                    if obj_lookup:
-                        objects_processed += 1
-                        # Track object type counts
-                        obj_type = obj_lookup.object_type
-                        object_type_counts[obj_type] = object_type_counts.get(obj_type, 0) + 1
-                    else:
-                        objects_failed += 1
-                        
-                except Exception as e:
-                    objects_failed += 1
-                    self.logger.warning(
-                        f"Failed to process {os.path.basename(xml_file)}: {e}"
-                    )
-                    # Continue with next file
-            
-            # Log object type breakdown
-            if object_type_counts:
-                self.logger.info(f"Object type breakdown for {package_type} package:")
-                for obj_type, count in sorted(object_type_counts.items()):
-                    self.logger.info(f"  - {obj_type}: {count}")
-            
-            if objects_failed > 0:
-                self.logger.warning(
-                    f"Failed to process {objects_failed} files "
-                    f"({objects_failed}/{len(xml_files)})"
+            # Step 2: Open ZIP
+            with self._open_zip(zip_path) as archive:
+                # Step 3: Find all XML members
+                step_start = time.time()
+                members = find_xml_members(archive)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"Found {len(members)} XML/XSD files in {step_duration:.2f}s"
+                )
+                
+                # Step 4-6: Parse each XML member, store objects, update statistics
+                parsed_files = self._iter_parsed_members(
+                    archive,
+                    [info.filename for info in members],
+                    workers
+                )
+                self._store_package_objects(
+                    package,
+                    parsed_files,
+                    total_files=len(members),
+                    format_sail_code=format_sail_code,
+                    started_at=extraction_start,
+                    read_stats=get_archive_read_stats(members)
                 )
             
-            # Step 6: Update package statistics
-            package.total_objects = objects_processed
-            db.session.flush()
-            
-            # Step 6.5: Format SAIL code with UUID resolution
-            self.logger.info("Formatting SAIL code with UUID resolution...")
-            self._format_sail_code_for_package(package.id, session_id)
-            
-            extraction_duration = time.time() - extraction_start
-            
-            LoggerConfig.log_performance(
-                self.logger,
-                f'Package Extraction ({package_type})',
-                extraction_duration,
-                package_id=package.id,
-                total_files=len(xml_files),
-                objects_processed=objects_processed,
-                objects_failed=objects_failed
-            )
-            
-            self.logger.info(
-                f"Successfully extracted {objects_processed} objects "
-                f"from {package_type} package"
-            )
+            self.extraction_cache.register(package, os.path.getsize(zip_path))
             
             LoggerConfig.log_function_exit(
                 self.logger,
                 'extract_package',
-                result=f"{objects_processed} objects extracted"
+                result=f"{package.total_objects} objects extracted"
             )
             
             return package
@@ -248,47 +512,332 @@ class PackageExtractionService(BaseService):
             )
             
             raise PackageExtractionException(f"Failed to extract package: {e}")
+    
+    def store_parsed_package(
+        self,
+        session_id: int,
+        parsed_package: Dict[str, Any],
+        package_type: str,
+        format_sail_code: bool = True
+    ) -> Package:
+        """
+        Store a package that was already unzipped and parsed.
+        
+        This is the persistence half of extract_package(), used when parsing
+        happened elsewhere (e.g. in a separate process via
+        parse_package_archive()).
+        
+        Args:
+            session_id: Merge session ID
+            parsed_package: Result of parse_package_archive()
+            package_type: Package type (base, customized, new_vendor)
+            format_sail_code: Format SAIL code once the objects are stored
+            
+        Returns:
+            Package object with total_objects count
+            
+        Raises:
+            PackageExtractionException: If storing fails
+        """
+        store_start = time.time()
+        zip_path = parsed_package['zip_path']
+        
+        self.logger.info(f"Storing parsed {package_type} package: {zip_path}")
+        
+        package = self._create_package_record(
+            session_id, zip_path, package_type, self._hash_zip(zip_path)
+        )
+        
+        try:
+            self._store_package_objects(
+                package,
+                parsed_package['results'],
+                total_files=parsed_package['total_files'],
+                format_sail_code=format_sail_code,
+                started_at=store_start,
+                read_stats=parsed_package.get('read_stats')
+            )
+            self.extraction_cache.register(package, os.path.getsize(zip_path))
+            return package
+            
+        except Exception as e:
+            LoggerConfig.log_error_with_context(
+                self.logger,
+                e,
+                'Storing parsed package',
+                session_id=session_id,
+                package_id=package.id,
+                package_type=package_type,
+                zip_path=zip_path
+            )
+            
+            raise PackageExtractionException(f"Failed to store package: {e}")
+    
+    def is_extraction_cached(self, zip_path: str) -> bool:
+        """
+        Check whether extract_package() would reuse an earlier extraction.
         
-        finally:
-            # Step 7: Clean up temp directory
-            if temp_dir and os.path.exists(temp_dir):
-                self._cleanup_temp_dir(temp_dir)
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            True if the ZIP is in the extraction cache
+            
+        Raises:
+            PackageExtractionException: If the ZIP cannot be read
+        """
+        return self.extraction_cache.get_entry(self._hash_zip(zip_path)) is not None
     
-    def _extract_zip(self, zip_path: str, extract_to: str) -> None:
+    def _clone_cached_package(
+        self,
+        cache_entry: Any,
+        session_id: int,
+        zip_path: str,
+        package_type: str,
+        started_at: float,
+        format_sail_code: bool = True
+    ) -> Package:
         """
-        Extract ZIP file to directory.
+        Create the package from an extraction cache entry.
         
         Args:
+            cache_entry: ExtractionCacheEntry for the ZIP
+            session_id: Merge session ID
             zip_path: Path to ZIP file
-            extract_to: Directory to extract to
+            package_type: Package type (base, customized, new_vendor)
+            started_at: Start time used for the performance log
+            format_sail_code: Format the cloned (unformatted) SAIL code with
+                              this session's object lookup
+            
+        Returns:
+            Package with the cloned objects
             
         Raises:
-            PackageExtractionException: If extraction fails
+            PackageExtractionException: If cloning fails
+        """
+        try:
+            package = self.extraction_cache.clone_package(
+                cache_entry,
+                session_id,
+                package_type,
+                os.path.basename(zip_path)
+            )
+        except Exception as e:
+            LoggerConfig.log_error_with_context(
+                self.logger,
+                e,
+                'Cloning cached package',
+                session_id=session_id,
+                package_type=package_type,
+                zip_path=zip_path
+            )
+            raise PackageExtractionException(f"Failed to clone cached package: {e}")
+        
+        if format_sail_code:
+            self.logger.info("Formatting SAIL code with UUID resolution...")
+            self._format_sail_code_for_package(package.id, package.session_id)
+        
+        LoggerConfig.log_performance(
+            self.logger,
+            f'Package Extraction ({package_type})',
+            time.time() - started_at,
+            package_id=package.id,
+            objects_processed=package.total_objects,
+            cache='hit',
+            cloned_from_package_id=package.cloned_from_package_id
+        )
+        
+        self.logger.info(
+            f"Successfully extracted {package.total_objects} objects "
+            f"from {package_type} package (extraction cache)"
+        )
+        return package
+    
+    @staticmethod
+    def _hash_zip(zip_path: str) -> str:
+        """
+        Hash a package ZIP for the extraction cache.
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            SHA-256 hex digest of the ZIP
+            
+        Raises:
+            PackageExtractionException: If the ZIP cannot be read
+        """
+        try:
+            return compute_zip_hash(zip_path)
+        except OSError as e:
+            raise PackageExtractionException(f"Failed to read ZIP: {e}")
+    
+    def _create_package_record(
+        self,
+        session_id: int,
+        zip_path: str,
+        package_type: str,
+        zip_hash: Optional[str] = None
+    ) -> Package:
+        """
+        Create and flush the package record.
+        
+        Args:
+            session_id: Merge session ID
+            zip_path: Path to ZIP file
+            package_type: Package type (base, customized, new_vendor)
+            zip_hash: SHA-256 of the ZIP (see compute_zip_hash)
+            
+        Returns:
+            Flushed Package with id assigned
+        """
+        self.logger.debug(f"Creating package record for session_id={session_id}")
+        package = Package(
+            session_id=session_id,
+            package_type=package_type,
+            filename=os.path.basename(zip_path),
+            total_objects=0,
+            zip_hash=zip_hash
+        )
+        db.session.add(package)
+        db.session.flush()
+        
+        # Rows left behind under a reused package id would clash with the new ones
+        delete_package_objects(db.session, [package.id])
+        self.logger.debug(f"Package record created with id={package.id}")
+        return package
+    
+    def _store_package_objects(
+        self,
+        package: Package,
+        parsed_files: Iterable[Dict[str, Any]],
+        total_files: int,
+        format_sail_code: bool,
+        started_at: float,
+        read_stats: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Persist parsed objects for a package and update its statistics.
+        
+        Args:
+            package: Package record the objects belong to
+            parsed_files: Parse results as returned by parse_xml_member()
+            total_files: Number of XML/XSD files in the package
+            format_sail_code: Format SAIL code once the objects are stored
+            started_at: Start time used for the performance log
+            read_stats: Byte counts from get_archive_read_stats(), added to
+                        the performance log
+        """
+        from config import Config
+        
+        objects_processed = 0
+        objects_failed = 0
+        object_type_counts = {}
+        batches = 0
+        
+        self.logger.debug(
+            f"Starting object processing in batches of {Config.EXTRACTION_BATCH_SIZE}"
+        )
+        
+        # Database errors abort the extraction: a failed flush leaves the
+        # session unusable, so there is no way to continue with the next batch
+        for batch in iter_batches(parsed_files, Config.EXTRACTION_BATCH_SIZE):
+            batches += 1
+            self.logger.debug(f"Persisting batch {batches} ({len(batch)} files)")
+            
+            for obj_lookup in self._persist_parsed_batch(package.id, batch):
+                if obj_lookup:
+                    objects_processed += 1
+                    # Track object type counts
+                    obj_type = obj_lookup.object_type
+                    object_type_counts[obj_type] = object_type_counts.get(obj_type, 0) + 1
+                else:
+                    objects_failed += 1
+        
+        # Log object type breakdown
+        if object_type_counts:
+            self.logger.info(f"Object type breakdown for {package.package_type} package:")
+            for obj_type, count in sorted(object_type_counts.items()):
+                self.logger.info(f"  - {obj_type}: {count}")
+        
+        if objects_failed > 0:
+            self.logger.warning(
+                f"Failed to process {objects_failed} files "
+                f"({objects_failed}/{total_files})"
+            )
+        
+        # Update package statistics
+        package.total_objects = objects_processed
+        db.session.flush()
+        
+        # Format SAIL code with UUID resolution
+        if format_sail_code:
+            self.logger.info("Formatting SAIL code with UUID resolution...")
+            self._format_sail_code_for_package(package.id, package.session_id)
+        
+        LoggerConfig.log_performance(
+            self.logger,
+            f'Package Extraction ({package.package_type})',
+            time.time() - started_at,
+            package_id=package.id,
+            total_files=total_files,
+            objects_processed=objects_processed,
+            objects_failed=objects_failed,
+            batches=batches,
+            cache='miss',
+            peak_rss_mb=get_peak_rss_mb(include_children=True),
+            **(read_stats or {})
+        )
+        
+        self.logger.info(
+            f"Successfully extracted {objects_processed} objects "
+            f"from {package.package_type} package"
+        )
+    
+    @staticmethod
+    def _open_zip(zip_path: str) -> zipfile.ZipFile:
+        """
+        Open a package ZIP for reading.
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            Open ZipFile (use as a context manager)
+            
+        Raises:
+            PackageExtractionException: If the file is not a readable ZIP
         """
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_to)
+            return zipfile.ZipFile(zip_path, 'r')
         except Exception as e:
-            raise PackageExtractionException(f"Failed to extract ZIP: {e}")
+            raise PackageExtractionException(f"Failed to open ZIP: {e}")
     
-    def _find_xml_files(self, directory: str) -> List[str]:
+    def _iter_parsed_members(
+        self,
+        archive: zipfile.ZipFile,
+        member_names: List[str],
+        workers: int
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Find all XML and XSD files in directory recursively.
+        Parse XML members for this service, optionally across a process pool.
         
-        CDTs are stored as .xsd files, while other objects use .xml files.
+        See iter_parsed_xml_members(); serial parsing reuses this service's
+        parser factory.
         
         Args:
-            directory: Directory to search
+            archive: Open package ZIP
+            member_names: Names of XML/XSD members to parse
+            workers: Number of worker processes (0 or 1 parses serially)
             
         Returns:
-            List of XML and XSD file paths
+            Iterator of parse result dicts as returned by parse_xml_member()
         """
-        xml_files = []
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.xml') or file.endswith('.xsd'):
-                    xml_files.append(os.path.join(root, file))
-        return xml_files
+        if workers and workers > 1 and len(member_names) > 1:
+            self.logger.info(
+                f"Parsing {len(member_names)} files with {workers} worker processes"
+            )
+        return iter_parsed_xml_members(archive, member_names, workers, self.parser_factory)
     
     def _process_object(
         self,
@@ -298,12 +847,7 @@ class PackageExtractionService(BaseService):
         """
         Process single object from XML file.
         
-        This method:
-        1. Parses XML to extract object data
-        2. Finds or creates object in object_lookup (NO DUPLICATES!)
-        3. Creates package_object_mapping
-        4. Stores object-specific data
-        5. Stores version data in object_versions
+        Parses the file in the calling thread and persists the result.
         
         Args:
             package_id: Package ID
@@ -312,159 +856,177 @@ class PackageExtractionService(BaseService):
         Returns:
             ObjectLookup object if successful, None if parsing fails
         """
-        try:
-            # Determine object type from XML
-            object_type = self._determine_object_type(xml_path)
+        return self._persist_parsed_object(
+            package_id,
+            parse_xml_file(xml_path, self.parser_factory)
+        )
+    
+    def _persist_parsed_object(
+        self,
+        package_id: int,
+        parsed: Dict[str, Any]
+    ) -> Optional[ObjectLookup]:
+        """
+        Persist a single parsed object.
+        
+        Convenience wrapper around _persist_parsed_batch() for one object.
+        
+        Args:
+            package_id: Package ID
+            parsed: Parse result dict as returned by parse_xml_member()
             
-            # Get appropriate parser
-            parser = self.parser_factory.get_parser(object_type)
+        Returns:
+            ObjectLookup object if successful, None if parsing failed
+        """
+        return self._persist_parsed_batch(package_id, [parsed])[0]
+    
+    def _persist_parsed_batch(
+        self,
+        package_id: int,
+        parsed_batch: List[Dict[str, Any]]
+    ) -> List[Optional[ObjectLookup]]:
+        """
+        Persist a batch of parsed objects.
+        
+        The number of flushes and queries depends on the number of object
+        types in the batch, not on the number of objects or child rows.
+        This method:
+        1. Resolves object_lookup ids for the whole batch in one query
+           (NO DUPLICATES!)
+        2. Bulk-creates package_object_mappings
+        3. Stores content blobs not seen before and bulk-inserts version
+           data into object_versions
+        4. Inserts object-specific rows, then their child rows
+        
+        Args:
+            package_id: Package ID
+            parsed_batch: Parse result dicts as returned by parse_xml_member()
             
-            # Parse XML
-            try:
-                parsed_data = parser.parse(xml_path)
-            except Exception as parse_error:
+        Returns:
+            ObjectLookup per parse result, in input order (None where the
+            object was not stored)
+        """
+        results: List[Optional[ObjectLookup]] = [None] * len(parsed_batch)
+        
+        entries = []
+        batch_uuids = set()
+        for index, parsed in enumerate(parsed_batch):
+            parsed_data = self._get_storable_data(parsed)
+            if parsed_data is None:
+                continue
+            
+            if parsed_data['uuid'] in batch_uuids:
                 self.logger.warning(
-                    f"Failed to parse {xml_path} as {object_type}: {parse_error}"
+                    f"Duplicate UUID {parsed_data['uuid']} in {parsed['source']}, skipping"
                 )
-                return None
+                continue
             
-            if not parsed_data or not parsed_data.get('uuid'):
+            batch_uuids.add(parsed_data['uuid'])
+            entries.append((index, parsed['object_type'], parsed_data))
+        
+        if not entries:
+            return results
+        
+        # Step 5a: Find or create in object_lookup (CRITICAL - NO DUPLICATES!)
+        obj_lookups = self.object_lookup_repo.bulk_find_or_create([
+            {
+                'uuid': parsed_data['uuid'],
+                'name': parsed_data.get('name', 'Unknown'),
+                'object_type': object_type,
+                'description': parsed_data.get('description')
+            }
+            for _, object_type, parsed_data in entries
+        ])
+        
+        # Objects already in this package came from a duplicate file in an
+        # earlier batch
+        already_mapped = self.package_object_mapping_repo.get_mapped_object_ids(
+            package_id,
+            [obj_lookup.id for obj_lookup in obj_lookups]
+        )
+        
+        objects = []
+        for (index, object_type, parsed_data), obj_lookup in zip(entries, obj_lookups):
+            if obj_lookup.id in already_mapped:
                 self.logger.warning(
-                    f"No UUID found in {xml_path}. "
-                    f"Parsed data keys: {list(parsed_data.keys()) if parsed_data else 'None'}"
+                    f"Object {parsed_data['uuid']} already stored for package "
+                    f"{package_id}, skipping"
                 )
-                return None
-            
-            # Step 5a: Find or create in object_lookup (CRITICAL - NO DUPLICATES!)
-            obj_lookup = self.object_lookup_repo.find_or_create(
-                uuid=parsed_data['uuid'],
-                name=parsed_data.get('name', 'Unknown'),
-                object_type=object_type,
-                description=parsed_data.get('description')
-            )
+                continue
             
-            # Step 5b: Create package_object_mapping
-            self.package_object_mapping_repo.create_mapping(
-                package_id=package_id,
-                object_id=obj_lookup.id
-            )
-            
-            # Step 5c: Store object-specific data
-            self._store_object_specific_data(obj_lookup.id, package_id, object_type, parsed_data)
-            
-            # Step 5d: Store version data in object_versions
-            self._store_version_data(obj_lookup.id, package_id, parsed_data)
-            
-            return obj_lookup
-            
-        except Exception as e:
-            self.logger.error(f"Failed to process object from {xml_path}: {e}")
-            raise
+            results[index] = obj_lookup
+            objects.append((obj_lookup.id, object_type, parsed_data))
+        
+        if not objects:
+            return results
+        
+        # Step 5b: Create package_object_mappings
+        self.package_object_mapping_repo.bulk_create_mappings([
+            {'package_id': package_id, 'object_id': object_id}
+            for object_id, _, _ in objects
+        ])
+        
+        # Step 5c: Store version data in object_versions (and its content
+        # blobs, which object-specific rows may reference)
+        self._store_version_data(package_id, objects)
+        
+        # Step 5d: Store object-specific data
+        self._store_object_specific_data(package_id, objects)
+        
+        return results
     
-    def _determine_object_type(self, xml_path: str) -> str:
+    def _get_storable_data(self, parsed: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Determine object type from XML/XSD file.
+        Return the parsed data of a parse result if it can be stored.
         
-        Looks at the root element name to determine the object type.
-        Appian XML files use "Haul" suffix (e.g., groupHaul, processModelHaul).
-        For contentHaul, looks at child elements to determine actual type.
-        XSD files are CDTs (Custom Data Types).
+        Logs why a parse result is skipped (parse error or missing UUID).
         
         Args:
-            xml_path: Path to XML or XSD file
+            parsed: Parse result dict as returned by parse_xml_member()
             
         Returns:
-            Object type string (e.g., 'Interface', 'Process Model', 'CDT')
+            Parsed object data, or None if the object cannot be stored
         """
-        import xml.etree.ElementTree as ET
+        xml_path = parsed['source']
+        object_type = parsed['object_type']
+        parsed_data = parsed['data']
         
-        # XSD files are always CDTs
-        if xml_path.endswith('.xsd'):
-            return 'CDT'
+        if parsed['error']:
+            if object_type is None:
+                self.logger.warning(f"Failed to parse {xml_path}: {parsed['error']}")
+            else:
+                self.logger.warning(
+                    f"Failed to parse {xml_path} as {object_type}: {parsed['error']}"
+                )
+            return None
         
-        try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            # Remove namespace if present
-            tag = root.tag
-            if '}' in tag:
-                tag = tag.split('}')[1]
-            
-            # Special handling for contentHaul - look at child elements
-            if tag == 'contentHaul':
-                # Check for specific child elements
-                for child in root:
-                    child_tag = child.tag
-                    if '}' in child_tag:
-                        child_tag = child_tag.split('}')[1]
-                    
-                    child_type_mapping = {
-                        'interface': 'Interface',
-                        'expressionRule': 'Expression Rule',
-                        'rule': 'Expression Rule',  # Expression rules use 'rule' tag
-                        'constant': 'Constant',
-                        'integration': 'Integration',
-                        'webApi': 'Web API',
-                        'rulesFolder': 'Unknown',  # Folders are not objects we track
-                        'dataStore': 'Unknown',  # Data stores handled separately
-                    }
-                    
-                    if child_tag in child_type_mapping:
-                        return child_type_mapping[child_tag]
-            
-            # Map XML tag to object type
-            # Appian uses "Haul" suffix for most objects
-            type_mapping = {
-                'interfaceHaul': 'Interface',
-                'expressionRuleHaul': 'Expression Rule',
-                'processModelHaul': 'Process Model',
-                'recordTypeHaul': 'Record Type',
-                'dataTypeHaul': 'CDT',
-                'integrationHaul': 'Integration',
-                'webApiHaul': 'Web API',
-                'siteHaul': 'Site',
-                'groupHaul': 'Group',
-                'constantHaul': 'Constant',
-                'connectedSystemHaul': 'Connected System',
-                # Also support without Haul suffix
-                'interface': 'Interface',
-                'expressionRule': 'Expression Rule',
-                'processModel': 'Process Model',
-                'recordType': 'Record Type',
-                'dataType': 'CDT',
-                'integration': 'Integration',
-                'webApi': 'Web API',
-                'site': 'Site',
-                'group': 'Group',
-                'constant': 'Constant',
-                'connectedSystem': 'Connected System',
-            }
-            
-            return type_mapping.get(tag, 'Unknown')
-            
-        except Exception as e:
-            self.logger.warning(f"Could not determine object type for {xml_path}: {e}")
-            return 'Unknown'
+        if not parsed_data or not parsed_data.get('uuid'):
+            self.logger.warning(
+                f"No UUID found in {xml_path}. "
+                f"Parsed data keys: {list(parsed_data.keys()) if parsed_data else 'None'}"
+            )
+            return None
+        
+        return parsed_data
     
     def _store_object_specific_data(
         self,
-        object_id: int,
         package_id: int,
-        object_type: str,
-        parsed_data: Dict[str, Any]
+        objects: List[tuple]
     ) -> None:
         """
         Store object-specific data in type-specific tables.
         
         This method stores detailed object data in the appropriate table
-        based on object type (interfaces, process_models, etc.).
+        based on object type (interfaces, process_models, etc.). Parent rows
+        for the whole batch are flushed together so their ids are known,
+        process model nodes are flushed together so flows can reference
+        them, and all remaining child rows are inserted with one
+        executemany per table.
         
         Args:
-            object_id: Object ID from object_lookup
             package_id: Package ID
-            object_type: Object type
-            parsed_data: Parsed data from XML
+            objects: (object_id, object_type, parsed_data) tuples
         """
         # Import models dynamically to avoid circular imports
         from models import (
@@ -478,88 +1040,294 @@ class PackageExtractionService(BaseService):
             UnknownObject
         )
         
-        try:
+        row_builders = {
+            'Interface': (Interface, self._build_interface_row),
+            'Expression Rule': (ExpressionRule, self._build_expression_rule_row),
+            'Process Model': (ProcessModel, self._build_process_model_row),
+            'Record Type': (RecordType, self._build_record_type_row),
+            'CDT': (CDT, self._build_cdt_row),
+            'Integration': (Integration, self._build_integration_row),
+            'Web API': (WebAPI, self._build_web_api_row),
+            'Site': (Site, self._build_site_row),
+            'Group': (Group, self._build_group_row),
+            'Constant': (Constant, self._build_constant_row),
+            'Connected System': (ConnectedSystem, self._build_connected_system_row),
+        }
+        unknown_builder = (UnknownObject, self._build_unknown_object_row)
+        
+        # Group objects by the model that stores their type-specific row
+        objects_by_model = {}
+        for object_id, object_type, parsed_data in objects:
+            model, build_row = row_builders.get(object_type, unknown_builder)
+            objects_by_model.setdefault(model, []).append(
+                (object_id, object_type, parsed_data, build_row)
+            )
+        
+        # Build parent rows, skipping objects that already have one
+        # (prevent duplicate insertion)
+        parents = []
+        for model, model_objects in objects_by_model.items():
+            existing_ids = {
+                row.object_id for row in db.session.query(model.object_id).filter(
+                    model.package_id == package_id,
+                    model.object_id.in_([obj[0] for obj in model_objects])
+                )
+            }
+            
+            for object_id, object_type, parsed_data, build_row in model_objects:
+                if object_id in existing_ids:
+                    self.logger.debug(
+                        f"{model.__name__} already exists for object_id={object_id}, "
+                        f"package_id={package_id}, skipping"
+                    )
+                    continue
+                try:
+                    parent = model(**build_row(object_id, package_id, parsed_data))
+                except Exception as e:
+                    self.logger.error(f"Failed to store {object_type} data: {e}")
+                    # Don't raise - we still want to continue processing
+                    continue
+                parents.append((parent, object_type, parsed_data))
+        
+        if not parents:
+            return
+        
+        db.session.add_all([parent for parent, _, _ in parents])
+        db.session.flush()
+        
+        # Child rows, keyed by model so each table gets a single executemany
+        child_rows = {}
+        
+        def add_child_rows(model, rows):
+            if rows:
+                child_rows.setdefault(model, []).extend(rows)
+        
+        process_model_nodes = []
+        for parent, object_type, parsed_data in parents:
             if object_type == 'Interface':
-                self._store_interface_data(object_id, package_id, parsed_data)
+                add_child_rows(InterfaceParameter, [
+                    {
+                        'interface_id': parent.id,
+                        'parameter_name': param.get('name'),
+                        'parameter_type': param.get('type'),
+                        'is_required': param.get('required', False),
+                        'default_value': param.get('default_value'),
+                        'display_order': param.get('display_order', 0)
+                    }
+                    for param in parsed_data.get('parameters', [])
+                ])
+                add_child_rows(InterfaceSecurity, [
+                    {
+                        'interface_id': parent.id,
+                        'role_name': sec.get('role_name'),
+                        'permission_type': sec.get('permission_type')
+                    }
+                    for sec in parsed_data.get('security', [])
+                ])
+            
             elif object_type == 'Expression Rule':
-                self._store_expression_rule_data(object_id, package_id, parsed_data)
+                add_child_rows(ExpressionRuleInput, [
+                    {
+                        'rule_id': parent.id,
+                        'input_name': inp.get('name'),
+                        'input_type': inp.get('type'),
+                        'is_required': inp.get('required', False),
+                        'default_value': inp.get('default_value'),
+                        'display_order': inp.get('display_order', 0)
+                    }
+                    for inp in parsed_data.get('inputs', [])
+                ])
+            
             elif object_type == 'Process Model':
-                self._store_process_model_data(object_id, package_id, parsed_data)
+                # Nodes need database ids before flows can reference them
+                nodes = [
+                    (
+                        node,
+                        ProcessModelNode(
+                            process_model_id=parent.id,
+                            node_id=node.get('node_id'),
+                            node_type=node.get('node_type'),
+                            node_name=node.get('node_name'),
+                            properties=json.dumps(node.get('properties', {}))
+                        )
+                    )
+                    for node in parsed_data.get('nodes', [])
+                ]
+                process_model_nodes.append((parent, parsed_data, nodes))
+                
+                add_child_rows(ProcessModelVariable, [
+                    {
+                        'process_model_id': parent.id,
+                        'variable_name': var.get('variable_name'),
+                        'variable_type': var.get('variable_type'),
+                        'is_parameter': var.get('is_parameter', False),
+                        'default_value': var.get('default_value')
+                    }
+                    for var in parsed_data.get('variables', [])
+                ])
+            
             elif object_type == 'Record Type':
-                self._store_record_type_data(object_id, package_id, parsed_data)
+                add_child_rows(RecordTypeField, [
+                    {
+                        'record_type_id': parent.id,
+                        'field_name': field.get('field_name'),
+                        'field_type': field.get('field_type'),
+                        'is_primary_key': field.get('is_primary_key', False),
+                        'is_required': field.get('is_required', False),
+                        'display_order': field.get('display_order', 0)
+                    }
+                    for field in parsed_data.get('fields', [])
+                ])
+                add_child_rows(RecordTypeRelationship, [
+                    {
+                        'record_type_id': parent.id,
+                        'relationship_name': rel.get('relationship_name'),
+                        'related_record_uuid': rel.get('related_record_uuid'),
+                        'relationship_type': rel.get('relationship_type')
+                    }
+                    for rel in parsed_data.get('relationships', [])
+                ])
+                add_child_rows(RecordTypeView, [
+                    {
+                        'record_type_id': parent.id,
+                        'view_name': view.get('view_name'),
+                        'view_type': view.get('view_type'),
+                        'configuration': json.dumps(view.get('configuration', {}))
+                    }
+                    for view in parsed_data.get('views', [])
+                ])
+                add_child_rows(RecordTypeAction, [
+                    {
+                        'record_type_id': parent.id,
+                        'action_name': action.get('action_name'),
+                        'action_type': action.get('action_type'),
+                        'configuration': json.dumps(action.get('configuration', {}))
+                    }
+                    for action in parsed_data.get('actions', [])
+                ])
+            
             elif object_type == 'CDT':
-                self._store_cdt_data(object_id, package_id, parsed_data)
-            elif object_type == 'Integration':
-                self._store_integration_data(object_id, package_id, parsed_data)
-            elif object_type == 'Web API':
-                self._store_web_api_data(object_id, package_id, parsed_data)
-            elif object_type == 'Site':
-                self._store_site_data(object_id, package_id, parsed_data)
-            elif object_type == 'Group':
-                self._store_group_data(object_id, package_id, parsed_data)
-            elif object_type == 'Constant':
-                self._store_constant_data(object_id, package_id, parsed_data)
-            elif object_type == 'Connected System':
-                self._store_connected_system_data(object_id, package_id, parsed_data)
-            else:
-                self._store_unknown_object_data(object_id, package_id, parsed_data)
+                add_child_rows(CDTField, [
+                    {
+                        'cdt_id': parent.id,
+                        'field_name': field.get('field_name'),
+                        'field_type': field.get('field_type'),
+                        'is_list': field.get('is_list', False),
+                        'is_required': field.get('is_required', False),
+                        'display_order': field.get('display_order', 0)
+                    }
+                    for field in parsed_data.get('fields', [])
+                ])
+        
+        if process_model_nodes:
+            db.session.add_all([
+                node_obj
+                for _, _, nodes in process_model_nodes
+                for _, node_obj in nodes
+            ])
+            db.session.flush()
+            
+            for pm, parsed_data, nodes in process_model_nodes:
+                # Map both node_id (UUID) and gui_id to database id for flow lookups
+                node_map = {}
+                for node, node_obj in nodes:
+                    node_map[node.get('node_id')] = node_obj.id
+                    if node.get('gui_id'):
+                        node_map[node.get('gui_id')] = node_obj.id
                 
-        except Exception as e:
-            self.logger.error(f"Failed to store {object_type} data: {e}")
-            # Don't raise - we still want to continue processing
+                for flow in parsed_data.get('flows', []):
+                    from_node_id = node_map.get(flow.get('from_node_id'))
+                    to_node_id = node_map.get(flow.get('to_node_id'))
+                    
+                    if from_node_id and to_node_id:
+                        add_child_rows(ProcessModelFlow, [{
+                            'process_model_id': pm.id,
+                            'from_node_id': from_node_id,
+                            'to_node_id': to_node_id,
+                            'flow_label': flow.get('flow_label'),
+                            'flow_condition': flow.get('flow_condition')
+                        }])
+        
+        for model, rows in child_rows.items():
+            db.session.execute(model.__table__.insert(), rows)
     
     def _store_version_data(
         self,
-        object_id: int,
         package_id: int,
-        parsed_data: Dict[str, Any]
+        objects: List[tuple]
     ) -> None:
         """
-        Store version data in object_versions table.
+        Store version data in object_versions table with one executemany.
+        
+        fields, properties and raw_xml are stored in content_blobs and
+        referenced by hash, so content already stored for another package
+        or session is not written again. SAIL code stays inline because
+        it is reformatted per session after extraction; the unformatted
+        code is kept as a blob for packages cloned from the extraction
+        cache.
         
         Args:
-            object_id: Object ID from object_lookup
             package_id: Package ID
-            parsed_data: Parsed data from XML
+            objects: (object_id, object_type, parsed_data) tuples
         """
-        version = ObjectVersion(
-            object_id=object_id,
-            package_id=package_id,
-            version_uuid=parsed_data.get('version_uuid'),
-            sail_code=parsed_data.get('sail_code'),
-            fields=json.dumps(parsed_data.get('fields', [])) if parsed_data.get('fields') else None,
-            properties=json.dumps(parsed_data.get('properties', {})) if parsed_data.get('properties') else None,
-            raw_xml=parsed_data.get('raw_xml')
-        )
-        db.session.add(version)
-        db.session.flush()
+        blobs = {}
+        
+        def store_blob(content: Optional[str]) -> Optional[str]:
+            if not content:
+                return None
+            content_hash = compute_blob_hash(content)
+            blobs[content_hash] = content
+            return content_hash
+        
+        rows = [
+            {
+                'object_id': object_id,
+                'package_id': package_id,
+                'version_uuid': parsed_data.get('version_uuid'),
+                'sail_code': parsed_data.get('sail_code'),
+                'fields_hash': store_blob(
+                    json.dumps(parsed_data['fields']) if parsed_data.get('fields') else None
+                ),
+                'properties_hash': store_blob(
+                    json.dumps(parsed_data['properties']) if parsed_data.get('properties') else None
+                ),
+                'raw_xml_hash': store_blob(parsed_data.get('raw_xml')),
+                'raw_sail_code_hash': store_blob(parsed_data.get('sail_code')),
+                'content_hash': compute_content_hash(parsed_data)
+            }
+            for object_id, _, parsed_data in objects
+        ]
+        
+        self.content_blob_repo.bulk_store(blobs)
+        db.session.execute(ObjectVersion.__table__.insert(), rows)
     
-    def _cleanup_temp_dir(self, temp_dir: str) -> None:
+    def _format_sail_code_for_package(self, package_id: int, session_id: int) -> None:
         """
-        Clean up temporary directory.
+        Format SAIL code for all objects in a package with UUID resolution.
         
         Args:
-            temp_dir: Directory to clean up
+            package_id: Package ID to format
+            session_id: Session ID to build object lookup cache
         """
-        try:
-            import shutil
-            shutil.rmtree(temp_dir)
-            self.logger.info(f"Cleaned up temp directory: {temp_dir}")
-        except Exception as e:
-            self.logger.warning(f"Failed to clean up temp directory {temp_dir}: {e}")
+        self.format_sail_code_for_packages(session_id, [package_id])
     
-    def _format_sail_code_for_package(self, package_id: int, session_id: int) -> None:
+    def format_sail_code_for_packages(self, session_id: int, package_ids: List[int]) -> None:
         """
-        Format SAIL code for all objects in a package with UUID resolution.
+        Format SAIL code for all objects in the given packages with UUID resolution.
         
         This method:
-        1. Builds object lookup cache from all packages in the session
+        1. Builds object lookup cache from all packages in the session (once)
         2. Formats SAIL code in object_versions table
         3. Formats SAIL code in object-specific tables (interfaces, expression_rules, etc.)
         
+        Each call uses a formatter of its own, since the lookup and memo of
+        a formatter belong to one session and workflows of several sessions
+        can format at the same time. The packages are marked as formatted
+        (Package.sail_code_formatted).
+        
         Args:
-            package_id: Package ID to format
             session_id: Session ID to build object lookup cache
+            package_ids: Package IDs to format
         """
         try:
             format_start = time.time()
@@ -567,23 +1335,34 @@ class PackageExtractionService(BaseService):
             # Build object lookup cache from all packages in session
             self.logger.debug("Building object lookup cache...")
             object_lookup_dict = self._build_object_lookup_cache(session_id)
-            self.sail_formatter.set_object_lookup(object_lookup_dict)
+            sail_formatter = SAILFormatter()
+            sail_formatter.set_object_lookup(object_lookup_dict)
             self.logger.debug(f"Object lookup cache built with {len(object_lookup_dict)} objects")
             
-            # Format SAIL code in object_versions
-            formatted_count = self._format_object_versions(package_id)
-            
-            # Format SAIL code in object-specific tables
-            formatted_count += self._format_interfaces(package_id)
-            formatted_count += self._format_expression_rules(package_id)
-            formatted_count += self._format_integrations(package_id)
-            formatted_count += self._format_web_apis(package_id)
+            formatted_count = 0
+            for package_id in package_ids:
+                # Format SAIL code in object_versions
+                formatted_count += self._format_object_versions(package_id, sail_formatter)
+                
+                # Format SAIL code in object-specific tables
+                formatted_count += self._format_interfaces(package_id, sail_formatter)
+                formatted_count += self._format_expression_rules(package_id, sail_formatter)
+                formatted_count += self._format_integrations(package_id, sail_formatter)
+                formatted_count += self._format_web_apis(package_id, sail_formatter)
             
+            db.session.query(Package).filter(Package.id.in_(package_ids)).update(
+                {Package.sail_code_formatted: True}
+            )
             db.session.flush()
             
             format_duration = time.time() - format_start
             self.logger.info(
-                f"Formatted SAIL code for {formatted_count} objects in {format_duration:.2f}s"
+                f"Formatted SAIL code for {formatted_count} objects in "
+                f"{len(package_ids)} package(s) in {format_duration:.2f}s"
+            )
+            self.logger.debug(
+                f"SAIL formatter memo: {sail_formatter.memo_hits} hits, "
+                f"{sail_formatter.memo_misses} misses"
             )
             
         except Exception as e:
@@ -628,7 +1407,7 @@ class PackageExtractionService(BaseService):
         
         return lookup_dict
     
-    def _format_object_versions(self, package_id: int) -> int:
+    def _format_object_versions(self, package_id: int, sail_formatter: SAILFormatter) -> int:
         """Format SAIL code in object_versions table."""
         versions = ObjectVersion.query.filter_by(package_id=package_id).all()
         formatted_count = 0
@@ -636,7 +1415,7 @@ class PackageExtractionService(BaseService):
         for version in versions:
             if version.sail_code:
                 try:
-                    formatted_code = self.sail_formatter.format_sail_code(version.sail_code)
+                    formatted_code = sail_formatter.format_sail_code(version.sail_code)
                     if formatted_code != version.sail_code:
                         version.sail_code = formatted_code
                         formatted_count += 1
@@ -645,7 +1424,7 @@ class PackageExtractionService(BaseService):
         
         return formatted_count
     
-    def _format_interfaces(self, package_id: int) -> int:
+    def _format_interfaces(self, package_id: int, sail_formatter: SAILFormatter) -> int:
         """Format SAIL code in interfaces table."""
         from models import Interface
         
@@ -655,7 +1434,7 @@ class PackageExtractionService(BaseService):
         for interface in interfaces:
             if interface.sail_code:
                 try:
-                    formatted_code = self.sail_formatter.format_sail_code(interface.sail_code)
+                    formatted_code = sail_formatter.format_sail_code(interface.sail_code)
                     if formatted_code != interface.sail_code:
                         interface.sail_code = formatted_code
                         formatted_count += 1
@@ -664,7 +1443,7 @@ class PackageExtractionService(BaseService):
         
         return formatted_count
     
-    def _format_expression_rules(self, package_id: int) -> int:
+    def _format_expression_rules(self, package_id: int, sail_formatter: SAILFormatter) -> int:
         """Format SAIL code in expression_rules table."""
         from models import ExpressionRule
         
@@ -674,7 +1453,7 @@ class PackageExtractionService(BaseService):
         for rule in rules:
             if rule.sail_code:
                 try:
-                    formatted_code = self.sail_formatter.format_sail_code(rule.sail_code)
+                    formatted_code = sail_formatter.format_sail_code(rule.sail_code)
                     if formatted_code != rule.sail_code:
                         rule.sail_code = formatted_code
                         formatted_count += 1
@@ -683,7 +1462,7 @@ class PackageExtractionService(BaseService):
         
         return formatted_count
     
-    def _format_integrations(self, package_id: int) -> int:
+    def _format_integrations(self, package_id: int, sail_formatter: SAILFormatter) -> int:
         """Format SAIL code in integrations table."""
         from models import Integration
         
@@ -693,7 +1472,7 @@ class PackageExtractionService(BaseService):
         for integration in integrations:
             if integration.sail_code:
                 try:
-                    formatted_code = self.sail_formatter.format_sail_code(integration.sail_code)
+                    formatted_code = sail_formatter.format_sail_code(integration.sail_code)
                     if formatted_code != integration.sail_code:
                         integration.sail_code = formatted_code
                         formatted_count += 1
@@ -702,7 +1481,7 @@ class PackageExtractionService(BaseService):
         
         return formatted_count
     
-    def _format_web_apis(self, package_id: int) -> int:
+    def _format_web_apis(self, package_id: int, sail_formatter: SAILFormatter) -> int:
         """Format SAIL code in web_apis table."""
         from models import WebAPI
         
@@ -712,7 +1491,7 @@ class PackageExtractionService(BaseService):
         for web_api in web_apis:
             if web_api.sail_code:
                 try:
-                    formatted_code = self.sail_formatter.format_sail_code(web_api.sail_code)
+                    formatted_code = sail_formatter.format_sail_code(web_api.sail_code)
                     if formatted_code != web_api.sail_code:
                         web_api.sail_code = formatted_code
                         formatted_count += 1
@@ -721,471 +1500,205 @@ class PackageExtractionService(BaseService):
         
         return formatted_count
     
-    # Object-specific storage methods
+    # Object-specific row builders
+    #
+    # Each returns the column values of the type-specific row for one object;
+    # child rows are built by _store_object_specific_data once parent ids are known.
     
-    def _store_interface_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Interface-specific data."""
-        from models import Interface, InterfaceParameter, InterfaceSecurity
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = Interface.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"Interface already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        interface = Interface(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Interface'),
-            version_uuid=data.get('version_uuid'),
-            sail_code=data.get('sail_code'),
-            description=data.get('description')
-        )
-        db.session.add(interface)
-        db.session.flush()
-        
-        # Store parameters
-        for param in data.get('parameters', []):
-            param_obj = InterfaceParameter(
-                interface_id=interface.id,
-                parameter_name=param.get('name'),
-                parameter_type=param.get('type'),
-                is_required=param.get('required', False),
-                default_value=param.get('default_value'),
-                display_order=param.get('display_order', 0)
-            )
-            db.session.add(param_obj)
-        
-        # Store security
-        for sec in data.get('security', []):
-            sec_obj = InterfaceSecurity(
-                interface_id=interface.id,
-                role_name=sec.get('role_name'),
-                permission_type=sec.get('permission_type')
-            )
-            db.session.add(sec_obj)
-        
-        db.session.flush()
+    def _build_interface_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Interface-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Interface'),
+            'version_uuid': data.get('version_uuid'),
+            'sail_code': data.get('sail_code'),
+            'description': data.get('description')
+        }
     
-    def _store_expression_rule_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Expression Rule-specific data."""
-        from models import ExpressionRule, ExpressionRuleInput
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = ExpressionRule.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"ExpressionRule already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        rule = ExpressionRule(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Expression Rule'),
-            version_uuid=data.get('version_uuid'),
-            sail_code=data.get('sail_code'),
-            output_type=data.get('output_type'),
-            description=data.get('description')
-        )
-        db.session.add(rule)
-        db.session.flush()
-        
-        # Store inputs
-        for inp in data.get('inputs', []):
-            input_obj = ExpressionRuleInput(
-                rule_id=rule.id,
-                input_name=inp.get('name'),
-                input_type=inp.get('type'),
-                is_required=inp.get('required', False),
-                default_value=inp.get('default_value'),
-                display_order=inp.get('display_order', 0)
-            )
-            db.session.add(input_obj)
-        
-        db.session.flush()
+    def _build_expression_rule_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Expression Rule-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Expression Rule'),
+            'version_uuid': data.get('version_uuid'),
+            'sail_code': data.get('sail_code'),
+            'output_type': data.get('output_type'),
+            'description': data.get('description')
+        }
     
-    def _store_process_model_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Process Model-specific data."""
-        from models import ProcessModel, ProcessModelNode, ProcessModelFlow, ProcessModelVariable
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = ProcessModel.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"ProcessModel already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        pm = ProcessModel(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Process Model'),
-            version_uuid=data.get('version_uuid'),
-            description=data.get('description'),
-            total_nodes=data.get('total_nodes', 0),
-            total_flows=data.get('total_flows', 0),
-            complexity_score=data.get('complexity_score')
-        )
-        db.session.add(pm)
-        db.session.flush()
-        
-        # Store nodes
-        node_map = {}  # Map node_id to database id
-        for node in data.get('nodes', []):
-            node_obj = ProcessModelNode(
-                process_model_id=pm.id,
-                node_id=node.get('node_id'),
-                node_type=node.get('node_type'),
-                node_name=node.get('node_name'),
-                properties=json.dumps(node.get('properties', {}))
-            )
-            db.session.add(node_obj)
-            db.session.flush()
-            # Map both node_id (UUID) and gui_id to database id for flow lookups
-            node_map[node.get('node_id')] = node_obj.id
-            if node.get('gui_id'):
-                node_map[node.get('gui_id')] = node_obj.id
-        
-        # Store flows
-        for flow in data.get('flows', []):
-            from_node_id = node_map.get(flow.get('from_node_id'))
-            to_node_id = node_map.get(flow.get('to_node_id'))
-            
-            if from_node_id and to_node_id:
-                flow_obj = ProcessModelFlow(
-                    process_model_id=pm.id,
-                    from_node_id=from_node_id,
-                    to_node_id=to_node_id,
-                    flow_label=flow.get('flow_label'),
-                    flow_condition=flow.get('flow_condition')
-                )
-                db.session.add(flow_obj)
-        
-        # Store variables
-        for var in data.get('variables', []):
-            var_obj = ProcessModelVariable(
-                process_model_id=pm.id,
-                variable_name=var.get('variable_name'),
-                variable_type=var.get('variable_type'),
-                is_parameter=var.get('is_parameter', False),
-                default_value=var.get('default_value')
-            )
-            db.session.add(var_obj)
-        
-        db.session.flush()
+    def _build_process_model_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Process Model-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Process Model'),
+            'version_uuid': data.get('version_uuid'),
+            'description': data.get('description'),
+            'total_nodes': data.get('total_nodes', 0),
+            'total_flows': data.get('total_flows', 0),
+            'complexity_score': data.get('complexity_score')
+        }
     
-    def _store_record_type_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Record Type-specific data."""
-        from models import RecordType, RecordTypeField, RecordTypeRelationship, RecordTypeView, RecordTypeAction
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = RecordType.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"RecordType already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        rt = RecordType(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Record Type'),
-            version_uuid=data.get('version_uuid'),
-            description=data.get('description'),
-            source_type=data.get('source_type')
-        )
-        db.session.add(rt)
-        db.session.flush()
-        
-        # Store fields
-        for field in data.get('fields', []):
-            field_obj = RecordTypeField(
-                record_type_id=rt.id,
-                field_name=field.get('field_name'),
-                field_type=field.get('field_type'),
-                is_primary_key=field.get('is_primary_key', False),
-                is_required=field.get('is_required', False),
-                display_order=field.get('display_order', 0)
-            )
-            db.session.add(field_obj)
-        
-        # Store relationships
-        for rel in data.get('relationships', []):
-            rel_obj = RecordTypeRelationship(
-                record_type_id=rt.id,
-                relationship_name=rel.get('relationship_name'),
-                related_record_uuid=rel.get('related_record_uuid'),
-                relationship_type=rel.get('relationship_type')
-            )
-            db.session.add(rel_obj)
-        
-        # Store views
-        for view in data.get('views', []):
-            view_obj = RecordTypeView(
-                record_type_id=rt.id,
-                view_name=view.get('view_name'),
-                view_type=view.get('view_type'),
-                configuration=json.dumps(view.get('configuration', {}))
-            )
-            db.session.add(view_obj)
-        
-        # Store actions
-        for action in data.get('actions', []):
-            action_obj = RecordTypeAction(
-                record_type_id=rt.id,
-                action_name=action.get('action_name'),
-                action_type=action.get('action_type'),
-                configuration=json.dumps(action.get('configuration', {}))
-            )
-            db.session.add(action_obj)
-        
-        db.session.flush()
+    def _build_record_type_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Record Type-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Record Type'),
+            'version_uuid': data.get('version_uuid'),
+            'description': data.get('description'),
+            'source_type': data.get('source_type')
+        }
     
-    def _store_cdt_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store CDT-specific data."""
-        from models import CDT, CDTField
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = CDT.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"CDT already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        cdt = CDT(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown CDT'),
-            version_uuid=data.get('version_uuid'),
-            namespace=data.get('namespace'),
-            description=data.get('description')
-        )
-        db.session.add(cdt)
-        db.session.flush()
-        
-        # Store fields
-        for field in data.get('fields', []):
-            field_obj = CDTField(
-                cdt_id=cdt.id,
-                field_name=field.get('field_name'),
-                field_type=field.get('field_type'),
-                is_list=field.get('is_list', False),
-                is_required=field.get('is_required', False),
-                display_order=field.get('display_order', 0)
-            )
-            db.session.add(field_obj)
-        
-        db.session.flush()
+    def _build_cdt_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build CDT-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown CDT'),
+            'version_uuid': data.get('version_uuid'),
+            'namespace': data.get('namespace'),
+            'description': data.get('description')
+        }
     
-    def _store_integration_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Integration-specific data."""
-        from models import Integration
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = Integration.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"Integration already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        integration = Integration(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Integration'),
-            version_uuid=data.get('version_uuid'),
-            sail_code=data.get('sail_code'),
-            connection_info=data.get('connection_info'),
-            authentication_info=data.get('authentication_info'),
-            endpoint=data.get('endpoint'),
-            description=data.get('description')
-        )
-        db.session.add(integration)
-        db.session.flush()
+    def _build_integration_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Integration-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Integration'),
+            'version_uuid': data.get('version_uuid'),
+            'sail_code': data.get('sail_code'),
+            'connection_info': data.get('connection_info'),
+            'authentication_info': data.get('authentication_info'),
+            'endpoint': data.get('endpoint'),
+            'description': data.get('description')
+        }
     
-    def _store_web_api_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Web API-specific data."""
-        from models import WebAPI
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = WebAPI.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"WebAPI already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        web_api = WebAPI(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Web API'),
-            version_uuid=data.get('version_uuid'),
-            sail_code=data.get('sail_code'),
-            endpoint=data.get('endpoint'),
-            http_methods=json.dumps(data.get('http_methods', [])),
-            description=data.get('description')
-        )
-        db.session.add(web_api)
-        db.session.flush()
+    def _build_web_api_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Web API-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Web API'),
+            'version_uuid': data.get('version_uuid'),
+            'sail_code': data.get('sail_code'),
+            'endpoint': data.get('endpoint'),
+            'http_methods': json.dumps(data.get('http_methods', [])),
+            'description': data.get('description')
+        }
     
-    def _store_site_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Site-specific data."""
-        from models import Site
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = Site.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"Site already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        site = Site(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Site'),
-            version_uuid=data.get('version_uuid'),
-            page_hierarchy=json.dumps(data.get('pages', [])),
-            description=data.get('description')
-        )
-        db.session.add(site)
-        db.session.flush()
+    def _build_site_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Site-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Site'),
+            'version_uuid': data.get('version_uuid'),
+            'page_hierarchy': json.dumps(data.get('pages', [])),
+            'description': data.get('description')
+        }
     
-    def _store_group_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Group-specific data."""
-        from models import Group
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = Group.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"Group already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        group = Group(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Group'),
-            version_uuid=data.get('version_uuid'),
-            members=json.dumps(data.get('members', [])),
-            parent_group_uuid=data.get('parent_group_uuid'),
-            description=data.get('description')
-        )
-        db.session.add(group)
-        db.session.flush()
+    def _build_group_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Group-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Group'),
+            'version_uuid': data.get('version_uuid'),
+            'members': json.dumps(data.get('members', [])),
+            'parent_group_uuid': data.get('parent_group_uuid'),
+            'description': data.get('description')
+        }
     
-    def _store_constant_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Constant-specific data."""
-        from models import Constant
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = Constant.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"Constant already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        constant = Constant(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Constant'),
-            version_uuid=data.get('version_uuid'),
-            constant_value=data.get('value'),  # Parser returns 'value'
-            constant_type=data.get('value_type'),  # Parser returns 'value_type'
-            scope=data.get('scope'),
-            description=data.get('description')
-        )
-        db.session.add(constant)
-        db.session.flush()
+    def _build_constant_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Constant-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Constant'),
+            'version_uuid': data.get('version_uuid'),
+            'constant_value': data.get('value'),  # Parser returns 'value'
+            'constant_type': data.get('value_type'),  # Parser returns 'value_type'
+            'scope': data.get('scope'),
+            'description': data.get('description')
+        }
     
-    def _store_connected_system_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Connected System-specific data."""
-        from models import ConnectedSystem
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = ConnectedSystem.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"ConnectedSystem already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        cs = ConnectedSystem(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data['uuid'],
-            name=self._ensure_not_none(data.get('name'), 'Unknown Connected System'),
-            version_uuid=data.get('version_uuid'),
-            system_type=data.get('system_type'),
-            properties=data.get('properties'),  # Already JSON string from parser
-            description=data.get('description')
-        )
-        db.session.add(cs)
-        db.session.flush()
+    def _build_connected_system_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Connected System-specific row."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data['uuid'],
+            'name': self._ensure_not_none(data.get('name'), 'Unknown Connected System'),
+            'version_uuid': data.get('version_uuid'),
+            'system_type': data.get('system_type'),
+            'properties': data.get('properties'),  # Already JSON string from parser
+            'description': data.get('description')
+        }
     
-    def _store_unknown_object_data(self, object_id: int, package_id: int, data: Dict[str, Any]) -> None:
-        """Store Unknown object data."""
-        from models import UnknownObject
-        
-        # Check if already exists (prevent duplicate insertion)
-        existing = UnknownObject.query.filter_by(
-            object_id=object_id,
-            package_id=package_id
-        ).first()
-        
-        if existing:
-            self.logger.debug(f"UnknownObject already exists for object_id={object_id}, package_id={package_id}, skipping")
-            return
-        
-        unknown = UnknownObject(
-            object_id=object_id,
-            package_id=package_id,
-            uuid=data.get('uuid', 'unknown'),
-            name=data.get('name', 'Unknown'),
-            version_uuid=data.get('version_uuid'),
-            raw_xml=data.get('raw_xml'),
-            description=data.get('description')
-        )
-        db.session.add(unknown)
-        db.session.flush()
+    def _build_unknown_object_row(self, object_id: int, package_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Unknown object row (raw_xml blob is stored with the version data)."""
+        return {
+            'object_id': object_id,
+            'package_id': package_id,
+            'uuid': data.get('uuid', 'unknown'),
+            'name': data.get('name', 'Unknown'),
+            'version_uuid': data.get('version_uuid'),
+            'raw_xml_hash': compute_blob_hash(data['raw_xml']) if data.get('raw_xml') else None,
+            'description': data.get('description')
+        }
+
+
+def parse_package_archive(zip_path: str, workers: int = 0) -> Dict[str, Any]:
+    """
+    Parse all XML/XSD files of a package ZIP without DB access.
+    
+    This is a module-level function so the orchestrator can parse several
+    packages at the same time in separate processes. The result can then be
+    stored with PackageExtractionService.store_parsed_package().
+    
+    Args:
+        zip_path: Path to ZIP file
+        workers: Number of worker processes used to parse XML files
+                 (0 or 1 parses serially)
+        
+    Returns:
+        Dict containing:
+        - zip_path: The ZIP file that was parsed
+        - total_files: Number of XML/XSD files found
+        - results: Parse result dicts as returned by parse_xml_member()
+        - read_stats: Byte counts from get_archive_read_stats()
+        
+    Raises:
+        PackageExtractionException: If the ZIP cannot be opened
+    """
+    with PackageExtractionService._open_zip(zip_path) as archive:
+        members = find_xml_members(archive)
+        results = list(iter_parsed_xml_members(
+            archive,
+            [info.filename for info in members],
+            workers
+        ))
+    
+    return {
+        'zip_path': zip_path,
+        'total_files': len(members),
+        'results': results,
+        'read_stats': get_archive_read_stats(members)
+    }
 
 
 class PackageExtractionException(Exception):
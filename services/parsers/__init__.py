@@ -4,7 +4,7 @@ Parser module for extracting data from Appian XML files.
 This module provides parsers for different Appian object types.
 """
 
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 from services.parsers.xml_parser_factory import XMLParserFactory
 
-__all__ = ['BaseParser', 'XMLParserFactory']
+__all__ = ['BaseParser', 'XMLDocument', 'XMLParserFactory']
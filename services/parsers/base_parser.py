@@ -10,24 +10,100 @@ import xml.etree.ElementTree as ET
 import re
 
 
+class XMLDocument:
+    """
+    An XML file that has already been parsed.
+    
+    Holds the root element together with the raw bytes it was parsed from,
+    so a file is read and parsed exactly once and the same tree can be used
+    both for object type detection and for the type-specific parser.
+    
+    Example:
+        >>> document = XMLDocument.from_path('/tmp/pkg/content/abc.xml')
+        >>> document.root.tag
+        'contentHaul'
+    """
+    
+    def __init__(self, root: ET.Element, source: str, content: Optional[bytes] = None):
+        """
+        Initialize the document.
+        
+        Args:
+            root: Root element of the parsed XML tree
+            source: Where the XML came from (file path or archive member name)
+            content: Raw bytes the tree was parsed from (optional)
+        """
+        self.root = root
+        self.source = source
+        self.content = content
+    
+    @classmethod
+    def from_path(cls, xml_path: str) -> 'XMLDocument':
+        """
+        Read and parse an XML file from disk.
+        
+        Args:
+            xml_path: Path to the XML file
+            
+        Returns:
+            XMLDocument for the file
+            
+        Raises:
+            ET.ParseError: If the XML is malformed
+        """
+        with open(xml_path, 'rb') as f:
+            content = f.read()
+        return cls.from_bytes(content, xml_path)
+    
+    @classmethod
+    def from_bytes(cls, content: bytes, source: str) -> 'XMLDocument':
+        """
+        Parse XML from raw bytes.
+        
+        Args:
+            content: Raw XML bytes
+            source: Name used in log and error messages
+            
+        Returns:
+            XMLDocument for the content
+            
+        Raises:
+            ET.ParseError: If the XML is malformed
+        """
+        return cls(ET.fromstring(content), source, content)
+    
+    @property
+    def is_xsd(self) -> bool:
+        """True if the document is an XSD schema (CDT definition)."""
+        return self.source.endswith('.xsd')
+    
+    @property
+    def raw_xml(self) -> Optional[str]:
+        """Raw XML text with normalized line endings, or None if unavailable."""
+        if self.content is None:
+            return None
+        text = self.content.decode('utf-8')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
 class BaseParser(ABC):
     """
     Abstract base class for parsing Appian XML files.
     
     All object-specific parsers should inherit from this class and implement
-    the parse() method to extract object-specific data.
+    the parse_document() method to extract object-specific data. parse()
+    is kept as a convenience entry point for callers holding a file path.
     """
     
     def __init__(self):
         """Initialize the base parser."""
         pass
     
-    @abstractmethod
     def parse(self, xml_path: str) -> Dict[str, Any]:
         """
         Parse XML file and extract object data.
         
-        Must extract ALL relevant data from XML.
+        Reads and parses the file, then delegates to parse_document().
         
         Args:
             xml_path: Path to the XML file to parse
@@ -43,6 +119,29 @@ class BaseParser(ABC):
         Raises:
             ParsingException: If XML parsing fails
         """
+        return self.parse_document(XMLDocument.from_path(xml_path))
+    
+    @abstractmethod
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
+        """
+        Extract object data from an already parsed XML document.
+        
+        Must extract ALL relevant data from XML.
+        
+        Args:
+            document: Parsed XML document
+            
+        Returns:
+            Dict with keys:
+            - uuid: str
+            - name: str
+            - version_uuid: str
+            - description: str
+            - <object_specific_fields>
+            
+        Raises:
+            ParsingException: If required elements are missing
+        """
         pass
     
     def _extract_basic_info(self, root: ET.Element) -> Dict[str, Any]:
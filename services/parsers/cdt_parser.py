@@ -7,7 +7,7 @@ CDT XSD files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class CDTParser(BaseParser):
@@ -17,12 +17,12 @@ class CDTParser(BaseParser):
     Extracts namespace and field definitions from CDT XSD files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse CDT XSD file and extract all relevant data.
 
         Args:
-            xml_path: Path to the CDT XSD file
+            document: Parsed CDT XSD document
 
         Returns:
             Dict containing:
@@ -33,8 +33,7 @@ class CDTParser(BaseParser):
             - namespace: Target namespace
             - fields: List of field definitions
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         ns = {
             'xsd': 'http://www.w3.org/2001/XMLSchema',
@@ -47,7 +46,7 @@ class CDTParser(BaseParser):
         # Find the complexType element (CDT definition)
         complex_type = root.find('.//xsd:complexType', ns)
         if complex_type is None:
-            raise ValueError(f"No complexType element found in {xml_path}")
+            raise ValueError(f"No complexType element found in {document.source}")
 
         # Extract name from complexType
         name = complex_type.get('name')
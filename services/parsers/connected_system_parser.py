@@ -7,7 +7,7 @@ Connected System XML files.
 
 from typing import Dict, Any
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class ConnectedSystemParser(BaseParser):
@@ -17,12 +17,12 @@ class ConnectedSystemParser(BaseParser):
     Extracts system type and configuration properties from Connected System XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Connected System XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Connected System XML file
+            document: Parsed Connected System XML document
 
         Returns:
             Dict containing:
@@ -33,13 +33,12 @@ class ConnectedSystemParser(BaseParser):
             - system_type: Type of connected system
             - properties: Configuration properties as JSON string
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the connectedSystem element
         connected_system_elem = root.find('.//connectedSystem')
         if connected_system_elem is None:
-            raise ValueError(f"No connectedSystem element found in {xml_path}")
+            raise ValueError(f"No connectedSystem element found in {document.source}")
 
         # Extract basic info - UUID and name are child elements
         data = {
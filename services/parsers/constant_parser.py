@@ -6,8 +6,7 @@ Constant XML files.
 """
 
 from typing import Dict, Any
-import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class ConstantParser(BaseParser):
@@ -17,12 +16,12 @@ class ConstantParser(BaseParser):
     Extracts value, type, and scope information from Constant XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Constant XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Constant XML file
+            document: Parsed Constant XML document
 
         Returns:
             Dict containing:
@@ -34,13 +33,12 @@ class ConstantParser(BaseParser):
             - value_type: Data type of the constant
             - scope: Scope of the constant (APPLICATION, SYSTEM, etc.)
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the constant element
         constant_elem = root.find('.//constant')
         if constant_elem is None:
-            raise ValueError(f"No constant element found in {xml_path}")
+            raise ValueError(f"No constant element found in {document.source}")
 
         # Extract basic info - UUID and name are child elements
         data = {
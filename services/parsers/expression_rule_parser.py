@@ -7,7 +7,7 @@ Expression Rule XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class ExpressionRuleParser(BaseParser):
@@ -17,12 +17,12 @@ class ExpressionRuleParser(BaseParser):
     Extracts SAIL code, inputs, and output type from Expression Rule XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Expression Rule XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Expression Rule XML file
+            document: Parsed Expression Rule XML document
 
         Returns:
             Dict containing:
@@ -38,13 +38,12 @@ class ExpressionRuleParser(BaseParser):
 
         Validates: Requirements 1.1, 1.2, 1.3, 1.4, 1.5, 8.2, 8.3, 8.4
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the rule element
         rule_elem = root.find('.//rule')
         if rule_elem is None:
-            raise ValueError(f"No rule element found in {xml_path}")
+            raise ValueError(f"No rule element found in {document.source}")
 
         # Extract basic info - UUID and name are child elements, not attributes
         data = {
@@ -7,7 +7,7 @@ Group XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class GroupParser(BaseParser):
@@ -17,12 +17,12 @@ class GroupParser(BaseParser):
     Extracts group members and parent group information from Group XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Group XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Group XML file
+            document: Parsed Group XML document
 
         Returns:
             Dict containing:
@@ -34,13 +34,12 @@ class GroupParser(BaseParser):
             - parent_group_uuid: Parent group UUID (if any)
             - group_type: Type of group
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the group element
         group_elem = root.find('.//group')
         if group_elem is None:
-            raise ValueError(f"No group element found in {xml_path}")
+            raise ValueError(f"No group element found in {document.source}")
 
         # Extract basic info - UUID and name are child elements
         data = {
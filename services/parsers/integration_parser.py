@@ -6,8 +6,7 @@ Integration XML files.
 """
 
 from typing import Dict, Any
-import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class IntegrationParser(BaseParser):
@@ -18,12 +17,12 @@ class IntegrationParser(BaseParser):
     from Integration XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Integration XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Integration XML file
+            document: Parsed Integration XML document
 
         Returns:
             Dict containing:
@@ -36,15 +35,14 @@ class IntegrationParser(BaseParser):
             - endpoint_url: Integration endpoint URL
             - authentication_type: Authentication method
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the integration element (could be outboundIntegration or integration)
         integration_elem = root.find('.//outboundIntegration')
         if integration_elem is None:
             integration_elem = root.find('.//integration')
         if integration_elem is None:
-            raise ValueError(f"No integration element found in {xml_path}")
+            raise ValueError(f"No integration element found in {document.source}")
 
         # Extract basic info - UUID and name are child elements
         data = {
@@ -7,7 +7,7 @@ Interface XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class InterfaceParser(BaseParser):
@@ -17,12 +17,12 @@ class InterfaceParser(BaseParser):
     Extracts SAIL code, parameters, and security settings from Interface XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Interface XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Interface XML file
+            document: Parsed Interface XML document
 
         Returns:
             Dict containing:
@@ -34,13 +34,12 @@ class InterfaceParser(BaseParser):
             - parameters: List of parameter definitions
             - security: List of security role assignments
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the interface element
         interface_elem = root.find('.//interface')
         if interface_elem is None:
-            raise ValueError(f"No interface element found in {xml_path}")
+            raise ValueError(f"No interface element found in {document.source}")
 
         # Extract basic info - UUID and name are child elements, not attributes
         data = {
@@ -7,7 +7,7 @@ Process Model XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class ProcessModelParser(BaseParser):
@@ -17,12 +17,12 @@ class ProcessModelParser(BaseParser):
     Extracts nodes, flows, variables, and calculates complexity from Process Model XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Process Model XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Process Model XML file
+            document: Parsed Process Model XML document
 
         Returns:
             Dict containing:
@@ -37,18 +37,17 @@ class ProcessModelParser(BaseParser):
             - total_flows: Count of flows
             - complexity_score: Calculated complexity metric
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the process model element
         pm_elem = root.find('.//{http://www.appian.com/ae/types/2009}pm')
         if pm_elem is None:
-            raise ValueError(f"No process model element found in {xml_path}")
+            raise ValueError(f"No process model element found in {document.source}")
 
         # Extract basic info from meta element
         meta_elem = pm_elem.find('.//{http://www.appian.com/ae/types/2009}meta')
         if meta_elem is None:
-            raise ValueError(f"No meta element found in {xml_path}")
+            raise ValueError(f"No meta element found in {document.source}")
 
         data = self._extract_basic_info_from_meta(meta_elem)
 
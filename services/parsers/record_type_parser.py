@@ -7,7 +7,7 @@ Record Type XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class RecordTypeParser(BaseParser):
@@ -17,12 +17,12 @@ class RecordTypeParser(BaseParser):
     Extracts fields, relationships, views, and actions from Record Type XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Record Type XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Record Type XML file
+            document: Parsed Record Type XML document
 
         Returns:
             Dict containing:
@@ -35,8 +35,7 @@ class RecordTypeParser(BaseParser):
             - views: List of view configurations
             - actions: List of record actions
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         ns = {'a': 'http://www.appian.com/ae/types/2009'}
 
@@ -45,7 +44,7 @@ class RecordTypeParser(BaseParser):
         if record_type_elem is None:
             record_type_elem = root.find('.//a:recordType', ns)
         if record_type_elem is None:
-            raise ValueError(f"No recordType element found in {xml_path}")
+            raise ValueError(f"No recordType element found in {document.source}")
 
         # Extract basic info
         data = {
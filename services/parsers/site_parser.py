@@ -7,7 +7,7 @@ Site XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class SiteParser(BaseParser):
@@ -17,12 +17,12 @@ class SiteParser(BaseParser):
     Extracts page hierarchy and site configuration from Site XML files.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Site XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Site XML file
+            document: Parsed Site XML document
 
         Returns:
             Dict containing:
@@ -33,14 +33,13 @@ class SiteParser(BaseParser):
             - pages: List of page definitions in hierarchy
             - url_stub: Site URL stub
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the site element
         ns = {'a': 'http://www.appian.com/ae/types/2009'}
         site_elem = root.find('.//site', ns)
         if site_elem is None:
-            raise ValueError(f"No site element found in {xml_path}")
+            raise ValueError(f"No site element found in {document.source}")
 
         # Extract basic info - UUID and name are attributes with namespace
         data = {
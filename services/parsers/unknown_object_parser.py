@@ -6,8 +6,7 @@ that don't have a dedicated parser.
 """
 
 from typing import Dict, Any
-import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class UnknownObjectParser(BaseParser):
@@ -18,18 +17,17 @@ class UnknownObjectParser(BaseParser):
     for objects that don't have a dedicated parser.
     """
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse unknown object type.
 
         Args:
-            xml_path: Path to the XML file
+            document: Parsed XML document
 
         Returns:
             Dict with basic object information and raw XML
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Try to extract basic info from root or first child
         data = {}
@@ -50,7 +48,6 @@ class UnknownObjectParser(BaseParser):
             }
 
         # Store raw XML for unknown objects
-        with open(xml_path, 'r', encoding='utf-8') as f:
-            data['raw_xml'] = f.read()
+        data['raw_xml'] = document.raw_xml
 
         return data
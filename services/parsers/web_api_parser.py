@@ -7,7 +7,7 @@ Web API XML files.
 
 from typing import Dict, Any, List
 import xml.etree.ElementTree as ET
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 
 
 class WebAPIParser(BaseParser):
@@ -35,12 +35,12 @@ class WebAPIParser(BaseParser):
             elem = element.find(path)
         return elem.text if elem is not None and elem.text else None
 
-    def parse(self, xml_path: str) -> Dict[str, Any]:
+    def parse_document(self, document: XMLDocument) -> Dict[str, Any]:
         """
         Parse Web API XML file and extract all relevant data.
 
         Args:
-            xml_path: Path to the Web API XML file
+            document: Parsed Web API XML document
 
         Returns:
             Dict containing:
@@ -52,8 +52,7 @@ class WebAPIParser(BaseParser):
             - endpoint_path: API endpoint path
             - http_methods: List of supported HTTP methods
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        root = document.root
 
         # Find the webApi element
         ns = {'a': 'http://www.appian.com/ae/types/2009'}
@@ -61,7 +60,7 @@ class WebAPIParser(BaseParser):
         if web_api_elem is None:
             web_api_elem = root.find('.//a:webApi', ns)
         if web_api_elem is None:
-            raise ValueError(f"No webApi element found in {xml_path}")
+            raise ValueError(f"No webApi element found in {document.source}")
 
         # Extract basic info - UUID and name are attributes with namespace
         data = {
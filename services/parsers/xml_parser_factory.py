@@ -6,7 +6,7 @@ for each Appian object type.
 """
 
 from typing import Dict
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 from services.parsers.unknown_object_parser import UnknownObjectParser
 from services.parsers.interface_parser import InterfaceParser
 from services.parsers.expression_rule_parser import ExpressionRuleParser
@@ -21,6 +21,57 @@ from services.parsers.constant_parser import ConstantParser
 from services.parsers.connected_system_parser import ConnectedSystemParser
 
 
+# Version of the data the parsers extract. Bump it whenever a parser changes
+# what it extracts, so cached package extractions are not reused.
+PARSER_VERSION = 2
+
+# Map of root element tag to object type.
+# Appian uses "Haul" suffix for most objects; plain tags are also accepted.
+ROOT_TAG_TYPES: Dict[str, str] = {
+    'interfaceHaul': 'Interface',
+    'expressionRuleHaul': 'Expression Rule',
+    'processModelHaul': 'Process Model',
+    'recordTypeHaul': 'Record Type',
+    'dataTypeHaul': 'CDT',
+    'integrationHaul': 'Integration',
+    'webApiHaul': 'Web API',
+    'siteHaul': 'Site',
+    'groupHaul': 'Group',
+    'constantHaul': 'Constant',
+    'connectedSystemHaul': 'Connected System',
+    'interface': 'Interface',
+    'expressionRule': 'Expression Rule',
+    'processModel': 'Process Model',
+    'recordType': 'Record Type',
+    'dataType': 'CDT',
+    'integration': 'Integration',
+    'webApi': 'Web API',
+    'site': 'Site',
+    'group': 'Group',
+    'constant': 'Constant',
+    'connectedSystem': 'Connected System',
+}
+
+# Map of contentHaul child element tag to object type
+CONTENT_HAUL_CHILD_TYPES: Dict[str, str] = {
+    'interface': 'Interface',
+    'expressionRule': 'Expression Rule',
+    'rule': 'Expression Rule',  # Expression rules use 'rule' tag
+    'constant': 'Constant',
+    'integration': 'Integration',
+    'webApi': 'Web API',
+    'rulesFolder': 'Unknown',  # Folders are not objects we track
+    'dataStore': 'Unknown',  # Data stores handled separately
+}
+
+
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an element tag."""
+    if '}' in tag:
+        return tag.split('}')[1]
+    return tag
+
+
 class XMLParserFactory:
     """
     Factory for creating XML parsers based on object type.
@@ -82,6 +133,33 @@ class XMLParserFactory:
         """
         return self._parsers.get(object_type, self._unknown_parser)
     
+    def detect_object_type(self, document: XMLDocument) -> str:
+        """
+        Determine object type from an already parsed XML/XSD document.
+        
+        Looks at the root element name to determine the object type.
+        For contentHaul, looks at child elements to determine actual type.
+        XSD files are CDTs (Custom Data Types).
+        
+        Args:
+            document: Parsed XML document
+            
+        Returns:
+            Object type string (e.g., 'Interface', 'Process Model', 'CDT')
+        """
+        if document.is_xsd:
+            return 'CDT'
+        
+        tag = _local_name(document.root.tag)
+        
+        if tag == 'contentHaul':
+            for child in document.root:
+                child_tag = _local_name(child.tag)
+                if child_tag in CONTENT_HAUL_CHILD_TYPES:
+                    return CONTENT_HAUL_CHILD_TYPES[child_tag]
+        
+        return ROOT_TAG_TYPES.get(tag, 'Unknown')
+    
     def get_supported_types(self) -> list:
         """
         Get list of supported object types.
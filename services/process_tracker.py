@@ -31,6 +31,10 @@ class ProcessTracker:
             'response_length': 0,
             'error_recovery_used': False
         }
+        self.rag_cache_metrics = {
+            'status': None,  # hit, miss or coalesced
+            'hit_rate': None
+        }
         self.errors = []
         self.raw_agent_output = ""  # Store raw agent output
         
@@ -50,6 +54,13 @@ class ProcessTracker:
                 self.steps[step_name]['end_time'] - self.steps[step_name]['start_time'], 2
             )
     
+    def get_current_step(self) -> Optional[str]:
+        """Get the most recently started step that has not ended"""
+        for step_name, step_data in reversed(list(self.steps.items())):
+            if step_data['duration'] is None:
+                return step_name
+        return None
+    
     def set_agent_metadata(self, agent_name: str, model_name: str = None):
         """Set agent and model information"""
         self.metadata['agent_name'] = agent_name
@@ -63,6 +74,12 @@ class ProcessTracker:
             if scores:
                 self.confidence_metrics['rag_similarity_avg'] = round(sum(scores) / len(scores), 3)
     
+    def set_rag_cache_metrics(self, rag_response: dict, cache_stats: dict = None):
+        """Set RAG retrieval cache status and hit rate"""
+        self.rag_cache_metrics['status'] = rag_response.get('cache') if rag_response else None
+        if cache_stats:
+            self.rag_cache_metrics['hit_rate'] = cache_stats.get('hit_rate')
+    
     def set_json_validity(self, is_valid: bool):
         """Set JSON validity flag"""
         self.confidence_metrics['json_valid'] = is_valid
@@ -126,6 +143,14 @@ class ProcessTracker:
         else:
             badges['processing_time'] = f"Processing Time: {total_time}s ❌"
         
+        # RAG Cache badge
+        cache_status = self.rag_cache_metrics['status']
+        if cache_status:
+            badge = f"RAG Cache: {cache_status.title()}"
+            if self.rag_cache_metrics['hit_rate']:
+                badge += f" (hit rate {self.rag_cache_metrics['hit_rate']})"
+            badges['rag_cache'] = badge + (" ⚡" if cache_status != 'miss' else "")
+        
         # Error Recovery badge
         if self.confidence_metrics['error_recovery_used']:
             badges['error_recovery'] = "Error Recovery: Yes ⚠️"
@@ -145,6 +170,7 @@ class ProcessTracker:
             'step_durations': json.dumps(self.get_timeline_data()),
             'raw_agent_output': self.raw_agent_output,
             'rag_similarity_avg': self.confidence_metrics['rag_similarity_avg'],
+            'rag_cache_status': self.rag_cache_metrics['status'],
             'json_valid': self.confidence_metrics['json_valid'],
             'error_log': json.dumps(self.errors) if self.errors else None
         }
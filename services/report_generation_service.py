@@ -15,6 +15,7 @@ from openpyxl.styles import (
     Font, Alignment, PatternFill, Border, Side
 )
 from openpyxl.utils import get_column_letter
+from sqlalchemy.orm import joinedload
 
 from core.base_service import BaseService
 from models import db, MergeSession, Change, Package, ObjectVersion
@@ -202,7 +203,9 @@ class ReportGenerationService(BaseService):
             vendor_version = None
 
             if base_pkg:
-                base_version = db.session.query(ObjectVersion).filter_by(
+                base_version = db.session.query(ObjectVersion).options(
+                    joinedload(ObjectVersion.fields_blob)
+                ).filter_by(
                     object_id=obj.id, package_id=base_pkg.id
                 ).first()
 
@@ -214,7 +217,9 @@ class ReportGenerationService(BaseService):
                 ).first()
 
             if vendor_pkg:
-                vendor_version = db.session.query(ObjectVersion).filter_by(
+                vendor_version = db.session.query(ObjectVersion).options(
+                    joinedload(ObjectVersion.fields_blob)
+                ).filter_by(
                     object_id=obj.id, package_id=vendor_pkg.id
                 ).first()
 
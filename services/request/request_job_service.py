@@ -0,0 +1,269 @@
+"""
+Request Job Service - Run breakdown/verify/create/convert requests in the background
+
+Document extraction, Bedrock retrieval and the Q agent call run on a
+bounded executor instead of the Flask request thread. The Request row's
+status and step_durations are updated as the job progresses.
+"""
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from flask import current_app
+
+from core.base_service import BaseService
+from core.exceptions import ResourceConstraintException
+from core.logger import LoggerConfig
+from models import db, Request
+from repositories.request_repository import RequestRepository
+from services.ai.q_agent_service import QAgentService
+from services.process_tracker import ProcessTracker
+from services.request.document_service import DocumentService
+from services.request.request_service import RequestService
+
+
+class RequestJobService(BaseService):
+    """
+    Service for running document-intelligence requests as background jobs
+
+    Jobs move a Request from 'queued' to 'processing' and then to
+    'completed' or 'error'. At most REQUEST_JOB_WORKERS jobs run at once;
+    submissions beyond REQUEST_JOB_MAX_PENDING unfinished jobs are
+    rejected.
+
+    Example:
+        >>> req = request_service.create_request('verify', input_text=text, status='queued')
+        >>> job_service.submit(req.id, 'verify', design_content=text)
+        >>> job_service.get_job_status(req.id)['status']
+        'processing'
+    """
+
+    # Unfinished jobs, shared so any request thread can report progress
+    _active_jobs: Dict[int, ProcessTracker] = {}
+    _jobs_lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    # Actions whose final_output is JSON
+    JSON_OUTPUT_ACTIONS = {'breakdown', 'verify', 'create'}
+
+    def __init__(self, container=None):
+        """Initialize service with dependencies."""
+        super().__init__(container)
+        self.logger = LoggerConfig.get_logger(__name__)
+
+    def _initialize_dependencies(self):
+        """Initialize service dependencies"""
+        self.request_repo = self._get_repository(RequestRepository)
+        self.request_service = self._get_service(RequestService)
+        self.document_service = self._get_service(DocumentService)
+        self.q_agent_service = self._get_service(QAgentService)
+
+    def submit(self, request_id: int, action_type: str, **inputs: Any) -> None:
+        """
+        Queue a request for background processing
+
+        Must be called inside a Flask application context; the job runs
+        in that application.
+
+        Args:
+            request_id: ID of the queued request
+            action_type: 'breakdown', 'verify', 'create' or 'convert'
+            **inputs: Job inputs (file_path, design_content,
+                acceptance_criteria or maria_sql)
+
+        Raises:
+            ResourceConstraintException: If too many jobs are unfinished
+        """
+        from config import Config
+
+        runners = {
+            'breakdown': self._run_breakdown,
+            'verify': self._run_verification,
+            'create': self._run_creation,
+            'convert': self._run_conversion
+        }
+        runner = runners[action_type]
+
+        with self._jobs_lock:
+            if len(self._active_jobs) >= Config.REQUEST_JOB_MAX_PENDING:
+                raise ResourceConstraintException(
+                    "Too many requests are being processed - please try again shortly"
+                )
+            tracker = ProcessTracker(request_id, action_type)
+            self._active_jobs[request_id] = tracker
+            if RequestJobService._executor is None:
+                RequestJobService._executor = ThreadPoolExecutor(
+                    max_workers=Config.REQUEST_JOB_WORKERS,
+                    thread_name_prefix='RequestJob'
+                )
+            executor = RequestJobService._executor
+
+        app = current_app._get_current_object()
+        executor.submit(self._run_job, app, tracker, runner, inputs)
+        self.logger.info(f"Queued {action_type} request {request_id}")
+
+    def get_job_status(self, request_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the progress of a request
+
+        Args:
+            request_id: Request ID
+
+        Returns:
+            Dict with request_id, action_type, status, steps (completed
+            step timings), current_step, total_time and, once finished,
+            output or error; None if the request does not exist
+        """
+        req = self.request_repo.get_by_id(request_id)
+        if not req:
+            return None
+        db.session.refresh(req)
+
+        with self._jobs_lock:
+            tracker = self._active_jobs.get(request_id)
+
+        status = {
+            'request_id': req.id,
+            'action_type': req.action_type,
+            'status': req.status,
+            'steps': json.loads(req.step_durations) if req.step_durations else [],
+            'current_step': tracker.get_current_step() if tracker else None,
+            'total_time': req.total_time
+        }
+        if req.status == 'completed':
+            status['output'] = (
+                json.loads(req.final_output)
+                if req.action_type in self.JSON_OUTPUT_ACTIONS and req.final_output
+                else req.final_output
+            )
+        elif req.status == 'error':
+            errors = json.loads(req.error_log) if req.error_log else []
+            status['error'] = errors[-1]['message'] if errors else 'Processing failed'
+        return status
+
+    def _run_job(
+        self,
+        app,
+        tracker: ProcessTracker,
+        runner: Callable[..., str],
+        inputs: Dict[str, Any]
+    ) -> None:
+        """Run a job in a worker thread and record its outcome."""
+        with app.app_context():
+            try:
+                self._save_progress(tracker, status='processing')
+                output = runner(tracker, **inputs)
+                self._save_progress(tracker, status='completed', output=output)
+                self.logger.info(
+                    f"Completed {tracker.action_type} request {tracker.request_id} "
+                    f"in {tracker.get_total_time()}s"
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"{tracker.action_type} request {tracker.request_id} failed: {e}",
+                    exc_info=True
+                )
+                db.session.rollback()
+                tracker.add_error(str(e), tracker.get_current_step())
+                self._save_progress(tracker, status='error')
+            finally:
+                with self._jobs_lock:
+                    self._active_jobs.pop(tracker.request_id, None)
+                db.session.remove()
+
+    @contextmanager
+    def _step(self, tracker: ProcessTracker, step_name: str) -> Iterator[None]:
+        """Time a job step and save the timeline when it ends."""
+        tracker.start_step(step_name)
+        yield
+        tracker.end_step(step_name)
+        self._save_progress(tracker)
+
+    def _save_progress(
+        self,
+        tracker: ProcessTracker,
+        status: Optional[str] = None,
+        output: Optional[str] = None
+    ) -> None:
+        """Write status, step timings, RAG cache status and output to the Request row."""
+        req = self.request_repo.get_by_id(tracker.request_id)
+        if not req:
+            return
+        if status:
+            req.status = status
+        if output is not None:
+            req.final_output = output
+        req.step_durations = json.dumps(tracker.get_timeline_data())
+        req.total_time = int(tracker.get_total_time())
+        if tracker.rag_cache_metrics['status']:
+            req.rag_cache_status = tracker.rag_cache_metrics['status']
+        if tracker.errors:
+            req.error_log = json.dumps(tracker.errors)
+        self.request_repo.update(req)
+
+    def _retrieve_context(
+        self,
+        tracker: ProcessTracker,
+        req: Request,
+        query_text: str
+    ) -> Dict[str, Any]:
+        """Query the knowledge base and record the retrieval cache status."""
+        bedrock_response = self.request_service.process_with_bedrock(req, query_text)
+        tracker.set_rag_cache_metrics(
+            bedrock_response, self.request_service.bedrock_service.get_cache_stats()
+        )
+        return bedrock_response
+
+    def _run_breakdown(self, tracker: ProcessTracker, file_path: str) -> str:
+        """Extract the document, retrieve context and break it down."""
+        req = self.request_repo.get_by_id(tracker.request_id)
+
+        with self._step(tracker, 'Document Extraction'):
+            file_content = self.document_service.extract_content(file_path)
+
+        with self._step(tracker, 'Knowledge Base Retrieval'):
+            query_text = f"Find similar spec breakdowns for: {file_content[:500]}..."
+            bedrock_response = self._retrieve_context(tracker, req, query_text)
+
+        with self._step(tracker, 'Q Agent Breakdown'):
+            breakdown_data = self.q_agent_service.process_breakdown(
+                req.id, file_content, bedrock_response
+            )
+        return json.dumps(breakdown_data)
+
+    def _run_verification(self, tracker: ProcessTracker, design_content: str) -> str:
+        """Retrieve similar designs and verify the design document."""
+        req = self.request_repo.get_by_id(tracker.request_id)
+
+        with self._step(tracker, 'Knowledge Base Retrieval'):
+            query_text = f"Find existing design documents similar to: {design_content[:500]}..."
+            bedrock_response = self._retrieve_context(tracker, req, query_text)
+
+        with self._step(tracker, 'Q Agent Verification'):
+            verification_data = self.q_agent_service.process_verification(
+                req.id, design_content, bedrock_response
+            )
+        return json.dumps(verification_data)
+
+    def _run_creation(self, tracker: ProcessTracker, acceptance_criteria: str) -> str:
+        """Retrieve objects to modify and generate the design document."""
+        req = self.request_repo.get_by_id(tracker.request_id)
+
+        with self._step(tracker, 'Knowledge Base Retrieval'):
+            # Ask specifically for objects to modify
+            query_text = (f"What objects need to be modified for: {acceptance_criteria}? "
+                          "List the specific components, forms, rules, and services that require changes.")
+            bedrock_response = self._retrieve_context(tracker, req, query_text)
+
+        with self._step(tracker, 'Q Agent Design Generation'):
+            design_data = self.q_agent_service.process_creation(
+                req.id, acceptance_criteria, bedrock_response
+            )
+        return json.dumps(design_data)
+
+    def _run_conversion(self, tracker: ProcessTracker, maria_sql: str) -> str:
+        """Convert MariaDB SQL to Oracle."""
+        with self._step(tracker, 'Q Agent SQL Conversion'):
+            return self.q_agent_service.process_conversion(tracker.request_id, maria_sql)
@@ -25,7 +25,8 @@ class RequestService(BaseService):
         self.bedrock_service = DataSourceFactory.create_rag_service()
 
     def create_request(self, action_type: str, filename: str = None,
-                       input_text: str = None) -> Request:
+                       input_text: str = None,
+                       status: str = 'processing') -> Request:
         """
         Create a new request
 
@@ -33,6 +34,7 @@ class RequestService(BaseService):
             action_type: Type of action (breakdown, verify, create)
             filename: Optional filename for file-based requests
             input_text: Optional input text for text-based requests
+            status: Initial status ('queued' for background jobs)
 
         Returns:
             Created Request instance
@@ -41,7 +43,7 @@ class RequestService(BaseService):
             action_type=action_type,
             filename=filename,
             input_text=input_text,
-            status='processing'
+            status=status
         )
 
     def update_request_status(self, request_id: int, status: str,
@@ -6,26 +6,79 @@ This service formats SAIL code by:
 2. Replacing UUID references with actual object names
 3. Replacing Appian function calls with public names
 4. Cleaning up formatting
+
+Steps 1-3 each run as a single regex pass with patterns compiled once at
+import time. UUID references and function calls are matched by one
+combined pattern and replaced through a single dispatch callback.
 """
 
 import re
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from core.base_service import BaseService
 from core.logger import get_merge_logger
 
 
+# Escape sequences and what they stand for
+ESCAPE_SEQUENCES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', "'": "'"}
+
+# A run of backslashes, optionally ending in an escape sequence
+_ESCAPE_PATTERN = re.compile(r'(\\+)([ntr"\']?)')
+
+# UUID reference formats: #"_a-uuid", #"uuid", rule!uuid, cons!uuid, type!uuid
+_UUID_REFERENCE_PATTERNS = (
+    r'#"(?P<quoted_uuid>_a-[a-f0-9\-_]+|[a-f0-9\-]{36})"',
+    r'(?:rule|cons|type)!(?P<prefixed_uuid>[a-f0-9\-]{36})',
+)
+
+# Function call formats: a!functionName( and #"SYSTEM_SYSRULES_functionName"(
+_FUNCTION_CALL_PATTERNS = (
+    r'a!(?P<a_function>[a-zA-Z][a-zA-Z0-9_]*)\s*\(',
+    r'#"SYSTEM_SYSRULES_(?P<system_function>[a-zA-Z][a-zA-Z0-9_]*)"?\s*\(',
+)
+
+_UUID_REFERENCE_PATTERN = re.compile('|'.join(_UUID_REFERENCE_PATTERNS))
+_REFERENCE_PATTERN = re.compile('|'.join(_UUID_REFERENCE_PATTERNS + _FUNCTION_CALL_PATTERNS))
+
+_NODE_HEADER_PATTERN = re.compile(r'(=== NODE: [^=]+ ===)')
+
+
 class SAILFormatter(BaseService):
-    """Formats SAIL code by resolving UUIDs and cleaning formatting"""
+    """
+    Formats SAIL code by resolving UUIDs and cleaning formatting.
+    
+    Formatted output is memoized per (code, lookup generation). The
+    generation changes whenever set_object_lookup() is given a different
+    lookup, so identical code in several packages or tables is formatted
+    once per lookup.
+    """
+    
+    # Memoized results kept before the memo is cleared
+    MEMO_MAX_ENTRIES = 10000
+    
+    # Appian function mapping, loaded by the first formatter and shared
+    _appian_functions: Optional[Dict[str, str]] = None
     
     def __init__(self, container=None):
         """Initialize formatter with dependencies"""
         super().__init__(container)
         self.logger = get_merge_logger()
-        self.appian_functions = self._load_appian_functions()
+        if SAILFormatter._appian_functions is None:
+            SAILFormatter._appian_functions = self._load_appian_functions()
+        self.appian_functions = SAILFormatter._appian_functions
         self.object_lookup = {}
+        self.lookup_generation = 0
+        self._memo: Dict[Tuple[str, int], str] = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self._replacers = {
+            'quoted_uuid': self._replace_uuid,
+            'prefixed_uuid': self._replace_uuid,
+            'a_function': self._replace_function,
+            'system_function': self._replace_function,
+        }
     
     def _initialize_dependencies(self) -> None:
         """Initialize service dependencies"""
@@ -35,10 +88,18 @@ class SAILFormatter(BaseService):
         """
         Set the object lookup dictionary for UUID resolution.
         
+        Starts a new lookup generation (and drops memoized output) unless
+        the lookup is unchanged.
+        
         Args:
             object_lookup: Dict mapping UUID -> {name, object_type, ...}
         """
+        if object_lookup == self.object_lookup:
+            return
+        
         self.object_lookup = object_lookup
+        self.lookup_generation += 1
+        self._memo.clear()
     
     def _load_appian_functions(self) -> Dict[str, str]:
         """Load Appian public functions mapping"""
@@ -72,25 +133,34 @@ class SAILFormatter(BaseService):
         
         Args:
             sail_code: Raw SAIL code
-            
+        
         Returns:
             Formatted SAIL code
         """
         if not sail_code or not sail_code.strip():
             return ""
         
+        memo_key = (sail_code, self.lookup_generation)
+        formatted_code = self._memo.get(memo_key)
+        if formatted_code is not None:
+            self.memo_hits += 1
+            return formatted_code
+        self.memo_misses += 1
+        
         # Step 1: Remove escape sequences
         formatted_code = self._remove_escape_sequences(sail_code)
         
-        # Step 2: Replace UUID references with object names
-        formatted_code = self._replace_uuid_references(formatted_code)
-        
-        # Step 3: Replace Appian function calls with public names
-        formatted_code = self._replace_appian_functions(formatted_code)
+        # Steps 2-3: Replace UUID references with object names and Appian
+        # function calls with public names
+        formatted_code = _REFERENCE_PATTERN.sub(self._replace_reference, formatted_code)
         
         # Step 4: Clean up formatting
         formatted_code = self._clean_formatting(formatted_code)
         
+        if len(self._memo) >= self.MEMO_MAX_ENTRIES:
+            self._memo.clear()
+        self._memo[memo_key] = formatted_code
+        
         return formatted_code
     
     def format_process_model_logic(self, business_logic: str) -> str:
@@ -99,7 +169,7 @@ class SAILFormatter(BaseService):
         
         Args:
             business_logic: Raw business logic text
-            
+        
         Returns:
             Formatted business logic
         """
@@ -118,79 +188,57 @@ class SAILFormatter(BaseService):
         return formatted_logic
     
     def _remove_escape_sequences(self, code: str) -> str:
-        """Remove escape sequences while preserving content"""
-        # Remove common escape sequences
-        code = code.replace('\\n', '\n')
-        code = code.replace('\\t', '\t')
-        code = code.replace('\\r', '\r')
-        code = code.replace('\\"', '"')
-        code = code.replace("\\'", "'")
-        code = code.replace('\\\\', '\\')
-        return code
+        """
+        Remove escape sequences while preserving content.
+        
+        A backslash directly before n, t, r, " or ' always starts an escape
+        sequence; the remaining backslashes of a run collapse pairwise.
+        """
+        if '\\' not in code:
+            return code
+        return _ESCAPE_PATTERN.sub(self._replace_escape_run, code)
+    
+    @staticmethod
+    def _replace_escape_run(match: re.Match) -> str:
+        """Replace a run of backslashes matched by _ESCAPE_PATTERN."""
+        backslashes = len(match.group(1))
+        escaped = match.group(2)
+        if escaped:
+            backslashes -= 1
+        return '\\' * (backslashes // 2 + backslashes % 2) + ESCAPE_SEQUENCES.get(escaped, '')
     
     def _replace_uuid_references(self, code: str) -> str:
         """Replace UUID references with actual object names"""
-        # Pattern to match various UUID reference formats
-        patterns = [
-            r'#"(_a-[a-f0-9\-_]+)"',  # Standard format: #"_a-uuid"
-            r'#"([a-f0-9\-]{36})"',   # Standard UUID format: #"uuid"
-            r'rule!([a-f0-9\-]{36})',  # Rule reference: rule!uuid
-            r'cons!([a-f0-9\-]{36})',  # Constant reference: cons!uuid
-            r'type!([a-f0-9\-]{36})',  # Type reference: type!uuid
-        ]
-        
-        def replace_uuid(match):
-            uuid = match.group(1)
-            obj = self.object_lookup.get(uuid)
-            
-            if obj:
-                object_name = obj.get('name', uuid)
-                object_type = obj.get('object_type', '')
-                
-                # Return appropriate format based on object type
-                if object_type == 'Expression Rule':
-                    return f'rule!{object_name}'
-                elif object_type == 'Constant':
-                    return f'cons!{object_name}'
-                elif object_type == 'Interface':
-                    return f'rule!{object_name}'
-                else:
-                    return f'rule!{object_name}'
-            
-            return match.group(0)  # Return original if not found
+        return _UUID_REFERENCE_PATTERN.sub(self._replace_reference, code)
+    
+    def _replace_reference(self, match: re.Match) -> str:
+        """Dispatch a UUID reference or function call match to its replacer."""
+        return self._replacers[match.lastgroup](match)
+    
+    def _replace_uuid(self, match: re.Match) -> str:
+        """Replace a UUID reference with the referenced object's name"""
+        uuid = match.group(match.lastgroup)
+        obj = self.object_lookup.get(uuid)
         
-        # Apply all patterns
-        for pattern in patterns:
-            code = re.sub(pattern, replace_uuid, code)
+        if obj:
+            object_name = obj.get('name', uuid)
+            object_type = obj.get('object_type', '')
+            
+            # Constants keep the cons! prefix, everything else is a rule!
+            if object_type == 'Constant':
+                return f'cons!{object_name}'
+            return f'rule!{object_name}'
         
-        return code
+        return match.group(0)  # Return original if not found
     
-    def _replace_appian_functions(self, code: str) -> str:
-        """Replace a! and #"SYSTEM_*" function calls with public function names"""
+    def _replace_function(self, match: re.Match) -> str:
+        """Replace an a! or #"SYSTEM_*" function call with its public name"""
         if not self.appian_functions:
-            return code
-        
-        # Pattern 1: a!functionName( calls
-        pattern1 = r'a!([a-zA-Z][a-zA-Z0-9_]*)\s*\('
-        
-        # Pattern 2: #"SYSTEM_SYSRULES_functionName"( calls
-        pattern2 = r'#"SYSTEM_SYSRULES_([a-zA-Z][a-zA-Z0-9_]*)"?\s*\('
-        
-        def replace_a_function(match):
-            internal_name = match.group(1)
-            public_name = self.appian_functions.get(internal_name, internal_name)
-            return f'a!{public_name}('
-        
-        def replace_system_function(match):
-            internal_name = match.group(1)
-            public_name = self.appian_functions.get(internal_name, internal_name)
-            return f'a!{public_name}('
-        
-        # Apply both patterns
-        code = re.sub(pattern1, replace_a_function, code)
-        code = re.sub(pattern2, replace_system_function, code)
+            return match.group(0)
         
-        return code
+        internal_name = match.group(match.lastgroup)
+        public_name = self.appian_functions.get(internal_name, internal_name)
+        return f'a!{public_name}('
     
     def _clean_formatting(self, code: str) -> str:
         """Clean up code formatting"""
@@ -222,7 +270,7 @@ class SAILFormatter(BaseService):
     def _format_node_sections(self, logic: str) -> str:
         """Format process model node sections with proper separation"""
         # Split by node headers and reformat
-        node_sections = re.split(r'(=== NODE: [^=]+ ===)', logic)
+        node_sections = _NODE_HEADER_PATTERN.split(logic)
         formatted_sections = []
         
         for i, section in enumerate(node_sections):
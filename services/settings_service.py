@@ -12,7 +12,8 @@ from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from models import (
     db, Request, ChatSession, MergeSession, Package, ObjectLookup,
-    PackageObjectMapping, DeltaComparisonResult, Change, ObjectVersion,
+    PackageObjectMapping, DeltaComparisonResult, CustomerComparisonResult,
+    Change, ObjectVersion, ContentBlob, ExtractionCacheEntry, SummaryCacheEntry,
     Interface, InterfaceParameter, InterfaceSecurity,
     ExpressionRule, ExpressionRuleInput,
     ProcessModel, ProcessModelNode, ProcessModelFlow, ProcessModelVariable,
@@ -156,9 +157,15 @@ class SettingsService:
             self.logger.debug("Deleting three-way merge tables")
             deleted_counts['changes'] = Change.query.delete()
             deleted_counts['delta_comparison_results'] = DeltaComparisonResult.query.delete()
+            deleted_counts['customer_comparison_results'] = CustomerComparisonResult.query.delete()
             deleted_counts['object_versions'] = ObjectVersion.query.delete()
+            deleted_counts['content_blobs'] = ContentBlob.query.delete()
             deleted_counts['package_object_mappings'] = PackageObjectMapping.query.delete()
             deleted_counts['object_lookup'] = ObjectLookup.query.delete()
+            # Bulk deletes skip the ORM cascades, and package ids are reused
+            # afterwards, so cache entries must not outlive their packages
+            deleted_counts['extraction_cache'] = ExtractionCacheEntry.query.delete()
+            deleted_counts['summary_cache'] = SummaryCacheEntry.query.delete()
             deleted_counts['packages'] = Package.query.delete()
             deleted_counts['merge_sessions'] = MergeSession.query.delete()
             
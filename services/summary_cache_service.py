@@ -0,0 +1,237 @@
+"""
+Summary Cache Service
+
+Reuses AI summaries when the same change is summarized again.
+
+Entries are keyed by the SHA-256 of everything the merge summary prompt is
+built from for one change (object, classification and the customer and
+vendor versions) plus the agent name and prompt version. The same object
+pair in another session of the same application gets the cached summary
+without calling the Q agent.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from core.base_service import BaseService
+from core.logger import get_merge_logger
+from models import db, SummaryCacheEntry
+from services.ai.q_agent_service import MERGE_SUMMARY_AGENT, MERGE_SUMMARY_PROMPT_VERSION
+
+
+def compute_summary_cache_key(change_data: Dict[str, Any]) -> str:
+    """
+    Compute the cache key of a change prepared for the Q agent.
+    
+    The change ID is left out, so identical changes in different
+    sessions share a key.
+    
+    Args:
+        change_data: Change dictionary from MergeSummaryService
+    
+    Returns:
+        SHA-256 hex digest
+    """
+    inputs = {key: value for key, value in change_data.items() if key != 'change_id'}
+    payload = json.dumps(
+        [MERGE_SUMMARY_AGENT, MERGE_SUMMARY_PROMPT_VERSION, inputs],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SummaryCacheService(BaseService):
+    """
+    Service for the persistent AI summary cache.
+    
+    Only summaries produced by the agent are cached, never fallback
+    summaries. Eviction removes entries not used for
+    SUMMARY_CACHE_MAX_AGE_DAYS and then the least recently used entries
+    beyond SUMMARY_CACHE_MAX_ENTRIES.
+    
+    Example:
+        >>> cache = SummaryCacheService()
+        >>> cached = cache.lookup(changes_data)
+        >>> remaining = [c for c in changes_data if c['change_id'] not in cached]
+        >>> cache.store(remaining, summaries)
+    """
+    
+    # Maximum number of keys per IN clause
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
+    def __init__(self, container=None):
+        """Initialize service with dependencies."""
+        super().__init__(container)
+        self.logger = get_merge_logger()
+        self.hits = 0
+        self.misses = 0
+    
+    def _initialize_dependencies(self) -> None:
+        """Initialize service dependencies."""
+        pass
+    
+    def lookup(self, changes_data: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Find cached summaries for changes.
+        
+        Args:
+            changes_data: Change dictionaries from MergeSummaryService
+        
+        Returns:
+            Dict mapping change_id -> summary data for the cached changes
+        """
+        from config import Config
+        
+        if not Config.SUMMARY_CACHE_ENABLED or not changes_data:
+            return {}
+        
+        keys = {
+            change['change_id']: compute_summary_cache_key(change)
+            for change in changes_data
+        }
+        entries = self._get_entries(set(keys.values()))
+        
+        cached = {}
+        for change_id, key in keys.items():
+            entry = entries.get(key)
+            if entry is not None:
+                cached[change_id] = dict(json.loads(entry.summary), change_id=change_id)
+        
+        if entries:
+            SummaryCacheEntry.query.filter(
+                SummaryCacheEntry.id.in_([entry.id for entry in entries.values()])
+            ).update(
+                {
+                    'hit_count': db.func.coalesce(SummaryCacheEntry.hit_count, 0) + 1,
+                    'last_used_at': datetime.utcnow()
+                },
+                synchronize_session=False
+            )
+            db.session.flush()
+        
+        self.hits += len(cached)
+        self.misses += len(changes_data) - len(cached)
+        self.logger.info(
+            f"Summary cache: {len(cached)} of {len(changes_data)} changes cached"
+        )
+        return cached
+    
+    def store(
+        self,
+        changes_data: List[Dict[str, Any]],
+        summaries: Dict[int, Dict[str, Any]]
+    ) -> int:
+        """
+        Cache agent summaries of changes and run eviction.
+        
+        Args:
+            changes_data: Change dictionaries the summaries were generated for
+            summaries: Dict mapping change_id -> summary data from the agent
+        
+        Returns:
+            Number of summaries stored
+        """
+        from config import Config
+        
+        if not Config.SUMMARY_CACHE_ENABLED:
+            return 0
+        
+        new_summaries = {}
+        for change in changes_data:
+            summary = summaries.get(change['change_id'])
+            if summary:
+                data = {key: value for key, value in summary.items() if key != 'change_id'}
+                new_summaries[compute_summary_cache_key(change)] = json.dumps(data)
+        if not new_summaries:
+            return 0
+        
+        # Upsert, so a generation storing the same key at the same time
+        # cannot make this insert fail on the unique cache_key
+        now = datetime.utcnow()
+        statement = sqlite_insert(SummaryCacheEntry.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=['cache_key'],
+            set_={
+                'summary': statement.excluded.summary,
+                'last_used_at': statement.excluded.last_used_at
+            }
+        )
+        db.session.execute(statement, [
+            {
+                'cache_key': key,
+                'summary': summary,
+                'hit_count': 0,
+                'created_at': now,
+                'last_used_at': now
+            }
+            for key, summary in new_summaries.items()
+        ])
+        
+        self.evict()
+        return len(new_summaries)
+    
+    def evict(self) -> int:
+        """
+        Remove stale entries and keep the cache within its size limit.
+        
+        Returns:
+            Number of entries removed
+        """
+        from config import Config
+        
+        cutoff = datetime.utcnow() - timedelta(days=Config.SUMMARY_CACHE_MAX_AGE_DAYS)
+        evicted = SummaryCacheEntry.query.filter(
+            SummaryCacheEntry.last_used_at < cutoff
+        ).delete(synchronize_session=False)
+        
+        overflow_ids = [
+            row.id for row in db.session.query(SummaryCacheEntry.id).order_by(
+                SummaryCacheEntry.last_used_at.desc(),
+                SummaryCacheEntry.id.desc()
+            ).offset(Config.SUMMARY_CACHE_MAX_ENTRIES)
+        ]
+        for start in range(0, len(overflow_ids), self.IN_CLAUSE_CHUNK_SIZE):
+            evicted += SummaryCacheEntry.query.filter(
+                SummaryCacheEntry.id.in_(overflow_ids[start:start + self.IN_CLAUSE_CHUNK_SIZE])
+            ).delete(synchronize_session=False)
+        
+        if evicted:
+            db.session.flush()
+            self.logger.info(f"Evicted {evicted} summary cache entries")
+        
+        return evicted
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with entries, hits, misses and hit_rate (hits and misses
+            are counted per change since process start)
+        """
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            'entries': SummaryCacheEntry.query.count(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': f"{hit_rate:.2f}%"
+        }
+    
+    def _get_entries(self, keys: set) -> Dict[str, SummaryCacheEntry]:
+        """Load cache entries by key, one query per chunk of keys."""
+        keys = list(keys)
+        entries = {}
+        for start in range(0, len(keys), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = keys[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            for entry in SummaryCacheEntry.query.filter(
+                SummaryCacheEntry.cache_key.in_(chunk)
+            ):
+                entries[entry.cache_key] = entry
+        return entries
@@ -7,13 +7,27 @@ sub-services (extraction, delta, customer, classification, guidance).
 
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 from core.base_service import BaseService
 from core.logger import LoggerConfig, get_merge_logger
-from models import db, MergeSession, Package, Change
+from models import (
+    db,
+    MergeSession,
+    Package,
+    Change,
+    DeltaComparisonResult,
+    CustomerComparisonResult,
+    ObjectVersion
+)
 from repositories.change_repository import ChangeRepository
-from services.package_extraction_service import PackageExtractionService
+from repositories.content_blob_repository import ContentBlobRepository
+from services.package_extraction_service import (
+    PackageExtractionService,
+    compute_zip_hash,
+    parse_package_archive
+)
 from services.delta_comparison_service import DeltaComparisonService
 from services.customer_comparison_service import CustomerComparisonService
 from services.classification_service import ClassificationService
@@ -22,7 +36,16 @@ from services.comparison_persistence_service import (
     ComparisonPersistenceService
 )
 from services.merge_summary_service import MergeSummaryService
-from domain.enums import SessionStatus
+from services.merge_progress import MergeProgress
+from domain.entities import CustomerChange, DeltaChange
+from domain.enums import ChangeCategory, ChangeType, SessionStatus
+
+
+# Steps of the merge workflow, as logged
+WORKFLOW_STEPS = 10
+
+# Steps of a customer package re-merge, as logged
+REMERGE_STEPS = 5
 
 
 class ThreeWayMergeOrchestrator(BaseService):
@@ -41,9 +64,14 @@ class ThreeWayMergeOrchestrator(BaseService):
     9. Update session status to 'ready'
     10. Return session with reference_id and total_changes
     
+    Each step is logged with LoggerConfig.log_step and recorded in a
+    MergeProgress, so a run in the background can report step progress.
+    
     Key Design Principles:
-    - Transactional: All operations in a single transaction
-    - Rollback on error: Any failure rolls back entire session
+    - Checkpointed: Each step commits its results and records itself as
+      the session's completed_step
+    - Rollback on error: A failure rolls back the failed step only
+    - Resumable: A retry continues after the last checkpoint
     - Status tracking: Session status updated at each step
     - Error handling: Comprehensive error handling with logging
     - Idempotent: Can be retried safely
@@ -88,18 +116,25 @@ class ThreeWayMergeOrchestrator(BaseService):
             MergeSummaryService
         )
         self.change_repository = self._get_repository(ChangeRepository)
+        self.content_blob_repository = self._get_repository(ContentBlobRepository)
     
     def create_merge_session(
         self,
         base_zip_path: str,
         customized_zip_path: str,
-        new_vendor_zip_path: str
+        new_vendor_zip_path: str,
+        concurrent_extraction: Optional[bool] = None,
+        reference_id: Optional[str] = None,
+        progress: Optional[MergeProgress] = None
     ) -> MergeSession:
         """
         Create and process a new merge session.
         
         This is the main entry point for the three-way merge workflow.
-        It executes all 8 steps in a single transaction.
+        Each step is committed together with a checkpoint (the session's
+        completed_step). Processing an existing session (reference_id)
+        skips the steps up to its checkpoint and loads their packages,
+        comparison results and changes from the database.
         
         Workflow:
         1. Create session record with status='PROCESSING'
@@ -117,14 +152,29 @@ class ThreeWayMergeOrchestrator(BaseService):
         
         If any step fails:
         - Log error
-        - Update session status to 'ERROR'
-        - Rollback transaction
+        - Rollback the failed step
+        - Update session status to 'ERROR' (earlier steps stay committed)
         - Raise exception
         
+        In concurrent extraction mode the three ZIPs are unzipped and parsed
+        in separate processes at the same time. Steps 2-4 then only persist
+        each package (in order, as its parse finishes) and SAIL code is
+        formatted once for all three packages after step 4.
+        
+        ZIPs that were extracted before are not parsed at all: steps 2-4
+        clone the earlier package from the extraction cache.
+        
         Args:
             base_zip_path: Path to Package A (Base Version) ZIP file
             customized_zip_path: Path to Package B (Customer Version) ZIP file
             new_vendor_zip_path: Path to Package C (New Vendor Version) ZIP file
+            concurrent_extraction: Parse the three packages concurrently.
+                                   Defaults to Config.CONCURRENT_PACKAGE_EXTRACTION.
+            reference_id: Process an existing session (created with
+                          create_session_record() or failed) instead of
+                          creating one, resuming after its checkpoint
+            progress: Records step progress (step, objects processed,
+                      elapsed time) while the workflow runs
             
         Returns:
             MergeSession: Created session with reference_id and total_changes
@@ -144,6 +194,12 @@ class ThreeWayMergeOrchestrator(BaseService):
         """
         session = None
         workflow_start_time = time.time()
+        parse_executor = None
+        progress = progress or MergeProgress(reference_id, WORKFLOW_STEPS)
+        
+        if concurrent_extraction is None:
+            from config import Config
+            concurrent_extraction = Config.CONCURRENT_PACKAGE_EXTRACTION
         
         try:
             # Log workflow start
@@ -161,209 +217,299 @@ class ThreeWayMergeOrchestrator(BaseService):
             
             # Step 1: Create session record
             step_start = time.time()
-            LoggerConfig.log_step(self.logger, 1, 10, "Creating merge session record")
+            self._log_step(progress, 1, "Creating merge session record")
             
-            session = self._create_session()
+            if reference_id:
+                session = self._get_session(reference_id)
+                session.status = SessionStatus.PROCESSING.value
+            else:
+                session = self._create_session()
+            progress.reference_id = session.reference_id
+            self._checkpoint(session, 1)
             
             step_duration = time.time() - step_start
             self.logger.info(
                 f"✓ Session created: {session.reference_id} (id={session.id}) "
                 f"in {step_duration:.2f}s"
             )
+            progress.complete_step(1, step_duration)
+            
+            # Steps up to the last checkpoint are skipped; their results
+            # are loaded from the database instead
+            resume_after = session.completed_step
+            if resume_after > 1:
+                self.logger.info(
+                    f"Resuming session {session.reference_id} after step "
+                    f"{resume_after}/{WORKFLOW_STEPS}"
+                )
+            packages = self._get_packages(session.id) if resume_after > 1 else {}
+            
+            # Start parsing the packages still to extract in the background
+            parse_futures = {}
+            if concurrent_extraction:
+                # Packages in the extraction cache are cloned, not parsed
+                to_parse = [
+                    (package_type, zip_path)
+                    for package_type, zip_path in (
+                        ('base', base_zip_path),
+                        ('customized', customized_zip_path),
+                        ('new_vendor', new_vendor_zip_path),
+                    )
+                    if package_type not in packages
+                    and not self.package_extraction_service.is_extraction_cached(zip_path)
+                ]
+                if to_parse:
+                    self.logger.info(f"Parsing {len(to_parse)} package(s) concurrently")
+                    parse_executor = ProcessPoolExecutor(max_workers=len(to_parse))
+                    parse_futures = {
+                        package_type: parse_executor.submit(parse_package_archive, zip_path)
+                        for package_type, zip_path in to_parse
+                    }
             
             # Step 2: Extract Package A (Base)
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 2, 10, "Extracting Package A (Base Version)")
-            self.logger.debug(f"Package A path: {base_zip_path}")
-            
-            package_a = self.package_extraction_service.extract_package(
-                session_id=session.id,
-                zip_path=base_zip_path,
-                package_type='base'
-            )
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Package A extracted: {package_a.total_objects} objects "
-                f"in {step_duration:.2f}s"
-            )
+            if resume_after < 2:
+                step_start = time.time()
+                self._log_step(progress, 2, "Extracting Package A (Base Version)")
+                self.logger.debug(f"Package A path: {base_zip_path}")
+                
+                package_a = self._extract_package(
+                    session.id, base_zip_path, 'base', parse_futures.get('base'),
+                    format_sail_code=not concurrent_extraction
+                )
+                self._checkpoint(session, 2)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Package A extracted: {package_a.total_objects} objects "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(2, step_duration, package_a.total_objects)
+            else:
+                package_a = packages['base']
             
             # Step 3: Extract Package B (Customized)
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 3, 10, "Extracting Package B (Customer Version)")
-            self.logger.debug(f"Package B path: {customized_zip_path}")
-            
-            package_b = self.package_extraction_service.extract_package(
-                session_id=session.id,
-                zip_path=customized_zip_path,
-                package_type='customized'
-            )
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Package B extracted: {package_b.total_objects} objects "
-                f"in {step_duration:.2f}s"
-            )
+            if resume_after < 3:
+                step_start = time.time()
+                self._log_step(progress, 3, "Extracting Package B (Customer Version)")
+                self.logger.debug(f"Package B path: {customized_zip_path}")
+                
+                package_b = self._extract_package(
+                    session.id, customized_zip_path, 'customized',
+                    parse_futures.get('customized'),
+                    format_sail_code=not concurrent_extraction
+                )
+                self._checkpoint(session, 3)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Package B extracted: {package_b.total_objects} objects "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(3, step_duration, package_b.total_objects)
+            else:
+                package_b = packages['customized']
             
             # Step 4: Extract Package C (New Vendor)
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 4, 10, "Extracting Package C (New Vendor Version)")
-            self.logger.debug(f"Package C path: {new_vendor_zip_path}")
-            
-            package_c = self.package_extraction_service.extract_package(
-                session_id=session.id,
-                zip_path=new_vendor_zip_path,
-                package_type='new_vendor'
-            )
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Package C extracted: {package_c.total_objects} objects "
-                f"in {step_duration:.2f}s"
-            )
+            if resume_after < 4:
+                step_start = time.time()
+                self._log_step(progress, 4, "Extracting Package C (New Vendor Version)")
+                self.logger.debug(f"Package C path: {new_vendor_zip_path}")
+                
+                package_c = self._extract_package(
+                    session.id, new_vendor_zip_path, 'new_vendor',
+                    parse_futures.get('new_vendor'),
+                    format_sail_code=not concurrent_extraction
+                )
+                
+                # Packages stored unformatted, by concurrent extraction in this
+                # or an earlier attempt, are formatted now that all three are
+                # stored, so the lookup is built once
+                unformatted_ids = [
+                    package.id for package in (package_a, package_b, package_c)
+                    if not package.sail_code_formatted
+                ]
+                if unformatted_ids:
+                    self.logger.info(
+                        f"Formatting SAIL code for {len(unformatted_ids)} package(s)..."
+                    )
+                    self.package_extraction_service.format_sail_code_for_packages(
+                        session.id, unformatted_ids
+                    )
+                self._checkpoint(session, 4)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Package C extracted: {package_c.total_objects} objects "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(4, step_duration, package_c.total_objects)
+            else:
+                package_c = packages['new_vendor']
             
             # Step 5: Perform delta comparison (A→C)
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 5, 10, "Performing delta comparison (A→C)")
-            self.logger.debug(
-                f"Comparing base package (id={package_a.id}) with "
-                f"new vendor package (id={package_c.id})"
-            )
-            
-            delta_changes = self.delta_comparison_service.compare(
-                session_id=session.id,
-                base_package_id=package_a.id,
-                new_vendor_package_id=package_c.id
-            )
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Delta comparison complete: {len(delta_changes)} changes detected "
-                f"in {step_duration:.2f}s"
-            )
-            
-            # Step 6: Perform customer comparison (A→B, Set E)
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 6, 10, "Performing customer comparison (A→B, Set E)")
-            self.logger.debug(
-                f"Comparing base package (id={package_a.id}) with "
-                f"customer package (id={package_b.id})"
-            )
-            
-            customer_changes = (
-                self.customer_comparison_service.compare(
+            if resume_after < 5:
+                step_start = time.time()
+                self._log_step(progress, 5, "Performing delta comparison (A→C)")
+                self.logger.debug(
+                    f"Comparing base package (id={package_a.id}) with "
+                    f"new vendor package (id={package_c.id})"
+                )
+                
+                delta_changes = self.delta_comparison_service.compare(
                     session_id=session.id,
                     base_package_id=package_a.id,
-                    customer_package_id=package_b.id
+                    new_vendor_package_id=package_c.id
                 )
-            )
+                self._checkpoint(session, 5)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Delta comparison complete: {len(delta_changes)} changes detected "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(5, step_duration, len(delta_changes))
+            elif resume_after < 7:
+                delta_changes = self._load_delta_changes(session.id)
             
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Customer comparison complete: {len(customer_changes)} changes detected "
-                f"in {step_duration:.2f}s"
-            )
+            # Step 6: Perform customer comparison (A→B, Set E)
+            if resume_after < 6:
+                step_start = time.time()
+                self._log_step(progress, 6, "Performing customer comparison (A→B, Set E)")
+                self.logger.debug(
+                    f"Comparing base package (id={package_a.id}) with "
+                    f"customer package (id={package_b.id})"
+                )
+                
+                customer_changes = (
+                    self.customer_comparison_service.compare(
+                        session_id=session.id,
+                        base_package_id=package_a.id,
+                        customer_package_id=package_b.id
+                    )
+                )
+                self._checkpoint(session, 6)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Customer comparison complete: {len(customer_changes)} changes detected "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(6, step_duration, len(customer_changes))
+            elif resume_after < 7:
+                customer_changes = self._load_customer_changes(session.id)
             
             # Step 7: Classify changes (set-based: D ∩ E, D \ E, E \ D)
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 7, 10, "Classifying changes (set-based logic)")
-            self.logger.debug("Applying set-based classification: D ∩ E, D \\ E, E \\ D")
-            self.logger.debug("Comparing B vs C content for objects in D ∩ E")
-            
-            classified_changes = self.classification_service.classify(
-                session_id=session.id,
-                vendor_changes=delta_changes,
-                customer_changes=customer_changes,
-                customer_package_id=package_b.id,
-                new_vendor_package_id=package_c.id
-            )
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Classification complete: {len(classified_changes)} changes classified "
-                f"in {step_duration:.2f}s"
-            )
-            
-            # Log classification breakdown
-            classification_counts = {}
-            for change in classified_changes:
-                classification_counts[change.classification] = \
-                    classification_counts.get(change.classification, 0) + 1
-            
-            self.logger.info("Classification breakdown:")
-            # Sort by classification name instead of value to avoid comparison issues
-            for classification, count in sorted(classification_counts.items(), key=lambda x: x[0].name):
-                self.logger.info(f"  - {classification.value}: {count}")
-            
-            # Step 8: Persist detailed comparisons
-            step_start = time.time()
-            LoggerConfig.log_step(
-                self.logger, 8, 10,
-                "Persisting detailed object comparisons"
-            )
-            
-            comparison_counts = (
-                self.comparison_persistence_service.persist_all_comparisons(
+            if resume_after < 7:
+                step_start = time.time()
+                self._log_step(progress, 7, "Classifying changes (set-based logic)")
+                self.logger.debug("Applying set-based classification: D ∩ E, D \\ E, E \\ D")
+                self.logger.debug("Comparing B vs C content for objects in D ∩ E")
+                
+                classified_changes = self.classification_service.classify(
                     session_id=session.id,
-                    base_package_id=package_a.id,
+                    vendor_changes=delta_changes,
+                    customer_changes=customer_changes,
                     customer_package_id=package_b.id,
                     new_vendor_package_id=package_c.id
                 )
-            )
+                self._checkpoint(session, 7)
+                total_changes = len(classified_changes)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Classification complete: {len(classified_changes)} changes classified "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(7, step_duration, len(classified_changes))
+                
+                # Log classification breakdown
+                classification_counts = {}
+                for change in classified_changes:
+                    classification_counts[change.classification] = \
+                        classification_counts.get(change.classification, 0) + 1
+                
+                self.logger.info("Classification breakdown:")
+                # Sort by classification name instead of value to avoid comparison issues
+                for classification, count in sorted(classification_counts.items(), key=lambda x: x[0].name):
+                    self.logger.info(f"  - {classification.value}: {count}")
+            else:
+                total_changes = self.change_repository.count_total(session.id)
             
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Comparison persistence complete: {comparison_counts} "
-                f"in {step_duration:.2f}s"
-            )
+            # Step 8: Persist detailed comparisons
+            if resume_after < 8:
+                step_start = time.time()
+                self._log_step(
+                    progress, 8,
+                    "Persisting detailed object comparisons"
+                )
+                
+                comparison_counts = (
+                    self.comparison_persistence_service.persist_all_comparisons(
+                        session_id=session.id,
+                        base_package_id=package_a.id,
+                        customer_package_id=package_b.id,
+                        new_vendor_package_id=package_c.id
+                    )
+                )
+                self._checkpoint(session, 8)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Comparison persistence complete: {comparison_counts} "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(8, step_duration, sum(comparison_counts.values()))
             
             # Step 9: Generate merge guidance
-            step_start = time.time()
-            LoggerConfig.log_step(self.logger, 9, 10, "Generating merge guidance")
-            
-            changes = self.change_repository.get_by_session(session.id)
-            self.logger.debug(
-                f"Retrieved {len(changes)} changes for guidance generation"
-            )
-            
-            guidance_records = self.merge_guidance_service.generate_guidance(
-                session_id=session.id,
-                changes=changes
-            )
-            
-            step_duration = time.time() - step_start
-            self.logger.info(
-                f"✓ Guidance generation complete: "
-                f"{len(guidance_records)} guidance records "
-                f"in {step_duration:.2f}s"
-            )
-            
-            # Update session with total changes and status
-            session.total_changes = len(classified_changes)
-            session.status = SessionStatus.READY.value
-            db.session.flush()
-            
-            # Commit transaction
-            self.logger.debug("Committing database transaction")
-            db.session.commit()
-            self.logger.debug("Transaction committed successfully")
+            if resume_after < 9:
+                step_start = time.time()
+                self._log_step(progress, 9, "Generating merge guidance")
+                
+                changes = self.change_repository.get_by_session(session.id)
+                self.logger.debug(
+                    f"Retrieved {len(changes)} changes for guidance generation"
+                )
+                
+                guidance_records = self.merge_guidance_service.generate_guidance(
+                    session_id=session.id,
+                    changes=changes
+                )
+                
+                # Update session with total changes and status
+                session.total_changes = total_changes
+                session.status = SessionStatus.READY.value
+                self._checkpoint(session, 9)
+                
+                step_duration = time.time() - step_start
+                self.logger.info(
+                    f"✓ Guidance generation complete: "
+                    f"{len(guidance_records)} guidance records "
+                    f"in {step_duration:.2f}s"
+                )
+                progress.complete_step(9, step_duration, len(guidance_records))
+            else:
+                session.total_changes = total_changes
+                session.status = SessionStatus.READY.value
+                db.session.commit()
             
             # Step 10: Trigger AI summary generation (async)
             # IMPORTANT: This must happen AFTER commit so the background thread
             # can see the changes in the database
             step_start = time.time()
-            LoggerConfig.log_step(
-                self.logger, 10, 10,
+            self._log_step(
+                progress, 10,
                 "Triggering AI summary generation (async)"
             )
             
             self.merge_summary_service.generate_summaries_async(session.id)
+            self._checkpoint(session, 10)
             
             step_duration = time.time() - step_start
             self.logger.info(
                 f"✓ AI summary generation triggered (processing in background) "
                 f"in {step_duration:.2f}s"
             )
+            progress.complete_step(10, step_duration, session.total_changes)
             
             # Note: Summaries will be generated asynchronously
             # The workflow continues without waiting for completion
@@ -387,6 +533,7 @@ class ThreeWayMergeOrchestrator(BaseService):
                 session_id=session.id,
                 reference_id=session.reference_id,
                 total_changes=session.total_changes,
+                resumed_after_step=resume_after,
                 package_a_objects=package_a.total_objects,
                 package_b_objects=package_b.total_objects,
                 package_c_objects=package_c.total_objects
@@ -421,30 +568,163 @@ class ThreeWayMergeOrchestrator(BaseService):
                 workflow_duration=f"{workflow_duration:.2f}s"
             )
             
+            # Rollback the failed step; completed steps stay checkpointed
+            self.logger.debug("Rolling back database transaction")
+            db.session.rollback()
+            self.logger.debug("Transaction rolled back")
+            
             # Update session status to ERROR if session was created
             if session:
                 try:
                     self.logger.debug(f"Updating session {session.reference_id} status to ERROR")
                     session.status = SessionStatus.ERROR.value
                     db.session.commit()
-                    self.logger.info(f"Session {session.reference_id} marked as ERROR")
+                    self.logger.info(
+                        f"Session {session.reference_id} marked as ERROR "
+                        f"(checkpoint: step {session.completed_step})"
+                    )
                 except Exception as commit_error:
                     self.logger.error(
                         f"Failed to update session status: {commit_error}",
                         exc_info=True
                     )
             
-            # Rollback transaction
-            self.logger.debug("Rolling back database transaction")
-            db.session.rollback()
-            self.logger.debug("Transaction rolled back")
-            
             LoggerConfig.log_separator(self.logger, char="-")
             
             # Re-raise as ThreeWayMergeException
             raise ThreeWayMergeException(
                 f"Failed to create merge session: {e}"
             ) from e
+        
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _extract_package(
+        self,
+        session_id: int,
+        zip_path: str,
+        package_type: str,
+        parse_future: Optional[Future] = None,
+        format_sail_code: bool = True
+    ) -> Package:
+        """
+        Extract one package, or store it if it was parsed concurrently.
+        
+        Args:
+            session_id: Session ID
+            zip_path: Path to package ZIP file
+            package_type: Package type (base, customized, new_vendor)
+            parse_future: Future of parse_package_archive() when the package
+                          is being parsed concurrently, None otherwise
+            format_sail_code: Format SAIL code once the package is stored;
+                              False when all packages are formatted together
+            
+        Returns:
+            Package: Stored package
+        """
+        if parse_future is None:
+            return self.package_extraction_service.extract_package(
+                session_id=session_id,
+                zip_path=zip_path,
+                package_type=package_type,
+                format_sail_code=format_sail_code
+            )
+        
+        wait_start = time.time()
+        parsed_package = parse_future.result()
+        self.logger.debug(
+            f"Waited {time.time() - wait_start:.2f}s for {package_type} package parse"
+        )
+        
+        return self.package_extraction_service.store_parsed_package(
+            session_id=session_id,
+            parsed_package=parsed_package,
+            package_type=package_type,
+            format_sail_code=format_sail_code
+        )
+    
+    def _log_step(
+        self,
+        progress: MergeProgress,
+        step_number: int,
+        description: str,
+        total_steps: int = WORKFLOW_STEPS
+    ) -> None:
+        """Log a workflow step and record it as started."""
+        LoggerConfig.log_step(self.logger, step_number, total_steps, description)
+        progress.start_step(step_number, description)
+    
+    def _checkpoint(self, session: MergeSession, step_number: int) -> None:
+        """Commit the work of a completed step and record it as done."""
+        session.completed_step = max(session.completed_step or 0, step_number)
+        db.session.commit()
+    
+    def _get_packages(self, session_id: int) -> Dict[str, Package]:
+        """Get the stored packages of a session by package type."""
+        packages = db.session.query(Package).filter_by(session_id=session_id).all()
+        return {package.package_type: package for package in packages}
+    
+    def _load_delta_changes(self, session_id: int) -> List[DeltaChange]:
+        """Rebuild the delta comparison result (Set D) of a completed step 5."""
+        results = db.session.query(DeltaComparisonResult).filter_by(
+            session_id=session_id
+        ).order_by(DeltaComparisonResult.id).all()
+        return [
+            DeltaChange(
+                object_id=result.object_id,
+                change_category=ChangeCategory(result.change_category),
+                change_type=ChangeType(result.change_type),
+                version_changed=result.version_changed,
+                content_changed=result.content_changed
+            )
+            for result in results
+        ]
+    
+    def _load_customer_changes(self, session_id: int) -> List[CustomerChange]:
+        """Rebuild the customer comparison result (Set E) of a completed step 6."""
+        results = db.session.query(CustomerComparisonResult).filter_by(
+            session_id=session_id
+        ).order_by(CustomerComparisonResult.id).all()
+        return [
+            CustomerChange(
+                object_id=result.object_id,
+                change_category=ChangeCategory(result.change_category),
+                change_type=ChangeType(result.change_type),
+                version_changed=result.version_changed,
+                content_changed=result.content_changed
+            )
+            for result in results
+        ]
+    
+    def create_session_record(self) -> MergeSession:
+        """
+        Create and commit a merge session record before processing it.
+        
+        Lets callers hand out the reference_id straight away and run
+        create_merge_session(reference_id=...) in the background.
+        
+        Returns:
+            MergeSession: Committed session with status='PROCESSING'
+        """
+        session = self._create_session()
+        db.session.commit()
+        self.logger.info(f"Session record created: {session.reference_id}")
+        return session
+    
+    def _get_session(self, reference_id: str) -> MergeSession:
+        """
+        Get a session record created with create_session_record().
+        
+        Raises:
+            ValueError: If the session does not exist
+        """
+        session = db.session.query(MergeSession).filter_by(
+            reference_id=reference_id
+        ).first()
+        if not session:
+            raise ValueError(f"Session not found: {reference_id}")
+        return session
     
     def _create_session(self) -> MergeSession:
         """
@@ -644,7 +924,8 @@ class ThreeWayMergeOrchestrator(BaseService):
         Get working set of changes for review.
         
         Returns changes with object details for user review.
-        Can optionally filter by classification.
+        Can optionally filter by classification. For large sessions use
+        ChangeRepository.get_working_set_rows(), which pages the list.
         
         Args:
             reference_id: Session reference ID
@@ -677,48 +958,14 @@ class ThreeWayMergeOrchestrator(BaseService):
         if not session:
             raise ValueError(f"Session not found: {reference_id}")
         
-        # Build query
-        query = db.session.query(Change).filter(
-            Change.session_id == session.id
+        # One joined query for the listed columns
+        rows = self.change_repository.get_working_set_rows(
+            session.id,
+            classifications=classification_filter,
+            include_description=True
         )
         
-        # Apply classification filter if provided
-        if classification_filter:
-            query = query.filter(
-                Change.classification.in_(classification_filter)
-            )
-        
-        # Order by display_order
-        query = query.order_by(Change.display_order)
-        
-        # Execute query
-        changes = query.all()
-        
-        # Convert to dicts with object information
-        working_set = []
-        
-        for change in changes:
-            # Get object details
-            obj = change.object
-            
-            change_dict = {
-                'change_id': change.id,
-                'display_order': change.display_order,
-                'classification': change.classification,
-                'vendor_change_type': change.vendor_change_type,
-                'customer_change_type': change.customer_change_type,
-                'object': {
-                    'id': obj.id,
-                    'uuid': obj.uuid,
-                    'name': obj.name,
-                    'object_type': obj.object_type,
-                    'description': obj.description
-                }
-            }
-            
-            working_set.append(change_dict)
-        
-        return working_set
+        return [row.to_dict(include_description=True) for row in rows]
     
     def delete_session(self, reference_id: str) -> None:
         """
@@ -731,6 +978,8 @@ class ThreeWayMergeOrchestrator(BaseService):
         - Delta comparison results
         - Changes
         
+        Content blobs no other session references are deleted as well.
+        
         Note: Objects in object_lookup are NOT deleted (they may be
         referenced by other sessions).
         
@@ -755,8 +1004,12 @@ class ThreeWayMergeOrchestrator(BaseService):
         
         # Delete session (cascades to all related data)
         db.session.delete(session)
+        db.session.flush()
+        blobs_deleted = self.content_blob_repository.delete_unreferenced()
         db.session.commit()
         
+        self.logger.debug(f"Deleted {blobs_deleted} unreferenced content blobs")
+        
         self.logger.info(f"Session {reference_id} deleted")
     
     def retry_failed_session(
@@ -769,8 +1022,10 @@ class ThreeWayMergeOrchestrator(BaseService):
         """
         Retry a failed session.
         
-        This deletes the failed session and creates a new one with the
-        same packages.
+        The session is resumed after its last checkpoint: packages,
+        comparison results and changes of completed steps are reused and
+        only the remaining steps run. Sessions from before checkpoints
+        were recorded are deleted and created again from the packages.
         
         Args:
             reference_id: Failed session reference ID
@@ -779,7 +1034,7 @@ class ThreeWayMergeOrchestrator(BaseService):
             new_vendor_zip_path: Path to Package C ZIP file
             
         Returns:
-            MergeSession: New session
+            MergeSession: Resumed or new session
             
         Example:
             >>> session = orchestrator.retry_failed_session(
@@ -791,6 +1046,19 @@ class ThreeWayMergeOrchestrator(BaseService):
         """
         self.logger.info(f"Retrying failed session {reference_id}")
         
+        session = db.session.query(MergeSession).filter_by(
+            reference_id=reference_id
+        ).first()
+        
+        # Resume after the last checkpoint
+        if session and session.completed_step:
+            return self.create_merge_session(
+                base_zip_path=base_zip_path,
+                customized_zip_path=customized_zip_path,
+                new_vendor_zip_path=new_vendor_zip_path,
+                reference_id=reference_id
+            )
+        
         # Delete failed session
         try:
             self.delete_session(reference_id)
@@ -806,6 +1074,288 @@ class ThreeWayMergeOrchestrator(BaseService):
         )
 
 
+    def remerge_customer_package(
+        self,
+        reference_id: str,
+        customized_zip_path: str,
+        progress: Optional[MergeProgress] = None
+    ) -> MergeSession:
+        """
+        Re-merge a ready session against a new Package B (Customer Version).
+        
+        Packages A and C and the delta comparison (A→C) are unchanged, so
+        their stored results are reused and only Package B is extracted
+        again. Objects whose Package B fingerprint (version UUID and
+        content hash) is unchanged keep their change records, including
+        review status and notes; only objects whose fingerprint changed,
+        appeared or disappeared are re-classified and get new comparisons
+        and AI summaries.
+        
+        Workflow:
+        1. Extract the new Package B and replace the old one
+        2. Perform customer comparison (A→B, Set E)
+        3. Re-classify objects whose Package B fingerprint changed
+        4. Persist detailed comparisons of the re-classified changes
+        5. Trigger AI summary generation for them (async)
+        
+        Steps 1-4 run in one transaction: if any of them fails the session
+        is left as it was. The new Package B is parsed before that
+        transaction starts, so the database is not locked while the ZIP
+        is read.
+        
+        Args:
+            reference_id: Session reference ID (status must be 'ready')
+            customized_zip_path: Path to the new Package B ZIP file
+            progress: Records step progress while the re-merge runs
+        
+        Returns:
+            MergeSession: Session with updated total_changes
+        
+        Raises:
+            ValueError: If the session does not exist or is not ready
+            ThreeWayMergeException: If any step fails
+        
+        Example:
+            >>> session = orchestrator.remerge_customer_package(
+            ...     reference_id="MRG_001",
+            ...     customized_zip_path="/path/to/customized_v2.zip"
+            ... )
+        """
+        session = self._get_session(reference_id)
+        if session.status != SessionStatus.READY.value:
+            raise ValueError(
+                f"Session {reference_id} cannot be re-merged "
+                f"(status: {session.status})"
+            )
+        
+        workflow_start_time = time.time()
+        progress = progress or MergeProgress(reference_id, REMERGE_STEPS)
+        packages = self._get_packages(session.id)
+        package_a = packages['base']
+        old_package_b = packages['customized']
+        package_c = packages['new_vendor']
+        
+        LoggerConfig.log_separator(self.logger)
+        self.logger.info(f"CUSTOMER PACKAGE RE-MERGE STARTING - {reference_id}")
+        LoggerConfig.log_separator(self.logger)
+        
+        try:
+            # Step 1: Extract the new Package B
+            step_start = time.time()
+            self._log_step(
+                progress, 1, "Extracting Package B (Customer Version)",
+                total_steps=REMERGE_STEPS
+            )
+            
+            if compute_zip_hash(customized_zip_path) == old_package_b.zip_hash:
+                self.logger.info(
+                    f"Package B is unchanged for session {reference_id} - "
+                    f"nothing to re-merge"
+                )
+                progress.complete_step(1, time.time() - step_start, 0)
+                return session
+            
+            session.status = SessionStatus.PROCESSING.value
+            db.session.commit()
+            
+            # Parse the ZIP before the first write, so the write transaction
+            # of steps 1-4 does not span reading it. Packages in the
+            # extraction cache are cloned, not parsed.
+            parsed_package_b = None
+            if not self.package_extraction_service.is_extraction_cached(customized_zip_path):
+                from config import Config
+                parsed_package_b = parse_package_archive(
+                    customized_zip_path, Config.EXTRACTION_WORKERS
+                )
+            old_fingerprints = self._get_fingerprints(old_package_b.id)
+            
+            if parsed_package_b is None:
+                package_b = self.package_extraction_service.extract_package(
+                    session_id=session.id,
+                    zip_path=customized_zip_path,
+                    package_type='customized'
+                )
+            else:
+                package_b = self.package_extraction_service.store_parsed_package(
+                    session_id=session.id,
+                    parsed_package=parsed_package_b,
+                    package_type='customized'
+                )
+            
+            # Its object rows go with it; blobs only it referenced are deleted
+            db.session.delete(old_package_b)
+            db.session.flush()
+            self.content_blob_repository.delete_unreferenced()
+            
+            # Objects without a content hash cannot be compared, so they
+            # are treated as changed
+            new_fingerprints = self._get_fingerprints(package_b.id)
+            changed_object_ids = {
+                object_id
+                for object_id in old_fingerprints.keys() | new_fingerprints.keys()
+                if old_fingerprints.get(object_id) != new_fingerprints.get(object_id)
+                or new_fingerprints[object_id][1] is None
+            }
+            
+            step_duration = time.time() - step_start
+            self.logger.info(
+                f"✓ Package B extracted: {package_b.total_objects} objects, "
+                f"{len(changed_object_ids)} with a changed fingerprint "
+                f"in {step_duration:.2f}s"
+            )
+            progress.complete_step(1, step_duration, package_b.total_objects)
+            
+            # Step 2: Perform customer comparison (A→B, Set E)
+            step_start = time.time()
+            self._log_step(
+                progress, 2, "Performing customer comparison (A→B, Set E)",
+                total_steps=REMERGE_STEPS
+            )
+            
+            db.session.query(CustomerComparisonResult).filter_by(
+                session_id=session.id
+            ).delete(synchronize_session=False)
+            customer_changes = self.customer_comparison_service.compare(
+                session_id=session.id,
+                base_package_id=package_a.id,
+                customer_package_id=package_b.id
+            )
+            
+            step_duration = time.time() - step_start
+            self.logger.info(
+                f"✓ Customer comparison complete: {len(customer_changes)} changes detected "
+                f"in {step_duration:.2f}s"
+            )
+            progress.complete_step(2, step_duration, len(customer_changes))
+            
+            # Step 3: Re-classify objects whose fingerprint changed
+            step_start = time.time()
+            self._log_step(
+                progress, 3, "Re-classifying changed objects (set-based logic)",
+                total_steps=REMERGE_STEPS
+            )
+            
+            self.comparison_persistence_service.delete_comparisons(
+                session.id, changed_object_ids
+            )
+            reclassified_changes = self.classification_service.reclassify_objects(
+                session_id=session.id,
+                vendor_changes=self._load_delta_changes(session.id),
+                customer_changes=customer_changes,
+                customer_package_id=package_b.id,
+                new_vendor_package_id=package_c.id,
+                object_ids=changed_object_ids
+            )
+            
+            step_duration = time.time() - step_start
+            self.logger.info(
+                f"✓ Re-classification complete: {len(reclassified_changes)} changes "
+                f"re-classified in {step_duration:.2f}s"
+            )
+            progress.complete_step(3, step_duration, len(reclassified_changes))
+            
+            # Step 4: Persist detailed comparisons (only missing ones are computed)
+            step_start = time.time()
+            self._log_step(
+                progress, 4, "Persisting detailed object comparisons",
+                total_steps=REMERGE_STEPS
+            )
+            
+            comparison_counts = (
+                self.comparison_persistence_service.persist_all_comparisons(
+                    session_id=session.id,
+                    base_package_id=package_a.id,
+                    customer_package_id=package_b.id,
+                    new_vendor_package_id=package_c.id
+                )
+            )
+            
+            session.total_changes = self.change_repository.count_total(session.id)
+            session.reviewed_count = session.changes.filter_by(status='reviewed').count()
+            session.skipped_count = session.changes.filter_by(status='skipped').count()
+            session.status = SessionStatus.READY.value
+            db.session.commit()
+            
+            step_duration = time.time() - step_start
+            self.logger.info(
+                f"✓ Comparison persistence complete: {comparison_counts} "
+                f"in {step_duration:.2f}s"
+            )
+            progress.complete_step(4, step_duration, sum(comparison_counts.values()))
+            
+            # Step 5: Trigger AI summary generation for the new changes (async)
+            step_start = time.time()
+            self._log_step(
+                progress, 5, "Triggering AI summary generation (async)",
+                total_steps=REMERGE_STEPS
+            )
+            
+            new_change_ids = [
+                change_id for (change_id,) in db.session.query(Change.id).filter(
+                    Change.session_id == session.id,
+                    Change.object_id.in_(changed_object_ids)
+                )
+            ]
+            if new_change_ids:
+                self.merge_summary_service.generate_summaries_async(
+                    session.id, new_change_ids
+                )
+            
+            step_duration = time.time() - step_start
+            progress.complete_step(5, step_duration, len(new_change_ids))
+            
+            LoggerConfig.log_performance(
+                self.logger,
+                'Customer Package Re-merge',
+                time.time() - workflow_start_time,
+                session_id=session.id,
+                reference_id=reference_id,
+                total_changes=session.total_changes,
+                objects_reclassified=len(changed_object_ids),
+                package_b_objects=package_b.total_objects
+            )
+            
+            return session
+        
+        except Exception as e:
+            LoggerConfig.log_error_with_context(
+                self.logger,
+                e,
+                'Customer package re-merge',
+                session_id=session.id,
+                reference_id=reference_id,
+                customized_zip_path=customized_zip_path,
+                workflow_duration=f"{time.time() - workflow_start_time:.2f}s"
+            )
+            
+            # The session keeps its previous Package B and changes
+            db.session.rollback()
+            try:
+                session.status = SessionStatus.READY.value
+                db.session.commit()
+            except Exception as commit_error:
+                self.logger.error(
+                    f"Failed to restore session status: {commit_error}",
+                    exc_info=True
+                )
+            
+            raise ThreeWayMergeException(
+                f"Failed to re-merge customer package: {e}"
+            ) from e
+    
+    def _get_fingerprints(self, package_id: int) -> Dict[int, Tuple[Optional[str], Optional[str]]]:
+        """Get (version_uuid, content_hash) of each object in a package."""
+        rows = db.session.query(
+            ObjectVersion.object_id,
+            ObjectVersion.version_uuid,
+            ObjectVersion.content_hash
+        ).filter_by(package_id=package_id)
+        return {
+            object_id: (version_uuid, content_hash)
+            for object_id, version_uuid, content_hash in rows
+        }
+
+
 class ThreeWayMergeException(Exception):
     """Exception raised when three-way merge workflow fails."""
     pass
@@ -84,6 +84,29 @@ const DocFlow = {
         this.showNotification(message, 'error');
     },
     
+    // Poll a queued request until it completes or fails
+    pollRequest: async function(pollUrl, onProgress = null, interval = 1500) {
+        while (true) {
+            const response = await fetch(pollUrl);
+            const data = await response.json();
+            if (!data.success) {
+                throw new Error(data.error || 'Failed to get request status');
+            }
+            
+            const job = data.data;
+            if (job.status === 'completed') {
+                return job;
+            }
+            if (job.status === 'error') {
+                throw new Error(job.error || 'Processing failed');
+            }
+            if (onProgress) {
+                onProgress(job);
+            }
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+    },
+    
     // Debounce function
     debounce: function(func, wait) {
         let timeout;
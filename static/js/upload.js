@@ -72,22 +72,7 @@ document.addEventListener('DOMContentLoaded', function() {
         const formData = new FormData();
         formData.append('file', file);
         
-        // Simulate progress steps
-        const steps = [
-            { text: 'Uploading file...', delay: 500 },
-            { text: 'Extracting content...', delay: 1000 },
-            { text: 'Querying knowledge base...', delay: 1500 },
-            { text: 'Generating breakdown...', delay: 2000 },
-            { text: 'Finalizing results...', delay: 2500 }
-        ];
-        
-        let stepIndex = 0;
-        const progressInterval = setInterval(() => {
-            if (stepIndex < steps.length) {
-                processingText.textContent = steps[stepIndex].text;
-                stepIndex++;
-            }
-        }, 600);
+        processingText.textContent = 'Uploading file...';
         
         fetch('/breakdown/upload', {
             method: 'POST',
@@ -95,9 +80,21 @@ document.addEventListener('DOMContentLoaded', function() {
         })
         .then(response => response.json())
         .then(data => {
-            clearInterval(progressInterval);
             console.log('Upload response:', data); // Debug log
             
+            if (!data.success) {
+                throw new Error(data.error || 'Upload failed');
+            }
+            
+            // The breakdown runs in the background; follow its progress
+            processingText.textContent = 'Queued for processing...';
+            return DocFlow.pollRequest(data.data.poll_url, job => {
+                processingText.textContent = job.current_step
+                    ? `${job.current_step}...`
+                    : 'Queued for processing...';
+            }).then(() => data);
+        })
+        .then(data => {
             if (data.success) {
                 showSuccess();
                 DocFlow.showNotification('File uploaded and processed successfully!', 'success');
@@ -121,7 +118,6 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         })
         .catch(error => {
-            clearInterval(progressInterval);
             console.error('Upload error:', error);
             DocFlow.showNotification(error.message, 'error');
             resetUpload();
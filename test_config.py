@@ -0,0 +1,29 @@
+"""
+Test Configuration
+
+Settings loaded by tests/base_test.py. The database, uploads and outputs
+go to a scratch directory that BaseTestCase removes after each test.
+"""
+from pathlib import Path
+from typing import ClassVar
+
+from config import Config
+
+
+class TestConfig(Config):
+    """Configuration for unittest-style tests (see tests/base_test.py)"""
+
+    TESTING: bool = True
+    """Enable Flask testing mode"""
+
+    BASE_DIR: ClassVar[Path] = Path(__file__).parent / 'test_files'
+    """Scratch directory, removed after each test"""
+
+    SQLALCHEMY_DATABASE_URI: str = f"sqlite:///{BASE_DIR / 'test.db'}"
+    """Database of the test, kept apart from the application database"""
+
+    UPLOAD_FOLDER: ClassVar[Path] = BASE_DIR / 'uploads'
+    """Directory for test uploads"""
+
+    OUTPUT_FOLDER: ClassVar[Path] = BASE_DIR / 'outputs'
+    """Directory for test outputs"""
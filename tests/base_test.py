@@ -13,9 +13,7 @@ class BaseTestCase(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.app = create_app()
-        self.app.config.from_object(TestConfig)
-        TestConfig.init_directories()
+        self.app = create_app(TestConfig)
 
         self.client = self.app.test_client()
         self.app_context = self.app.app_context()
@@ -31,6 +29,7 @@ class BaseTestCase(unittest.TestCase):
         """Clean up after tests"""
         db.session.remove()
         db.drop_all()
+        db.engine.dispose()
         self.app_context.pop()
 
         # Clean up test directories
@@ -3,9 +3,19 @@ Pytest configuration and fixtures for all tests.
 
 This file provides common fixtures for Flask app context and database setup.
 """
+import uuid
+from pathlib import Path
+
 import pytest
 from app import create_app
+from config import Config
 from models import db as _db
+from services.three_way_merge_orchestrator import ThreeWayMergeOrchestrator
+from test_config import TestConfig
+
+
+# Directory of the test application packages used by merge workflow tests
+MERGE_PACKAGES_DIR = Path("applicationArtifacts/Three Way Testing Files/V2")
 
 
 @pytest.fixture(scope='session')
@@ -22,6 +32,29 @@ def app():
     return app
 
 
+@pytest.fixture(scope='function')
+def isolated_app(tmp_path):
+    """
+    Create Flask application with its own database for each test.
+    
+    Scope: function - the database is created in tmp_path and dropped
+    after the test, so committed rows do not leak into other tests
+    """
+    config_class = type('IsolatedConfig', (TestConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'UPLOAD_FOLDER': tmp_path / 'uploads',
+        'OUTPUT_FOLDER': tmp_path / 'outputs'
+    })
+    app = create_app(config_class)
+    
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+        _db.engine.dispose()
+
+
 @pytest.fixture(scope='function')
 def app_context(app):
     """
@@ -54,3 +87,53 @@ def session(db):
     Scope: function - fresh session for each test
     """
     yield db.session
+
+
+@pytest.fixture(scope='function')
+def merge_packages():
+    """
+    Paths of the test application packages, as create_merge_session arguments.
+    
+    Skips the test when the packages are not available.
+    """
+    packages = {
+        'base_zip_path': str(MERGE_PACKAGES_DIR / "Test Application - Base Version.zip"),
+        'customized_zip_path': str(MERGE_PACKAGES_DIR / "Test Application Customer Version.zip"),
+        'new_vendor_zip_path': str(MERGE_PACKAGES_DIR / "Test Application Vendor New Version.zip"),
+    }
+    if not Path(packages['base_zip_path']).exists():
+        pytest.skip("Test packages not available")
+    return packages
+
+
+@pytest.fixture(scope='function')
+def unique_reference_ids(monkeypatch):
+    """
+    Give new merge sessions unique reference IDs.
+    
+    MergeJobService keeps progress by reference ID for the whole test run,
+    so the sequential IDs of each fresh database would collide.
+    """
+    monkeypatch.setattr(
+        ThreeWayMergeOrchestrator, '_generate_reference_id',
+        lambda self: f"MRG_TEST_{uuid.uuid4().hex[:8]}"
+    )
+
+
+@pytest.fixture(scope='function')
+def orchestrator(isolated_app, unique_reference_ids, monkeypatch):
+    """
+    Create ThreeWayMergeOrchestrator on an isolated database.
+    
+    Scope: function - the extraction cache is disabled and AI summaries are
+    not generated; the change IDs passed to generate_summaries_async are
+    recorded in orchestrator.summarized
+    """
+    monkeypatch.setattr(Config, 'EXTRACTION_CACHE_ENABLED', False)
+    orchestrator = ThreeWayMergeOrchestrator()
+    orchestrator.summarized = []
+    monkeypatch.setattr(
+        orchestrator.merge_summary_service, 'generate_summaries_async',
+        lambda session_id, change_ids=None: orchestrator.summarized.append(change_ids)
+    )
+    return orchestrator
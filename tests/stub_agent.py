@@ -0,0 +1,77 @@
+"""
+Stub Agent Worker for Testing
+
+Speaks the agent pool protocol (see services.ai.agent_pool) without the
+Q CLI. Responses are scripted in a JSON file:
+
+    {
+        "rules": [
+            {"match": "merge", "stdout": "{\"summaries\": []}"},
+            {"match": "slow", "delay": 10},
+            {"match": "hang", "delay": 10, "ignore_timeout": true},
+            {"match": "crash", "exit": 3}
+        ],
+        "default": {"stdout": "pid {pid} call {calls}"}
+    }
+
+The first rule whose `match` regex is found in the prompt (or agent name)
+answers; `{pid}` and `{calls}` in stdout are replaced with the worker's
+process ID and call count.
+
+Usage:
+    Q_AGENT_WORKER_COMMAND="python tests/stub_agent.py script.json"
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+
+def respond(rule, request, calls):
+    """Build the response of a run request from its rule."""
+    delay = float(rule.get('delay', 0))
+    timeout = float(request.get('timeout', 120))
+    if delay > timeout and not rule.get('ignore_timeout'):
+        time.sleep(timeout)
+        return {'error': 'timeout'}
+    time.sleep(delay)
+
+    if 'exit' in rule:
+        sys.exit(int(rule['exit']))
+
+    return {
+        'returncode': rule.get('returncode', 0),
+        'stdout': rule.get('stdout', '').replace('{pid}', str(os.getpid())).replace(
+            '{calls}', str(calls)
+        ),
+        'stderr': rule.get('stderr', '')
+    }
+
+
+def main():
+    """Serve requests until stdin is closed."""
+    with open(sys.argv[1]) as script_file:
+        script = json.load(script_file)
+
+    calls = 0
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request.get('type') == 'ping':
+            response = {'type': 'pong'}
+        else:
+            calls += 1
+            text = f"{request.get('agent')}\n{request.get('prompt')}"
+            rule = next(
+                (r for r in script.get('rules', []) if re.search(r['match'], text)),
+                script.get('default', {})
+            )
+            response = respond(rule, request, calls)
+        response['id'] = request.get('id')
+        sys.stdout.write(json.dumps(response) + '\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Tests for Agent Pool
+
+Tests that agent calls reuse warm workers, that workers are recycled,
+replaced after timeouts, cancellations and crashes, and that the Q agent
+service runs prompts through the pool. Workers are tests/stub_agent.py.
+"""
+
+import json
+import shlex
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from config import Config
+from core.exceptions import (
+    AgentCancelledException, AgentTimeoutException, AgentWorkerException
+)
+from services.ai.agent_pool import AgentPool
+from services.ai.q_agent_service import QAgentService
+
+
+STUB_AGENT = str(Path(__file__).parent / 'stub_agent.py')
+
+
+@pytest.fixture
+def stub_command(tmp_path):
+    """Command line of a stub worker with a scripted set of responses."""
+    script = {
+        'rules': [
+            {'match': 'merge-summary-agent', 'stdout': json.dumps(
+                {'summaries': [{'change_id': 7, 'summary': 'from stub'}]}
+            )},
+            {'match': 'slow', 'delay': 10},
+            {'match': 'hang', 'delay': 10, 'ignore_timeout': True},
+            {'match': 'crash', 'exit': 3}
+        ],
+        'default': {'stdout': '{pid}'}
+    }
+    script_path = tmp_path / 'script.json'
+    script_path.write_text(json.dumps(script))
+    return [sys.executable, STUB_AGENT, str(script_path)]
+
+
+@pytest.fixture
+def pool(stub_command):
+    """Pool of two stub workers."""
+    pool = AgentPool(stub_command, size=2, max_calls_per_worker=3, timeout_grace=0.2)
+    yield pool
+    pool.close()
+
+
+class TestAgentPool:
+    """Test AgentPool"""
+
+    def test_reuses_warm_worker_and_recycles(self, pool):
+        """Test calls share a worker until it reaches max_calls_per_worker"""
+        pids = [pool.run('chat-agent', 'hello', timeout=5).stdout for _ in range(4)]
+
+        assert pids[0] == pids[1] == pids[2]
+        assert pids[3] != pids[0]
+        stats = pool.get_stats()
+        assert (stats['calls'], stats['workers_started'], stats['workers_recycled']) == (4, 2, 1)
+
+    def test_timeout_replaces_worker(self, pool):
+        """Test timeouts raise and unresponsive workers are replaced"""
+        first = pool.run('chat-agent', 'hello', timeout=5).stdout
+
+        with pytest.raises(AgentTimeoutException):
+            pool.run('chat-agent', 'slow', timeout=0.2)
+        assert pool.run('chat-agent', 'hello', timeout=5).stdout == first
+
+        with pytest.raises(AgentTimeoutException):
+            pool.run('chat-agent', 'hang', timeout=0.2)
+        assert pool.run('chat-agent', 'hello', timeout=5).stdout != first
+        assert pool.get_stats()['timeouts'] == 2
+
+    def test_cancel_and_crash_replace_worker(self, pool):
+        """Test cancelled calls and crashed workers do not poison the pool"""
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+        start = time.monotonic()
+        with pytest.raises(AgentCancelledException):
+            pool.run('chat-agent', 'hang', timeout=30, cancel_event=cancel)
+        assert time.monotonic() - start < 5
+
+        with pytest.raises(AgentWorkerException):
+            pool.run('chat-agent', 'crash', timeout=5)
+
+        assert pool.run('chat-agent', 'hello', timeout=5).stdout
+        stats = pool.get_stats()
+        assert (stats['cancelled'], stats['worker_failures']) == (1, 1)
+
+    def test_concurrent_calls_use_separate_workers(self, pool):
+        """Test up to size calls run at the same time"""
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(pool.run('chat-agent', 'hello', timeout=5).stdout)
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert pool.get_stats()['workers_started'] <= 3
+
+
+class TestQAgentServicePool:
+    """Test QAgentService runs prompts on the agent pool"""
+
+    def test_merge_summaries_through_pool(self, stub_command, monkeypatch):
+        """Test merge summaries are parsed from a pooled worker's output"""
+        monkeypatch.setattr(Config, 'Q_AGENT_POOL_SIZE', 1)
+        monkeypatch.setattr(Config, 'Q_AGENT_WORKER_COMMAND', shlex.join(stub_command))
+        service = QAgentService()
+        try:
+            summaries = service.process_merge_summaries(
+                1, [{'change_id': 7, 'object_name': 'Rule'}], use_fallback=False
+            )
+        finally:
+            service.agent_pool.close()
+
+        assert summaries == {7: {'change_id': 7, 'summary': 'from stub'}}
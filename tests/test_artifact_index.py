@@ -0,0 +1,97 @@
+"""
+Tests for Artifact Index
+
+Tests that artifact objects are found by ranked keyword lookup and that
+artifact files are parsed once and re-loaded only when they change.
+"""
+
+import json
+import os
+
+from services.ai.artifact_index import ApplicationArtifacts, KeywordIndex, tokenize
+from services.ai.q_agent_service import QAgentService
+
+
+OBJECTS = [
+    {'name': 'SS_EvaluationForm', 'object_type': 'Interface', 'description': 'Create an evaluation'},
+    {'name': 'SS_AwardSummary', 'object_type': 'Interface', 'description': 'Award details'},
+    {'name': 'SS_GetSettings', 'object_type': 'Expression Rule', 'description': 'Reads settings'},
+    {'name': 'SS_PlatformHelper', 'object_type': 'Expression Rule', 'description': ''},
+]
+
+
+def _write_artifacts(directory, objects=OBJECTS):
+    """Write lookup and blueprint files and return their paths."""
+    lookup_file = directory / 'lookup.json'
+    blueprint_file = directory / 'blueprint.json'
+    lookup_file.write_text(json.dumps({f'uuid-{i}': obj for i, obj in enumerate(objects)}))
+    blueprint_file.write_text(json.dumps({
+        'rules': [{'name': 'SS_CreateEvaluation'}, {'name': 'SS_Unrelated'}],
+        'interfaces': [{'name': 'SS_SettingsPage', 'description': 'Settings'}]
+    }))
+    return lookup_file, blueprint_file
+
+
+class TestKeywordIndex:
+    """Test tokenize and KeywordIndex"""
+
+    def test_tokenize_splits_camel_case_and_separators(self):
+        """Test Appian names are split into words"""
+        assert tokenize("SS_EvaluationForm v2") == ['ss', 'evaluation', 'form', 'v', '2']
+        assert tokenize("HTTPServer-config") == ['http', 'server', 'config']
+
+    def test_search_ranks_by_keyword_matches(self):
+        """Test more and name matches rank higher, prefixes count less"""
+        index = KeywordIndex(OBJECTS, {'name': 2.0, 'description': 1.0})
+
+        names = [o['name'] for o in index.search(['evaluation', 'form', 'award'], 10)]
+        assert names == ['SS_EvaluationForm', 'SS_AwardSummary']
+
+        assert [o['name'] for o in index.search(['sett'], 10)] == ['SS_GetSettings']
+        assert index.search(['form'], 10, fields=('description',)) == []
+        # Words are matched, not substrings of other words
+        assert [o['name'] for o in index.search(['form'], 10)] == ['SS_EvaluationForm']
+        assert index.search(['a', 'ss'], 1) == [OBJECTS[0]]
+
+
+class TestApplicationArtifacts:
+    """Test ApplicationArtifacts"""
+
+    def test_loads_once_and_reloads_changed_files(self, tmp_path):
+        """Test files are only parsed again after they change"""
+        lookup_file, blueprint_file = _write_artifacts(tmp_path)
+        artifacts = ApplicationArtifacts(lookup_file, blueprint_file)
+
+        first = artifacts.get()
+        assert artifacts.get() is first
+        assert artifacts.loads == 1
+        assert len(first.objects) == 4 and len(first.rules) == 2
+
+        _write_artifacts(tmp_path, OBJECTS[:1])
+        stat = lookup_file.stat()
+        os.utime(lookup_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = artifacts.get()
+        assert second.generation == 2
+        assert len(second.objects) == 1
+
+    def test_missing_files_are_empty(self, tmp_path):
+        """Test missing artifact files give empty indexes"""
+        snapshot = ApplicationArtifacts(tmp_path / 'a.json', tmp_path / 'b.json').get()
+
+        assert snapshot.lookup == {} and snapshot.blueprint == {}
+        assert snapshot.objects.search(['evaluation'], 10) == []
+
+    def test_relevant_objects_prompt_section(self, tmp_path):
+        """Test the Q agent prompt lists ranked objects, rules and interfaces"""
+        service = QAgentService()
+        service._application_artifacts = ApplicationArtifacts(*_write_artifacts(tmp_path))
+
+        text = service._get_relevant_objects("award summary", max_objects=2)
+
+        assert "- SS_AwardSummary (Interface)" in text
+        assert "- SS_EvaluationForm (Interface)" in text
+        assert "SS_PlatformHelper" not in text
+        assert "RELEVANT RULES FROM BLUEPRINT:\n- SS_CreateEvaluation\n" in text
+        assert "SS_Unrelated" not in text
+        assert "RELEVANT INTERFACES FROM BLUEPRINT:\n- SS_SettingsPage\n" in text
@@ -0,0 +1,140 @@
+"""
+Tests for the Bedrock Retrieval Cache
+
+Tests that Bedrock retrievals are reused within their TTL, evicted least
+recently used first, that identical concurrent queries share one call
+and that failed retrievals are not cached. Bedrock is a stubbed client.
+"""
+
+import threading
+import time
+
+import pytest
+from services.ai.bedrock_service import BedrockRAGService, normalize_query
+from services.ai.retrieval_cache import RetrievalCache
+from services.process_tracker import ProcessTracker
+
+
+class StubBedrockClient:
+    """bedrock-agent-runtime client returning canned retrieval results"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def retrieve(self, knowledgeBaseId, retrievalQuery, retrievalConfiguration):
+        with self._lock:
+            self.calls.append(retrievalQuery['text'])
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("throttled")
+        return {'retrievalResults': [{
+            'content': {'text': f"about {retrievalQuery['text']}"},
+            'score': 0.8,
+            'location': {'s3Location': {'uri': 's3://kb/doc.pdf'}}
+        }]}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _service(client, cache=None):
+    """Bedrock service with a stubbed client and its own cache."""
+    service = BedrockRAGService(
+        retrieval_cache=cache or RetrievalCache(ttl_seconds=300, max_entries=10)
+    )
+    service.bedrock_client = client
+    return service
+
+
+class TestBedrockRetrievalCache:
+    """Test BedrockRAGService retrieval caching"""
+
+    def test_repeated_query_is_served_from_cache(self):
+        """Test the same normalized query is retrieved once"""
+        client = StubBedrockClient()
+        service = _service(client)
+
+        first = service.query('create', 'Evaluation form')
+        first['results'].clear()
+        second = service.query('create', '  evaluation   FORM ')
+        other_action = service.query('verify', 'Evaluation form')
+
+        assert client.calls == ['Evaluation form', 'Evaluation form']
+        assert (first['cache'], second['cache'], other_action['cache']) == ('miss', 'hit', 'miss')
+        assert second['results'][0]['content'] == 'about Evaluation form'
+        assert service.get_cache_stats()['hit_rate'] == '33.33%'
+
+    def test_ttl_and_lru_eviction(self):
+        """Test entries expire after the TTL and the least recently used go first"""
+        clock = FakeClock()
+        client = StubBedrockClient()
+        service = _service(client, RetrievalCache(ttl_seconds=60, max_entries=2, clock=clock))
+
+        for text in ['a', 'b', 'a', 'c']:
+            service.query('chat', text)
+        assert service.query('chat', 'a')['cache'] == 'hit'
+        assert service.query('chat', 'b')['cache'] == 'miss'
+
+        clock.now = 61
+        assert service.query('chat', 'b')['cache'] == 'miss'
+        stats = service.get_cache_stats()
+        assert (stats['evicted'], stats['expired']) == (2, 1)
+
+    def test_concurrent_identical_queries_are_coalesced(self):
+        """Test in-flight identical queries wait for one retrieve call"""
+        client = StubBedrockClient(delay=0.2)
+        service = _service(client)
+        responses = []
+
+        threads = [
+            threading.Thread(target=lambda: responses.append(service.query('chat', 'q')))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(client.calls) == 1
+        assert sorted(r['cache'] for r in responses) == ['coalesced'] * 4 + ['miss']
+        assert all(r['status'] == 'success' for r in responses)
+
+    def test_failed_retrievals_are_not_cached(self):
+        """Test errors return the fallback response and are retried next time"""
+        client = StubBedrockClient(fail=True)
+        service = _service(client)
+
+        assert service.query('chat', 'q')['status'] == 'fallback'
+        client.fail = False
+        assert service.query('chat', 'q')['cache'] == 'miss'
+        assert len(client.calls) == 2
+
+    def test_normalize_query(self):
+        """Test case and whitespace differences share a key"""
+        assert normalize_query("  Create\nEvaluation  Form ") == "create evaluation form"
+        assert normalize_query(None) == ""
+
+
+class TestProcessTrackerCacheMetrics:
+    """Test ProcessTracker reports the RAG cache"""
+
+    @pytest.mark.parametrize('status, badge', [
+        ('hit', "RAG Cache: Hit (hit rate 50.00%) ⚡"),
+        ('miss', "RAG Cache: Miss (hit rate 50.00%)"),
+    ])
+    def test_rag_cache_badge(self, status, badge):
+        """Test the cache status and hit rate appear with the other badges"""
+        tracker = ProcessTracker(1, 'create')
+        tracker.set_rag_cache_metrics({'cache': status}, {'hit_rate': '50.00%'})
+
+        assert tracker.get_confidence_badges()['rag_cache'] == badge
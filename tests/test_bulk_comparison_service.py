@@ -0,0 +1,166 @@
+"""
+Tests for Bulk Comparison Service
+
+Tests that objects are compared between two packages from preloaded
+versions and object-specific content.
+"""
+
+import pytest
+from models import (
+    db, MergeSession, Package, ObjectVersion,
+    Constant, Interface, InterfaceParameter
+)
+from repositories.object_lookup_repository import ObjectLookupRepository
+from services.bulk_comparison_service import BulkComparisonService
+
+
+@pytest.fixture
+def session(app):
+    """
+    Database session that is rolled back after each test.
+    
+    Tables are created if needed but not dropped, so tests sharing the
+    application database are unaffected.
+    """
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.rollback()
+
+
+def _create_packages(session):
+    """Create a merge session with a base and a new vendor package."""
+    merge_session = MergeSession(reference_id="TEST-BULK", status="processing")
+    session.add(merge_session)
+    session.flush()
+
+    base = Package(session_id=merge_session.id, package_type="base", filename="a.zip")
+    new = Package(session_id=merge_session.id, package_type="new_vendor", filename="c.zip")
+    session.add_all([base, new])
+    session.flush()
+    return base, new
+
+
+def _add_version(session, obj, package, version_uuid, sail_code=None, content_hash=None):
+    """Add an object_versions row."""
+    session.add(ObjectVersion(
+        object_id=obj.id,
+        package_id=package.id,
+        version_uuid=version_uuid,
+        sail_code=sail_code,
+        content_hash=content_hash
+    ))
+
+
+class TestBulkComparisonService:
+    """Test BulkComparisonService"""
+
+    def test_compare_objects(self, session):
+        """Test version, SAIL code and object-specific changes are detected"""
+        base, new = _create_packages(session)
+
+        same, resaved, sail_changed, constant = ObjectLookupRepository().bulk_find_or_create([
+            {"uuid": "bulk-same", "name": "Same", "object_type": "Expression Rule"},
+            {"uuid": "bulk-resaved", "name": "Resaved", "object_type": "Expression Rule"},
+            {"uuid": "bulk-sail", "name": "Sail", "object_type": "Interface"},
+            {"uuid": "bulk-constant", "name": "Constant", "object_type": "Constant"}
+        ])
+
+        _add_version(session, same, base, "v1", "a!x()")
+        _add_version(session, same, new, "v1", "a!x()")
+        _add_version(session, resaved, base, "v1", "a!y()")
+        _add_version(session, resaved, new, "v2", "a!y()")
+        _add_version(session, sail_changed, base, "v1", "a!z()")
+        _add_version(session, sail_changed, new, "v1", "a!z(1)")
+        _add_version(session, constant, base, "v1")
+        _add_version(session, constant, new, "v1")
+
+        for package, value in [(base, "1"), (new, "2")]:
+            session.add(Constant(
+                object_id=constant.id,
+                package_id=package.id,
+                uuid=constant.uuid,
+                name=constant.name,
+                constant_value=value
+            ))
+        session.flush()
+
+        results = BulkComparisonService().compare_objects(
+            [same, resaved, sail_changed, constant],
+            base.id,
+            new.id
+        )
+
+        assert results[same.id] == (False, False)
+        assert results[resaved.id] == (True, False)
+        assert results[sail_changed.id] == (False, True)
+        assert results[constant.id] == (False, True)
+
+    def test_compare_objects_child_counts(self, session):
+        """Test differing child row counts mark content as changed"""
+        base, new = _create_packages(session)
+
+        (obj,) = ObjectLookupRepository().bulk_find_or_create([
+            {"uuid": "bulk-interface", "name": "Interface", "object_type": "Interface"}
+        ])
+
+        for package, param_count in [(base, 1), (new, 2)]:
+            _add_version(session, obj, package, "v1", "a!x()")
+            interface = Interface(
+                object_id=obj.id,
+                package_id=package.id,
+                uuid=obj.uuid,
+                name=obj.name
+            )
+            session.add(interface)
+            session.flush()
+            for i in range(param_count):
+                session.add(InterfaceParameter(
+                    interface_id=interface.id,
+                    parameter_name=f"param{i}"
+                ))
+        session.flush()
+
+        results = BulkComparisonService().compare_objects([obj], base.id, new.id)
+
+        assert results[obj.id] == (False, True)
+
+    def test_compare_objects_missing_version(self, session):
+        """Test objects without version data are treated as unchanged"""
+        base, new = _create_packages(session)
+
+        (obj,) = ObjectLookupRepository().bulk_find_or_create([
+            {"uuid": "bulk-missing", "name": "Missing", "object_type": "Constant"}
+        ])
+        _add_version(session, obj, base, "v1")
+        session.flush()
+
+        results = BulkComparisonService().compare_objects([obj], base.id, new.id)
+
+        assert results[obj.id] == (False, False)
+
+    def test_compare_objects_uses_content_hash(self, session):
+        """Test equal content hashes skip the full content comparison"""
+        base, new = _create_packages(session)
+
+        same_hash, other_hash = ObjectLookupRepository().bulk_find_or_create([
+            {"uuid": "bulk-hash-same", "name": "Same", "object_type": "Interface"},
+            {"uuid": "bulk-hash-other", "name": "Other", "object_type": "Interface"}
+        ])
+
+        # SAIL code differs, but the hashes say the content is the same
+        _add_version(session, same_hash, base, "v1", "a!x()", content_hash="h1")
+        _add_version(session, same_hash, new, "v2", "a!x(1)", content_hash="h1")
+        # Different hashes fall back to comparing the content itself
+        _add_version(session, other_hash, base, "v1", "a!y()", content_hash="h2")
+        _add_version(session, other_hash, new, "v1", "a!y()", content_hash="h3")
+        session.flush()
+
+        results = BulkComparisonService().compare_objects(
+            [same_hash, other_hash],
+            base.id,
+            new.id
+        )
+
+        assert results[same_hash.id] == (True, False)
+        assert results[other_hash.id] == (False, False)
@@ -0,0 +1,241 @@
+"""
+Tests for Extraction Cache Service
+
+Tests that packages extracted from an identical ZIP are cloned from the
+cache, and that cache entries are evicted by age, size and parser version.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from config import Config
+from models import (
+    db, MergeSession, Package, ObjectVersion, PackageObjectMapping,
+    ExtractionCacheEntry, ProcessModel, ProcessModelNode, ProcessModelFlow,
+    ObjectLookup, Interface, InterfaceParameter
+)
+from services.extraction_cache_service import ExtractionCacheService
+from services.settings_service import SettingsService
+from services.package_extraction_service import PackageExtractionService
+from services.parsers.xml_parser_factory import PARSER_VERSION
+
+
+TEST_PACKAGE_PATH = (
+    'applicationArtifacts/Three Way Testing Files/V2/'
+    'Test Application - Base Version.zip'
+)
+
+
+@pytest.fixture
+def session(isolated_app):
+    """Database session on a database created and dropped for each test."""
+    yield db.session
+
+
+def _create_merge_session(session, reference_id):
+    """Create a merge session record."""
+    merge_session = MergeSession(reference_id=reference_id, status="processing")
+    session.add(merge_session)
+    session.flush()
+    return merge_session
+
+
+def _add_entry(session, merge_session, zip_hash, zip_size, last_used_at,
+               parser_version=PARSER_VERSION):
+    """Add a cache entry for a new, empty package."""
+    package = Package(
+        session_id=merge_session.id,
+        package_type="base",
+        filename=f"{zip_hash}.zip",
+        zip_hash=zip_hash
+    )
+    session.add(package)
+    session.flush()
+    entry = ExtractionCacheEntry(
+        zip_hash=zip_hash,
+        parser_version=parser_version,
+        package_id=package.id,
+        zip_size=zip_size,
+        last_used_at=last_used_at
+    )
+    session.add(entry)
+    session.flush()
+    return entry
+
+
+class TestExtractionCacheService:
+    """Test ExtractionCacheService"""
+    
+    def test_identical_zip_is_cloned(self, session):
+        """Test a second extraction of the same ZIP clones the first one"""
+        if not os.path.exists(TEST_PACKAGE_PATH):
+            pytest.skip(f"Test package not found: {TEST_PACKAGE_PATH}")
+        
+        first_session = _create_merge_session(session, "TEST-CACHE-1")
+        second_session = _create_merge_session(session, "TEST-CACHE-2")
+        service = PackageExtractionService()
+        
+        first = service.extract_package(
+            first_session.id, TEST_PACKAGE_PATH, 'base'
+        )
+        assert first.cloned_from_package_id is None
+        assert service.is_extraction_cached(TEST_PACKAGE_PATH)
+        
+        second = service.extract_package(
+            second_session.id, TEST_PACKAGE_PATH, 'base'
+        )
+        assert second.cloned_from_package_id == first.id
+        assert second.total_objects == first.total_objects
+        assert second.zip_hash == first.zip_hash
+        
+        def version_data(package):
+            return sorted(
+                (v.object_id, v.version_uuid, v.sail_code, v.fields, v.content_hash)
+                for v in ObjectVersion.query.filter_by(package_id=package.id)
+            )
+        
+        assert version_data(second) == version_data(first)
+        assert (
+            PackageObjectMapping.query.filter_by(package_id=second.id).count() ==
+            PackageObjectMapping.query.filter_by(package_id=first.id).count()
+        )
+        
+        # Flows point at the cloned nodes of the cloned process model
+        for process_model in ProcessModel.query.filter_by(package_id=second.id):
+            for flow in ProcessModelFlow.query.filter_by(process_model_id=process_model.id):
+                for node_id in (flow.from_node_id, flow.to_node_id):
+                    node = session.get(ProcessModelNode, node_id)
+                    assert node.process_model_id == process_model.id
+        
+        entry = ExtractionCacheEntry.query.filter_by(zip_hash=first.zip_hash).one()
+        assert entry.package_id == first.id
+        assert entry.hit_count == 1
+    
+    def test_cache_disabled(self, session, monkeypatch):
+        """Test nothing is reused when the cache is disabled"""
+        merge_session = _create_merge_session(session, "TEST-CACHE-OFF")
+        _add_entry(session, merge_session, "disabled-hash", 100, datetime.utcnow())
+        monkeypatch.setattr(Config, 'EXTRACTION_CACHE_ENABLED', False)
+        
+        assert ExtractionCacheService().get_entry("disabled-hash") is None
+    
+    def test_evict_by_age_size_and_parser_version(self, session, monkeypatch):
+        """Test stale, oversized and outdated entries are evicted"""
+        monkeypatch.setattr(Config, 'EXTRACTION_CACHE_MAX_AGE_DAYS', 30)
+        monkeypatch.setattr(Config, 'EXTRACTION_CACHE_MAX_SIZE_MB', 3)
+        
+        merge_session = _create_merge_session(session, "TEST-CACHE-EVICT")
+        now = datetime.utcnow()
+        megabyte = 1024 * 1024
+        recent = _add_entry(session, merge_session, "recent", 2 * megabyte, now)
+        older = _add_entry(
+            session, merge_session, "older", 2 * megabyte, now - timedelta(days=1)
+        )
+        small = _add_entry(
+            session, merge_session, "small", megabyte, now - timedelta(days=2)
+        )
+        _add_entry(session, merge_session, "stale", 1, now - timedelta(days=31))
+        _add_entry(
+            session, merge_session, "outdated", 1, now,
+            parser_version=PARSER_VERSION - 1
+        )
+        
+        assert ExtractionCacheService().evict() == 3
+        
+        remaining = {entry.zip_hash for entry in ExtractionCacheEntry.query}
+        assert remaining == {recent.zip_hash, small.zip_hash}
+        assert older.zip_hash not in remaining
+    
+    def test_deleting_package_removes_entry(self, session):
+        """Test a cache entry goes away with its package"""
+        merge_session = _create_merge_session(session, "TEST-CACHE-DELETE")
+        entry = _add_entry(session, merge_session, "deleted-hash", 100, datetime.utcnow())
+        entry_id = entry.id
+        
+        session.delete(merge_session)
+        session.flush()
+        
+        assert session.get(ExtractionCacheEntry, entry_id) is None
+    
+    def test_deleting_package_removes_object_rows(self, session):
+        """Test object-specific and child rows go away with their package"""
+        merge_session = _create_merge_session(session, "TEST-CACHE-ROWS")
+        package = Package(
+            session_id=merge_session.id, package_type="base", filename="rows.zip"
+        )
+        obj = ObjectLookup(
+            uuid="_a-cache-rows-interface", name="Rows Interface",
+            object_type="Interface"
+        )
+        session.add_all([package, obj])
+        session.flush()
+        interface = Interface(
+            object_id=obj.id, package_id=package.id,
+            uuid=obj.uuid, name=obj.name
+        )
+        session.add(interface)
+        session.flush()
+        parameter = InterfaceParameter(
+            interface_id=interface.id, parameter_name="input"
+        )
+        session.add(parameter)
+        session.flush()
+        interface_id, parameter_id = interface.id, parameter.id
+        
+        session.delete(merge_session)
+        session.flush()
+        session.expire_all()
+        
+        assert session.get(Interface, interface_id) is None
+        assert session.get(InterfaceParameter, parameter_id) is None
+    
+    def test_entry_of_reused_package_id_is_ignored(self, session):
+        """Test an entry is not matched to a new package that reused its id"""
+        merge_session = _create_merge_session(session, "TEST-CACHE-REUSED")
+        entry = _add_entry(session, merge_session, "old-hash", 100, datetime.utcnow())
+        
+        # A bulk delete skips the ORM cascade to the entry; the new package
+        # of another ZIP gets the same id
+        package_id = entry.package_id
+        Package.query.filter_by(id=package_id).delete()
+        session.add(Package(
+            id=package_id, session_id=merge_session.id, package_type="base",
+            filename="new.zip", zip_hash="new-hash"
+        ))
+        session.flush()
+        
+        assert ExtractionCacheService().get_entry("old-hash") is None
+    
+    def test_disabled_cache_counts_no_misses(self, session, monkeypatch):
+        """Test registering a package with the cache disabled is not a miss"""
+        merge_session = _create_merge_session(session, "TEST-CACHE-MISSES")
+        package = Package(
+            session_id=merge_session.id, package_type="base",
+            filename="misses.zip", zip_hash="misses-hash"
+        )
+        session.add(package)
+        session.flush()
+        service = ExtractionCacheService()
+        
+        monkeypatch.setattr(Config, 'EXTRACTION_CACHE_ENABLED', False)
+        service.register(package, 100)
+        assert service.get_stats()['misses'] == 0
+        
+        monkeypatch.setattr(Config, 'EXTRACTION_CACHE_ENABLED', True)
+        service.register(package, 100)
+        assert service.get_stats()['misses'] == 1
+        assert service.get_stats()['entries'] == 1
+    
+    def test_cleanup_deletes_cache_entries(self, session, monkeypatch):
+        """Test the database cleanup leaves no cache entry behind"""
+        merge_session = _create_merge_session(session, "TEST-CACHE-CLEANUP")
+        _add_entry(session, merge_session, "cleanup-hash", 100, datetime.utcnow())
+        session.commit()
+        settings_service = SettingsService()
+        monkeypatch.setattr(settings_service, '_delete_uploaded_files', lambda: 0)
+        
+        result = settings_service.cleanup_database()
+        
+        assert result['details']['extraction_cache'] == 1
+        assert ExtractionCacheEntry.query.count() == 0
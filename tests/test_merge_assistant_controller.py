@@ -10,7 +10,7 @@ from io import BytesIO
 from flask import Flask
 
 from app import create_app
-from models import db, MergeSession
+from models import db, MergeSession, Change, ObjectLookup
 
 
 class TestMergeAssistantController:
@@ -132,6 +132,79 @@ class TestMergeAssistantController:
         assert 'total' in data['data']
         assert 'filtered' in data['data']
     
+    def test_get_working_set_pages_filters_and_etag(self):
+        """Test get_working_set cursor pages, filters, fields and ETag."""
+        with self.app.app_context():
+            session = MergeSession(
+                reference_id='MRG_PAGE',
+                status='ready',
+                total_changes=3
+            )
+            db.session.add(session)
+            db.session.flush()
+            for order, object_type in enumerate(
+                ['Interface', 'Interface', 'Process Model'], start=1
+            ):
+                obj = ObjectLookup(
+                    uuid=f'page-{order}',
+                    name=f'Object {order}',
+                    object_type=object_type
+                )
+                db.session.add(obj)
+                db.session.flush()
+                db.session.add(Change(
+                    session_id=session.id,
+                    object_id=obj.id,
+                    classification='CONFLICT',
+                    display_order=order
+                ))
+            db.session.commit()
+        
+        first = self.client.get('/merge/MRG_PAGE/changes?per_page=2')
+        data = first.get_json()['data']
+        assert [c['display_order'] for c in data['changes']] == [1, 2]
+        assert (data['has_more'], data['next_cursor']) == (True, 2)
+        
+        second = self.client.get(
+            '/merge/MRG_PAGE/changes',
+            query_string={'per_page': 2, 'after': data['next_cursor']}
+        ).get_json()['data']
+        assert [c['display_order'] for c in second['changes']] == [3]
+        assert (second['has_more'], second['next_cursor']) == (False, None)
+        
+        filtered = self.client.get(
+            '/merge/MRG_PAGE/changes',
+            query_string={'object_type': 'Process Model', 'fields': 'status'}
+        ).get_json()['data']
+        assert filtered['changes'] == [
+            {'change_id': filtered['changes'][0]['change_id'],
+             'display_order': 3, 'status': 'pending'}
+        ]
+        
+        bad = self.client.get('/merge/MRG_PAGE/changes?fields=notes')
+        assert bad.status_code == 400
+        
+        # Unchanged: 304; after a review: a new ETag
+        etag = first.headers['ETag']
+        cached = self.client.get(
+            '/merge/MRG_PAGE/changes?per_page=2',
+            headers={'If-None-Match': etag}
+        )
+        assert cached.status_code == 304
+        
+        with self.app.app_context():
+            change = db.session.query(Change).filter_by(display_order=1).first()
+            change.status = 'reviewed'
+            db.session.commit()
+        
+        updated = self.client.get(
+            '/merge/MRG_PAGE/changes?per_page=2',
+            headers={'If-None-Match': etag}
+        )
+        assert updated.status_code == 200
+        assert updated.headers['ETag'] != etag
+        assert updated.get_json()['data']['changes'][0]['status'] == 'reviewed'
+    
     def test_endpoints_exist(self):
         """Test that all required endpoints are registered."""
         # Get all routes
@@ -5,6 +5,7 @@ Tests the complete three-way merge workflow using real Appian packages.
 """
 
 import os
+import time
 import pytest
 from pathlib import Path
 
@@ -71,15 +72,27 @@ class TestMergeAssistantControllerIntegration:
                 content_type='multipart/form-data'
             )
         
-        # Verify session created
-        assert response.status_code == 201
+        # Verify session created and queued
+        assert response.status_code == 202
         data = response.get_json()
         assert data['success'] is True
         assert 'reference_id' in data['data']
-        assert 'total_changes' in data['data']
+        assert 'progress_url' in data['data']
         
         reference_id = data['data']['reference_id']
-        total_changes = data['data']['total_changes']
+        
+        # Wait for the background workflow
+        deadline = time.time() + 600
+        while True:
+            response = self.client.get(data['data']['progress_url'])
+            progress = response.get_json()['data']
+            if progress['status'] != 'processing' or time.time() > deadline:
+                break
+            time.sleep(0.5)
+        
+        assert progress['status'] == 'ready'
+        assert [step['step'] for step in progress['steps']] == list(range(1, 11))
+        total_changes = progress['total_changes']
         
         print(f"\n✓ Session created: {reference_id}")
         print(f"  Total changes: {total_changes}")
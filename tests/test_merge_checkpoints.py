@@ -0,0 +1,108 @@
+"""
+Tests for Merge Workflow Checkpoints
+
+Tests that each workflow step is committed as a checkpoint, that a failed
+step leaves the completed ones in place, and that retrying a failed
+session resumes from its first incomplete step without extracting the
+packages again. Uses the test application packages.
+"""
+
+import pytest
+from config import Config
+from models import db, MergeSession, Package, Change
+from services.three_way_merge_orchestrator import ThreeWayMergeException
+
+
+def _fail_step(monkeypatch, service, method):
+    """Make a workflow step raise."""
+    def fail(*args, **kwargs):
+        raise RuntimeError(f"{method} failed")
+    monkeypatch.setattr(service, method, fail)
+
+
+def _failed_session():
+    """Get the most recent session, which the failed run left behind."""
+    db.session.expire_all()
+    return db.session.query(MergeSession).order_by(MergeSession.id.desc()).first()
+
+
+class TestMergeCheckpoints:
+    """Test checkpointing and resuming of the merge workflow"""
+
+    def test_completed_session_is_checkpointed(self, orchestrator, merge_packages):
+        """Test a successful run records every step"""
+        session = orchestrator.create_merge_session(**merge_packages)
+
+        assert session.status == 'ready'
+        assert session.completed_step == 10
+
+    def test_retry_resumes_after_failed_persistence(self, orchestrator, merge_packages, monkeypatch):
+        """Test a step 8 failure keeps steps 1-7 and retry runs only 8-10"""
+        expected = orchestrator.create_merge_session(**merge_packages).total_changes
+
+        with monkeypatch.context() as patch:
+            _fail_step(patch, orchestrator.comparison_persistence_service,
+                       'persist_all_comparisons')
+            with pytest.raises(ThreeWayMergeException):
+                orchestrator.create_merge_session(**merge_packages)
+
+        failed = _failed_session()
+        assert (failed.status, failed.completed_step) == ('error', 7)
+        assert failed.packages.count() == 3
+        assert failed.changes.count() == expected
+
+        # Packages and changes must be reused, not recreated
+        _fail_step(monkeypatch, orchestrator.package_extraction_service, 'extract_package')
+        _fail_step(monkeypatch, orchestrator.classification_service, 'classify')
+        resumed = orchestrator.retry_failed_session(failed.reference_id, **merge_packages)
+
+        assert resumed.reference_id == failed.reference_id
+        assert (resumed.status, resumed.completed_step) == ('ready', 10)
+        assert resumed.total_changes == expected
+        assert db.session.query(Change).filter_by(session_id=resumed.id).count() == expected
+
+    def test_retry_reloads_comparison_results(self, orchestrator, merge_packages, monkeypatch):
+        """Test a step 7 failure is resumed from stored delta and customer results"""
+        expected = orchestrator.create_merge_session(**merge_packages).total_changes
+
+        with monkeypatch.context() as patch:
+            _fail_step(patch, orchestrator.classification_service, 'classify')
+            with pytest.raises(ThreeWayMergeException):
+                orchestrator.create_merge_session(**merge_packages)
+
+        failed = _failed_session()
+        assert failed.completed_step == 6
+        assert failed.changes.count() == 0
+
+        _fail_step(monkeypatch, orchestrator.delta_comparison_service, 'compare')
+        _fail_step(monkeypatch, orchestrator.customer_comparison_service, 'compare')
+        resumed = orchestrator.retry_failed_session(failed.reference_id, **merge_packages)
+
+        assert resumed.status == 'ready'
+        assert resumed.total_changes == expected
+        assert db.session.query(Package).filter_by(session_id=resumed.id).count() == 3
+
+    def test_retry_formats_packages_stored_unformatted(self, orchestrator, merge_packages, monkeypatch):
+        """Test a serial retry formats packages A and B of a concurrent run"""
+        store_parsed_package = orchestrator.package_extraction_service.store_parsed_package
+
+        def fail_new_vendor(*args, **kwargs):
+            if kwargs['package_type'] == 'new_vendor':
+                raise RuntimeError("store_parsed_package failed")
+            return store_parsed_package(*args, **kwargs)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(orchestrator.package_extraction_service,
+                          'store_parsed_package', fail_new_vendor)
+            with pytest.raises(ThreeWayMergeException):
+                orchestrator.create_merge_session(**merge_packages, concurrent_extraction=True)
+
+        failed = _failed_session()
+        assert failed.completed_step == 3
+        assert [package.sail_code_formatted for package in failed.packages] == [False, False]
+
+        monkeypatch.setattr(Config, 'CONCURRENT_PACKAGE_EXTRACTION', False)
+        resumed = orchestrator.retry_failed_session(failed.reference_id, **merge_packages)
+
+        assert resumed.status == 'ready'
+        assert all(package.sail_code_formatted for package in resumed.packages)
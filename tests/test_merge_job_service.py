@@ -0,0 +1,206 @@
+"""
+Tests for Merge Job Service
+
+Tests that merge sessions are created straight away and processed in the
+background, that step progress can be polled and streamed as
+Server-Sent Events, and that failures and overload are reported. The
+merge workflow itself is stubbed.
+"""
+
+import io
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from config import Config
+from core.exceptions import ResourceConstraintException
+from models import db, MergeSession
+from services.merge_job_service import MergeJobService
+from services.merge_progress import MergeProgress
+
+
+class StubWorkflow:
+    """Stands in for create_merge_session, recording two steps"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.release = threading.Event()
+        self.zip_paths = []
+
+    def __call__(self, base_zip_path, customized_zip_path, new_vendor_zip_path,
+                 reference_id, progress):
+        self.zip_paths.append((base_zip_path, customized_zip_path, new_vendor_zip_path))
+        progress.start_step(1, "Creating merge session record")
+        progress.complete_step(1, 0.01)
+        progress.start_step(2, "Extracting Package A (Base Version)")
+        self.release.wait(5)
+        if self.fail:
+            raise ValueError("corrupt zip")
+        progress.complete_step(2, 0.5, objects_processed=42)
+
+        merge_session = db.session.query(MergeSession).filter_by(
+            reference_id=reference_id
+        ).first()
+        merge_session.status = 'ready'
+        merge_session.total_changes = 7
+        db.session.commit()
+        return merge_session
+
+
+@pytest.fixture
+def job_service(isolated_app, unique_reference_ids, monkeypatch):
+    """MergeJobService on an isolated database with a stubbed workflow."""
+    service = MergeJobService()
+    workflow = StubWorkflow()
+    monkeypatch.setattr(service.orchestrator, 'create_merge_session', workflow)
+    service.workflow = workflow
+    return service
+
+
+def _wait_until_finished(progress, timeout=5):
+    """Wait for a workflow to finish."""
+    deadline = time.time() + timeout
+    while not progress.finished and time.time() < deadline:
+        progress.wait_for_change(progress.version, 0.1)
+    assert progress.finished
+
+
+class TestMergeProgress:
+    """Test MergeProgress"""
+
+    def test_steps_record_objects_and_elapsed_time(self):
+        """Test completed steps keep logged timings and running steps tick"""
+        progress = MergeProgress('MRG_001', total_steps=10)
+        progress.start_step(2, "Extracting Package A (Base Version)")
+        progress.complete_step(2, 3.214, objects_processed=412)
+        progress.start_step(3, "Extracting Package B (Customer Version)")
+
+        data = progress.to_dict()
+
+        assert data['current_step'] == 3 and data['status'] == 'processing'
+        assert data['steps'][0] == {
+            'step': 2,
+            'description': "Extracting Package A (Base Version)",
+            'status': 'completed',
+            'objects_processed': 412,
+            'elapsed_seconds': 3.21
+        }
+        assert data['steps'][1]['status'] == 'running'
+        assert data['steps'][1]['elapsed_seconds'] >= 0
+
+    def test_failure_marks_running_step(self):
+        """Test an error fails the running step and wakes waiting readers"""
+        progress = MergeProgress('MRG_001')
+        progress.start_step(5, "Performing delta comparison (A→C)")
+        version = progress.version
+
+        threading.Timer(0.05, progress.finish, args=('error',), kwargs={'error': 'boom'}).start()
+
+        assert progress.wait_for_change(version, timeout=5) > version
+        data = progress.to_dict()
+        assert data['steps'][0]['status'] == 'failed'
+        assert data['error'] == 'boom'
+
+
+class TestMergeJobService:
+    """Test MergeJobService and the progress endpoints"""
+
+    def test_submit_returns_before_workflow_finishes(self, isolated_app, job_service):
+        """Test the reference_id is available while the workflow runs"""
+        progress = job_service.submit('a.zip', 'b.zip', 'c.zip')
+
+        polled = job_service.get_progress(progress.reference_id)
+        assert polled['status'] == 'processing'
+        assert db.session.query(MergeSession).filter_by(
+            reference_id=progress.reference_id
+        ).one().status == 'processing'
+
+        job_service.workflow.release.set()
+        _wait_until_finished(progress)
+
+        response = isolated_app.test_client().get(f'/merge/{progress.reference_id}/progress')
+        data = response.get_json()['data']
+        assert data['status'] == 'ready' and data['total_changes'] == 7
+        assert [step['objects_processed'] for step in data['steps']] == [None, 42]
+
+    def test_uploads_with_same_filenames_are_kept_apart(self, isolated_app, job_service):
+        """Test each merge reads its own copy of identically named uploads"""
+        job_service.workflow.release.set()
+        client = isolated_app.test_client()
+        responses = []
+        for content in (b'first', b'second'):
+            responses.append(client.post('/merge/create', data={
+                package: (io.BytesIO(content + package.encode()), 'package.zip')
+                for package in ('base_package', 'customized_package', 'new_vendor_package')
+            }, content_type='multipart/form-data'))
+            _wait_until_finished(
+                job_service.get_job(responses[-1].get_json()['data']['reference_id'])
+            )
+
+        try:
+            assert [response.status_code for response in responses] == [202, 202]
+            first, second = job_service.workflow.zip_paths
+            assert len(set(first + second)) == 6
+            assert Path(first[0]).read_bytes() == b'firstbase_package'
+            assert Path(second[0]).read_bytes() == b'secondbase_package'
+            assert Path(second[1]).read_bytes() == b'secondcustomized_package'
+        finally:
+            for paths in job_service.workflow.zip_paths:
+                shutil.rmtree(Path(paths[0]).parent.parent, ignore_errors=True)
+
+    def test_progress_stream_sends_events_until_done(self, isolated_app, job_service):
+        """Test the SSE stream sends progress events and a final done event"""
+        progress = job_service.submit('a.zip', 'b.zip', 'c.zip')
+        threading.Timer(0.1, job_service.workflow.release.set).start()
+
+        response = isolated_app.test_client().get(f'/merge/{progress.reference_id}/progress/stream')
+        body = response.get_data(as_text=True)
+
+        assert response.mimetype == 'text/event-stream'
+        events = [
+            (lines[0][len('event: '):], json.loads(lines[1][len('data: '):]))
+            for lines in (chunk.split('\n') for chunk in body.strip().split('\n\n'))
+        ]
+        assert events[-1][0] == 'done'
+        assert events[-1][1]['status'] == 'ready'
+        assert all(name == 'progress' for name, _ in events[:-1])
+        assert [step['step'] for step in events[-1][1]['steps']] == [1, 2]
+
+    def test_failed_workflow_is_reported(self, job_service):
+        """Test a failure is reported and leaves the session in error"""
+        job_service.workflow.fail = True
+        job_service.workflow.release.set()
+
+        progress = job_service.submit('a.zip', 'b.zip', 'c.zip')
+        _wait_until_finished(progress)
+
+        data = job_service.get_progress(progress.reference_id)
+        assert data['status'] == 'error' and data['error'] == 'corrupt zip'
+        db.session.expire_all()
+        assert db.session.query(MergeSession).filter_by(
+            reference_id=progress.reference_id
+        ).one().status == 'error'
+
+    def test_submit_rejected_when_too_many_pending(self, job_service, monkeypatch):
+        """Test submissions beyond MERGE_JOB_MAX_PENDING are rejected"""
+        monkeypatch.setattr(Config, 'MERGE_JOB_MAX_PENDING', 1)
+        progress = job_service.submit('a.zip', 'b.zip', 'c.zip')
+
+        with pytest.raises(ResourceConstraintException):
+            job_service.submit('a.zip', 'b.zip', 'c.zip')
+
+        job_service.workflow.release.set()
+        _wait_until_finished(progress)
+
+    def test_remerge_rejected_while_session_processing(self, job_service):
+        """Test a session still being merged cannot be re-merged"""
+        progress = job_service.submit('a.zip', 'b.zip', 'c.zip')
+
+        with pytest.raises(ValueError, match="cannot be re-merged"):
+            job_service.submit_remerge(progress.reference_id, 'b2.zip')
+
+        job_service.workflow.release.set()
+        _wait_until_finished(progress)
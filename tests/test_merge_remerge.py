@@ -0,0 +1,112 @@
+"""
+Tests for Customer Package Re-merge
+
+Tests that re-merging a session against a new Package B reuses Packages A
+and C, re-classifies only objects whose customer version changed and keeps
+the review status and notes of the other changes. Uses the test
+application packages.
+"""
+
+import pytest
+from models import (
+    db, Change, MergeSession, Package, ObjectVersion, PACKAGE_OBJECT_MODELS
+)
+from repositories.content_blob_repository import ContentBlobRepository
+from services.three_way_merge_orchestrator import ThreeWayMergeException
+
+
+def _classifications(session):
+    """Get the classification of each changed object in a session."""
+    return {change.object_id: change.classification for change in session.changes}
+
+
+class TestCustomerPackageRemerge:
+    """Test ThreeWayMergeOrchestrator.remerge_customer_package"""
+
+    def test_unchanged_package_keeps_session(self, orchestrator, merge_packages, monkeypatch):
+        """Test re-merging the same Package B changes nothing"""
+        session = orchestrator.create_merge_session(**merge_packages)
+        before = _classifications(session)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("package extracted again")
+        monkeypatch.setattr(orchestrator.package_extraction_service, 'extract_package', fail)
+
+        remerged = orchestrator.remerge_customer_package(
+            session.reference_id, merge_packages['customized_zip_path']
+        )
+
+        assert remerged.status == 'ready'
+        assert _classifications(remerged) == before
+
+    def test_remerge_matches_fresh_merge_and_keeps_reviews(self, orchestrator, merge_packages):
+        """Test only changed objects are re-classified and reviews survive"""
+        session = orchestrator.create_merge_session(**merge_packages)
+        old_customer_package_id = session.packages.filter_by(
+            package_type='customized'
+        ).one().id
+
+        # A vendor-only change; its customer version is the base version
+        reviewed = session.changes.filter(Change.customer_change_type.is_(None)).first()
+        reviewed.status = 'reviewed'
+        reviewed.notes = 'Checked with the vendor'
+        session.reviewed_count = 1
+        db.session.commit()
+        reviewed_id = reviewed.id
+
+        # Package B without customizations
+        remerged = orchestrator.remerge_customer_package(
+            session.reference_id, merge_packages['base_zip_path']
+        )
+        summarized = orchestrator.summarized[-1]
+        fresh = orchestrator.create_merge_session(
+            base_zip_path=merge_packages['base_zip_path'],
+            customized_zip_path=merge_packages['base_zip_path'],
+            new_vendor_zip_path=merge_packages['new_vendor_zip_path']
+        )
+
+        assert remerged.status == 'ready'
+        assert _classifications(remerged) == _classifications(fresh)
+        assert remerged.total_changes == fresh.total_changes
+        assert db.session.get(Package, old_customer_package_id) is None
+        assert remerged.packages.count() == 3
+
+        # Nothing of the old Package B is left behind
+        for model in [ObjectVersion] + PACKAGE_OBJECT_MODELS:
+            assert db.session.query(model).filter_by(
+                package_id=old_customer_package_id
+            ).count() == 0
+        assert ContentBlobRepository().delete_unreferenced() == 0
+
+        kept = db.session.get(Change, reviewed_id)
+        assert (kept.status, kept.notes) == ('reviewed', 'Checked with the vendor')
+        assert remerged.reviewed_count == 1
+
+        orders = sorted(change.display_order for change in remerged.changes)
+        assert orders == list(range(1, remerged.total_changes + 1))
+
+        # Only the re-classified changes are summarized again
+        assert summarized and reviewed_id not in summarized
+
+    def test_failed_remerge_leaves_session_unchanged(self, orchestrator, merge_packages, monkeypatch):
+        """Test a failing step rolls the re-merge back"""
+        session = orchestrator.create_merge_session(**merge_packages)
+        before = _classifications(session)
+        package_ids = {package.id for package in session.packages}
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("classification failed")
+        monkeypatch.setattr(orchestrator.classification_service, 'reclassify_objects', fail)
+
+        with pytest.raises(ThreeWayMergeException, match="classification failed"):
+            orchestrator.remerge_customer_package(
+                session.reference_id, merge_packages['base_zip_path']
+            )
+
+        db.session.expire_all()
+        session = db.session.query(MergeSession).filter_by(
+            reference_id=session.reference_id
+        ).one()
+        assert session.status == 'ready'
+        assert {package.id for package in session.packages} == package_ids
+        assert _classifications(session) == before
@@ -0,0 +1,184 @@
+"""
+Tests for Merge Summary Service
+
+Tests that the data sent to the Q agent is prepared per change, that
+regenerating one summary does not prepare the whole session, and that
+summaries are written back in one transaction per batch.
+"""
+
+import pytest
+from models import db, MergeSession, Package, ObjectVersion, Change
+from repositories.object_lookup_repository import ObjectLookupRepository
+from services.merge_summary_service import MergeSummaryService
+
+
+@pytest.fixture
+def session(app):
+    """
+    Database session that is rolled back after each test.
+
+    Tables are created if needed but not dropped, so tests sharing the
+    application database are unaffected.
+    """
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.rollback()
+
+
+def _create_changes(session):
+    """Create a session with two changes and customer/vendor versions."""
+    merge_session = MergeSession(reference_id="TEST-SUMMARY", status="ready")
+    session.add(merge_session)
+    session.flush()
+
+    packages = {}
+    for package_type in ('base', 'customized', 'new_vendor'):
+        packages[package_type] = Package(
+            session_id=merge_session.id,
+            package_type=package_type,
+            filename=f"{package_type}.zip"
+        )
+    session.add_all(packages.values())
+    session.flush()
+
+    objects = ObjectLookupRepository().bulk_find_or_create([
+        {"uuid": "summary-rule", "name": "Rule", "object_type": "Expression Rule"},
+        {"uuid": "summary-interface", "name": "Interface", "object_type": "Interface"}
+    ])
+
+    changes = []
+    for order, obj in enumerate(objects, 1):
+        for package_type in ('customized', 'new_vendor'):
+            session.add(ObjectVersion(
+                object_id=obj.id,
+                package_id=packages[package_type].id,
+                version_uuid=f"{package_type}-{order}",
+                sail_code=f"a!{package_type}({order})",
+                fields='{"x": 1}'
+            ))
+        change = Change(
+            session_id=merge_session.id,
+            object_id=obj.id,
+            classification="CONFLICT",
+            vendor_change_type="MODIFIED",
+            customer_change_type="MODIFIED",
+            display_order=order
+        )
+        session.add(change)
+        changes.append(change)
+    session.flush()
+    return merge_session, changes
+
+
+class TestMergeSummaryService:
+    """Test MergeSummaryService"""
+
+    def test_prepare_change_data_matches_session_data(self, session):
+        """Test a single change is prepared exactly as for the whole session"""
+        merge_session, changes = _create_changes(session)
+        service = MergeSummaryService()
+
+        session_data = {
+            c['change_id']: c for c in service._prepare_changes_data(merge_session.id)
+        }
+
+        for change in changes:
+            change_data = service._prepare_change_data(change)
+            assert change_data == session_data[change.id]
+            assert change_data['customer_version']['sail_code'] == (
+                f"a!customized({change.display_order})"
+            )
+
+    def test_regenerate_summary_prepares_only_one_change(self, session, monkeypatch):
+        """Test regeneration sends one change without preparing the session"""
+        _, changes = _create_changes(session)
+        service = MergeSummaryService()
+        sent = []
+
+        def fail_session_preparation(session_id):
+            raise AssertionError("whole session prepared")
+
+        def process_merge_summaries(session_id, changes_data, use_fallback=True):
+            sent.append(changes_data)
+            return service.q_agent_service.fallback_merge_summaries(changes_data)
+
+        # Keep the test data uncommitted so it is rolled back
+        monkeypatch.setattr(session, 'commit', session.flush)
+        monkeypatch.setattr(service, '_prepare_changes_data', fail_session_preparation)
+        monkeypatch.setattr(
+            service.q_agent_service, 'process_merge_summaries', process_merge_summaries
+        )
+
+        service.regenerate_summary(changes[1].id)
+
+        assert [[c['change_id'] for c in batch] for batch in sent] == [[changes[1].id]]
+        session.refresh(changes[1])
+        assert changes[1].ai_summary_status == 'completed'
+
+    def test_update_change_summaries_in_one_transaction(self, session, monkeypatch):
+        """Test a batch of summaries is written and cached in one transaction"""
+        _, changes = _create_changes(session)
+        service = MergeSummaryService()
+        batch = [service._prepare_change_data(change) for change in changes]
+        commits = []
+        monkeypatch.setattr(session, 'commit', lambda: commits.append(session.flush()))
+        before = service.get_write_stats()
+
+        service._update_change_summaries(
+            {
+                changes[0].id: {'summary': 'first', 'complexity': 'LOW'},
+                changes[1].id: {'summary': 'second', 'complexity': 'HIGH'},
+                999999: {'summary': 'unknown change'}
+            },
+            cache_batch=batch
+        )
+
+        assert len(commits) == 1
+        for change, text in zip(changes, ['first', 'second']):
+            session.refresh(change)
+            assert change.ai_summary_status == 'completed'
+            assert change.ai_summary.startswith(text)
+            assert change.ai_summary_generated_at is not None
+
+        stats = service.get_write_stats()
+        assert stats['transactions'] == before['transactions'] + 1
+        assert stats['rows'] == before['rows'] + 2
+        assert stats['max_lock_ms'] >= 0
+
+        cached = service.summary_cache.lookup(batch)
+        assert cached[changes[1].id]['summary'] == 'second'
+
+    def test_cache_failure_keeps_summaries(self, session, monkeypatch):
+        """Test summaries are written even when caching them fails"""
+        _, changes = _create_changes(session)
+        service = MergeSummaryService()
+        batch = [service._prepare_change_data(change) for change in changes]
+        monkeypatch.setattr(session, 'commit', session.flush)
+
+        def fail(changes_data, summaries):
+            raise RuntimeError("cache unavailable")
+        monkeypatch.setattr(service.summary_cache, 'store', fail)
+
+        service._update_change_summaries(
+            {change.id: {'summary': 'kept', 'complexity': 'LOW'} for change in changes},
+            cache_batch=batch
+        )
+
+        for change in changes:
+            session.refresh(change)
+            assert change.ai_summary_status == 'completed'
+            assert change.ai_summary.startswith('kept')
+
+    def test_mark_batch_failed(self, session, monkeypatch):
+        """Test a failed batch is marked with a single statement"""
+        _, changes = _create_changes(session)
+        service = MergeSummaryService()
+        monkeypatch.setattr(session, 'commit', session.flush)
+
+        service._mark_batch_failed([{'change_id': c.id} for c in changes], "timeout")
+
+        for change in changes:
+            session.refresh(change)
+            assert change.ai_summary_status == 'failed'
+            assert change.ai_summary == "Summary generation failed: timeout"
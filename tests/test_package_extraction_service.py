@@ -6,13 +6,18 @@ Updated to verify package_id is set correctly in object-specific tables.
 """
 import os
 import unittest
+import zipfile
+from unittest.mock import patch
 from tests.base_test import BaseTestCase
 from models import (
     db, MergeSession, Package, ObjectLookup,
-    PackageObjectMapping, ObjectVersion,
+    PackageObjectMapping, ObjectVersion, ContentBlob,
     Interface, ExpressionRule, ProcessModel
 )
-from services.package_extraction_service import PackageExtractionService
+from services.package_extraction_service import (
+    PackageExtractionService, compute_content_hash, find_xml_members,
+    parse_xml_member
+)
 from repositories.object_lookup_repository import ObjectLookupRepository
 from repositories.package_object_mapping_repository import (
     PackageObjectMappingRepository
@@ -439,6 +444,151 @@ class TestPackageExtractionService(BaseTestCase):
                         f"Process Model references non-existent package_id={pkg_id}"
                     )
 
+    def test_parallel_extraction_matches_serial(self):
+        """Test extraction with a worker pool stores the same objects as serial"""
+        test_package_path = (
+            'applicationArtifacts/Three Way Testing Files/V2/'
+            'Test Application - Base Version.zip'
+        )
+
+        if not os.path.exists(test_package_path):
+            self.skipTest(f"Test package not found: {test_package_path}")
+
+        serial = self.service.extract_package(
+            session_id=self.session.id,
+            zip_path=test_package_path,
+            package_type='base',
+            workers=0
+        )
+        parallel = self.service.extract_package(
+            session_id=self.session.id,
+            zip_path=test_package_path,
+            package_type='customized',
+            workers=2
+        )
+
+        self.assertEqual(serial.total_objects, parallel.total_objects)
+
+        serial_objects = {
+            v.object_id for v in ObjectVersion.query.filter_by(package_id=serial.id)
+        }
+        parallel_objects = {
+            v.object_id for v in ObjectVersion.query.filter_by(package_id=parallel.id)
+        }
+        self.assertEqual(serial_objects, parallel_objects)
+
+    def test_extract_package_reads_zip_without_temp_dir(self):
+        """Test extraction streams members from the ZIP without a temp directory"""
+        test_package_path = (
+            'applicationArtifacts/Three Way Testing Files/V2/'
+            'Test Application - Base Version.zip'
+        )
+
+        if not os.path.exists(test_package_path):
+            self.skipTest(f"Test package not found: {test_package_path}")
+
+        with patch('tempfile.mkdtemp', side_effect=AssertionError('temp dir used')):
+            package = self.service.extract_package(
+                session_id=self.session.id,
+                zip_path=test_package_path,
+                package_type='base'
+            )
+
+        self.assertGreater(package.total_objects, 0)
+
+    def test_find_and_parse_xml_members(self):
+        """Test XML members are listed from the central directory and parsed"""
+        test_package_path = (
+            'applicationArtifacts/Three Way Testing Files/V2/'
+            'Test Application - Base Version.zip'
+        )
+
+        if not os.path.exists(test_package_path):
+            self.skipTest(f"Test package not found: {test_package_path}")
+
+        with zipfile.ZipFile(test_package_path) as archive:
+            members = find_xml_members(archive)
+            self.assertTrue(members)
+            self.assertTrue(all(
+                info.filename.endswith(('.xml', '.xsd')) for info in members
+            ))
+
+            parsed = parse_xml_member(archive, members[0].filename)
+
+        self.assertEqual(parsed['source'], members[0].filename)
+        self.assertIn('error', parsed)
+
+    def test_extract_package_stores_content_hash(self):
+        """Test every extracted version gets a content hash"""
+        test_package_path = (
+            'applicationArtifacts/Three Way Testing Files/V2/'
+            'Test Application - Base Version.zip'
+        )
+
+        if not os.path.exists(test_package_path):
+            self.skipTest(f"Test package not found: {test_package_path}")
+
+        package = self.service.extract_package(
+            session_id=self.session.id,
+            zip_path=test_package_path,
+            package_type='base'
+        )
+
+        versions = ObjectVersion.query.filter_by(package_id=package.id).all()
+        self.assertTrue(versions)
+        self.assertTrue(all(len(v.content_hash) == 64 for v in versions))
+
+    def test_reextracted_package_reuses_content_blobs(self):
+        """Test re-extracting a package stores no new content blobs"""
+        test_package_path = (
+            'applicationArtifacts/Three Way Testing Files/V2/'
+            'Test Application - Base Version.zip'
+        )
+
+        if not os.path.exists(test_package_path):
+            self.skipTest(f"Test package not found: {test_package_path}")
+
+        first = self.service.extract_package(
+            session_id=self.session.id,
+            zip_path=test_package_path,
+            package_type='base'
+        )
+        blob_count = ContentBlob.query.count()
+
+        second = self.service.extract_package(
+            session_id=self.session.id,
+            zip_path=test_package_path,
+            package_type='customized'
+        )
+
+        self.assertEqual(ContentBlob.query.count(), blob_count)
+        first_fields = {
+            v.object_id: v.fields
+            for v in ObjectVersion.query.filter_by(package_id=first.id)
+        }
+        second_fields = {
+            v.object_id: v.fields
+            for v in ObjectVersion.query.filter_by(package_id=second.id)
+        }
+        self.assertEqual(first_fields, second_fields)
+        self.assertTrue(any(first_fields.values()))
+
+    def test_compute_content_hash(self):
+        """Test the content hash ignores export identity but not content"""
+        data = {
+            'uuid': 'abc',
+            'version_uuid': 'v1',
+            'raw_xml': '<a/>',
+            'sail_code': 'a!x()',
+            'parameters': [{'name': 'p1'}]
+        }
+
+        reexported = dict(data, version_uuid='v2', raw_xml='<b/>')
+        modified = dict(data, parameters=[{'name': 'p1'}, {'name': 'p2'}])
+
+        self.assertEqual(compute_content_hash(data), compute_content_hash(reexported))
+        self.assertNotEqual(compute_content_hash(data), compute_content_hash(modified))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,7 +7,7 @@ These tests verify the basic functionality of the parser infrastructure.
 import pytest
 import xml.etree.ElementTree as ET
 from io import StringIO
-from services.parsers.base_parser import BaseParser
+from services.parsers.base_parser import BaseParser, XMLDocument
 from services.parsers.xml_parser_factory import (
     XMLParserFactory,
     UnknownObjectParser,
@@ -241,6 +241,40 @@ class TestXMLParserFactory:
         # Should have initial parsers plus the 2 we added
         assert len(types) == initial_count + 2
 
+    def test_detect_object_type_from_root_tag(self):
+        """Test object type is detected from the parsed root element."""
+        factory = XMLParserFactory()
+        document = XMLDocument.from_bytes(
+            b'<processModelHaul><versionUuid>v1</versionUuid></processModelHaul>',
+            'pm.xml'
+        )
+        
+        assert factory.detect_object_type(document) == 'Process Model'
+
+    def test_detect_object_type_content_haul(self):
+        """Test contentHaul documents are typed by their child element."""
+        factory = XMLParserFactory()
+        document = XMLDocument.from_bytes(
+            b'<contentHaul><rule><uuid>r1</uuid></rule></contentHaul>',
+            'rule.xml'
+        )
+        
+        assert factory.detect_object_type(document) == 'Expression Rule'
+
+    def test_detect_object_type_xsd_is_cdt(self):
+        """Test XSD documents are always CDTs."""
+        factory = XMLParserFactory()
+        document = XMLDocument.from_bytes(b'<schema/>', 'type.xsd')
+        
+        assert factory.detect_object_type(document) == 'CDT'
+
+    def test_detect_object_type_unknown(self):
+        """Test unrecognized root elements map to Unknown."""
+        factory = XMLParserFactory()
+        document = XMLDocument.from_bytes(b'<somethingElse/>', 'x.xml')
+        
+        assert factory.detect_object_type(document) == 'Unknown'
+
     def test_singleton_factory(self):
         """Test get_parser_factory returns singleton instance."""
         factory1 = get_parser_factory()
@@ -273,3 +307,19 @@ class TestUnknownObjectParser:
         assert data['description'] == 'Unknown object type'
         assert 'raw_xml' in data
         assert 'customField' in data['raw_xml']
+
+    def test_parse_document_uses_parsed_tree(self):
+        """Test parse_document works from an in-memory document."""
+        content = (
+            b'<unknownObject uuid="unknown-456" name="InMemory">'
+            b'<description>From bytes</description>'
+            b'</unknownObject>'
+        )
+        document = XMLDocument.from_bytes(content, 'member/unknown.xml')
+        
+        parser = UnknownObjectParser()
+        data = parser.parse_document(document)
+        
+        assert data['uuid'] == 'unknown-456'
+        assert data['name'] == 'InMemory'
+        assert data['raw_xml'] == content.decode('utf-8')
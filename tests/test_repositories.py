@@ -4,10 +4,12 @@ Test Repository Layer
 Tests for base and core repositories.
 """
 
+import uuid
+
 import pytest
 from models import (
     db, ObjectLookup, PackageObjectMapping, DeltaComparisonResult,
-    Change, MergeSession, Package
+    Change, MergeSession, Package, ObjectVersion
 )
 from repositories.object_lookup_repository import ObjectLookupRepository
 from repositories.package_object_mapping_repository import (
@@ -17,6 +19,9 @@ from repositories.delta_comparison_repository import (
     DeltaComparisonRepository
 )
 from repositories.change_repository import ChangeRepository
+from repositories.content_blob_repository import (
+    ContentBlobRepository, compute_blob_hash
+)
 
 
 class TestObjectLookupRepository:
@@ -112,6 +117,31 @@ class TestObjectLookupRepository:
             db.session.rollback()
 
 
+    def test_bulk_find_or_create_updates_existing(self, app):
+        """Test bulk find_or_create reuses and renames existing objects"""
+        with app.app_context():
+            db.create_all()
+            repo = ObjectLookupRepository()
+            
+            existing = repo.find_or_create(
+                uuid="test-uuid-bulk-1",
+                name="Old Name",
+                object_type="Interface"
+            )
+            
+            results = repo.bulk_find_or_create([
+                {"uuid": "test-uuid-bulk-1", "name": "New Name", "object_type": "Interface"},
+                {"uuid": "test-uuid-bulk-2", "name": None, "object_type": "Constant"}
+            ])
+            
+            assert results[0].id == existing.id
+            assert results[0].name == "New Name"
+            assert results[1].id is not None
+            assert results[1].name == "Unknown"
+            
+            db.session.rollback()
+
+
 class TestPackageObjectMappingRepository:
     """Test PackageObjectMappingRepository"""
     
@@ -194,6 +224,149 @@ class TestPackageObjectMappingRepository:
             db.session.rollback()
 
 
+    def test_get_mapped_object_ids(self, app):
+        """Test checking which objects are already mapped to a package"""
+        with app.app_context():
+            db.create_all()
+            session = MergeSession(reference_id="TEST-MAP-IDS", status="processing")
+            db.session.add(session)
+            db.session.flush()
+            
+            package = Package(
+                session_id=session.id,
+                package_type="base",
+                filename="test.zip"
+            )
+            db.session.add(package)
+            db.session.flush()
+            
+            obj_repo = ObjectLookupRepository()
+            obj1, obj2 = obj_repo.bulk_find_or_create([
+                {"uuid": "test-uuid-map-1", "name": "Object 1", "object_type": "Interface"},
+                {"uuid": "test-uuid-map-2", "name": "Object 2", "object_type": "Interface"}
+            ])
+            
+            mapping_repo = PackageObjectMappingRepository()
+            mapping_repo.bulk_create_mappings([
+                {"package_id": package.id, "object_id": obj1.id}
+            ])
+            
+            mapped = mapping_repo.get_mapped_object_ids(
+                package.id, [obj1.id, obj2.id]
+            )
+            assert mapped == {obj1.id}
+            assert mapping_repo.get_mapped_object_ids(package.id, []) == set()
+            
+            db.session.rollback()
+
+
+class TestContentBlobRepository:
+    """Test ContentBlobRepository"""
+    
+    def test_bulk_store_skips_existing(self, app):
+        """Test identical content is only stored once"""
+        with app.app_context():
+            db.create_all()
+            repo = ContentBlobRepository()
+            content = '<test>blob-store</test>'
+            content_hash = compute_blob_hash(content)
+            
+            assert repo.bulk_store({content_hash: content}) == 1
+            assert repo.bulk_store({content_hash: content}) == 0
+            assert repo.get_content(content_hash) == content
+            assert repo.get_content(compute_blob_hash('missing')) is None
+            
+            db.session.rollback()
+    
+    def test_version_reads_blob_content(self, app):
+        """Test object versions resolve blob references and inline content"""
+        with app.app_context():
+            db.create_all()
+            session = MergeSession(reference_id="TEST-BLOB", status="processing")
+            db.session.add(session)
+            db.session.flush()
+            
+            package = Package(
+                session_id=session.id,
+                package_type="base",
+                filename="test.zip"
+            )
+            db.session.add(package)
+            db.session.flush()
+            
+            obj1, obj2 = ObjectLookupRepository().bulk_find_or_create([
+                {"uuid": "test-uuid-blob-1", "name": "Object 1", "object_type": "Record Type"},
+                {"uuid": "test-uuid-blob-2", "name": "Object 2", "object_type": "Record Type"}
+            ])
+            
+            fields = '[{"field_name": "id"}]'
+            fields_hash = compute_blob_hash(fields)
+            ContentBlobRepository().bulk_store({fields_hash: fields})
+            
+            blob_version = ObjectVersion(
+                object_id=obj1.id,
+                package_id=package.id,
+                fields_hash=fields_hash
+            )
+            inline_version = ObjectVersion(
+                object_id=obj2.id,
+                package_id=package.id,
+                fields=fields
+            )
+            db.session.add_all([blob_version, inline_version])
+            db.session.flush()
+            
+            assert blob_version.fields == fields
+            assert inline_version.fields == fields
+            
+            rows = db.session.query(
+                ObjectVersion.object_id,
+                ObjectVersion.fields
+            ).filter(ObjectVersion.package_id == package.id).all()
+            assert {row.object_id: row.fields for row in rows} == {
+                obj1.id: fields,
+                obj2.id: fields
+            }
+            
+            db.session.rollback()
+    
+    def test_delete_unreferenced_keeps_referenced_blobs(self, app):
+        """Test only blobs no version references are deleted"""
+        with app.app_context():
+            db.create_all()
+            session = MergeSession(
+                reference_id=f"TEST-BLOB-{uuid.uuid4().hex[:8]}",
+                status="processing"
+            )
+            db.session.add(session)
+            db.session.flush()
+            package = Package(session_id=session.id, package_type="base", filename="test.zip")
+            db.session.add(package)
+            db.session.flush()
+            obj = ObjectLookupRepository().find_or_create(
+                uuid=f"test-uuid-blob-{uuid.uuid4().hex}",
+                name="Object",
+                object_type="Record Type"
+            )
+            
+            repo = ContentBlobRepository()
+            kept = f'<kept>{uuid.uuid4().hex}</kept>'
+            orphan = f'<orphan>{uuid.uuid4().hex}</orphan>'
+            repo.bulk_store({compute_blob_hash(kept): kept, compute_blob_hash(orphan): orphan})
+            db.session.add(ObjectVersion(
+                object_id=obj.id,
+                package_id=package.id,
+                raw_xml_hash=compute_blob_hash(kept)
+            ))
+            db.session.flush()
+            
+            assert repo.delete_unreferenced() >= 1
+            assert repo.get_content(compute_blob_hash(kept)) == kept
+            assert repo.get_content(compute_blob_hash(orphan)) is None
+            
+            db.session.rollback()
+
+
 class TestDeltaComparisonRepository:
     """Test DeltaComparisonRepository"""
     
@@ -398,3 +571,54 @@ class TestChangeRepository:
             assert counts.get("NO_CONFLICT") == 1
             
             db.session.rollback()
+    
+    def test_get_working_set_rows_pages_by_display_order(self, app):
+        """Test working set rows are projected, filtered and keyset-paged"""
+        with app.app_context():
+            db.create_all()
+            session = MergeSession(
+                reference_id=f"TEST-WS-{uuid.uuid4().hex[:8]}",
+                status="ready"
+            )
+            db.session.add(session)
+            db.session.flush()
+            
+            obj_repo = ObjectLookupRepository()
+            change_repo = ChangeRepository()
+            for order, classification in enumerate(
+                ["CONFLICT", "CONFLICT", "NO_CONFLICT"], start=1
+            ):
+                obj = obj_repo.find_or_create(
+                    uuid=f"test-ws-{uuid.uuid4().hex}",
+                    name=f"Object {order}",
+                    object_type="Interface",
+                    description="Long description"
+                )
+                change_repo.create_change(session.id, obj.id, classification, order)
+            
+            first_page = change_repo.get_working_set_rows(session.id, limit=2)
+            second_page = change_repo.get_working_set_rows(
+                session.id,
+                after_display_order=first_page[-1].display_order,
+                limit=2
+            )
+            conflicts = change_repo.get_working_set_rows(
+                session.id, classifications=["CONFLICT"]
+            )
+            described = change_repo.get_working_set_rows(
+                session.id, include_description=True
+            )
+            
+            assert [row.object_name for row in first_page] == ["Object 1", "Object 2"]
+            assert [row.display_order for row in second_page] == [3]
+            assert [row.display_order for row in conflicts] == [1, 2]
+            assert first_page[0].object_description is None
+            assert described[0].object_description == "Long description"
+            assert second_page[0].to_dict()['object'] == {
+                'id': second_page[0].object_id,
+                'uuid': second_page[0].object_uuid,
+                'name': "Object 3",
+                'object_type': "Interface"
+            }
+            
+            db.session.rollback()
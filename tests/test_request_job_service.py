@@ -0,0 +1,149 @@
+"""
+Tests for Request Job Service
+
+Tests that document requests run in the background, record their step
+timings and outcome on the Request row, and that submissions are
+rejected when too many jobs are unfinished. Bedrock and the Q agent are
+stubbed.
+"""
+
+import time
+
+import pytest
+from config import Config
+from core.exceptions import ResourceConstraintException
+from models import db, Request
+from services.process_tracker import ProcessTracker
+from services.request.request_job_service import RequestJobService
+
+
+@pytest.fixture
+def session(app):
+    """Database session with tables created but not dropped."""
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.rollback()
+
+
+@pytest.fixture
+def job_service(session, monkeypatch):
+    """RequestJobService with stubbed Bedrock retrieval."""
+    service = RequestJobService()
+    monkeypatch.setattr(
+        service.request_service, 'process_with_bedrock',
+        lambda req, query_text: {'status': 'success', 'results': []}
+    )
+    return service
+
+
+def _queued_request(service, action_type, text):
+    """Create a queued request."""
+    return service.request_service.create_request(action_type, input_text=text, status='queued')
+
+
+def _wait_for(service, request_id, timeout=10):
+    """Poll a job until it completes or fails."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = service.get_job_status(request_id)
+        if status['status'] in ('completed', 'error'):
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"request {request_id} did not finish")
+
+
+class TestRequestJobService:
+    """Test RequestJobService"""
+
+    def test_job_completes_with_step_timings(self, job_service, monkeypatch):
+        """Test a create job stores its output and step durations"""
+        monkeypatch.setattr(
+            job_service.q_agent_service, 'process_creation',
+            lambda request_id, criteria, bedrock: {'design': criteria}
+        )
+        req = _queued_request(job_service, 'create', 'Add a field')
+
+        job_service.submit(req.id, 'create', acceptance_criteria='Add a field')
+        status = _wait_for(job_service, req.id)
+
+        assert status['status'] == 'completed'
+        assert status['output'] == {'design': 'Add a field'}
+        assert [step['step'] for step in status['steps']] == [
+            'Knowledge Base Retrieval', 'Q Agent Design Generation'
+        ]
+        assert db.session.get(Request, req.id).status == 'completed'
+
+    def test_retrieval_records_rag_cache_metrics(self, job_service, monkeypatch):
+        """Test knowledge base retrieval sets the tracker's RAG cache badge"""
+        monkeypatch.setattr(
+            job_service.request_service, 'process_with_bedrock',
+            lambda req, query_text: {'status': 'success', 'results': [], 'cache': 'hit'}
+        )
+        monkeypatch.setattr(
+            job_service.request_service.bedrock_service, 'get_cache_stats',
+            lambda: {'hit_rate': '50.0%'}
+        )
+        req = _queued_request(job_service, 'verify', 'Design')
+        tracker = ProcessTracker(req.id, 'verify')
+
+        job_service._retrieve_context(tracker, req, 'Find designs')
+
+        assert tracker.rag_cache_metrics == {'status': 'hit', 'hit_rate': '50.0%'}
+        assert tracker.get_confidence_badges()['rag_cache'] == 'RAG Cache: Hit (hit rate 50.0%) ⚡'
+
+    def test_job_saves_rag_cache_status(self, job_service, monkeypatch):
+        """Test a finished job keeps its retrieval cache status on the Request row"""
+        monkeypatch.setattr(
+            job_service.request_service, 'process_with_bedrock',
+            lambda req, query_text: {'status': 'success', 'results': [], 'cache': 'coalesced'}
+        )
+        monkeypatch.setattr(
+            job_service.q_agent_service, 'process_verification',
+            lambda request_id, design, bedrock: {'status': 'ok'}
+        )
+        req = _queued_request(job_service, 'verify', 'Design')
+
+        job_service.submit(req.id, 'verify', design_content='Design')
+        _wait_for(job_service, req.id)
+
+        db.session.expire_all()
+        assert db.session.get(Request, req.id).rag_cache_status == 'coalesced'
+
+    def test_failed_job_records_error(self, job_service, monkeypatch):
+        """Test an exception marks the request as error with its message"""
+        def fail(request_id, sql):
+            raise RuntimeError("agent unavailable")
+        monkeypatch.setattr(job_service.q_agent_service, 'process_conversion', fail)
+        req = _queued_request(job_service, 'convert', 'SELECT 1')
+
+        job_service.submit(req.id, 'convert', maria_sql='SELECT 1')
+        status = _wait_for(job_service, req.id)
+
+        assert status['status'] == 'error'
+        assert status['error'] == 'agent unavailable'
+        assert 'output' not in status
+
+    def test_submit_rejected_when_too_many_pending(self, app, job_service, monkeypatch):
+        """Test submissions beyond the pending limit are rejected with 503"""
+        monkeypatch.setattr(Config, 'REQUEST_JOB_MAX_PENDING', 0)
+        req = _queued_request(job_service, 'convert', 'SELECT 1')
+
+        with pytest.raises(ResourceConstraintException):
+            job_service.submit(req.id, 'convert', maria_sql='SELECT 1')
+
+        response = app.test_client().post('/convert/process', json={'maria_sql': 'SELECT 1'})
+        assert response.status_code == 503
+        assert response.get_json()['success'] is False
+
+    def test_reprocess_rejected_when_too_many_pending(self, app, job_service, monkeypatch):
+        """Test a rejected reprocess returns 503 and marks the new request as error"""
+        original = _queued_request(job_service, 'verify', 'Design')
+        monkeypatch.setattr(Config, 'REQUEST_JOB_MAX_PENDING', 0)
+
+        response = app.test_client().post(f'/process/reprocess/{original.id}')
+
+        assert response.status_code == 503
+        assert response.get_json()['success'] is False
+        new_request = Request.query.filter(Request.id > original.id).one()
+        assert new_request.status == 'error'
@@ -0,0 +1,102 @@
+"""
+Tests for SAIL Formatter
+
+Tests escape sequence removal, UUID and function call replacement, and
+memoization of formatted code per object lookup.
+"""
+
+import pytest
+from services.sail_formatter import SAILFormatter
+
+
+RULE_UUID = "0a1b2c3d-1111-2222-3333-444455556666"
+CONSTANT_UUID = "0a1b2c3d-7777-8888-9999-aaaabbbbcccc"
+INTERFACE_UUID = "_a-0000eaac-2ee0-8000-62ea-01ef9001ef90_4511483"
+
+OBJECT_LOOKUP = {
+    RULE_UUID: {"name": "AS_getValue", "object_type": "Expression Rule"},
+    CONSTANT_UUID: {"name": "AS_MAX_ROWS", "object_type": "Constant"},
+    INTERFACE_UUID: {"name": "AS_Summary", "object_type": "Interface"},
+}
+
+
+@pytest.fixture
+def formatter(app_context):
+    """Formatter with a known object lookup and function map."""
+    formatter = SAILFormatter()
+    formatter.appian_functions = {"textField_20": "textField"}
+    formatter.set_object_lookup(dict(OBJECT_LOOKUP))
+    return formatter
+
+
+class TestSAILFormatter:
+    """Test SAILFormatter"""
+
+    def test_remove_escape_sequences(self, formatter):
+        """Test escaped characters and backslashes are unescaped"""
+        assert formatter._remove_escape_sequences('a\\nb\\tc\\"d\\\'e') == 'a\nb\tc"d\'e'
+        assert formatter._remove_escape_sequences('a\\\\b') == 'a\\b'
+        assert formatter._remove_escape_sequences('a\\\\nb') == 'a\\\nb'
+        assert formatter._remove_escape_sequences('plain') == 'plain'
+
+    def test_replace_references(self, formatter):
+        """Test UUID references and function calls are replaced in one pass"""
+        code = (
+            f'#"{RULE_UUID}"(cons!{CONSTANT_UUID}, #"{INTERFACE_UUID}", '
+            f'a!textField_20 (), #"SYSTEM_SYSRULES_textField_20"(), '
+            f'rule!0a1b2c3d-0000-0000-0000-000000000000)'
+        )
+
+        assert formatter.format_sail_code(code) == (
+            'rule!AS_getValue(cons!AS_MAX_ROWS, rule!AS_Summary, '
+            'a!textField(), a!textField(), '
+            'rule!0a1b2c3d-0000-0000-0000-000000000000)'
+        )
+
+    def test_function_calls_unchanged_without_function_map(self, formatter):
+        """Test function calls are left alone when no functions are loaded"""
+        formatter.appian_functions = {}
+        formatter.set_object_lookup({})
+
+        assert formatter.format_sail_code('a!textField_20 ()') == 'a!textField_20 ()'
+
+    def test_format_process_model_logic(self, formatter):
+        """Test process model logic only resolves UUID references"""
+        logic = f'=== NODE: Start ===\nrule!{RULE_UUID}\na!textField_20()'
+
+        assert formatter.format_process_model_logic(logic) == (
+            '=== NODE: Start ===\n    rule!AS_getValue\n    a!textField_20()'
+        )
+
+    def test_memoizes_per_lookup_generation(self, formatter):
+        """Test identical code is formatted once until the lookup changes"""
+        code = f'rule!{RULE_UUID}()'
+
+        assert formatter.format_sail_code(code) == 'rule!AS_getValue()'
+        assert formatter.format_sail_code(code) == 'rule!AS_getValue()'
+        assert (formatter.memo_hits, formatter.memo_misses) == (1, 1)
+
+        # Setting an equal lookup keeps the memoized output
+        generation = formatter.lookup_generation
+        formatter.set_object_lookup(dict(OBJECT_LOOKUP))
+        assert formatter.lookup_generation == generation
+
+        formatter.set_object_lookup({
+            RULE_UUID: {"name": "AS_getOther", "object_type": "Expression Rule"}
+        })
+        assert formatter.lookup_generation == generation + 1
+        assert formatter.format_sail_code(code) == 'rule!AS_getOther()'
+        assert (formatter.memo_hits, formatter.memo_misses) == (1, 2)
+
+    def test_formatters_keep_their_own_lookup(self, formatter):
+        """Test formatters of two sessions do not share lookup or memo"""
+        other = SAILFormatter()
+        other.set_object_lookup({
+            RULE_UUID: {"name": "AS_getOther", "object_type": "Expression Rule"}
+        })
+        code = f'rule!{RULE_UUID}()'
+
+        assert formatter.format_sail_code(code) == 'rule!AS_getValue()'
+        assert other.format_sail_code(code) == 'rule!AS_getOther()'
+        assert formatter.format_sail_code(code) == 'rule!AS_getValue()'
+        assert other.appian_functions is SAILFormatter().appian_functions
@@ -0,0 +1,124 @@
+"""
+Tests for Summary Cache Service
+
+Tests that AI summaries are reused for changes with identical prompt
+inputs, and that cached summaries are evicted by age and count.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from config import Config
+from models import db, SummaryCacheEntry
+from services.summary_cache_service import (
+    SummaryCacheService, compute_summary_cache_key
+)
+
+
+@pytest.fixture
+def session(app):
+    """
+    Database session that is rolled back after each test.
+
+    Tables are created if needed but not dropped, so tests sharing the
+    application database are unaffected.
+    """
+    with app.app_context():
+        db.create_all()
+        SummaryCacheEntry.query.delete()
+        yield db.session
+        db.session.rollback()
+
+
+def _change(change_id, sail_code="a!x()", classification="CONFLICT"):
+    """Create a change dictionary as prepared for the Q agent."""
+    return {
+        'change_id': change_id,
+        'object_name': 'Rule',
+        'object_type': 'Expression Rule',
+        'object_uuid': 'cache-rule',
+        'classification': classification,
+        'vendor_change_type': 'MODIFIED',
+        'customer_change_type': 'MODIFIED',
+        'customer_version': {'version_uuid': 'b', 'sail_code': sail_code},
+        'new_vendor_version': {'version_uuid': 'c', 'sail_code': 'a!y()'}
+    }
+
+
+def _summary(change_id, text):
+    """Create summary data as returned by the agent."""
+    return {'change_id': change_id, 'summary': text, 'complexity': 'LOW'}
+
+
+class TestSummaryCacheService:
+    """Test SummaryCacheService"""
+
+    def test_cache_key_ignores_change_id(self):
+        """Test identical changes in different sessions share a key"""
+        assert compute_summary_cache_key(_change(1)) == compute_summary_cache_key(_change(2))
+        assert compute_summary_cache_key(_change(1)) != compute_summary_cache_key(
+            _change(1, sail_code="a!z()")
+        )
+        assert compute_summary_cache_key(_change(1)) != compute_summary_cache_key(
+            _change(1, classification="NO_CONFLICT")
+        )
+
+    def test_lookup_returns_stored_summaries(self, session):
+        """Test a summary stored for one session is found for another"""
+        cache = SummaryCacheService()
+        assert cache.store([_change(1)], {1: _summary(1, "cached")}) == 1
+
+        cached = cache.lookup([_change(7), _change(8, sail_code="other")])
+
+        assert cached == {7: _summary(7, "cached")}
+        assert (cache.hits, cache.misses) == (1, 1)
+        entry = SummaryCacheEntry.query.one()
+        session.refresh(entry)
+        assert entry.hit_count == 1
+
+    def test_store_replaces_entry_stored_concurrently(self, session, monkeypatch):
+        """Test storing a key another generation just stored updates it"""
+        cache = SummaryCacheService()
+        cache.store([_change(1)], {1: _summary(1, "first")})
+        # The other generation's entry was not there when this one looked
+        with monkeypatch.context() as patch:
+            patch.setattr(cache, '_get_entries', lambda keys: {})
+            assert cache.store([_change(2)], {2: _summary(2, "second")}) == 1
+
+        session.expire_all()
+        assert cache.lookup([_change(3)]) == {3: _summary(3, "second")}
+        assert SummaryCacheEntry.query.count() == 1
+
+    def test_store_skips_changes_without_summary(self, session):
+        """Test changes the agent returned nothing for are not cached"""
+        cache = SummaryCacheService()
+
+        assert cache.store([_change(1), _change(2, sail_code="b")], {1: _summary(1, "x")}) == 1
+        assert SummaryCacheEntry.query.count() == 1
+
+    def test_cache_disabled(self, session, monkeypatch):
+        """Test nothing is stored or found when the cache is disabled"""
+        cache = SummaryCacheService()
+        cache.store([_change(1)], {1: _summary(1, "cached")})
+        monkeypatch.setattr(Config, 'SUMMARY_CACHE_ENABLED', False)
+
+        assert cache.lookup([_change(2)]) == {}
+        assert cache.store([_change(3, sail_code="b")], {3: _summary(3, "x")}) == 0
+
+    def test_evict_by_age_and_count(self, session, monkeypatch):
+        """Test stale entries and the least recently used overflow are evicted"""
+        monkeypatch.setattr(Config, 'SUMMARY_CACHE_MAX_AGE_DAYS', 30)
+        monkeypatch.setattr(Config, 'SUMMARY_CACHE_MAX_ENTRIES', 2)
+        now = datetime.utcnow()
+        for key, days_ago in [('recent', 0), ('older', 1), ('oldest', 2), ('stale', 31)]:
+            session.add(SummaryCacheEntry(
+                cache_key=key,
+                summary='{}',
+                last_used_at=now - timedelta(days=days_ago)
+            ))
+        session.flush()
+
+        assert SummaryCacheService().evict() == 2
+
+        remaining = {entry.cache_key for entry in SummaryCacheEntry.query}
+        assert remaining == {'recent', 'older'}
@@ -0,0 +1,114 @@
+"""
+Tests for Summary Priority Queue
+
+Tests that AI summaries are queued CONFLICT first, then by display order
+and complexity, that batches respect the token budget and that changes
+opened by a reviewer are promoted.
+"""
+
+from services.ai.summary_queue import (
+    SummaryPriorityQueue, estimate_tokens, summary_complexity
+)
+from services.merge_summary_service import MergeSummaryService
+
+
+def _change(change_id, classification, sail_code=''):
+    """Create a change dictionary as prepared for the Q agent."""
+    return {
+        'change_id': change_id,
+        'classification': classification,
+        'customer_version': {'sail_code': sail_code, 'fields': {}},
+        'new_vendor_version': None
+    }
+
+
+def _ids(batch):
+    """Change IDs of a batch."""
+    return [change['change_id'] for change in batch]
+
+
+class TestSummaryPriorityQueue:
+    """Test SummaryPriorityQueue"""
+
+    def test_orders_by_classification_display_order_and_complexity(self):
+        """Test CONFLICT changes come first, then by display order"""
+        changes = [
+            _change(1, 'NO_CONFLICT'),
+            _change(2, 'NEW'),
+            _change(3, 'CONFLICT'),
+            _change(4, 'CONFLICT', sail_code='a!x()'),
+            _change(5, 'CONFLICT', sail_code='a!longer()'),
+            _change(6, 'DELETED'),
+        ]
+        display_orders = {1: 1, 2: 2, 3: 4, 4: 3, 5: 3, 6: 5}
+
+        queue = SummaryPriorityQueue(changes, display_orders)
+
+        assert [_ids(batch) for batch in queue.iter_batches(2)] == [
+            [5, 4], [3, 6], [1, 2]
+        ]
+        assert len(queue) == 0
+
+    def test_promote_moves_change_to_front(self):
+        """Test promoted changes are taken next, latest promotion first"""
+        queue = SummaryPriorityQueue(
+            [_change(i, 'NO_CONFLICT') for i in range(1, 6)],
+            {i: i for i in range(1, 6)}
+        )
+        batches = queue.iter_batches(2)
+
+        assert _ids(next(batches)) == [1, 2]
+        assert queue.promote(4)
+        assert queue.promote(5)
+        assert not queue.promote(1)
+        assert _ids(next(batches)) == [5, 4]
+        assert _ids(next(batches)) == [3]
+        assert next(batches, None) is None
+
+    def test_batches_are_packed_to_token_budget(self):
+        """Test batches stop before the change that exceeds the budget"""
+        changes = [
+            _change(1, 'CONFLICT', sail_code='x' * 4000),
+            _change(2, 'CONFLICT', sail_code='x' * 400),
+            _change(3, 'CONFLICT', sail_code='x' * 400),
+            _change(4, 'NO_CONFLICT', sail_code='x' * 400),
+        ]
+        small = estimate_tokens(changes[1])
+        assert estimate_tokens(changes[0]) > 2 * small
+
+        queue = SummaryPriorityQueue(changes, {i: i for i in range(1, 5)})
+
+        assert [_ids(batch) for batch in queue.iter_batches(10, 2 * small)] == [
+            [1], [2, 3], [4]
+        ]
+
+    def test_summary_complexity(self):
+        """Test complexity counts SAIL code and fields of both versions"""
+        change = {
+            'customer_version': {'sail_code': 'abc', 'fields': {'a': 1}},
+            'new_vendor_version': {'sail_code': None, 'fields': {'b': 2, 'c': 3}}
+        }
+
+        assert summary_complexity(change) == 6
+        assert summary_complexity({}) == 0
+
+
+class TestMergeSummaryServicePrioritization:
+    """Test MergeSummaryService.prioritize_change"""
+
+    def test_prioritize_change(self, app_context):
+        """Test only changes waiting in a running generation are promoted"""
+        service = MergeSummaryService()
+        queue = SummaryPriorityQueue(
+            [_change(1, 'CONFLICT'), _change(2, 'NO_CONFLICT')]
+        )
+
+        assert not service.prioritize_change(9999, 2)
+
+        MergeSummaryService._active_queues[9999] = queue
+        try:
+            assert service.prioritize_change(9999, 2)
+            assert _ids(queue.pop_batch(1)) == [2]
+            assert not service.prioritize_change(9999, 2)
+        finally:
+            MergeSummaryService._active_queues.pop(9999, None)
@@ -0,0 +1,148 @@
+"""
+Tests for Summary Scheduler
+
+Tests that summary batches run concurrently within the configured cap,
+that transient failures are retried, that batches timing out are split
+and that agent invocations are rate limited and recorded.
+"""
+
+import threading
+import time
+
+from core.exceptions import AgentTimeoutException, TransientException
+from services.ai.summary_scheduler import (
+    BatchStats, Histogram, SummaryScheduler, TokenBucket
+)
+
+
+def _batches(count):
+    """Create single-change batches."""
+    return [[{'change_id': i}] for i in range(1, count + 1)]
+
+
+class TestSummaryScheduler:
+    """Test SummaryScheduler"""
+
+    def test_runs_batches_concurrently_within_cap(self):
+        """Test no more than max_concurrency batches run at once"""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def process_batch(batch):
+            with lock:
+                running.append(batch)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(batch)
+            return {batch[0]['change_id']: {'summary': 'ok'}}
+
+        started = []
+        scheduler = SummaryScheduler(process_batch, max_concurrency=3)
+        outcomes = list(scheduler.run(
+            _batches(7),
+            on_start=lambda batch_num, batch: started.append(batch_num)
+        ))
+
+        assert max(peak) == 3
+        assert started == list(range(1, 8))
+        assert sorted(o.batch_num for o in outcomes) == list(range(1, 8))
+        assert all(o.succeeded and o.attempts == 1 for o in outcomes)
+
+    def test_retries_transient_failures(self):
+        """Test transient failures are retried until the batch succeeds"""
+        calls = []
+
+        def process_batch(batch):
+            calls.append(batch)
+            if len(calls) < 3:
+                raise TransientException("timed out")
+            return {1: {'summary': 'ok'}}
+
+        scheduler = SummaryScheduler(
+            process_batch, max_concurrency=1, max_retries=2, backoff_seconds=0
+        )
+        (outcome,) = scheduler.run(_batches(1))
+
+        assert outcome.succeeded
+        assert outcome.attempts == 3
+        assert outcome.summaries == {1: {'summary': 'ok'}}
+
+    def test_gives_up_after_retries_and_on_other_errors(self):
+        """Test exhausted retries and non-transient errors are reported"""
+        def process_batch(batch):
+            if batch[0]['change_id'] == 1:
+                raise TransientException("no summaries")
+            raise FileNotFoundError("q")
+
+        scheduler = SummaryScheduler(
+            process_batch, max_concurrency=2, max_retries=1, backoff_seconds=0
+        )
+        outcomes = {o.batch_num: o for o in scheduler.run(_batches(2))}
+
+        assert not outcomes[1].succeeded
+        assert outcomes[1].attempts == 2
+        assert isinstance(outcomes[2].error, FileNotFoundError)
+        assert outcomes[2].attempts == 1
+
+    def test_splits_batches_that_time_out(self):
+        """Test a timed out batch is halved until the halves go through"""
+        calls = []
+
+        def process_batch(batch):
+            ids = [change['change_id'] for change in batch]
+            calls.append(ids)
+            if len(batch) > 2 or 4 in ids:
+                raise AgentTimeoutException("timed out")
+            return {i: {'summary': 'ok'} for i in ids}
+
+        stats = BatchStats()
+        scheduler = SummaryScheduler(
+            process_batch, max_concurrency=1, max_retries=0,
+            backoff_seconds=0, stats=stats
+        )
+        batch = [{'change_id': i} for i in range(1, 6)]
+        (outcome,) = scheduler.run([batch])
+
+        assert calls == [[1, 2, 3, 4, 5], [1, 2], [3, 4, 5], [3], [4, 5], [4], [5]]
+        assert sorted(outcome.summaries) == [1, 2, 3, 5]
+        assert outcome.failed == [{'change_id': 4}]
+        assert not outcome.succeeded
+        assert [c['change_id'] for c in outcome.summarized] == [1, 2, 3, 5]
+        assert isinstance(outcome.error, AgentTimeoutException)
+        assert (outcome.attempts, outcome.splits) == (7, 3)
+
+        recorded = stats.to_dict()
+        assert (recorded['timeouts'], recorded['splits']) == (4, 3)
+        assert recorded['changes']['count'] == 7
+        assert recorded['changes']['max'] == 5
+
+    def test_histogram_buckets(self):
+        """Test values are counted in the first bucket they fit"""
+        histogram = Histogram([1, 5])
+        for value in (0.5, 1, 3, 7):
+            histogram.observe(value)
+
+        assert histogram.to_dict() == {
+            'count': 4,
+            'mean': 2.88,
+            'max': 7,
+            'buckets': {'<=1': 2, '<=5': 1, '>5': 1}
+        }
+
+    def test_token_bucket_limits_rate(self):
+        """Test tokens beyond the burst capacity are handed out at the rate"""
+        bucket = TokenBucket(rate_per_minute=1200, capacity=2)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        start = time.monotonic()
+        assert bucket.acquire() > 0
+        assert time.monotonic() - start >= 0.04
+
+    def test_token_bucket_unlimited(self):
+        """Test a non-positive rate never waits"""
+        bucket = TokenBucket(rate_per_minute=0)
+
+        assert all(bucket.acquire() == 0 for _ in range(100))
@@ -93,6 +93,46 @@ class TestThreeWayMergeOrchestrator(BaseTestCase):
         print(f"  Total changes: {session.total_changes}")
         print(f"  Status: {session.status}")
     
+    def test_create_merge_session_concurrent_extraction(self):
+        """
+        Test concurrent package extraction produces the same result.
+        
+        Verifies:
+        - Session reaches 'ready' in concurrent mode
+        - Package object counts match a serial run
+        - Same set of changes and classifications
+        """
+        serial = self.orchestrator.create_merge_session(
+            base_zip_path=self.base_zip,
+            customized_zip_path=self.customized_zip,
+            new_vendor_zip_path=self.new_vendor_zip,
+            concurrent_extraction=False
+        )
+        concurrent = self.orchestrator.create_merge_session(
+            base_zip_path=self.base_zip,
+            customized_zip_path=self.customized_zip,
+            new_vendor_zip_path=self.new_vendor_zip,
+            concurrent_extraction=True
+        )
+        
+        self.assertEqual(concurrent.status, 'ready')
+        self.assertEqual(concurrent.total_changes, serial.total_changes)
+        
+        def package_counts(session):
+            return {
+                pkg.package_type: pkg.total_objects
+                for pkg in Package.query.filter_by(session_id=session.id)
+            }
+        
+        def classifications(session):
+            return sorted(
+                (change.object_id, change.classification)
+                for change in Change.query.filter_by(session_id=session.id)
+            )
+        
+        self.assertEqual(package_counts(concurrent), package_counts(serial))
+        self.assertEqual(classifications(concurrent), classifications(serial))
+    
     def test_get_session_status(self):
         """
         Test getting session status.